@@ -51,6 +51,12 @@ const App: React.FC = () => {
     return () => window.removeEventListener('popstate', handlePopState);
   }, []);
 
+  // Readiness flag polled by the test harness (testsprite_tests/harness/waits.py):
+  // cleared on navigation, set again once the new view has committed.
+  React.useEffect(() => {
+    (window as any).__qbankReady = true;
+  }, [view]);
+
   // Update URL function (optional, to keep URL in sync)
   const updateUrl = (newView: string, id?: string | null) => {
     const url = new URL(window.location.href);
@@ -67,6 +73,7 @@ const App: React.FC = () => {
   };
 
   const handleNavigate = (newView: 'landing' | 'creator' | 'teacher' | 'student' | 'pdf' | 'tools' | 'paper-builder' | 'ppt-generator' | 'refinement-studio', id?: string) => {
+    if (newView !== view) (window as any).__qbankReady = false;
     setView(newView);
     updateUrl(newView, id);
     setPresentationSetId(id || null);
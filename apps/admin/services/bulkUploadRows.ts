@@ -0,0 +1,64 @@
+import { PreviewRow } from '../types';
+
+// Row-level normalize and validate for bulk uploads. Kept free of Supabase and
+// DOM imports so the XLSX streaming worker can run them off the main thread.
+
+export const normalizeRow = (row: any, index: number): PreviewRow => {
+    const obj: any = {};
+    const lowerKeys: Record<string, any> = {};
+    for (const k of Object.keys(row)) lowerKeys[k.toLowerCase().trim()] = row[k];
+
+    // Mapping Logic
+    // Question Text: Prefer Hindi, then English, then generic keys
+    obj.question_text = lowerKeys['question_hin'] || lowerKeys['question_eng'] || lowerKeys['question'] || lowerKeys['question_text'] || lowerKeys['question text'] || '';
+
+    // Options: Handle numbered options (option1_hin, option1, etc.) and lettered options
+    obj.option_a = lowerKeys['option1_hin'] || lowerKeys['option1_eng'] || lowerKeys['option1'] || lowerKeys['option a'] || lowerKeys['option_a'] || lowerKeys['a'] || '';
+    obj.option_b = lowerKeys['option2_hin'] || lowerKeys['option2_eng'] || lowerKeys['option2'] || lowerKeys['option b'] || lowerKeys['option_b'] || lowerKeys['b'] || '';
+    obj.option_c = lowerKeys['option3_hin'] || lowerKeys['option3_eng'] || lowerKeys['option3'] || lowerKeys['option c'] || lowerKeys['option_c'] || lowerKeys['c'] || '';
+    obj.option_d = lowerKeys['option4_hin'] || lowerKeys['option4_eng'] || lowerKeys['option4'] || lowerKeys['option d'] || lowerKeys['option_d'] || lowerKeys['d'] || '';
+
+    obj.correct_answer = lowerKeys['correct answer'] || lowerKeys['correct_answer'] || lowerKeys['answer'] || '';
+    obj.answer_explanation = lowerKeys['solution_hin'] || lowerKeys['solution_eng'] || lowerKeys['explanation'] || lowerKeys['answer_explanation'] || lowerKeys['solution'] || '';
+
+    obj.subject_name = lowerKeys['subject'] || lowerKeys['subject_name'] || 'General';
+    obj.topic_name = lowerKeys['chapter'] || lowerKeys['topic'] || lowerKeys['topic_name'] || 'General'; // Use 'chapter' as topic if present
+    obj.difficulty_level = lowerKeys['difficulty'] || 'Medium'; // Default
+    obj.language_type = lowerKeys['language'] || (lowerKeys['question_hin'] ? 'Hindi' : 'Bilingual'); // Infer language
+
+    // Metadata
+    const examSource = lowerKeys['exam'] || lowerKeys['source'];
+    obj.question_source = examSource || 'BulkUpload';
+
+    // Post-processing
+    // Normalize difficulty
+    const diff = String(obj.difficulty_level).toLowerCase();
+    if (diff.includes('easy')) obj.difficulty_level = 'Easy';
+    else if (diff.includes('hard')) obj.difficulty_level = 'Hard';
+    else obj.difficulty_level = 'Medium';
+
+    return {
+        ...obj,
+        id: `row_${index}`,
+        rowNumber: index + 1,
+        isValid: false, // Will be set by validator
+        errors: [],
+        originalData: row
+    };
+};
+
+export const validateRow = (row: PreviewRow): PreviewRow => {
+    const errors: string[] = [];
+    if (!row.question_text || row.question_text.trim().length < 5) errors.push("Question text is too short or missing.");
+    if (!row.option_a || !row.option_b) errors.push("At least Option A and B are required.");
+    if (!row.correct_answer) errors.push("Correct Answer is missing.");
+
+    // Basic check if correct answer is in options
+    // (This logic needs to be robust, e.g., if answer is 'A' or the text itself)
+
+    return {
+        ...row,
+        isValid: errors.length === 0,
+        errors
+    };
+};
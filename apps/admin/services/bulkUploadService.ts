@@ -3,6 +3,23 @@ import Papa from 'papaparse';
 import * as XLSX from 'xlsx';
 import { supabase } from './storageService';
 import { QuestionMaster, BulkUploadBatch, BulkUploadRow, PreviewRow } from '../types';
+import { normalizeRow, validateRow } from './bulkUploadRows';
+import type { XlsxStreamMessage } from './xlsxStream.worker';
+
+export interface XlsxStreamProgress {
+    phase: 'strings' | 'rows';
+    bytesRead: number;
+    totalBytes: number;
+    rows: number;
+}
+
+export interface XlsxStreamOptions {
+    batchSize?: number;
+    // false: raw sheet_to_json-style rows instead of validated PreviewRows.
+    normalize?: boolean;
+    onProgress?: (progress: XlsxStreamProgress) => void;
+    signal?: AbortSignal;
+}
 
 export const bulkUploadService = {
 
@@ -18,7 +35,12 @@ export const bulkUploadService = {
                     complete: (results) => resolve(results.data),
                     error: (error) => reject(error),
                 });
-            } else if (fileType === 'xlsx' || fileType === 'xls') {
+            } else if (fileType === 'xlsx') {
+                // Streamed in a worker; only the rows themselves are kept.
+                const rows: any[] = [];
+                bulkUploadService.streamXlsx(file, (batch) => { for (const row of batch) rows.push(row); }, { normalize: false })
+                    .then(() => resolve(rows), reject);
+            } else if (fileType === 'xls') {
                 const reader = new FileReader();
                 reader.readAsArrayBuffer(file);
                 reader.onload = (e) => {
@@ -45,74 +67,57 @@ export const bulkUploadService = {
         });
     },
 
-    // 2. Normalize Keys (Flexible Column Mapping)
-    normalizeData(rawData: any[]): PreviewRow[] {
-        return rawData.map((row, index) => {
-            // Basic normalization logic - can be improved with AI or manual mapping UI
-            // Trying to find keys that match our schema
-            const findKey = (keys: string[]) => keys.find(k => row[k] !== undefined && row[k] !== null);
-
-            const obj: any = {};
-            const lowerKeys = Object.keys(row).reduce((acc, k) => ({ ...acc, [k.toLowerCase().trim()]: row[k] }), {});
-
-            // Mapping Logic
-            // Mapping Logic
-            // Question Text: Prefer Hindi, then English, then generic keys
-            obj.question_text = lowerKeys['question_hin'] || lowerKeys['question_eng'] || lowerKeys['question'] || lowerKeys['question_text'] || lowerKeys['question text'] || '';
-
-            // Options: Handle numbered options (option1_hin, option1, etc.) and lettered options
-            obj.option_a = lowerKeys['option1_hin'] || lowerKeys['option1_eng'] || lowerKeys['option1'] || lowerKeys['option a'] || lowerKeys['option_a'] || lowerKeys['a'] || '';
-            obj.option_b = lowerKeys['option2_hin'] || lowerKeys['option2_eng'] || lowerKeys['option2'] || lowerKeys['option b'] || lowerKeys['option_b'] || lowerKeys['b'] || '';
-            obj.option_c = lowerKeys['option3_hin'] || lowerKeys['option3_eng'] || lowerKeys['option3'] || lowerKeys['option c'] || lowerKeys['option_c'] || lowerKeys['c'] || '';
-            obj.option_d = lowerKeys['option4_hin'] || lowerKeys['option4_eng'] || lowerKeys['option4'] || lowerKeys['option d'] || lowerKeys['option_d'] || lowerKeys['d'] || '';
-
-            obj.correct_answer = lowerKeys['correct answer'] || lowerKeys['correct_answer'] || lowerKeys['answer'] || '';
-            obj.answer_explanation = lowerKeys['solution_hin'] || lowerKeys['solution_eng'] || lowerKeys['explanation'] || lowerKeys['answer_explanation'] || lowerKeys['solution'] || '';
-
-            obj.subject_name = lowerKeys['subject'] || lowerKeys['subject_name'] || 'General';
-            obj.topic_name = lowerKeys['chapter'] || lowerKeys['topic'] || lowerKeys['topic_name'] || 'General'; // Use 'chapter' as topic if present
-            obj.difficulty_level = lowerKeys['difficulty'] || 'Medium'; // Default
-            obj.language_type = lowerKeys['language'] || (lowerKeys['question_hin'] ? 'Hindi' : 'Bilingual'); // Infer language
-
-            // Metadata
-            const examSource = lowerKeys['exam'] || lowerKeys['source'];
-            obj.question_source = examSource || 'BulkUpload';
-
-            // Post-processing
-            // Normalize difficulty
-            const diff = String(obj.difficulty_level).toLowerCase();
-            if (diff.includes('easy')) obj.difficulty_level = 'Easy';
-            else if (diff.includes('hard')) obj.difficulty_level = 'Hard';
-            else obj.difficulty_level = 'Medium';
-
-            return {
-                ...obj,
-                id: `row_${index}`,
-                rowNumber: index + 1,
-                isValid: false, // Will be set by validator
-                errors: [],
-                originalData: row
+    // 1b. Streaming XLSX: rows arrive in batches from a Web Worker without the
+    // workbook ever being held in memory. The next batch is only sent once
+    // onBatch (which may be async, e.g. saving the batch) has finished.
+    streamXlsx(file: File, onBatch: (rows: any[], firstRow: number) => void | Promise<void>, options: XlsxStreamOptions = {}): Promise<number> {
+        const { batchSize = 1000, normalize = true, onProgress, signal } = options;
+        return new Promise((resolve, reject) => {
+            const worker = new Worker(new URL('./xlsxStream.worker.ts', import.meta.url), { type: 'module' });
+            let settled = false;
+            const finish = (error: Error | null, rows = 0) => {
+                if (settled) return;
+                settled = true;
+                worker.terminate();
+                signal?.removeEventListener('abort', abort);
+                if (error) reject(error);
+                else resolve(rows);
             };
+            const abort = () => finish(new DOMException('XLSX streaming aborted', 'AbortError'));
+            if (signal?.aborted) return abort();
+            signal?.addEventListener('abort', abort);
+
+            let pending = Promise.resolve();
+            worker.onmessage = (event: MessageEvent<XlsxStreamMessage>) => {
+                const message = event.data;
+                // Batches and the final message are handled in order, after any async onBatch.
+                pending = pending.then(async () => {
+                    if (settled) return;
+                    if (message.type === 'batch') {
+                        await onBatch(message.rows, message.firstRow);
+                        worker.postMessage('ack');
+                    } else if (message.type === 'progress') {
+                        onProgress?.(message);
+                    } else if (message.type === 'done') {
+                        finish(null, message.rows);
+                    } else {
+                        finish(new Error(message.message));
+                    }
+                }).catch((error) => finish(error instanceof Error ? error : new Error(String(error))));
+            };
+            worker.onerror = (event) => finish(new Error(event.message || 'XLSX worker failed'));
+            worker.postMessage({ file, batchSize, normalize });
         });
     },
 
+    // 2. Normalize Keys (Flexible Column Mapping)
+    normalizeData(rawData: any[]): PreviewRow[] {
+        return rawData.map(normalizeRow);
+    },
+
     // 3. Validation Engine
     validateRows(rows: PreviewRow[]): PreviewRow[] {
-        return rows.map(row => {
-            const errors: string[] = [];
-            if (!row.question_text || row.question_text.trim().length < 5) errors.push("Question text is too short or missing.");
-            if (!row.option_a || !row.option_b) errors.push("At least Option A and B are required.");
-            if (!row.correct_answer) errors.push("Correct Answer is missing.");
-
-            // Basic check if correct answer is in options
-            // (This logic needs to be robust, e.g., if answer is 'A' or the text itself)
-
-            return {
-                ...row,
-                isValid: errors.length === 0,
-                errors
-            };
-        });
+        return rows.map(validateRow);
     },
 
     // 4. Batch Saving
@@ -26,7 +26,9 @@ let aiInstance: GoogleGenAI | null = null;
 const getAI = () => {
   if (!aiInstance) {
     const key = import.meta.env.VITE_GEMINI_API_KEY || 'dummy_key';
-    aiInstance = new GoogleGenAI({ apiKey: key });
+    // Optional override, e.g. the local mock in testsprite_tests/harness/mock_ai.py
+    const baseUrl = import.meta.env.VITE_GEMINI_BASE_URL;
+    aiInstance = new GoogleGenAI({ apiKey: key, ...(baseUrl ? { httpOptions: { baseUrl } } : {}) });
   }
   return aiInstance;
 };
@@ -0,0 +1,70 @@
+// Web Worker side of bulkUploadService.streamXlsx: reads the sheet with
+// readXlsxRows and posts rows back in batches, normalized and validated
+// unless the caller asked for raw rows. At most MAX_IN_FLIGHT batches are
+// unacknowledged at a time, so a slow consumer (e.g. one saving each batch)
+// holds the reader back instead of letting batches pile up in its queue.
+import { normalizeRow, validateRow } from './bulkUploadRows';
+import { readXlsxRows } from './xlsxStreamReader';
+
+export interface XlsxStreamRequest {
+    file: Blob;
+    batchSize: number;
+    normalize: boolean;
+}
+
+export type XlsxStreamMessage =
+    | { type: 'progress'; phase: 'strings' | 'rows'; bytesRead: number; totalBytes: number; rows: number }
+    | { type: 'batch'; rows: any[]; firstRow: number }
+    | { type: 'done'; rows: number }
+    | { type: 'error'; message: string };
+
+const MAX_IN_FLIGHT = 2;
+
+const scope = self as unknown as {
+    onmessage: ((event: MessageEvent) => void) | null;
+    postMessage(message: XlsxStreamMessage): void;
+};
+
+let inFlight = 0;
+let release: (() => void) | null = null;
+
+const acknowledged = (): Promise<void> =>
+    inFlight < MAX_IN_FLIGHT ? Promise.resolve() : new Promise((resolve) => { release = resolve; });
+
+async function stream({ file, batchSize, normalize }: XlsxStreamRequest): Promise<void> {
+    let rows = 0;
+    let batch: any[] = [];
+    let progress = { bytesRead: 0, totalBytes: 0 };
+
+    const flush = async () => {
+        if (!batch.length) return;
+        await acknowledged();
+        inFlight++;
+        scope.postMessage({ type: 'batch', rows: batch, firstRow: rows - batch.length + 1 });
+        scope.postMessage({ type: 'progress', phase: 'rows', ...progress, rows });
+        batch = [];
+    };
+
+    const onStrings = (bytesRead: number, totalBytes: number) =>
+        scope.postMessage({ type: 'progress', phase: 'strings', bytesRead, totalBytes, rows: 0 });
+
+    for await (const { row, bytesRead, totalBytes } of readXlsxRows(file, onStrings)) {
+        batch.push(normalize ? validateRow(normalizeRow(row, rows)) : row);
+        rows++;
+        progress = { bytesRead, totalBytes };
+        if (batch.length >= batchSize) await flush();
+    }
+    await flush();
+    scope.postMessage({ type: 'done', rows });
+}
+
+scope.onmessage = (event: MessageEvent) => {
+    if (event.data === 'ack') {
+        inFlight--;
+        release?.();
+        release = null;
+        return;
+    }
+    stream(event.data as XlsxStreamRequest).catch((error) =>
+        scope.postMessage({ type: 'error', message: error instanceof Error ? error.message : String(error) }));
+};
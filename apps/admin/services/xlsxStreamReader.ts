@@ -0,0 +1,312 @@
+// Streaming reader for the first worksheet of an .xlsx file.
+//
+// The file is never read whole: the zip central directory is read from the
+// end of the Blob, the sheet entry is inflated as a stream
+// (DecompressionStream) and rows are cut out of the XML text as they arrive.
+// Rows come out as the objects XLSX.utils.sheet_to_json would build (keys
+// from the first row, empty cells left out). The shared strings table is the
+// one part held in memory, since any cell may point into it.
+//
+// No DOM APIs, so it runs in a Web Worker (see xlsxStream.worker.ts).
+
+export type XlsxCell = string | number | boolean;
+
+export interface XlsxRow {
+    row: Record<string, XlsxCell>;
+    // Compressed sheet bytes consumed so far, against totalBytes.
+    bytesRead: number;
+    totalBytes: number;
+}
+
+export type XlsxProgress = (bytesRead: number, totalBytes: number) => void;
+
+interface ZipEntry {
+    method: number;
+    compressedSize: number;
+    headerOffset: number;
+}
+
+const EOCD_SIGNATURE = 0x06054b50;
+const CENTRAL_SIGNATURE = 0x02014b50;
+const LOCAL_SIGNATURE = 0x04034b50;
+const EOCD_SIZE = 22;
+const MAX_COMMENT = 0xffff;
+
+// Text never holds a raw "<", so bodies are matched as [^<] runs.
+const CELL = /<c\b([^>]*?)(?:\/>|>([^<]*(?:<(?!\/c>)[^<]*)*)<\/c>)/g;
+const CELL_REF = /\br="([A-Z]+)/;
+const CELL_TYPE = /\bt="([^"]*)"/;
+const VALUE = /<v>([^<]*)<\/v>/;
+const TEXT_RUN = /<t\b[^>]*>([^<]*)<\/t>/g;
+const PHONETIC = /<rPh\b[\s\S]*?<\/rPh>/g;
+const ENTITY = /&(?:#(\d+)|#x([0-9a-fA-F]+)|(amp|lt|gt|quot|apos));/g;
+const ESCAPED_CHAR = /_x([0-9a-fA-F]{4})_/g;
+const NAMED_ENTITIES: Record<string, string> = { amp: '&', lt: '<', gt: '>', quot: '"', apos: "'" };
+
+const decodeXml = (text: string): string => {
+    if (text.indexOf('&') >= 0) {
+        text = text.replace(ENTITY, (_, dec, hex, name) =>
+            name ? NAMED_ENTITIES[name] : String.fromCodePoint(dec ? Number(dec) : parseInt(hex, 16)));
+    }
+    // OOXML escapes control characters as _xHHHH_.
+    return text.indexOf('_x') >= 0 ? text.replace(ESCAPED_CHAR, (_, hex) => String.fromCharCode(parseInt(hex, 16))) : text;
+};
+
+const runText = (xml: string): string => {
+    let text = '';
+    for (const match of xml.replace(PHONETIC, '').matchAll(TEXT_RUN)) text += match[1];
+    return decodeXml(text);
+};
+
+const columnIndex = (letters: string): number => {
+    let index = 0;
+    for (let i = 0; i < letters.length; i++) index = index * 26 + letters.charCodeAt(i) - 64;
+    return index - 1;
+};
+
+async function* chunksOf<T>(stream: ReadableStream<T>): AsyncGenerator<T> {
+    const reader = stream.getReader();
+    let finished = false;
+    try {
+        for (;;) {
+            const { done, value } = await reader.read();
+            if (done) {
+                finished = true;
+                return;
+            }
+            yield value;
+        }
+    } finally {
+        if (!finished) await reader.cancel();
+        reader.releaseLock();
+    }
+}
+
+// Complete <tag ...>...</tag> (or <tag .../>) elements as they arrive; the
+// tags read here (row, si) never nest.
+async function* elements(text: AsyncIterable<string>, tag: string): AsyncGenerator<string> {
+    const open = `<${tag}`;
+    const close = `</${tag}>`;
+    let buffer = '';
+    for await (const chunk of text) {
+        buffer += chunk;
+        let pos = 0;
+        for (;;) {
+            const start = buffer.indexOf(open, pos);
+            if (start < 0) {
+                // Keep a tail that may hold the start of the next tag.
+                pos = Math.max(pos, buffer.length - open.length);
+                break;
+            }
+            const next = buffer[start + open.length];
+            if (next === undefined) {
+                pos = start;
+                break;
+            }
+            if (next !== '>' && next !== '/' && next !== ' ' && next !== '\t' && next !== '\n' && next !== '\r') {
+                pos = start + 1;
+                continue;
+            }
+            const tagEnd = buffer.indexOf('>', start);
+            if (tagEnd < 0) {
+                pos = start;
+                break;
+            }
+            if (buffer[tagEnd - 1] === '/') {
+                yield buffer.slice(start, tagEnd + 1);
+                pos = tagEnd + 1;
+                continue;
+            }
+            const end = buffer.indexOf(close, tagEnd);
+            if (end < 0) {
+                pos = start;
+                break;
+            }
+            yield buffer.slice(start, end + close.length);
+            pos = end + close.length;
+        }
+        buffer = buffer.slice(pos);
+    }
+}
+
+async function readDirectory(file: Blob): Promise<Map<string, ZipEntry>> {
+    const tailSize = Math.min(file.size, EOCD_SIZE + MAX_COMMENT);
+    const tail = new DataView(await file.slice(file.size - tailSize).arrayBuffer());
+    let eocd = -1;
+    for (let i = tail.byteLength - EOCD_SIZE; i >= 0; i--) {
+        if (tail.getUint32(i, true) === EOCD_SIGNATURE) {
+            eocd = i;
+            break;
+        }
+    }
+    if (eocd < 0) throw new Error('Not an .xlsx file: no zip directory found');
+    const count = tail.getUint16(eocd + 10, true);
+    const size = tail.getUint32(eocd + 12, true);
+    const offset = tail.getUint32(eocd + 16, true);
+    if (offset === 0xffffffff) throw new Error('ZIP64 workbooks are not supported');
+
+    const directory = new DataView(await file.slice(offset, offset + size).arrayBuffer());
+    const names = new TextDecoder();
+    const entries = new Map<string, ZipEntry>();
+    let p = 0;
+    for (let i = 0; i < count; i++) {
+        if (directory.getUint32(p, true) !== CENTRAL_SIGNATURE) throw new Error('Corrupt .xlsx zip directory');
+        const nameLength = directory.getUint16(p + 28, true);
+        const name = names.decode(new Uint8Array(directory.buffer, directory.byteOffset + p + 46, nameLength));
+        entries.set(name, {
+            method: directory.getUint16(p + 10, true),
+            compressedSize: directory.getUint32(p + 20, true),
+            headerOffset: directory.getUint32(p + 42, true),
+        });
+        p += 46 + nameLength + directory.getUint16(p + 30, true) + directory.getUint16(p + 32, true);
+    }
+    return entries;
+}
+
+class XlsxArchive {
+    private constructor(private file: Blob, private entries: Map<string, ZipEntry>) {}
+
+    static async open(file: Blob): Promise<XlsxArchive> {
+        return new XlsxArchive(file, await readDirectory(file));
+    }
+
+    has(name: string): boolean {
+        return this.entries.has(name);
+    }
+
+    size(name: string): number {
+        return this.entry(name).compressedSize;
+    }
+
+    private entry(name: string): ZipEntry {
+        const entry = this.entries.get(name);
+        if (!entry) throw new Error(`Missing ${name} in .xlsx file`);
+        return entry;
+    }
+
+    // Decoded text of an entry, chunk by chunk; onBytes gets the compressed
+    // byte count as it is read.
+    async text(name: string, onBytes?: (bytes: number) => void): Promise<AsyncGenerator<string>> {
+        const entry = this.entry(name);
+        const header = new DataView(await this.file.slice(entry.headerOffset, entry.headerOffset + 30).arrayBuffer());
+        if (header.getUint32(0, true) !== LOCAL_SIGNATURE) throw new Error(`Corrupt ${name} in .xlsx file`);
+        const start = entry.headerOffset + 30 + header.getUint16(26, true) + header.getUint16(28, true);
+        let read = 0;
+        let raw = this.file.slice(start, start + entry.compressedSize).stream().pipeThrough(
+            new TransformStream<Uint8Array, Uint8Array>({
+                transform(chunk, controller) {
+                    read += chunk.byteLength;
+                    onBytes?.(read);
+                    controller.enqueue(chunk);
+                },
+            }),
+        );
+        if (entry.method === 8) raw = raw.pipeThrough(new DecompressionStream('deflate-raw') as ReadableWritablePair<Uint8Array, Uint8Array>);
+        else if (entry.method !== 0) throw new Error(`Unsupported compression method ${entry.method} for ${name}`);
+        return chunksOf(raw.pipeThrough(new TextDecoderStream()));
+    }
+
+    async readText(name: string): Promise<string> {
+        let text = '';
+        for await (const chunk of await this.text(name)) text += chunk;
+        return text;
+    }
+}
+
+// Path of the first worksheet, via workbook.xml and its relationships.
+async function firstSheet(archive: XlsxArchive): Promise<string> {
+    const workbook = await archive.readText('xl/workbook.xml');
+    const sheet = /<sheet\b[^>]*?\bid="([^"]+)"/.exec(workbook);
+    if (!sheet) throw new Error('The workbook has no sheets');
+    const rels = await archive.readText('xl/_rels/workbook.xml.rels');
+    for (const [relationship] of rels.matchAll(/<Relationship\b[^>]*>/g)) {
+        if (/\bId="([^"]+)"/.exec(relationship)?.[1] !== sheet[1]) continue;
+        const target = decodeXml(/\bTarget="([^"]+)"/.exec(relationship)?.[1] ?? '');
+        return target.startsWith('/') ? target.slice(1) : `xl/${target}`;
+    }
+    throw new Error('The first sheet is missing from the workbook');
+}
+
+async function sharedStrings(archive: XlsxArchive, onProgress?: XlsxProgress): Promise<string[]> {
+    const name = 'xl/sharedStrings.xml';
+    const strings: string[] = [];
+    if (!archive.has(name)) return strings;
+    const total = archive.size(name);
+    for await (const si of elements(await archive.text(name, (bytes) => onProgress?.(bytes, total)), 'si')) strings.push(runText(si));
+    return strings;
+}
+
+const cellValue = (attrs: string, body: string | undefined, strings: string[]): XlsxCell | undefined => {
+    const type = CELL_TYPE.exec(attrs)?.[1] ?? 'n';
+    if (body === undefined) return undefined;
+    if (type === 'inlineStr') return runText(body);
+    const value = VALUE.exec(body)?.[1];
+    if (value === undefined) return undefined;
+    switch (type) {
+        case 's': return strings[Number(value)];
+        case 'b': return value === '1';
+        case 'str':
+        case 'e':
+        case 'd': return decodeXml(value);
+        default: return Number(value);
+    }
+};
+
+// Cell values of one <row>, by column index.
+const rowCells = (row: string, strings: string[]): XlsxCell[] => {
+    const cells: XlsxCell[] = [];
+    let next = 0;
+    for (const [, attrs, body] of row.matchAll(CELL)) {
+        const ref = CELL_REF.exec(attrs);
+        const index = ref ? columnIndex(ref[1]) : next;
+        next = index + 1;
+        const value = cellValue(attrs, body, strings);
+        if (value !== undefined) cells[index] = value;
+    }
+    return cells;
+};
+
+// sheet_to_json's header keys: blanks become __EMPTY, repeats get _1, _2...
+class HeaderKeys {
+    private keys: string[] = [];
+    private seen = new Map<string, number>();
+
+    constructor(cells: XlsxCell[]) {
+        for (let i = 0; i < cells.length; i++) this.keys[i] = this.unique(cells[i] === undefined ? '__EMPTY' : String(cells[i]));
+    }
+
+    key(index: number): string {
+        return this.keys[index] ?? (this.keys[index] = this.unique('__EMPTY'));
+    }
+
+    private unique(name: string): string {
+        const count = this.seen.get(name) ?? 0;
+        this.seen.set(name, count + 1);
+        return count ? `${name}_${count}` : name;
+    }
+}
+
+// Rows after the header row. onStrings reports progress through the shared
+// strings table, which is read before the first row comes out.
+export async function* readXlsxRows(file: Blob, onStrings?: XlsxProgress): AsyncGenerator<XlsxRow> {
+    const archive = await XlsxArchive.open(file);
+    const strings = await sharedStrings(archive, onStrings);
+    const sheet = await firstSheet(archive);
+    const totalBytes = archive.size(sheet);
+    let bytesRead = 0;
+    let header: HeaderKeys | null = null;
+    for await (const rowXml of elements(await archive.text(sheet, (bytes) => { bytesRead = bytes; }), 'row')) {
+        const cells = rowCells(rowXml, strings);
+        if (!header) {
+            if (cells.length) header = new HeaderKeys(cells);
+            continue;
+        }
+        const row: Record<string, XlsxCell> = {};
+        let empty = true;
+        cells.forEach((value, index) => {
+            row[header!.key(index)] = value;
+            empty = false;
+        });
+        if (!empty) yield { row, bytesRead, totalBytes };
+    }
+}
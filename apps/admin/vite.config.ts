@@ -10,13 +10,18 @@ export default defineConfig(({ mode }) => {
       host: '0.0.0.0',
       proxy: {
         '/replicate-api': {
-          target: 'https://api.replicate.com/v1',
+          target: env.REPLICATE_API_TARGET || 'https://api.replicate.com/v1',
           changeOrigin: true,
           rewrite: (path) => path.replace(/^\/replicate-api/, ''),
           secure: false,
         },
       },
     },
+    build: {
+      // Opt-in: emits .map files (without sourceMappingURL comments) for the
+      // harness trace analyzer to resolve minified frames against.
+      sourcemap: env.VITE_BUILD_SOURCEMAP === 'true' ? 'hidden' : false,
+    },
     plugins: [react()],
     define: {
       'process.env.API_KEY': JSON.stringify(env.GEMINI_API_KEY),
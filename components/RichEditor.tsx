@@ -370,6 +370,7 @@ export const RichEditor: React.FC<RichEditorProps> = React.memo(({
               <button
                 className="flex items-center gap-1 px-2 py-1 rounded hover:bg-slate-200 text-xs font-semibold text-slate-700"
                 onMouseDown={(e) => { e.preventDefault(); setShowSizePicker(!showSizePicker); }}
+                title="Font Size"
               >
                 <Type size={14} />
                 <ChevronDown size={10} />
@@ -219,3 +219,9 @@ export const useBoardStore = create<BoardState>((set, get) => ({
   activePanel: 'none',
   setActivePanel: (activePanel) => set({ activePanel })
 }));
+
+// Dev builds expose the store so the canvas benchmark
+// (testsprite_tests/harness/canvas.py) can load strokes without drawing them.
+if (import.meta.env.DEV) {
+  (window as any).__qbankBoardStore = useBoardStore;
+}
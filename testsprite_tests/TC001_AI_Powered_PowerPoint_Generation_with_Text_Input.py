@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -55,9 +57,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        await asyncio.sleep(5)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
 
     finally:
         if context:
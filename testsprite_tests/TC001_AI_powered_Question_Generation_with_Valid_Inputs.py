@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -48,45 +50,46 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Try to reload the page or open a new tab to navigate to a known URL for Creator mode or AI question generation interface.
         await page.goto('http://localhost:3003/creator', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click on the 'Creator Studio' button to enter the AI question generation interface.
         frame = context.pages[-1]
         # Click on the 'Creator Studio' button to enter the AI question generation interface.
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click on the 'Intelligence Lab' menu item on the left sidebar to access AI question generation interface.
         frame = context.pages[-1]
         # Click on 'Intelligence Lab' in the left sidebar to access AI question generation interface.
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Input valid parameters for subject, difficulty level, language, and question type, then trigger AI question generation by clicking 'Initialize Synthesis'.
         frame = context.pages[-1]
         # Input '5' as the number of questions to generate
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('5')
+        await waits.settle(page, elem); await elem.fill('5')
         
 
         frame = context.pages[-1]
         # Click 'Initialize Synthesis' to trigger AI question generation
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
-        await expect(frame.locator('text=Group stage matches of the ICC U19 Men\'s Cricket World Cup 2026 were played on January 18, 2026. Which two nations are co-hosting this edition of the tournament?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Global leaders gathered in Davos on January 18, 2026, for the Annual Meeting of the World Economic Forum (WEF) starting the next day. What is the official theme of the WEF 2026 Annual Meeting?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, citizens of which European country went to the polls to elect a new President, as the incumbent Marcelo Rebelo de Sousa completed his term?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, millions of devotees in India observed \'Mauni Amavasya\' by taking a holy dip in sacred rivers. This auspicious day falls in which month of the Hindu calendar?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=The main draw matches of the Australian Open 2026, the first Grand Slam tennis tournament of the year, commenced on January 18, 2026. In which city is this tournament held?').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
+        await waits.expect_texts(frame, [
+            "Group stage matches of the ICC U19 Men's Cricket World Cup 2026 were played on January 18, 2026. Which two nations are co-hosting this edition of the tournament?",
+            'Global leaders gathered in Davos on January 18, 2026, for the Annual Meeting of the World Economic Forum (WEF) starting the next day. What is the official theme of the WEF 2026 Annual Meeting?',
+            'On January 18, 2026, citizens of which European country went to the polls to elect a new President, as the incumbent Marcelo Rebelo de Sousa completed his term?',
+            "On January 18, 2026, millions of devotees in India observed 'Mauni Amavasya' by taking a holy dip in sacred rivers. This auspicious day falls in which month of the Hindu calendar?",
+            'The main draw matches of the Australian Open 2026, the first Grand Slam tennis tournament of the year, commenced on January 18, 2026. In which city is this tournament held?',
+        ], timeout_ms=30000)
+
     finally:
         if context:
             await context.close()
@@ -0,0 +1,30 @@
+# Compiled from testsprite_frontend_test_plan.json (TC001, step hash c35d15acf9af3e01) by `python -m harness compile`.
+# Edit the plan or harness/steps.py, not this file.
+import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+        # -> Open the Bilingual Refinement Studio in English mode.
+        await s.open_refinement_studio(language='English')
+
+        # -> Enter sample question content in English.
+        await s.enter_text(language='English')
+
+        # -> Switch the editor language to Hindi.
+        await s.switch_language(language='Hindi')
+
+        # --> Check that the English content is cleared and Hindi mode editor is empty.
+        await s.expect_language_cleared(language='English')
+
+        # -> Enter sample question content in Hindi.
+        await s.enter_text(language='Hindi')
+
+        # -> Switch back to English.
+        await s.switch_language(language='English')
+
+        # --> Verify that Hindi content is cleared and English editor is empty or shows previously saved English content correctly after editor remount.
+        await s.expect_language_cleared(language='Hindi')
+
+asyncio.run(run_test())
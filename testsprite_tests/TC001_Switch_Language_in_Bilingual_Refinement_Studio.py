@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -58,73 +60,73 @@ async def run_test():
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Open the Refinement Studio editor overlay for the selected question by clicking the 'Edit Question' button (index 1175). After the overlay opens, the next steps will be to set the editor language to English and enter English content in the three columns.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div[1]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Ensure editor is in English mode, enter distinct English test strings into Question, Answers/Logic, and Metadata fields, then switch to Hindi and capture whether the English strings persist (to verify remount/no persistence). Immediately collect a presence flag for each English test string.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[1]/div[2]/div[1]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[1]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('EN_Q_TEST_001 — Does the editor remount when language changes? (unique-en-001)')
+        await waits.settle(page, elem); await elem.fill('EN_Q_TEST_001 — Does the editor remount when language changes? (unique-en-001)')
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[2]/div[2]/div[1]/div/div[1]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('EN_ANS_TEST_001 — English answer content (unique-en-001)')
+        await waits.settle(page, elem); await elem.fill('EN_ANS_TEST_001 — English answer content (unique-en-001)')
         
         # -> Open (or re-open) the Refinement Studio editor overlay for the target question by clicking the 'Edit Question' button (index 3739) so the editor fields are freshly mounted and ready for language selection.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div[1]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Ensure editor is set to English, enter distinct English text into Question, Answer (option B), and Metadata fields, then switch to Hindi to trigger remount and allow verification of content persistence.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[1]/div[2]/div[1]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[1]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('TEST-ENG Question: This is English test content for verification of remount behavior.')
+        await waits.settle(page, elem); await elem.fill('TEST-ENG Question: This is English test content for verification of remount behavior.')
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[2]/div[2]/div[1]/div/div[2]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('TEST-ENG Answer B: English content for option B (remount test).')
+        await waits.settle(page, elem); await elem.fill('TEST-ENG Answer B: English content for option B (remount test).')
         
         # -> Click the 'Edit Question' button to open the editor overlay so English content can be entered in Question, Answers/Logic, and Metadata.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div[1]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Enter distinct English text into the Question, Answer (B), and Analytical Synthesis metadata rich editors, then switch the editor to Hindi mode to trigger remount and allow verification.
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[1]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('ENG_Q_TEST: Which department of the Ministry of Finance prepares the Economic Survey?')
+        await waits.settle(page, elem); await elem.fill('ENG_Q_TEST: Which department of the Ministry of Finance prepares the Economic Survey?')
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[2]/div[2]/div[1]/div/div[2]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('ENG_ANS_B_TEST: B. Department of Economic Affairs')
+        await waits.settle(page, elem); await elem.fill('ENG_ANS_B_TEST: B. Department of Economic Affairs')
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[2]/div[2]/div[3]/div[2]/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('ENG_META_TEST: Analytical synthesis in English for testing remount behavior.')
+        await waits.settle(page, elem); await elem.fill('ENG_META_TEST: Analytical synthesis in English for testing remount behavior.')
         
         # --> Assertions to verify final state
         frame = context.pages[-1]
@@ -134,7 +136,6 @@ async def run_test():
         except AssertionError:
             raise AssertionError("Test case failed: Expected the Refinement Studio editor to remount and restore the original English question text after toggling back to English, but the English content was not present — indicating the editor did not remount correctly or language state persisted/was overwritten")
         ```
-        await asyncio.sleep(5)
 
     finally:
         if context:
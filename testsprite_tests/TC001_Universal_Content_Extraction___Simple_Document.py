@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -50,7 +52,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click on 'Tools' to enter environment for document import and text extraction
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Retry clicking 'Tools' button or find alternative navigation to Tools environment.
@@ -60,28 +62,28 @@ async def run_test():
         frame = context.pages[-1]
         # Retry clicking 'Tools' button to enter Tools environment
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click on 'PDF to Text AI' to launch the text extraction tool for DOCX import.
         frame = context.pages[-1]
         # Click 'PDF to Text AI' to launch the text extraction tool
         elem = frame.locator('xpath=html/body/div/div/div[2]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Check if AI Proofreader or Question Formatter tools support DOCX import or text extraction.
         frame = context.pages[-1]
         # Click 'AI Proofreader' to check if it supports DOCX import and text extraction
         elem = frame.locator('xpath=html/body/div/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click 'AI Proofreader' launch link to check if it supports DOCX import and text extraction.
         frame = context.pages[-1]
         # Click 'LAUNCH TOOL' under AI Proofreader to open the tool
         elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -90,8 +92,7 @@ async def run_test():
             await expect(frame.locator('text=Document Extraction Complete and Formatting Preserved').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: The system did not correctly extract and preserve text from the simple DOCX document as required by the test plan.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
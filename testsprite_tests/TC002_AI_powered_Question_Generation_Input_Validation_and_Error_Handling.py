@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -48,56 +50,56 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Try to open a new tab or reload the page to see if the interface appears or if there is any navigation option.
         await page.goto('http://localhost:3003/creator', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click on the 'Creator Studio' button to enter the AI question generation interface.
         frame = context.pages[-1]
         # Click on the 'Creator Studio' button to enter the AI question generation interface.
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click on the 'AI ANSWER' tab in the left sidebar to try to access the AI question generation interface.
         frame = context.pages[-1]
         # Click on the 'AI ANSWER' tab in the left sidebar to access AI question generation interface.
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click on the 'AI Answer' tab (index 4) to access the AI question generation interface.
         frame = context.pages[-1]
         # Click on the 'AI Answer' tab to access the AI question generation interface.
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Input invalid or missing values for subject, difficulty, and language dropdowns and attempt to trigger question generation to verify error messages.
         frame = context.pages[-1]
         # Click the button to trigger AI question generation with invalid or missing inputs.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Try clicking the 'AI Book' tab button with index 5 as an alternative to access AI question generation or related interface for input validation testing.
         frame = context.pages[-1]
         # Click on the 'AI Book' tab to try to access AI question generation or related interface.
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Try to clear or reset the Topics to Cover field using alternative methods such as clicking and sending backspace keys or ignoring this field and proceed to click 'Design Structure' button to check for validation errors.
         frame = context.pages[-1]
         # Click the Topics to Cover field to focus it.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div[2]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Report the website issue regarding the lack of input validation and error messages on the AI Book Architect interface and stop further testing.
         frame = context.pages[-1]
         # Click the 'Report Issue' button to report the lack of input validation and error messages on the AI Book Architect interface.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[4]/div[7]/div[2]/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -106,8 +108,7 @@ async def run_test():
             await expect(frame.locator('text=Question Generation Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test failed: The system did not detect invalid or incomplete inputs during AI question generation and did not display appropriate error messages as required by the test plan.')
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
@@ -0,0 +1,18 @@
+# Compiled from testsprite_frontend_test_plan.json (TC002, step hash e3b4748786607485) by `python -m harness compile`.
+# Edit the plan or harness/steps.py, not this file.
+import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+        # -> Open the Bilingual Refinement Studio.
+        await s.open_refinement_studio()
+
+        # --> Confirm that three columns labelled Question, Answers/Logic, and Metadata are visible and properly aligned.
+        await s.expect_labels(labels='Question, Answers/Logic, and Metadata')
+
+        # --> Verify that content can be entered and scrolled independently in each column.
+        await s.expect_independent_scroll()
+
+asyncio.run(run_test())
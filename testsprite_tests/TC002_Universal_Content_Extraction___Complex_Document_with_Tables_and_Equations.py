@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -59,8 +61,7 @@ async def run_test():
             await expect(frame.locator('text=Extraction Complete: Complex Nested Tables, Images, and Equations Preserved')).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: The extraction and preservation of complex nested tables, images, and equations from the PDF input did not succeed as expected.')
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
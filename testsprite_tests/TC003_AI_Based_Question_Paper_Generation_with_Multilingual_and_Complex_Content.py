@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -76,7 +78,6 @@ async def run_test():
             await expect(frame.locator('text=Question Paper Generated: 100% Content Preserved').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: Expected the paper generation to preserve 100% of uploaded content (complex tables, LaTeX/MathML equations, images, and Hindi/English multilingual text) and display a confirmation, but the confirmation did not appear — generated/exported document likely lost or misrendered content")
-        await asyncio.sleep(5)
 
     finally:
         if context:
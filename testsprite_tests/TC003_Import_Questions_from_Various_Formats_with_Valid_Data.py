@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -58,7 +60,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click 'Enter Environment' button under Creator Studio
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -67,8 +69,7 @@ async def run_test():
             await expect(frame.locator('text=Import Successful! Questions Loaded').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test failed: Importing question sets from supported formats did not result in successful creation and display of questions as expected.')
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -59,35 +61,35 @@ async def run_test():
 
         # -> Open a new tab to search for the import document functionality or related help.
         await page.goto('http://localhost:3000/import', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click on the 'Creator Studio' button to enter the environment for synthesizing bilingual assessments and managing institutional cloud libraries.
         frame = context.pages[-1]
         # Click on 'Creator Studio' to enter the environment for bilingual content management
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Locate and click on an option or button to import a document containing mixed Hindi and English paragraphs with complex font styles.
         frame = context.pages[-1]
         # Click on 'Curation Studio' to explore options for content import or editing
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click on the 'AI Answer' button to check if it provides document import or upload functionality for mixed Hindi and English content.
         frame = context.pages[-1]
         # Click on 'AI Answer' to explore document import or upload options
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Try clicking the 'Intelligence Lab' button to check if it provides document import or upload functionality for mixed Hindi and English content.
         frame = context.pages[-1]
         # Click on 'Intelligence Lab' to explore document import or upload options
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Locate and click on any button or menu that allows importing or uploading a document containing mixed Hindi and English paragraphs with complex font styles.
@@ -100,8 +102,7 @@ async def run_test():
             await expect(frame.locator('text=Document Import Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: The test plan execution failed because the system did not preserve multilingual content including Hindi and English with correct font rendering and special characters as expected.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
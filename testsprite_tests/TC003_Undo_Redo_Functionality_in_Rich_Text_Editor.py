@@ -0,0 +1,30 @@
+# Compiled from testsprite_frontend_test_plan.json (TC003, step hash 0902d7dac0c4eb37) by `python -m harness compile`.
+# Edit the plan or harness/steps.py, not this file.
+import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+        # -> Open the Advanced Rich Text Editor.
+        await s.open_editor()
+
+        # -> Enter some text content.
+        await s.enter_text()
+
+        # -> Make several edits by adding, deleting, and formatting text.
+        await s.several_edits()
+
+        # -> Trigger Undo multiple times.
+        await s.press_history(action='Undo')
+
+        # --> Confirm that text reverts step by step correctly to previous states.
+        await s.expect_undo_steps()
+
+        # -> Trigger Redo multiple times.
+        await s.press_history(action='Redo')
+
+        # --> Confirm that undone changes are restored step by step correctly.
+        await s.expect_redo_steps()
+
+asyncio.run(run_test())
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -52,28 +54,28 @@ async def run_test():
 
         # -> Try to reload the page or open a new tab to check if the upload interface or document upload option is available elsewhere.
         await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click on the 'Creator Studio' button to enter the environment for content creation and upload.
         frame = context.pages[-1]
         # Click on Creator Studio to enter the environment for content creation and document upload
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Validate AI detection accuracy by comparing extracted question metadata with expected classifications and verify if accuracy is above 95%.
         frame = context.pages[-1]
         # Click on 'AI Answer' or relevant menu to access AI detection validation tools or reports.
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Upload or input the diverse question set document or text into the source material area to initiate AI detection and validation.
         frame = context.pages[-1]
         # Click on the PDF tab to upload a document with diverse questions for AI detection validation.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div[3]/div[2]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -83,25 +85,28 @@ async def run_test():
         await expect(frame.locator('text=On January 24, 2026, which country launched the 'Green Energy Corridor Project' with assistance from India, aimed at promoting renewable energy development and cross-border electricity trade? What is the project's initial capacity?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=According to a report released on January 24, 2026, which Indian city was ranked as the 'Most Congested City in the World' for the year 2025? What was the key factor contributing to this ranking?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=On January 24, 2026, which Indian state government announced a new initiative, 'Mission Niryat Protsahan,' aimed at boosting exports from the state? What is the primary focus of this mission?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which major economic policy change was announced by the Indian government on January 24, 2026, related to renewable energy?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 24, 2026, ISRO launched which satellite to improve weather forecasting capabilities?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=What was the key highlight of the Union Budget preview discussed on January 24, 2026, regarding fiscal deficit targets?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Who was appointed as the new Chief Election Commissioner of India on January 24, 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 24, 2026, India signed a bilateral trade agreement with which country to enhance economic ties?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 24, 2026, which Indian state announced a new policy for renewable energy targets aiming for 50% solar power by 2030?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=The main draw matches of the Australian Open 2026, the first Grand Slam tennis tournament of the year, commenced on January 18, 2026. In which city is this tournament held?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Global leaders gathered in Davos on January 18, 2026, for the Annual Meeting of the World Economic Forum (WEF) starting the next day. What is the official theme of the WEF 2026 Annual Meeting?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, citizens of which European country went to the polls to elect a new President, as the incumbent Marcelo Rebelo de Sousa completed his term?').first).to_be_visible(timeout=30000)
+        await waits.expect_texts(frame, [
+            'Which major economic policy change was announced by the Indian government on January 24, 2026, related to renewable energy?',
+            'On January 24, 2026, ISRO launched which satellite to improve weather forecasting capabilities?',
+            'What was the key highlight of the Union Budget preview discussed on January 24, 2026, regarding fiscal deficit targets?',
+            'Who was appointed as the new Chief Election Commissioner of India on January 24, 2026?',
+            'On January 24, 2026, India signed a bilateral trade agreement with which country to enhance economic ties?',
+            'On January 24, 2026, which Indian state announced a new policy for renewable energy targets aiming for 50% solar power by 2030?',
+            'The main draw matches of the Australian Open 2026, the first Grand Slam tennis tournament of the year, commenced on January 18, 2026. In which city is this tournament held?',
+            'Global leaders gathered in Davos on January 18, 2026, for the Annual Meeting of the World Economic Forum (WEF) starting the next day. What is the official theme of the WEF 2026 Annual Meeting?',
+            'On January 18, 2026, citizens of which European country went to the polls to elect a new President, as the incumbent Marcelo Rebelo de Sousa completed his term?',
+        ], timeout_ms=30000)
         await expect(frame.locator('text=On January 18, 2026, millions of devotees in India observed 'Mauni Amavasya' by taking a holy dip in sacred rivers. This auspicious day falls in which month of the Hindu calendar?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Group stage matches of the ICC U19 Men's Cricket World Cup 2026 were played on January 18, 2026. Which two nations are co-hosting this edition of the tournament?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=According to the Supreme Court ruling mentioned on Jan 18, 2026, private unaided schools must set aside what percentage of seats for EWS/DG children?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Where did the Olympic Torch Relay for the Milano Cortina 2026 Winter Olympics arrive on January 18, 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which missile was demonstrated to be capable of destroying components of the S-400 system in a report dated January 18, 2026?').first).to_be_visible(timeout=30000)
+        await waits.expect_texts(frame, [
+            'According to the Supreme Court ruling mentioned on Jan 18, 2026, private unaided schools must set aside what percentage of seats for EWS/DG children?',
+            'Where did the Olympic Torch Relay for the Milano Cortina 2026 Winter Olympics arrive on January 18, 2026?',
+            'Which missile was demonstrated to be capable of destroying components of the S-400 system in a report dated January 18, 2026?',
+        ], timeout_ms=30000)
         await expect(frame.locator('text=The 'Binaliw landslide' search operations concluded on January 18, 2026. In which country did this disaster occur?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=What was the theme for the 56th Annual Meeting of the World Economic Forum (2026), as mentioned by the UN Secretary-General?').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=The Men's EHF EURO 2026 (European Handball Championship) is being co-hosted by which group of countries?').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
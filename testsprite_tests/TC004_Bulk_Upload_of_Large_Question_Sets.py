@@ -1,5 +1,7 @@
 import asyncio
+import os
 from playwright import async_api
+from harness import bulkupload, waits
 
 async def run_test():
     pw = None
@@ -17,56 +19,28 @@ async def run_test():
                 "--window-size=1280,720",         # Set the browser window size
                 "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
                 "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
             ],
         )
 
         # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
-
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
+        context = await browser.new_context(viewport={"width": 1280, "height": 720})
+        await waits.install(context)
+        context.set_default_timeout(30000)
+
+        # -> Upload synthetic CSV, XLSX and JSON question sets through bulkUploadService,
+        # timing parse, normalize, validate and save and reading the JS heap after each stage.
+        results = await bulkupload.run(
+            context,
+            os.environ.get("QBANK_APP_URL", "http://localhost:3000"),
+            scales=bulkupload.parse_levels(os.environ.get("QBANK_BULK_ROWS", "1k")),
+            formats=bulkupload.parse_formats(os.environ.get("QBANK_BULK_FORMATS", "csv,xlsx,json")),
+        )
+        bulkupload.write(results)
 
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        # -> Open the Bulk Upload interface in the Creator Dashboard. No clickable navigation found on the root page, so attempt direct navigation to the Creator Dashboard route to reveal the Bulk Upload UI.
-        await page.goto("http://localhost:3000/creator/dashboard", wait_until="commit", timeout=10000)
-        
-        # -> Attempt direct navigation to the Bulk Upload route to open the Bulk Upload interface (use go_to_url since no clickable navigation exists on the page).
-        await page.goto("http://localhost:3000/creator/dashboard/bulk-upload", wait_until="commit", timeout=10000)
-        
-        # -> Click the Reload button on the error page to attempt to recover the server response and load the Bulk Upload UI (element index 74).
-        frame = context.pages[-1]
-        # Click element
-        elem = frame.locator('xpath=html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
         # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=1000 Questions Imported Successfully').first).to_be_visible(timeout=3000)
-        except AssertionError:
-            raise AssertionError("Test case failed: Verify bulk import of 1000 questions completed successfully and displayed a confirmation; the expected success message did not appear, indicating the upload may have failed or the confirmation UI is missing")
-        await asyncio.sleep(5)
+        problems = bulkupload.check(results)
+        if problems:
+            raise AssertionError('Test case failed: the bulk upload did not account for every row:\n' + '\n'.join(problems))
 
     finally:
         if context:
@@ -77,4 +51,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
@@ -0,0 +1,21 @@
+# Compiled from testsprite_frontend_test_plan.json (TC004, step hash 1d5441b6be74bbd9) by `python -m harness compile`.
+# Edit the plan or harness/steps.py, not this file.
+import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+        # -> Open the Advanced Rich Text Editor in a question creation form.
+        await s.open_editor()
+
+        # -> Place cursor inside the editor text area.
+        await s.focus_editor()
+
+        # -> Select and insert various mathematical symbols (e.g., ∑, ∫, √, π) from the Math Symbol insertion tool.
+        await s.insert_math_symbols()
+
+        # --> Verify that each selected symbol is inserted at the correct cursor position within the text.
+        await s.expect_symbols_inserted()
+
+asyncio.run(run_test())
@@ -1,5 +1,7 @@
 import asyncio
+import os
 from playwright import async_api
+from harness import keylatency, waits
 
 async def run_test():
     pw = None
@@ -17,38 +19,30 @@ async def run_test():
                 "--window-size=1280,720",         # Set the browser window size
                 "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
                 "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
             ],
         )
 
         # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
-
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
-        await asyncio.sleep(5)
+        context = await browser.new_context(viewport={"width": 1280, "height": 720})
+        await waits.install(context)
+        context.set_default_timeout(30000)
+
+        # -> Load the Creator inventory with 10K questions (QBANK_KEY_SCALES=10k,100k adds 100K),
+        # type and delete search queries key by key and toggle every filter, timing each input
+        # to the next paint.
+        results = await keylatency.run(
+            context,
+            os.environ.get("QBANK_APP_URL", "http://localhost:3000"),
+            scales=keylatency.parse_levels(os.environ.get("QBANK_KEY_SCALES", "10k")),
+        )
+        keylatency.write(results)
+
+        # --> Assertions to verify final state
+        violations = keylatency.check(
+            results, keylatency.parse_targets(os.environ.get("QBANK_KEY_TARGETS", keylatency.DEFAULT_TARGETS))
+        )
+        if violations:
+            raise AssertionError('Test case failed: search and filtering lag behind typing:\n' + '\n'.join(violations))
 
     finally:
         if context:
@@ -59,4 +53,3 @@ async def run_test():
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
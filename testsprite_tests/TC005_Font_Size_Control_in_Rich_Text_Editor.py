@@ -0,0 +1,27 @@
+# Compiled from testsprite_frontend_test_plan.json (TC005, step hash acd500f501a9675a) by `python -m harness compile`.
+# Edit the plan or harness/steps.py, not this file.
+import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+        # -> Enter a sample paragraph into the Advanced Rich Text Editor.
+        await s.enter_text()
+
+        # -> Select a portion of the text.
+        await s.select_text()
+
+        # -> Change font size using the Font Size control to various sizes (small, medium, large).
+        await s.set_font_size(sizes='small, medium, large')
+
+        # --> Check that the font size of the selected text changes immediately as per selection.
+        await s.expect_style(target='font size')
+
+        # -> Save changes and reload the editor.
+        await s.save_and_reload()
+
+        # --> Confirm that the font size changes persist after reload.
+        await s.expect_persisted()
+
+asyncio.run(run_test())
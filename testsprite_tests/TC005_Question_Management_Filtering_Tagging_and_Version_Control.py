@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -54,94 +56,95 @@ async def run_test():
         frame = context.pages[-1]
         # Click on the 'Creator Studio' button to enter the question management dashboard
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Try to click on 'Curation Studio' to access question tagging and version management features.
         frame = context.pages[-1]
         # Click on 'Curation Studio' to access question tagging and version management
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click the '+ NEW SET' button to initialize a new assessment node and activate the studio for question management.
         frame = context.pages[-1]
         # Click the '+ NEW SET' button to initialize a new assessment node and activate the studio
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Try to locate the correct input field for 'INSTITUTIONAL LABEL' or use alternative input methods to fill the form and proceed with initializing the assessment set.
         frame = context.pages[-1]
         # Try filling the 'INSTITUTIONAL LABEL' input field with a test label using index 10
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Assessment Set v1.0')
+        await waits.settle(page, elem); await elem.fill('Test Assessment Set v1.0')
         
 
         frame = context.pages[-1]
         # Try filling the executive summary in the same input field if applicable
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('This is a test assessment set for verifying question filtering, tagging, and version management.')
+        await waits.settle(page, elem); await elem.fill('This is a test assessment set for verifying question filtering, tagging, and version management.')
         
 
         frame = context.pages[-1]
         # Click 'Init' button to proceed with initialization
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Navigate to the Curation Studio to test tagging questions and managing question versions.
         frame = context.pages[-1]
         # Click on 'Curation Studio' to access question tagging and version management features
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Test creating a new version of a question and view version history to verify version management functionality.
         frame = context.pages[-1]
         # Click the 'Edit Question' button on the first question card to open question details for version management.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[4]/div/div[2]/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
-        await expect(frame.locator('text=Filters').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Language').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Quality').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Domain').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Focus').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Sample Questions (Current Affairs, Medium Difficulty, Jan 18, 2026)').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Group stage matches of the ICC U19 Men\'s Cricket World Cup 2026 were played on January 18, 2026. Which two nations are co-hosting this edition of the tournament?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Global leaders gathered in Davos on January 18, 2026, for the Annual Meeting of the World Economic Forum (WEF) starting the next day. What is the official theme of the WEF 2026 Annual Meeting?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, citizens of which European country went to the polls to elect a new President, as the incumbent Marcelo Rebelo de Sousa completed his term?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, millions of devotees in India observed \'Mauni Amavasya\' by taking a holy dip in sacred rivers. This auspicious day falls in which month of the Hindu calendar?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=The main draw matches of the Australian Open 2026, the first Grand Slam tennis tournament of the year, commenced on January 18, 2026. In which city is this tournament held?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=According to the Supreme Court ruling mentioned on Jan 18, 2026, private unaided schools must set aside what percentage of seats for EWS/DG children?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Where did the Olympic Torch Relay for the Milano Cortina 2026 Winter Olympics arrive on January 18, 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which missile was demonstrated to be capable of destroying components of the S-400 system in a report dated January 18, 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=The \'Binaliw landslide\' search operations concluded on January 18, 2026. In which country did this disaster occur?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=What was the theme for the 56th Annual Meeting of the World Economic Forum (2026), as mentioned by the UN Secretary-General?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=The Men\'s EHF EURO 2026 (European Handball Championship) is being co-hosted by which group of countries?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, which country\'s tribal forces allied with the government army took control of the Mashlab neighbourhood in Raqqa?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=The \'Week of Prayer for Christian Unity\' typically begins on which date, observed in 2026 on a Sunday?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which organization released the \'Export Preparedness Index\' mentioned in the news on January 18, 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which Deputy Prime Minister of Poland began a three-day visit to India on January 18, 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=According to news from January 18, 2026, who serves as the Prime Minister of Yemen?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which Indian city was chosen to host the 9th International Spice Conference (ISC 2026)?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, Commerce Minister Piyush Goyal announced that the India-EU Free Trade Agreement (FTA) is expected to conclude by which date?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which global day is observed on the third Sunday of January, falling on January 18 in 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=What major recent finding from the Chang\'e-6 mission was reported in the news on January 18, 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which Indian bank\'s \'Solar-Powered Mobile ATM\' was highlighted in current affairs on January 18, 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=The \'Integrated Ombudsman Scheme 2026\' mentioned in the news is an initiative of which institution?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which actor and politician was conferred the \'Fifth Dan\' black belt by Sogo Budo Kanri Kai in January 2026?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, the US Ambassador to India, Sergio Gor, met with which Indian official?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=On January 18, 2026, the United Nations Secretary-General arrived in Switzerland to attend which major annual summit?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Who has been appointed as the Goodwill Ambassador for the \'Bajaj Pune Grand Tour 2026\' to promote professional cycling in India?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=The Indian Navy\'s First Training Squadron arrived in Singapore on January 18, 2026, as part of which commemorative year?').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Which country held its Presidential Election on January 18, 2026?').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
+        await waits.expect_texts(frame, [
+            'Filters',
+            'Language',
+            'Quality',
+            'Domain',
+            'Focus',
+            'Sample Questions (Current Affairs, Medium Difficulty, Jan 18, 2026)',
+            "Group stage matches of the ICC U19 Men's Cricket World Cup 2026 were played on January 18, 2026. Which two nations are co-hosting this edition of the tournament?",
+            'Global leaders gathered in Davos on January 18, 2026, for the Annual Meeting of the World Economic Forum (WEF) starting the next day. What is the official theme of the WEF 2026 Annual Meeting?',
+            'On January 18, 2026, citizens of which European country went to the polls to elect a new President, as the incumbent Marcelo Rebelo de Sousa completed his term?',
+            "On January 18, 2026, millions of devotees in India observed 'Mauni Amavasya' by taking a holy dip in sacred rivers. This auspicious day falls in which month of the Hindu calendar?",
+            'The main draw matches of the Australian Open 2026, the first Grand Slam tennis tournament of the year, commenced on January 18, 2026. In which city is this tournament held?',
+            'According to the Supreme Court ruling mentioned on Jan 18, 2026, private unaided schools must set aside what percentage of seats for EWS/DG children?',
+            'Where did the Olympic Torch Relay for the Milano Cortina 2026 Winter Olympics arrive on January 18, 2026?',
+            'Which missile was demonstrated to be capable of destroying components of the S-400 system in a report dated January 18, 2026?',
+            "The 'Binaliw landslide' search operations concluded on January 18, 2026. In which country did this disaster occur?",
+            'What was the theme for the 56th Annual Meeting of the World Economic Forum (2026), as mentioned by the UN Secretary-General?',
+            "The Men's EHF EURO 2026 (European Handball Championship) is being co-hosted by which group of countries?",
+            "On January 18, 2026, which country's tribal forces allied with the government army took control of the Mashlab neighbourhood in Raqqa?",
+            "The 'Week of Prayer for Christian Unity' typically begins on which date, observed in 2026 on a Sunday?",
+            "Which organization released the 'Export Preparedness Index' mentioned in the news on January 18, 2026?",
+            'Which Deputy Prime Minister of Poland began a three-day visit to India on January 18, 2026?',
+            'According to news from January 18, 2026, who serves as the Prime Minister of Yemen?',
+            'Which Indian city was chosen to host the 9th International Spice Conference (ISC 2026)?',
+            'On January 18, 2026, Commerce Minister Piyush Goyal announced that the India-EU Free Trade Agreement (FTA) is expected to conclude by which date?',
+            'Which global day is observed on the third Sunday of January, falling on January 18 in 2026?',
+            "What major recent finding from the Chang'e-6 mission was reported in the news on January 18, 2026?",
+            "Which Indian bank's 'Solar-Powered Mobile ATM' was highlighted in current affairs on January 18, 2026?",
+            "The 'Integrated Ombudsman Scheme 2026' mentioned in the news is an initiative of which institution?",
+            "Which actor and politician was conferred the 'Fifth Dan' black belt by Sogo Budo Kanri Kai in January 2026?",
+            'On January 18, 2026, the US Ambassador to India, Sergio Gor, met with which Indian official?',
+            'On January 18, 2026, the United Nations Secretary-General arrived in Switzerland to attend which major annual summit?',
+            "Who has been appointed as the Goodwill Ambassador for the 'Bajaj Pune Grand Tour 2026' to promote professional cycling in India?",
+            "The Indian Navy's First Training Squadron arrived in Singapore on January 18, 2026, as part of which commemorative year?",
+            'Which country held its Presidential Election on January 18, 2026?',
+        ], timeout_ms=30000)
+
     finally:
         if context:
             await context.close()
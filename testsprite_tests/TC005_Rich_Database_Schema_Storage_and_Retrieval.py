@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -56,21 +58,21 @@ async def run_test():
 
         # -> Try to open developer console or check if there is a hidden menu or shortcut to add a question, or try to reload the page.
         await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click the 'Creator Studio' button to enter the environment for creating and managing complex questions.
         frame = context.pages[-1]
         # Click the 'Creator Studio' button to enter the environment for creating and managing questions
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Locate and click the button or interface to create a new complex question with nested tables, images, and equations.
         frame = context.pages[-1]
         # Click the 'Curation Studio' button to access question creation and editing environment
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -79,8 +81,7 @@ async def run_test():
             await expect(frame.locator('text=Complex Question Successfully Saved').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The database did not store or retrieve the complex question object correctly within 500ms as required by the test plan.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
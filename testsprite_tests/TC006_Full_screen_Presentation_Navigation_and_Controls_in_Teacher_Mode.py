@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -52,8 +54,7 @@ async def run_test():
             await expect(frame.locator('text=Presentation Completed Successfully').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError("Test case failed: The full-screen presentation mode did not start or function correctly. Navigation through questions, timer counting, and bookmark toggling did not perform as expected.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
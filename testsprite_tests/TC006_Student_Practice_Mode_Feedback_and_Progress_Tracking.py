@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -67,48 +69,48 @@ async def run_test():
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div[1]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the 'Daily' filter to attempt to load available practice sets (index 361). If no content appears, try other filters or use the Direct Access Code input and search.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div[1]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the 'Weekly' filter (index 362) to check for available practice sets or further UI behavior.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div[2]/div[1]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the 'Monthly' filter (index 363) to check for available practice sets. If Monthly shows none, then try 'Yearly' (index 364) or use Direct Access Code input (index 368) and Search (index 369).
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div[2]/div[1]/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Enter a Direct Access Code into the Direct Access input (index 430) and click the Search button (index 508) to attempt to load a practice set.
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('DEMO123')
+        await waits.settle(page, elem); await elem.fill('DEMO123')
         
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the Search button (index 508) to run the Direct Access Code DEMO123 again and check whether a practice set loads. If content appears, proceed to select the question set and continue the validation steps; if not, prepare to report a website issue.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the 'Yearly' filter (index 504) to check whether any practice sets appear in that category.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div[2]/div[1]/button[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
         frame = context.pages[-1]
@@ -116,7 +118,6 @@ async def run_test():
             await expect(frame.locator('text=Session Summary').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: The test expected a 'Session Summary' with personalized recommendations and updated progress to appear after completing the practice session (verifying instant feedback and progress tracking), but the session summary did not appear.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -0,0 +1,33 @@
+# Compiled from testsprite_frontend_test_plan.json (TC006, step hash 1be1ee413341ea85) by `python -m harness compile`.
+# Edit the plan or harness/steps.py, not this file.
+import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+        # -> Input text into the Advanced Rich Text Editor.
+        await s.enter_text()
+
+        # -> Select a section of the text.
+        await s.select_text()
+
+        # -> Change the text color using the text color picker.
+        await s.set_color(target='text')
+
+        # --> Verify the selected text color updates immediately.
+        await s.expect_style(target='text color')
+
+        # -> Change the background color of the selected text using the background color picker.
+        await s.set_color()
+
+        # --> Verify the background color updates immediately.
+        await s.expect_style(target='background color')
+
+        # -> Save changes and reload editor.
+        await s.save_and_reload()
+
+        # --> Ensure the selected colors persist after reload.
+        await s.expect_persisted()
+
+asyncio.run(run_test())
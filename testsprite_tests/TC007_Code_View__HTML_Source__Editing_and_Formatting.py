@@ -0,0 +1,30 @@
+# Compiled from testsprite_frontend_test_plan.json (TC007, step hash 46580b9eae29a919) by `python -m harness compile`.
+# Edit the plan or harness/steps.py, not this file.
+import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+        # -> Open the Advanced Rich Text Editor.
+        await s.open_editor()
+
+        # -> Enter some formatted content (text with bold, color, and math symbols).
+        await s.enter_formatted()
+
+        # -> Toggle to Code View to edit HTML source.
+        await s.code_view(mode='Code')
+
+        # --> Verify displayed HTML source is correctly formatted and represents the visual content.
+        await s.expect_source_matches()
+
+        # -> Edit the HTML source code, such as changing tags or content.
+        await s.edit_source()
+
+        # -> Toggle back to visual editor mode.
+        await s.code_view(mode='visual')
+
+        # --> Confirm the visual editor reflects the updated source content properly.
+        await s.expect_visual_matches_source()
+
+asyncio.run(run_test())
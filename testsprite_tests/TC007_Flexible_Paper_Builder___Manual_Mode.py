@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -52,33 +54,33 @@ async def run_test():
 
         # -> Try to open a new tab or navigate to a known URL for paper builder or question paper creation interface.
         await page.goto('http://localhost:3000/paper-builder', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click on 'Creator Studio' Enter Environment button to open the environment for paper creation.
         frame = context.pages[-1]
         # Click on 'Creator Studio' Enter Environment button
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Select and drag at least 10 questions to the paper builder area for manual paper creation.
         frame = context.pages[-1]
         # Select first question to drag
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Select second question to drag
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[6]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Select third question to drag
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[6]/div[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Find and interact with the manual paper creation or paper builder interface to drag and drop at least 10 questions.
@@ -89,21 +91,21 @@ async def run_test():
         frame = context.pages[-1]
         # Click '+ IN' button to add questions to paper builder
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Try to scroll to the '+ IN' button to make it visible and clickable, then attempt clicking it again.
         frame = context.pages[-1]
         # Click '+ IN' button to add questions to paper builder
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click the '+ IN' button (index 12) to add selected questions to the paper builder.
         frame = context.pages[-1]
         # Click '+ IN' button to add questions to paper builder
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -112,8 +114,7 @@ async def run_test():
             await expect(frame.locator('text=Paper saved successfully with correct order and metadata').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: The paper was not saved correctly with question order and metadata preserved as required by the test plan.')
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
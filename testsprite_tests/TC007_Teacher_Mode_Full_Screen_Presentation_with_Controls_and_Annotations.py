@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -55,7 +57,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Reload the app by re-navigating to http://localhost:3000 (last-resort navigation since no interactive elements are present). After reload, check for login/Teacher Mode controls and interactive elements.
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
@@ -69,7 +71,6 @@ async def run_test():
             await expect(frame.locator('text=Presentation Analytics').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: Expected 'Presentation Analytics' to be visible in Teacher Mode full-screen presentation (verifying analytics display for question responses and time spent), but it did not appear.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
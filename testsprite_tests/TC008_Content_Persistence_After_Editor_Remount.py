@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -55,89 +57,87 @@ async def run_test():
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Open the Refinement/Curation Studio overlay so the language toggle and RichEditor can be located (click 'Curation Studio' button). Then wait for the overlay to load.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the 'Curation Studio' button (index 886) to open the Refinement Studio overlay, then wait for the overlay to load so the language toggle and RichEditor can be located.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the 'Refine' button on the Demo card to open the Refinement Studio editor overlay, then wait for it to load so the language toggle and RichEditor can be located.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div/div[3]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the Edit (pencil) button for the displayed item to open the editor overlay, wait for it to load, then evaluate the DOM to locate the language toggle and the RichEditor (contenteditable/textarea).
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div[1]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the Edit (pencil) button for the item (use fresh index=2306), wait for the editor overlay to load, then evaluate the DOM to find language toggle elements (English/Hindi) and rich editor elements (contenteditable/textarea/input).
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div[1]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Append a persistent marker to English editor fields, switch to Hindi to force remount, switch back to English, then extract the editor texts to verify the marker remains present in each field.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[1]/div[2]/div[1]/button[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[1]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill(' [PERSIST_TEST_EN]')
+        await waits.settle(page, elem); await elem.fill(' [PERSIST_TEST_EN]')
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div[2]/div[2]/div[1]/div/div[2]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill(' [PERSIST_TEST_EN]')
+        await waits.settle(page, elem); await elem.fill(' [PERSIST_TEST_EN]')
         
         # -> Click the item's Edit button (index=4866) to open the editor overlay, wait for the overlay to mount, then inspect the DOM to find the English/Hindi language toggle(s) and the RichEditor contenteditable/textarea fields so the persistence test can proceed.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div[1]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Click the item's Edit (pencil) button at index=5321 to open the editor overlay so language toggles and RichEditor fields can be accessed for the persistence test.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div[1]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # -> Append marker ' [PERSIST_TEST_EN]' to the main question, option B and explanation in English; switch to Hindi and then back to English to force editor remount; then extract the three fields' text to verify the marker persisted.
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[1]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill(' [PERSIST_TEST_EN]')
+        await waits.settle(page, elem); await elem.fill(' [PERSIST_TEST_EN]')
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[2]/div[2]/div[1]/div/div[2]/div[2]/div/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill(' [PERSIST_TEST_EN]')
+        await waits.settle(page, elem); await elem.fill(' [PERSIST_TEST_EN]')
         
         frame = context.pages[-1]
         # Input text
         elem = frame.locator('xpath=html/body/div[1]/div/div[2]/div/div[2]/div/div[2]/div[2]/div[3]/div[2]/div[2]/div[1]').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill(' [PERSIST_TEST_EN]')
+        await waits.settle(page, elem); await elem.fill(' [PERSIST_TEST_EN]')
         
         # -> Open the item's editor again (click the Edit button) so the language toggles and editor fields can be accessed, then proceed to perform the language switches and extraction.
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div[1]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-        await asyncio.sleep(5)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
 
     finally:
         if context:
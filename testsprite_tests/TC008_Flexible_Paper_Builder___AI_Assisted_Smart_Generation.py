@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -52,28 +54,28 @@ async def run_test():
 
         # -> Try refreshing the page to see if the content loads properly or if there is a loading issue.
         await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click on 'Creator Studio' button to enter the environment for AI-assisted question paper generation.
         frame = context.pages[-1]
         # Click on Creator Studio to enter the environment for AI-assisted question paper generation
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Select a topic from the Domain dropdown, set difficulty from Quality dropdown, and then click the 'Intelligence Lab' button to trigger AI-assisted question paper generation.
         frame = context.pages[-1]
         # Click 'Intelligence Lab' button to trigger AI-assisted question paper generation
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click the 'Generate' button to trigger AI-assisted question paper generation based on the selected parameters.
         frame = context.pages[-1]
         # Click 'Generate' button to trigger AI-assisted question paper generation
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -82,8 +84,7 @@ async def run_test():
             await expect(frame.locator('text=AI Generated Question Paper Ready').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: AI-assisted generation of question papers did not produce the expected output based on selected topics, difficulty, and marks constraints.')
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -54,7 +56,6 @@ async def run_test():
             await expect(frame.locator('text=Canvas content persisted after reload').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: Verify that drawings, inserted shapes/images, and annotations persist after saving the session and reloading SmartBoard — the expected confirmation 'Canvas content persisted after reload' was not found, indicating the canvas state did not restore correctly.")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -57,8 +59,7 @@ async def run_test():
         # --> Assertions to verify final state
         frame = context.pages[-1]
         await expect(frame.locator('text=Q-Bank Pro').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
@@ -0,0 +1,21 @@
+# Compiled from testsprite_frontend_test_plan.json (TC008, step hash dd0a758b22ce9a46) by `python -m harness compile`.
+# Edit the plan or harness/steps.py, not this file.
+import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+        # -> Open the Advanced Rich Text Editor.
+        await s.open_editor()
+
+        # --> Verify all expected toolbar buttons and controls are visible and correctly labeled with tooltips.
+        await s.expect_toolbar_tooltips()
+
+        # -> Navigate toolbar using keyboard (Tab and arrow keys).
+        await s.keyboard_toolbar()
+
+        # --> Ensure focus moves appropriately and controls are operable via keyboard only.
+        await s.expect_keyboard_operable()
+
+asyncio.run(run_test())
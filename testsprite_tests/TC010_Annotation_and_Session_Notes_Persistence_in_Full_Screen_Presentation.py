@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -57,7 +59,6 @@ async def run_test():
             await expect(frame.locator('text=Annotations and session notes restored').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test case failed: The test attempted to verify that annotations and session notes added during the Teacher Mode full-screen presentation were saved and correctly restored after reopening the saved session, but the expected restored annotations/notes did not appear (data was not persisted or not rehydrated on reload).")
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -58,7 +60,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click on Creator Studio to enter the environment for managing and synthesizing assessments
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Locate or select a question paper or assessment containing complex tables, images, and equations for export.
@@ -69,14 +71,14 @@ async def run_test():
         frame = context.pages[-1]
         # Select the first question item with text, images, and formatting
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Try clicking the 'Edit Question' button (index 22) for the first question item to open it for export testing.
         frame = context.pages[-1]
         # Click 'Edit Question' button for the first question item to open it for export testing
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -85,8 +87,7 @@ async def run_test():
             await expect(frame.locator('text=Export Successful! All formats verified.').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Export of question papers did not preserve tables, images, equations, and formatting correctly across DOCX, PDF, HTML, Markdown, and Google Docs formats as required by the test plan.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
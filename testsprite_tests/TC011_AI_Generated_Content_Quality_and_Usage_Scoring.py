@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -58,7 +60,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click element
         elem = frame.locator('xpath=html/body/div[1]/div[1]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
         # --> Assertions to verify final state
         frame = context.pages[-1]
@@ -68,7 +70,6 @@ async def run_test():
         except AssertionError:
             raise AssertionError("Test case failed: Expected AI-generated presentation content and question papers to report an internal Usage-Quality Score of 4/5 or higher after submission, but the expected score did not appear (indicating the score is missing or below the required threshold)")
         ```
-        await asyncio.sleep(5)
 
     finally:
         if context:
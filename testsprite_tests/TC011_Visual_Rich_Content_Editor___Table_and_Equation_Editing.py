@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -58,35 +60,35 @@ async def run_test():
 
         # -> Try to reload the page or open a new tab to find a way to create a new question or access the visual editor.
         await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click on the 'Creator Studio' button to enter the environment for content creation.
         frame = context.pages[-1]
         # Click on the 'Creator Studio' button to enter the environment for content creation.
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click on the 'Curation Studio' button (index 3) to access the content creation and editing environment where tables and equations can be embedded.
         frame = context.pages[-1]
         # Click on the 'Curation Studio' button to access content creation and editing environment.
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Look for a button or link to create a new question or open the visual editor, possibly by clicking the '+ IN' button (index 12) or using the search or filter options.
         frame = context.pages[-1]
         # Click on the '+ IN' button to create a new question or open the visual editor.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click on the 'Edit Question' button (index 22) of the first question to open the visual editor for editing and embedding tables and equations.
         frame = context.pages[-1]
         # Click on the 'Edit Question' button of the first question to open the visual editor.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[5]/div/div[2]/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -95,8 +97,7 @@ async def run_test():
             await expect(frame.locator('text=Complex Table and Equation Successfully Saved').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed to confirm that edits to tables and equations are correctly saved and visually rendered in the editor.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 
 async def run_test():
     pw = None
@@ -23,6 +24,7 @@ async def run_test():
 
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
 
         # Open a new page in the browser context
@@ -56,7 +58,6 @@ async def run_test():
         except AssertionError:
             raise AssertionError("Test case failed: The test attempted to verify that all API endpoints enforce role-based access control (authorized roles allowed; unauthorized requests denied) and that rate limiting triggers appropriate responses under high request rates. The expected confirmation 'RBAC and Rate Limiting Verified' did not appear, so access controls or rate limiting did not behave as expected.")
         ```
-        await asyncio.sleep(5)
 
     finally:
         if context:
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -54,14 +56,14 @@ async def run_test():
         frame = context.pages[-1]
         # Click Creator Studio button to check if it receives focus and is keyboard accessible
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Manually focus each interactive element by clicking and then use keyboard navigation to verify focus visibility and logical tab order. Also check ARIA attributes and roles for accessibility compliance.
         frame = context.pages[-1]
         # Click Global Inventory button to focus and check keyboard accessibility
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -70,8 +72,7 @@ async def run_test():
             await expect(frame.locator('text=Accessibility Compliance Passed').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: The platform does not meet WCAG 2.1 Level AA standards including full keyboard navigation and screen reader compatibility as required by the test plan.')
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
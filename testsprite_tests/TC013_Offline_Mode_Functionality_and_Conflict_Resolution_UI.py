@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -56,26 +58,26 @@ async def run_test():
 
         # -> Try to navigate directly to a known URL path for question sets or infinite canvas or open a new tab to search for navigation options.
         await page.goto('http://localhost:3003/question-sets', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Try to navigate to the infinite canvas page or find a way to create a new question set or canvas content.
         await page.goto('http://localhost:3003/infinite-canvas', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Enter the Creator Studio environment to access question sets and canvas for offline mode testing.
         frame = context.pages[-1]
         # Click on 'Creator Studio' Enter Environment button to access question sets and canvas.
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Simulate going offline, make edits to question sets or canvas, then return online to test synchronization and conflict resolution UI.
         frame = context.pages[-1]
         # Click on the search input to focus and prepare for offline edits.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Try to find a button or menu to create a new question set or open an existing one, or reload the page to check for UI rendering issues.
@@ -84,32 +86,32 @@ async def run_test():
 
         # -> Try to reload the page to see if UI elements load properly or try to navigate to a different environment or page that might have question sets or canvas content.
         await page.goto('http://localhost:3003/infinite-canvas?view=student', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         await page.goto('http://localhost:3003/infinite-canvas?view=creator', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Simulate going offline, make edits such as editing a question, then go back online to verify synchronization and conflict resolution UI if conflicts occur.
         frame = context.pages[-1]
         # Click 'Edit Question' button on the first question set to make offline edits.
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[4]/div/div[2]/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Simulate going offline, make edits such as adding or modifying question vectors or response vectors, then go back online to verify synchronization and conflict resolution UI if conflicts occur.
         frame = context.pages[-1]
         # Click on 'Init Option 05' to add a new option as part of offline edit.
         elem = frame.locator('xpath=html/body/div/div/div[2]/div/div[2]/div/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Simulate going offline, make edits such as modifying the new response vector, then go back online to verify synchronization and conflict resolution UI if conflicts occur.
         frame = context.pages[-1]
         # Click the Admin button to simulate offline mode toggle or access offline mode controls.
         elem = frame.locator('xpath=html/body/div/div/div/header/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -118,8 +120,7 @@ async def run_test():
             await expect(frame.locator('text=Offline Mode Sync Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Offline mode changes did not sync correctly or conflict resolution UI did not appear as expected after reconnecting online.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
@@ -1,70 +1,33 @@
 import asyncio
 from playwright import async_api
+from harness import load
 
 async def run_test():
     pw = None
-    browser = None
-    context = None
 
     try:
         # Start a Playwright session in asynchronous mode
         pw = await async_api.async_playwright().start()
 
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
+        # Drive 500 virtual users through the StudentView practice and CreatorDashboard
+        # browse flows: most replay the app's HTTP traffic, a few click through real
+        # browser contexts. Sizes, URLs and thresholds come from QBANK_LOAD_* variables,
+        # Supabase settings from VITE_SUPABASE_* or testsprite_tests/standin/.env.standin.
+        config = load.LoadConfig.from_env()
+        report = await load.LoadEngine(pw, config).run()
+        report.write(load.REPORT_PATH)
 
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-
-        # Open a new page in the browser context
-        page = await context.new_page()
-
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
-        
         # --> Assertions to verify final state
-        frame = context.pages[-1]
-        ```
-        try:
-            await expect(frame.locator('text=Load Test Passed - System Stable Under 500+ Concurrent Users').first).to_be_visible(timeout=3000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The test attempted to verify system performance and stability under a load of 500+ concurrent users by expecting a 'Load Test Passed - System Stable Under 500+ Concurrent Users' confirmation. The expected confirmation did not appear, indicating possible degraded response times, errors, crashes, data loss, or prominent UI freezes during the load test.")
-        ```
-        await asyncio.sleep(5)
+        if not sum(report.flows.values()):
+            raise AssertionError("Test case failed: no virtual user completed a flow; is the app and Supabase stand-in running and seeded?")
+        if not report.passed:
+            raise AssertionError(
+                f"Test case failed: load thresholds ({config.thresholds}) exceeded with {config.users} concurrent users:\n"
+                + "\n".join(report.violations)
+            )
 
     finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
         if pw:
             await pw.stop()
 
 asyncio.run(run_test())
-    
\ No newline at end of file
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -58,21 +60,21 @@ async def run_test():
         frame = context.pages[-1]
         # Click on 'Creator Studio' button to enter the environment for managing question sets
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Navigate to 'Curation Studio' (button index 3) to access question sets for export testing.
         frame = context.pages[-1]
         # Click on 'Curation Studio' to access question sets for export testing
         elem = frame.locator('xpath=html/body/div/div/aside/nav/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click on '+ NEW SE' button (index 10) to create a new question set for export testing.
         frame = context.pages[-1]
         # Click on '+ NEW SE' button to create a new question set
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Locate and click on an export option/button for a question set or selected questions to initiate export.
@@ -86,7 +88,7 @@ async def run_test():
         frame = context.pages[-1]
         # Click 'Select All' button to select all question cards for export
         elem = frame.locator('xpath=html/body/div/div/div/main/div/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Locate and click on the export option/button to initiate export of selected questions.
@@ -107,14 +109,14 @@ async def run_test():
         frame = context.pages[-1]
         # Click on the 'Global Inventory' button to check for export options
         elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click the export button to open export options and initiate export for each supported format (PDF, DOCX, JSON, CSV, image).
         frame = context.pages[-1]
         # Click the export button (arrow up icon) to open export options
         elem = frame.locator('xpath=html/body/div/div/div/header/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -123,8 +125,7 @@ async def run_test():
             await expect(frame.locator('text=Export Successful! Your files are ready to download.').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Export functionality of question sets and associated annotations to PDF, DOCX, JSON, CSV, and image formats did not complete successfully. The exported files may be missing proper formatting, metadata, or embedded images/annotations as required by the test plan.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
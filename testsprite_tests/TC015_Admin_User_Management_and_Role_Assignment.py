@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -56,8 +58,7 @@ async def run_test():
             await expect(frame.locator('text=User Role Assignment Successful').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan to verify administrators can create user accounts, assign roles, and modify permissions securely did not pass. The expected confirmation message 'User Role Assignment Successful' was not found, indicating role changes or permission assignments did not take effect as required.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
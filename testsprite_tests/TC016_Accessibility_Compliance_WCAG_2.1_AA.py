@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -51,8 +53,7 @@ async def run_test():
             await expect(page.locator('text=Accessibility Perfect! No WCAG Violations Detected').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test failed: Accessibility audit detected critical WCAG 2.1 Level AA violations or keyboard navigation issues. The application does not meet the required accessibility standards.')
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
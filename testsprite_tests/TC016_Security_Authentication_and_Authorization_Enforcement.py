@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -48,26 +50,26 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Attempt to access Creator, Teacher, Student, and Admin modes without login to verify unauthenticated access is denied.
         await page.goto('http://localhost:3003/creator', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click 'Enter Environment' button for Creator Studio to verify if unauthenticated access is blocked.
         frame = context.pages[-1]
         # Click 'Enter Environment' button for Creator Studio to test access without login
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Reload the main page to reset context and then retry logout to clear session for unauthenticated access testing.
         await page.goto('http://localhost:3003', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Click 'Enter Environment' button for Creator Studio to verify unauthenticated access is denied.
         frame = context.pages[-1]
         # Click 'Enter Environment' button for Creator Studio without login to test access restriction
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -76,8 +78,7 @@ async def run_test():
             await expect(frame.locator('text=Access Granted to Creator Mode').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test failed: Authentication and authorization enforcement failed. Unauthenticated or unauthorized access to Creator, Teacher, Student, or Admin modes was not properly blocked as per the test plan.")
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
@@ -1,5 +1,6 @@
 import asyncio
 from playwright import async_api
+from harness import waits
 from playwright.async_api import expect
 
 async def run_test():
@@ -24,6 +25,7 @@ async def run_test():
         
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
+        await waits.install(context)
         context.set_default_timeout(5000)
         
         # Open a new page in the browser context
@@ -52,21 +54,21 @@ async def run_test():
 
         # -> Try to open a new tab or navigate to a known URL for user data or audit logs, or report issue if no navigation possible.
         await page.goto('http://localhost:3003/userdata', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.settle(page)
         
 
         # -> Enter Creator Studio environment to review stored user data and audit logs.
         frame = context.pages[-1]
         # Click Creator Studio to enter environment for managing institutional cloud libraries and assessments
         elem = frame.locator('xpath=html/body/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # -> Click the Admin button (index 9) to access administrative settings for compliance review.
         frame = context.pages[-1]
         # Click Admin button to access administrative settings for compliance review
         elem = frame.locator('xpath=html/body/div/div/div/header/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.settle(page, elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -75,8 +77,7 @@ async def run_test():
             await expect(frame.locator('text=GDPR and FERPA compliance verified successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: Data encryption, audit logging, and data access do not comply with GDPR and FERPA requirements as expected. Compliance verification message not found on the page.')
-        await asyncio.sleep(5)
-    
+
     finally:
         if context:
             await context.close()
@@ -0,0 +1,23 @@
+"""Execution harness for the generated TestSprite Playwright scripts.
+
+Run from the ``testsprite_tests`` directory, e.g.::
+
+    python -m harness run --workers 8 --browsers 4
+
+The harness's own unit tests run with ``python -m pytest harness/tests``.
+"""
+from .loader import TestScript, discover, load_run_test
+from .runner import ERROR, FAILED, PASSED, RunConfig, SuiteRunner, TestOutcome, run_suite
+
+__all__ = [
+    "ERROR",
+    "FAILED",
+    "PASSED",
+    "RunConfig",
+    "SuiteRunner",
+    "TestOutcome",
+    "TestScript",
+    "discover",
+    "load_run_test",
+    "run_suite",
+]
@@ -0,0 +1,844 @@
+"""Command line entry point: ``python -m harness <command>``."""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import List, Optional
+
+from . import bankgen, baseline, bulkupload, canvas, cassettes, collab, compiler, ingest, journal, keylatency, leaks, load, mock_ai, network, pdfexport, profile, report, seed, startup, waits
+from playwright.async_api import async_playwright
+
+from .codemod import RewriteStats, rewrite_file
+from .impact import changed_files, select, verify
+from .loader import TESTS_DIR, discover
+from .pool import DEFAULT_LAUNCH_ARGS, BrowserPool, PooledPlaywright
+from .runner import RunConfig, TestOutcome, run_suite
+from .shard import parse_shard_spec, plan_shards
+from .sourcemap import DEFAULT_MAP_DIRS, SourceMapResolver
+
+
+def _print_outcome(outcome: TestOutcome) -> None:
+    saved = outcome.extra.get("waits", {}).get("savedMs", 0) / 1000.0
+    print(f"{outcome.status:<7} {outcome.duration:7.1f}s  (-{saved:5.1f}s settle)  {outcome.script.key}", flush=True)
+
+
+def _levels(spec: str) -> List[int]:
+    try:
+        return canvas.parse_levels(spec)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _count(spec: str) -> int:
+    levels = _levels(spec)
+    if len(levels) != 1:
+        raise argparse.ArgumentTypeError(f"expected one count, got {spec!r}")
+    return levels[0]
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    scripts = discover(patterns=args.tests)
+    if args.diff:
+        selection = select(changed_files(args.diff))
+        for path in selection.unmapped:
+            print(f"unmapped: {path}")
+        if selection.unmapped and not args.mapped_only:
+            print(f"{len(selection.unmapped)} changed sources map to no feature; running everything")
+        else:
+            impacted = {s.key for s in selection.scripts}
+            scripts = [s for s in scripts if s.key in impacted]
+    if args.shard:
+        index, count = parse_shard_spec(args.shard)
+        scripts = plan_shards(scripts, count).shards[index].scripts
+    if not scripts:
+        print("no matching TC scripts", file=sys.stderr)
+        return 2
+    results_path = Path(args.results) if args.results else None
+    report_path = Path(args.report) if results_path and args.report else None
+    log = journal.Journal(Path(args.journal) if args.journal else (
+        results_path.with_suffix(".jsonl") if results_path else journal.JOURNAL_PATH))
+    if args.resume:
+        done = log.passed_titles()
+        remaining = [s for s in scripts if report.normalize_title(s.title) not in done]
+        print(f"resuming from {log.path}: {len(scripts) - len(remaining)} already passed, {len(remaining)} to run")
+        scripts = remaining
+        if not scripts:
+            log.render(results_path, report_path)
+            return 0
+    else:
+        log.reset()
+    if args.mock_ai and args.cassettes != cassettes.OFF:
+        print("--mock-ai and --cassettes both intercept AI traffic; pick one", file=sys.stderr)
+        return 2
+    config = RunConfig(
+        workers=args.workers,
+        browsers=args.browsers,
+        timeout=args.timeout,
+        headless=not args.headed,
+        cassette_mode=args.cassettes,
+        cassette_dir=Path(args.cassette_dir),
+        replay_latency=cassettes.parse_latency(args.replay_latency),
+        mock_ai_url=args.mock_ai,
+        collect_vitals=not args.no_vitals,
+        profile=args.profile,
+        network=network.PROFILES[args.network] if args.network else None,
+    )
+
+    def on_result(outcome: TestOutcome) -> None:
+        _print_outcome(outcome)
+        log.append(report.to_record(outcome))
+        log.render(results_path, report_path)
+
+    outcomes = run_suite(scripts, config, on_result=on_result)
+    passed = sum(o.passed for o in outcomes)
+    wall = max(o.finished for o in outcomes) - min(o.started for o in outcomes)
+    busy = sum(o.duration for o in outcomes)
+    replaced = sum(o.extra.get("waits", {}).get("replacedMs", 0) for o in outcomes) / 1000.0
+    saved = sum(o.extra.get("waits", {}).get("savedMs", 0) for o in outcomes) / 1000.0
+    print(f"\n{passed}/{len(outcomes)} passed in {wall:.1f}s wall ({busy:.1f}s of test time)")
+    print(f"settle() saved {saved:.1f}s of the {replaced:.1f}s of fixed sleeps it replaced "
+          f"(trailing sleeps deleted by `rewrite` are not counted)")
+    if results_path:
+        print(f"results: {results_path}" + (f", report: {report_path}" if report_path else ""))
+    records = [report.to_record(o) for o in outcomes]
+    traces = [Path(o.extra["profile"]) for o in outcomes if "profile" in o.extra]
+    if traces:
+        _summarize_profiles(traces, args.sourcemaps)
+    regressions = []
+    # Throttled runs are not comparable with the normal history.
+    if not args.no_baseline and not args.network:
+        with closing(baseline.connect(Path(args.baseline_db))) as conn:
+            run_id = baseline.record_run(conn, records, label=args.label)
+            regressions = baseline.compare(conn, run_id)
+        _print_regressions(regressions)
+    if passed != len(outcomes):
+        return 1
+    return 1 if args.gate and regressions else 0
+
+
+def cmd_netmatrix(args: argparse.Namespace) -> int:
+    scripts = discover(patterns=args.tests)
+    if not scripts:
+        print("no matching TC scripts", file=sys.stderr)
+        return 2
+    profiles = [None] if args.baseline else []
+    profiles += network.parse_profiles(args.profiles)
+    cells = []
+    for net in profiles:
+        print(f"-- {net.name if net else 'none'}", flush=True)
+        config = RunConfig(workers=args.workers, browsers=args.browsers, timeout=args.timeout,
+                           headless=not args.headed, network=net, network_seed=args.seed)
+        for outcome in run_suite(scripts, config, on_result=_print_outcome):
+            cells.append(network.cell_from_outcome(outcome))
+    result = network.MatrixReport(cells, baseline="none" if args.baseline else None)
+    result.write(Path(args.json))
+    print()
+    print(result.render())
+    print(f"report: {args.json}")
+    return 0
+
+
+def _print_regressions(regressions: List[baseline.Regression]) -> None:
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("no regressions against the baseline")
+
+
+def _summarize_profiles(traces: List[Path], map_dirs: Optional[List[str]]) -> None:
+    resolver = SourceMapResolver([Path(d) for d in map_dirs] if map_dirs else DEFAULT_MAP_DIRS)
+    summary = profile.analyze_files(traces, resolver)
+    profile.write_summary(summary)
+    for key, result in summary.items():
+        top = result["hotFunctions"][0] if result["hotFunctions"] else None
+        hottest = f"{top['function']} {top['selfMs']:.0f}ms" if top else "-"
+        print(f"profile  {key}: hottest {hottest}, {len(result['reactCommits'])} slow commits")
+    print(f"profile summary: {profile.SUMMARY_JSON_PATH} and {profile.SUMMARY_HTML_PATH}")
+
+
+def cmd_baseline(args: argparse.Namespace) -> int:
+    with closing(baseline.connect(Path(args.db))) as conn:
+        if args.action == "record":
+            for path in args.results:
+                run_id = baseline.record_run(conn, report.load_results(Path(path)), label=args.label or path)
+                print(f"run {run_id}: recorded {path}")
+            return 0
+        if args.action == "compare":
+            regressions = baseline.compare(conn, args.run, args.window, args.z, args.min_runs)
+            _print_regressions(regressions)
+            return 1 if regressions else 0
+        names = baseline.tests(conn, args.tests)
+        if not names:
+            print(f"no recorded runs match in {args.db}", file=sys.stderr)
+            return 2
+        metrics = args.metrics or list(baseline.METRICS)
+        print("\n\n".join(baseline.render_trend(conn, name, metrics, args.last) for name in names))
+    return 0
+
+
+def cmd_profile(args: argparse.Namespace) -> int:
+    traces = [Path(p) for p in args.traces] or sorted(profile.PROFILE_DIR.glob("*.trace.json*"))
+    if not traces:
+        print(f"no traces in {profile.PROFILE_DIR}; record some with 'run --profile'", file=sys.stderr)
+        return 2
+    _summarize_profiles(traces, args.sourcemaps)
+    return 0
+
+
+def cmd_load(args: argparse.Namespace) -> int:
+    config = load.LoadConfig.from_env()
+    for attr in ("users", "browser_users", "browsers", "duration", "ramp_up", "answers", "seed", "thresholds"):
+        value = getattr(args, attr)
+        if value is not None:
+            setattr(config, attr, value)
+    if args.flows:
+        config.flows = load.parse_flows(args.flows)
+    config.app_url = args.app_url or config.app_url
+    config.supabase_url = args.supabase_url or config.supabase_url
+
+    def progress(stats: load.LoadStats, elapsed: float) -> None:
+        print(f"  {elapsed:5.0f}s  {sum(stats.flows.values())} flows", flush=True)
+
+    async def go() -> load.LoadReport:
+        if not config.browser_users:
+            async with async_playwright() as playwright:
+                return await load.LoadEngine(playwright, config, on_progress=progress).run()
+        async with BrowserPool(size=max(config.browsers, 1), headless=not args.headed) as pool:
+            return await load.LoadEngine(PooledPlaywright(pool), config, on_progress=progress).run()
+
+    result = asyncio.run(go())
+    result.write(Path(args.json))
+    print(result.render())
+    print(f"report: {args.json}")
+    return 0 if result.passed else 1
+
+
+def cmd_canvas_bench(args: argparse.Namespace) -> int:
+    async def go() -> List[canvas.LevelResult]:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not args.headed, args=DEFAULT_LAUNCH_ARGS)
+            try:
+                context = await browser.new_context(viewport={"width": 1280, "height": 720})
+                await waits.install(context)
+                page = await context.new_page()
+                await canvas.open_board(page, args.app_url, args.set_id)
+                return await canvas.CanvasBench(page, args.seed).run(args.strokes)
+            finally:
+                await browser.close()
+
+    results = asyncio.run(go())
+    canvas.write(results, Path(args.json))
+    print(canvas.render(results))
+    violations = canvas.check(results, canvas.parse_min_fps(args.min_fps))
+    for violation in violations:
+        print(f"FAIL {violation}")
+    return 1 if violations else 0
+
+
+def cmd_leaks(args: argparse.Namespace) -> int:
+    def progress(cycle: int, used_kb: float) -> None:
+        print(f"  cycle {cycle:3d}  {used_kb:9.0f} KB", flush=True)
+
+    async def go() -> leaks.LeakReport:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not args.headed, args=DEFAULT_LAUNCH_ARGS)
+            try:
+                context = await browser.new_context(viewport={"width": 1280, "height": 720})
+                await waits.install(context)
+                page = await context.new_page()
+                await page.goto(args.app_url)
+                await waits.settle(page)
+                return await leaks.run(page, args.cycles, args.warmup, args.set_id,
+                                       leaks.LeakThresholds.parse(args.thresholds), on_cycle=progress)
+            finally:
+                await browser.close()
+
+    result = asyncio.run(go())
+    result.write(Path(args.json))
+    print(result.render())
+    return 0 if result.passed else 1
+
+
+def cmd_startup(args: argparse.Namespace) -> int:
+    unknown = [r for r in args.routes if r not in startup.ROUTES]
+    if unknown:
+        raise SystemExit(f"unknown routes {unknown}; choose from {sorted(startup.ROUTES)}")
+    resolver = SourceMapResolver([Path(d) for d in args.sourcemaps]) if args.sourcemaps else None
+
+    def progress(stats: startup.LoadStats) -> None:
+        tti = f"{stats.tti_ms:.0f}ms" if stats.tti_ms is not None else "-"
+        print(f"  {stats.route:<12}{stats.mode:<6}TTI {tti:>8}  {stats.modules:4d} scripts  "
+              f"{stats.js_bytes / 1024:7.0f} KB", flush=True)
+
+    async def go() -> startup.StartupReport:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not args.headed, args=DEFAULT_LAUNCH_ARGS)
+            try:
+                bench = startup.StartupBench(
+                    browser, {"admin": args.app_url, "canvas": args.canvas_url}, args.set_id, args.quiet_ms, resolver
+                )
+                return await bench.run(args.routes or list(startup.ROUTES), args.runs, on_load=progress)
+            finally:
+                await browser.close()
+
+    result = asyncio.run(go())
+    result.write(Path(args.json))
+    print(result.render())
+    print(f"report: {args.json}")
+    return 0
+
+
+def cmd_key_latency(args: argparse.Namespace) -> int:
+    def progress(result: keylatency.ScaleResult) -> None:
+        stats = result.stats()
+        print(f"  {result.questions:>7} questions  load {result.load_ms:7.0f}ms  "
+              f"p50 {stats['p50']:6.1f}ms  p95 {stats['p95']:6.1f}ms", flush=True)
+
+    async def go() -> List[keylatency.ScaleResult]:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not args.headed, args=DEFAULT_LAUNCH_ARGS)
+            try:
+                context = await browser.new_context(viewport={"width": 1280, "height": 720})
+                await waits.install(context)
+                return await keylatency.run(
+                    context, args.app_url, args.scales,
+                    [q for q in args.queries.split(",") if q], args.seed, args.intercept, on_scale=progress,
+                )
+            finally:
+                await browser.close()
+
+    results = asyncio.run(go())
+    keylatency.write(results, Path(args.json))
+    print(keylatency.render(results))
+    violations = keylatency.check(results, keylatency.parse_targets(args.targets))
+    for violation in violations:
+        print(f"FAIL {violation}")
+    return 1 if violations else 0
+
+
+def cmd_bulk_upload(args: argparse.Namespace) -> int:
+    def progress(result: bulkupload.UploadResult) -> None:
+        stages = "  ".join(f"{s.stage} {s.ms:.0f}ms" for s in result.stages)
+        print(f"  {result.format:<5}{result.rows:>8} rows  {stages}  peak {result.peak_kb / 1024:.0f} MB", flush=True)
+
+    async def go() -> List[bulkupload.UploadResult]:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not args.headed, args=DEFAULT_LAUNCH_ARGS)
+            try:
+                context = await browser.new_context(viewport={"width": 1280, "height": 720})
+                await waits.install(context)
+                return await bulkupload.run(
+                    context, args.app_url, args.rows, bulkupload.parse_formats(args.formats),
+                    args.seed, args.invalid, on_upload=progress,
+                )
+            finally:
+                await browser.close()
+
+    results = asyncio.run(go())
+    bulkupload.write(results, Path(args.json))
+    print(bulkupload.render(results))
+    problems = bulkupload.check(results)
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+
+def cmd_bulk_file(args: argparse.Namespace) -> int:
+    started = time.monotonic()
+    path = bulkupload.write_file(Path(args.out), args.rows, args.seed, args.invalid)
+    print(f"wrote {path} ({path.stat().st_size / 2**20:.1f} MB) in {time.monotonic() - started:.1f}s")
+    return 0
+
+
+def cmd_gen_bank(args: argparse.Namespace) -> int:
+    lengths = bankgen.calibrate(Path(args.lengths_from)) if args.lengths_from else None
+    for kind, model in (lengths or bankgen.default_lengths()).items():
+        print(f"{kind:<9} words per sentence: {model.describe()}")
+    stats = bankgen.generate(Path(args.out), args.rows, args.seed, lengths, args.chunk_rows)
+    print(f"wrote {stats.path} ({stats.bytes / 2**20:.1f} MB) in {stats.seconds:.1f}s, {stats.rows_per_s:,.0f} rows/s")
+    return 0
+
+
+def cmd_pdf_export(args: argparse.Namespace) -> int:
+    def progress(result: pdfexport.ExportResult) -> None:
+        status = result.error or f"{result.ms:.0f}ms  {result.pages} pages  {result.bytes / 1024:.0f} KB"
+        print(f"  {result.engine:<24}{result.questions:>6} questions  {status}", flush=True)
+
+    async def go() -> List[pdfexport.ExportResult]:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not args.headed, args=DEFAULT_LAUNCH_ARGS)
+            try:
+                context = await browser.new_context(viewport={"width": 1280, "height": 720}, accept_downloads=True)
+                await waits.install(context)
+                return await pdfexport.run(
+                    context, args.app_url, args.sizes, pdfexport.parse_engines(args.engines),
+                    args.seed, on_export=progress,
+                )
+            finally:
+                await browser.close()
+
+    results = asyncio.run(go())
+    pdfexport.write(results, Path(args.json))
+    print(pdfexport.render(results))
+    errors = pdfexport.check(results)
+    for error in errors:
+        print(f"FAIL {error}")
+    return 1 if errors else 0
+
+
+def cmd_collab(args: argparse.Namespace) -> int:
+    async def go() -> collab.CollabReport:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=not args.headed, args=DEFAULT_LAUNCH_ARGS)
+            try:
+                return await collab.run(browser, args.app_url, args.clients, args.strokes, args.interval_ms,
+                                        args.relay_delay_ms, args.set_id, args.seed)
+            finally:
+                await browser.close()
+
+    result = asyncio.run(go())
+    result.write(Path(args.json))
+    print(result.render())
+    violations = result.check(args.max_p95)
+    for violation in violations:
+        print(f"FAIL {violation}")
+    return 1 if violations else 0
+
+
+def cmd_sync_server(args: argparse.Namespace) -> int:
+    server = collab.make_server(args.host, args.port, args.relay_delay_ms)
+    print(f"board sync server on http://{args.host}:{args.port} (relay delay {args.relay_delay_ms:g}ms)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def cmd_mock_ai(args: argparse.Namespace) -> int:
+    profile = mock_ai.build_profile(
+        args.profile, args.latency, args.rate_limit, args.max_concurrency, args.stream_chunk_ms, args.seed
+    )
+    server = mock_ai.make_server(args.host, args.port, profile)
+    print(f"mock Gemini/Replicate on http://{args.host}:{args.port} ({args.profile}: {profile})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def cmd_seed(args: argparse.Namespace) -> int:
+    rows = args.rows or seed.SCALES[args.scale]
+    timings = seed.seed(rows, args.tables or list(seed.TABLES), args.dsn, not args.append, args.seed)
+    total = rows * len(timings)
+    elapsed = sum(timings.values())
+    print(f"seeded {total:,} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+    return 0
+
+
+def cmd_ingest(args: argparse.Namespace) -> int:
+    def progress(result: ingest.IngestResult) -> None:
+        print(f"\rbatch {result.batch_id}: {result.rows:,} rows, {result.saved:,} saved, {result.failed:,} failed "
+              f"({result.rows_per_s:,.0f} rows/s)", end="", flush=True)
+
+    result = ingest.ingest(Path(args.file), args.dsn, args.file_name, args.chunk_rows, progress)
+    print(f"\rbatch {result.batch_id}: {result.saved:,} of {result.rows:,} rows saved, {result.failed:,} failed "
+          f"validation, in {result.seconds:.1f}s ({result.rows_per_s:,.0f} rows/s)" + " " * 10)
+    return 0
+
+
+def cmd_select(args: argparse.Namespace) -> int:
+    if args.verify:
+        failures = verify()
+        for failure in failures:
+            print(f"FAIL {failure}")
+        return 1 if failures else 0
+    selection = select(changed_files(args.base))
+    if args.json:
+        print(json.dumps([s.key for s in selection.scripts]))
+        return 0
+    print(f"changed:  {len(selection.changed)} files ({len(selection.impacted)} incl. importers)")
+    print(f"features: {', '.join(selection.features) or '-'}")
+    print(f"test ids: {', '.join(selection.tc_ids) or '-'}")
+    for path in selection.unmapped:
+        print(f"unmapped: {path}")
+    if selection.unscripted:
+        print(f"no script for: {', '.join(selection.unscripted)}")
+    print(f"\n{len(selection.scripts)} of {len(discover())} scripts selected:")
+    for script in selection.scripts:
+        print(f"  {script.key}")
+    return 0
+
+
+def cmd_shard(args: argparse.Namespace) -> int:
+    scripts = discover(patterns=args.tests)
+    plan = plan_shards(scripts, args.count)
+    if args.json:
+        print(json.dumps([[s.key for s in shard.scripts] for shard in plan.shards], indent=2))
+    else:
+        for shard in plan.shards:
+            print(f"shard {shard.index + 1}/{args.count}: {len(shard.scripts):3d} tests, ~{shard.total:7.1f}s")
+        print(f"longest shard is {plan.imbalance * 100:.1f}% above the mean of {plan.mean:.1f}s")
+    if not args.spawn:
+        return 0
+
+    # Run every shard as its own local process, then merge their outputs.
+    out_dir = Path(args.out_dir)
+    procs = []
+    for shard in plan.shards:
+        shard_dir = out_dir / f"shard-{shard.index + 1}"
+        cmd = [
+            sys.executable, "-m", "harness", "run", *args.tests,
+            "--shard", f"{shard.index + 1}/{args.count}",
+            "--workers", str(args.workers),
+            "--browsers", str(args.browsers),
+            "--results", str(shard_dir / "test_results.json"),
+            "--no-baseline",
+        ]
+        procs.append(subprocess.Popen(cmd, cwd=TESTS_DIR))
+    codes = [p.wait() for p in procs]
+    shard_results = [out_dir / f"shard-{i + 1}" / "test_results.json" for i in range(args.count)]
+    records = _merge([p for p in shard_results if p.exists()], Path(args.results), Path(args.report))
+    # A shard that exits 1 ran to the end with failing tests, which `run` records
+    # too; any other code, or no results, means part of the suite never ran.
+    broken = [
+        shard.index + 1 for shard, code, path in zip(plan.shards, codes, shard_results)
+        if shard.scripts and (code not in (0, 1) or not path.exists())
+    ]
+    if broken:
+        print(f"not recorded in the baseline: shard {', '.join(map(str, broken))} did not finish")
+    elif not args.no_baseline:
+        # The shards skip the baseline so the merged suite is recorded as one run.
+        failed = sum(code == 1 for code in codes)
+        label = args.label or f"{args.count} shards" + (f", {failed} with failures" if failed else "")
+        with closing(baseline.connect(Path(args.baseline_db))) as conn:
+            baseline.record_run(conn, records, label=label)
+    return max(codes)
+
+
+def _merge(inputs: List[Path], results: Path, report_path: Path) -> List[dict]:
+    records = report.merge_records(*(report.load_results(p) for p in inputs))
+    report.write_results(records, results)
+    report.write_report(records, report_path)
+    return records
+
+
+def cmd_merge(args: argparse.Namespace) -> int:
+    records = _merge([Path(p) for p in args.inputs], Path(args.results), Path(args.report))
+    passed = sum(r.get("testStatus") == "PASSED" for r in records)
+    print(f"merged {len(records)} results from {len(args.inputs)} files ({passed} passed) into {args.results}")
+    return 0
+
+
+def cmd_rewrite(args: argparse.Namespace) -> int:
+    total = RewriteStats()
+    for script in discover(patterns=args.tests):
+        stats = rewrite_file(script.path, dry_run=args.dry_run)
+        if stats.settles or stats.trailing_ms or stats.batched:
+            print(f"{stats.settles:3d} waits, -{stats.trailing_ms / 1000:.0f}s trailing sleep, "
+                  f"{stats.batched:2d} text checks batched  {script.key}")
+        total += stats
+    # Deleted trailing sleeps never reach settle(), so run's wait figures leave them out.
+    print(f"\n{total.settles} fixed sleeps replaced by settle(), {total.trailing_ms / 1000:.0f}s of trailing sleep "
+          f"deleted outright, {total.batched} text assertions batched")
+    return 0
+
+
+def cmd_compile(args: argparse.Namespace) -> int:
+    results = compiler.Compiler(force=args.force, prune=args.prune).compile(args.ids, write=not args.check)
+    print(compiler.render_report(results))
+    if args.check:
+        stale = [r for r in results if r.status in (compiler.CREATED, compiler.UPDATED)]
+        for result in stale:
+            print(f"out of date: {result.path.name}")
+        return 1 if stale else 0
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m harness")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run TC scripts on a pool of warm browsers")
+    run.add_argument("tests", nargs="*", help="substrings of script names to run (default: all)")
+    run.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 4, help="tests running at once")
+    run.add_argument("-b", "--browsers", type=int, default=2, help="browsers kept warm in the pool")
+    run.add_argument("--timeout", type=float, default=300.0, help="per-test timeout in seconds")
+    run.add_argument("--headed", action="store_true", help="show the browser windows")
+    run.add_argument("--diff", nargs="?", const="HEAD", metavar="BASE", help="run only tests impacted since BASE")
+    run.add_argument("--mapped-only", action="store_true",
+                     help="with --diff, run only the selection even if a change maps to no feature")
+    run.add_argument("--shard", metavar="I/N", help="run only shard I of N (1-based)")
+    run.add_argument("--cassettes", choices=cassettes.MODES, default=cassettes.OFF,
+                     help="record/replay Gemini and Replicate traffic (auto: replay hits, record misses)")
+    run.add_argument("--cassette-dir", default=str(cassettes.CASSETTE_DIR), help="cassette store location")
+    run.add_argument("--replay-latency", default="none", metavar="none|recorded|MS",
+                     help="delay replayed AI responses")
+    run.add_argument("--mock-ai", metavar="URL", help="send Gemini/Replicate traffic to a 'mock-ai' server")
+    run.add_argument("--no-vitals", action="store_true", help="skip the Web Vitals/long-task metrics block")
+    run.add_argument("--profile", action="store_true",
+                     help="record a CDP trace per test and summarize hot functions (one test per browser)")
+    run.add_argument("--network", choices=sorted(network.PROFILES),
+                     help="run under an emulated network profile (not recorded in the baseline)")
+    run.add_argument("--sourcemaps", action="append", metavar="DIR",
+                     help="with --profile, where the build's .map files are (default apps/admin/dist/assets)")
+    run.add_argument("--no-baseline", action="store_true", help="do not append this run to the baseline database")
+    run.add_argument("--baseline-db", default=str(baseline.DEFAULT_DB), help="baseline SQLite file")
+    run.add_argument("--label", help="note stored with this run in the baseline database")
+    run.add_argument("--gate", action="store_true", help="exit 1 when a metric regressed against the baseline")
+    run.add_argument("--results", metavar="PATH", help="write a test_results.json for this run")
+    run.add_argument("--report", metavar="PATH", help="with --results, also write a raw_report.md")
+    run.add_argument("--journal", metavar="PATH",
+                     help="append-only JSONL of finished tests (default: next to --results, else tmp/test_results.jsonl)")
+    run.add_argument("--resume", action="store_true", help="keep the journal and skip tests that already passed in it")
+    run.set_defaults(func=cmd_run)
+
+    ld = sub.add_parser("load", help="drive virtual users through the student and creator flows")
+    ld.add_argument("-u", "--users", type=int, help="virtual users (default 500, env QBANK_LOAD_USERS)")
+    ld.add_argument("--browser-users", type=int, help="of those, users driving a real browser (default 10)")
+    ld.add_argument("-b", "--browsers", type=int, help="browsers hosting the browser users (default 2)")
+    ld.add_argument("-d", "--duration", type=float, help="seconds at full load after ramp-up (default 60)")
+    ld.add_argument("--ramp-up", type=float, help="seconds to start all users (default 10)")
+    ld.add_argument("--answers", type=int, help="questions answered per practice flow (default 5)")
+    ld.add_argument("--flows", help="flow weights, e.g. student_practice=0.6,creator_browse=0.4")
+    ld.add_argument("--thresholds", help=f"pass/fail limits (default {load.DEFAULT_THRESHOLDS})")
+    ld.add_argument("--app-url", help=f"app under test (default {load.DEFAULT_APP_URL})")
+    ld.add_argument("--supabase-url", help="Supabase or stand-in URL (default from standin/.env.standin)")
+    ld.add_argument("--seed", type=int, help="random seed for user behaviour")
+    ld.add_argument("--headed", action="store_true", help="show the browser windows")
+    ld.add_argument("--json", default=str(load.REPORT_PATH), help="where to write the JSON report")
+    ld.set_defaults(func=cmd_load)
+
+    bench = sub.add_parser("canvas-bench", help="frame-time benchmark of the SmartBoard canvas under N strokes")
+    bench.add_argument("--strokes", type=_levels, default=",".join(str(n) for n in canvas.DEFAULT_LEVELS),
+                       help="comma-separated stroke counts, e.g. 1k,5k,20k")
+    bench.add_argument("--app-url", default=load.DEFAULT_APP_URL, help="app under test (Vite dev server)")
+    bench.add_argument("--set-id", help="question set to present (default: first one listed)")
+    bench.add_argument("--min-fps", default=canvas.DEFAULT_MIN_FPS, help="fail below these FPS, e.g. 1000=30,5000=20")
+    bench.add_argument("--seed", type=int, default=0, help="random seed for the synthetic strokes")
+    bench.add_argument("--headed", action="store_true", help="show the browser window")
+    bench.add_argument("--json", default=str(canvas.REPORT_PATH), help="where to write the JSON report")
+    bench.set_defaults(func=cmd_canvas_bench)
+
+    leak = sub.add_parser("leaks", help="repeat workflow transitions and fail on JS heap or detached DOM growth")
+    leak.add_argument("-n", "--cycles", type=int, default=leaks.DEFAULT_CYCLES, help="transition cycles to run")
+    leak.add_argument("--warmup", type=int, default=leaks.DEFAULT_WARMUP, help="cycles before the baseline snapshot")
+    leak.add_argument("--thresholds", default=leaks.DEFAULT_THRESHOLDS, help="growth limits per cycle")
+    leak.add_argument("--app-url", default=load.DEFAULT_APP_URL, help="app under test")
+    leak.add_argument("--set-id", help="question set for the SmartBoard (default: first one listed)")
+    leak.add_argument("--headed", action="store_true", help="show the browser window")
+    leak.add_argument("--json", default=str(leaks.REPORT_PATH), help="where to write the JSON report")
+    leak.set_defaults(func=cmd_leaks)
+
+    nm = sub.add_parser("netmatrix", help="run TCs under each network profile; per-step latency and Supabase retries")
+    nm.add_argument("tests", nargs="*", help="substrings of script names to run (default: all)")
+    nm.add_argument("-p", "--profiles", default=",".join(network.DEFAULT_MATRIX),
+                    help=f"comma-separated profiles from {', '.join(network.PROFILES)}")
+    nm.add_argument("--no-baseline", dest="baseline", action="store_false",
+                    help="skip the unthrottled run the step slowdowns are measured against")
+    nm.add_argument("-w", "--workers", type=int, default=2, help="tests running at once")
+    nm.add_argument("-b", "--browsers", type=int, default=2, help="browsers kept warm in the pool")
+    nm.add_argument("--timeout", type=float, default=600.0, help="per-test timeout in seconds")
+    nm.add_argument("--seed", type=int, default=0, help="random seed for the lossy profile's dropped requests")
+    nm.add_argument("--headed", action="store_true", help="show the browser windows")
+    nm.add_argument("--json", default=str(network.REPORT_PATH), help="where to write the JSON report")
+    nm.set_defaults(func=cmd_netmatrix)
+
+    boot = sub.add_parser("startup", help="cold/warm time-to-interactive and JS cost of the app entry routes")
+    boot.add_argument("routes", nargs="*", help=f"routes to load (default: all of {', '.join(startup.ROUTES)})")
+    boot.add_argument("-n", "--runs", type=int, default=startup.DEFAULT_RUNS, help="cold+warm load pairs per route")
+    boot.add_argument("--app-url", default=startup.DEFAULT_APP_URLS["admin"], help="admin app")
+    boot.add_argument("--canvas-url", default=startup.DEFAULT_APP_URLS["canvas"], help="infinite canvas app")
+    boot.add_argument("--set-id", help="question set for the smartboard route (default: the TeacherView list)")
+    boot.add_argument("--quiet-ms", type=float, default=startup.QUIET_MS,
+                      help="network/main-thread quiet window that ends TTI")
+    boot.add_argument("--sourcemaps", action="append", metavar="DIR",
+                      help="split production chunks by npm package using the build's .map files")
+    boot.add_argument("--headed", action="store_true", help="show the browser window")
+    boot.add_argument("--json", default=str(startup.REPORT_PATH), help="where to write the JSON report")
+    boot.set_defaults(func=cmd_startup)
+
+    keys = sub.add_parser("key-latency", help="input-to-paint latency of inventory search and filters at N questions")
+    keys.add_argument("--scales", type=_levels, default=",".join(str(n) for n in keylatency.DEFAULT_SCALES),
+                      help="comma-separated question counts, e.g. 10k,100k")
+    keys.add_argument("--targets", default=keylatency.DEFAULT_TARGETS, help="p95 limits in ms, e.g. 10k=100,100k=200")
+    keys.add_argument("--queries", default=",".join(keylatency.DEFAULT_QUERIES), help="comma-separated search queries")
+    keys.add_argument("--seed", type=int, default=0, help="random seed for the synthetic questions")
+    keys.add_argument("--no-intercept", dest="intercept", action="store_false",
+                      help="read questions from the app's backend (seed it first) instead of serving them")
+    keys.add_argument("--app-url", default=load.DEFAULT_APP_URL, help="app under test")
+    keys.add_argument("--headed", action="store_true", help="show the browser window")
+    keys.add_argument("--json", default=str(keylatency.REPORT_PATH), help="where to write the JSON report")
+    keys.set_defaults(func=cmd_key_latency)
+
+    bulk = sub.add_parser("bulk-upload", help="time each bulkUploadService stage on synthetic CSV/XLSX/JSON files")
+    bulk.add_argument("--rows", type=_levels, default=",".join(str(n) for n in bulkupload.DEFAULT_SCALES),
+                      help="comma-separated row counts, e.g. 1k,10k,100k")
+    bulk.add_argument("-f", "--formats", default=",".join(bulkupload.FORMATS), help="comma-separated file formats")
+    bulk.add_argument("--invalid", type=float, default=bulkupload.DEFAULT_INVALID,
+                      help="share of rows the validator should reject")
+    bulk.add_argument("--seed", type=int, default=0, help="random seed for the synthetic questions")
+    bulk.add_argument("--app-url", default=load.DEFAULT_APP_URL, help="app under test (Vite dev server)")
+    bulk.add_argument("--headed", action="store_true", help="show the browser window")
+    bulk.add_argument("--json", default=str(bulkupload.REPORT_PATH), help="where to write the JSON report")
+    bulk.set_defaults(func=cmd_bulk_upload)
+
+    bfile = sub.add_parser("bulk-file", help="write a synthetic upload file in the question sample.csv layout")
+    bfile.add_argument("rows", type=_count, help="row count, e.g. 100k")
+    bfile.add_argument("out", help="file to write; .csv, .xlsx or .json")
+    bfile.add_argument("--invalid", type=float, default=bulkupload.DEFAULT_INVALID,
+                       help="share of rows the validator should reject")
+    bfile.add_argument("--seed", type=int, default=0, help="random seed for the synthetic questions")
+    bfile.set_defaults(func=cmd_bulk_file)
+
+    gen = sub.add_parser("gen-bank", help="generate a large synthetic question bank with NumPy, chunk by chunk")
+    gen.add_argument("rows", type=_count, help="row count, e.g. 1m")
+    gen.add_argument("out", help="file to write; " + ", ".join(f".{f}" for f in bankgen.FORMATS))
+    gen.add_argument("--seed", type=int, default=0, help="random seed")
+    gen.add_argument("--chunk-rows", type=int, default=bankgen.CHUNK_ROWS, help="rows generated and written at a time")
+    gen.add_argument("--lengths-from", nargs="?", const=str(bankgen.SAMPLE_CSV), default=None, metavar="CSV",
+                     help="match text lengths to a CSV export (default file: apps/admin/question sample.csv)")
+    gen.set_defaults(func=cmd_gen_bank)
+
+    pdf = sub.add_parser("pdf-export", help="time, peak heap and size of each PDF export path at N questions")
+    pdf.add_argument("--sizes", type=_levels, default=",".join(str(n) for n in pdfexport.DEFAULT_SIZES),
+                     help="comma-separated question counts, e.g. 50,500,2000")
+    pdf.add_argument("-e", "--engines", default=",".join(pdfexport.ENGINES), help="comma-separated export paths")
+    pdf.add_argument("--seed", type=int, default=0, help="random seed for the synthetic questions")
+    pdf.add_argument("--app-url", default=load.DEFAULT_APP_URL, help="app under test (Vite dev server)")
+    pdf.add_argument("--headed", action="store_true", help="show the browser window")
+    pdf.add_argument("--json", default=str(pdfexport.REPORT_PATH), help="where to write the JSON report")
+    pdf.set_defaults(func=cmd_pdf_export)
+
+    base = sub.add_parser("baseline", help="per-test duration/metric history and regression checks")
+    base.add_argument("--db", default=str(baseline.DEFAULT_DB), help="baseline SQLite file (env QBANK_BASELINE_DB)")
+    actions = base.add_subparsers(dest="action", required=True)
+    rec = actions.add_parser("record", help="import test_results.json files as runs")
+    rec.add_argument("results", nargs="+", help="test_results.json files, one run each")
+    rec.add_argument("--label", help="note stored with the runs (default: the file path)")
+    cmp_ = actions.add_parser("compare", help="flag regressions of a run against the previous K passing runs")
+    cmp_.add_argument("--run", type=int, help="run id to check (default: latest)")
+    cmp_.add_argument("-k", "--window", type=int, default=baseline.DEFAULT_WINDOW, help="history length per test")
+    cmp_.add_argument("--z", type=float, default=baseline.DEFAULT_Z, help="robust z-score above which to flag")
+    cmp_.add_argument("--min-runs", type=int, default=baseline.DEFAULT_MIN_RUNS, help="skip tests with less history")
+    tr = actions.add_parser("trend", help="print per-test tables of recent runs")
+    tr.add_argument("tests", nargs="*", help="substrings of test titles (default: all)")
+    tr.add_argument("-m", "--metric", dest="metrics", action="append", choices=baseline.METRICS,
+                    help="metric column, repeatable (default: all)")
+    tr.add_argument("--last", type=int, default=baseline.DEFAULT_WINDOW, help="runs to show")
+    base.set_defaults(func=cmd_baseline)
+
+    prof = sub.add_parser("profile", help="summarize saved 'run --profile' traces")
+    prof.add_argument("traces", nargs="*", help=f"trace files (default: everything in {profile.PROFILE_DIR})")
+    prof.add_argument("--sourcemaps", action="append", metavar="DIR",
+                      help="where the build's .map files are (default apps/admin/dist/assets)")
+    prof.set_defaults(func=cmd_profile)
+
+    mock = sub.add_parser("mock-ai", help="serve a local Gemini/Replicate stand-in")
+    mock.add_argument("--host", default="127.0.0.1")
+    mock.add_argument("--port", type=int, default=8787)
+    mock.add_argument("--profile", choices=sorted(mock_ai.PROFILES), default="realistic")
+    mock.add_argument("--latency", help="override: fixed:MS, uniform:LO:HI or lognormal:MEDIAN:SIGMA")
+    mock.add_argument("--rate-limit", type=float, help="override: probability of a 429 per request")
+    mock.add_argument("--max-concurrency", type=int, help="override: 429 above this many requests in flight")
+    mock.add_argument("--stream-chunk-ms", type=float, help="override: delay between streamed chunks")
+    mock.add_argument("--seed", type=int, help="override: random seed")
+    mock.set_defaults(func=cmd_mock_ai)
+
+    co = sub.add_parser("collab", help="N users drawing on one SmartBoard: stroke propagation, convergence, bytes")
+    co.add_argument("-n", "--clients", type=int, default=collab.DEFAULT_CLIENTS, help="browser contexts on the board")
+    co.add_argument("--strokes", type=int, default=collab.DEFAULT_STROKES, help="strokes each client draws")
+    co.add_argument("--interval-ms", type=float, default=collab.DEFAULT_INTERVAL_MS,
+                    help="mean pause between a client's strokes")
+    co.add_argument("--relay-delay-ms", type=float, default=0.0, help="delay the sync server adds before relaying")
+    co.add_argument("--max-p95", type=float, default=collab.DEFAULT_MAX_P95_MS,
+                    help="fail above this p95 propagation latency in ms")
+    co.add_argument("--app-url", default=load.DEFAULT_APP_URL, help="app under test (Vite dev server)")
+    co.add_argument("--set-id", help="question set to present (default: first one listed)")
+    co.add_argument("--seed", type=int, default=0, help="random seed for the strokes")
+    co.add_argument("--headed", action="store_true", help="show the browser windows")
+    co.add_argument("--json", default=str(collab.REPORT_PATH), help="where to write the JSON report")
+    co.set_defaults(func=cmd_collab)
+
+    sync = sub.add_parser("sync-server", help="serve the board sync stand-in the collab simulator uses")
+    sync.add_argument("--host", default="127.0.0.1")
+    sync.add_argument("--port", type=int, default=8790)
+    sync.add_argument("--relay-delay-ms", type=float, default=0.0, help="delay added before relaying each op")
+    sync.set_defaults(func=cmd_sync_server)
+
+    seeder = sub.add_parser("seed", help="bulk-load questions into the local Supabase stand-in")
+    seeder.add_argument("--scale", choices=sorted(seed.SCALES), default="100k", help="rows per table")
+    seeder.add_argument("--rows", type=int, help="override --scale with an exact row count")
+    seeder.add_argument("--table", dest="tables", action="append", choices=sorted(seed.TABLES),
+                        help="table to load, repeatable (default: all)")
+    seeder.add_argument("--dsn", default=seed.DEFAULT_DSN, help="Postgres connection string (env QBANK_DB_DSN)")
+    seeder.add_argument("--append", action="store_true", help="keep existing rows instead of truncating")
+    seeder.add_argument("--seed", type=int, default=0, help="random seed for the synthetic content")
+    seeder.set_defaults(func=cmd_seed)
+
+    ingester = sub.add_parser("ingest", help="COPY a CSV/XLSX/JSON upload into questions_master as one bulk batch")
+    ingester.add_argument("file", help="upload file; .csv, .xlsx or .json")
+    ingester.add_argument("--dsn", default=seed.DEFAULT_DSN, help="Postgres connection string (env QBANK_DB_DSN)")
+    ingester.add_argument("--file-name", help="upload_file_name recorded on the batch (default: the file's name)")
+    ingester.add_argument("--chunk-rows", type=int, default=ingest.CHUNK_ROWS, help="rows per COPY chunk and commit")
+    ingester.set_defaults(func=cmd_ingest)
+
+    sel = sub.add_parser("select", help="list the tests impacted by a git diff")
+    sel.add_argument("--base", default="HEAD", help="git ref to diff against (default: HEAD)")
+    sel.add_argument("--json", action="store_true", help="print the selected script names as JSON")
+    sel.add_argument("--verify", action="store_true", help="check the selection of known diffs instead")
+    sel.set_defaults(func=cmd_select)
+
+    shard = sub.add_parser("shard", help="split the suite into shards of equal expected runtime")
+    shard.add_argument("tests", nargs="*", help="substrings of script names to include (default: all)")
+    shard.add_argument("-n", "--count", type=int, required=True, help="number of shards")
+    shard.add_argument("--json", action="store_true", help="print the plan as a JSON list of script names")
+    shard.add_argument("--spawn", action="store_true", help="run every shard as a local process and merge")
+    shard.add_argument("-w", "--workers", type=int, default=2, help="with --spawn, tests at once per shard")
+    shard.add_argument("-b", "--browsers", type=int, default=1, help="with --spawn, browsers per shard")
+    shard.add_argument("--out-dir", default=str(report.TMP_DIR / "shards"), help="with --spawn, shard output dir")
+    shard.add_argument("--results", default=str(report.RESULTS_PATH), help="with --spawn, merged results path")
+    shard.add_argument("--report", default=str(report.REPORT_PATH), help="with --spawn, merged report path")
+    shard.add_argument("--no-baseline", action="store_true", help="with --spawn, do not record the merged run")
+    shard.add_argument("--baseline-db", default=str(baseline.DEFAULT_DB),
+                       help="with --spawn, baseline SQLite file (env QBANK_BASELINE_DB)")
+    shard.add_argument("--label", help="with --spawn, note stored with the merged run")
+    shard.set_defaults(func=cmd_shard)
+
+    merge = sub.add_parser("merge", help="combine shard test_results.json files into one results file and report")
+    merge.add_argument("inputs", nargs="+", help="test_results.json files to merge")
+    merge.add_argument("--results", default=str(report.RESULTS_PATH), help="merged test_results.json path")
+    merge.add_argument("--report", default=str(report.REPORT_PATH), help="merged raw_report.md path")
+    merge.set_defaults(func=cmd_merge)
+
+    rewrite = sub.add_parser("rewrite", help="replace fixed sleeps and batch text assertions in generated scripts")
+    rewrite.add_argument("tests", nargs="*", help="substrings of script names to rewrite (default: all)")
+    rewrite.add_argument("-n", "--dry-run", action="store_true", help="report without writing")
+    rewrite.set_defaults(func=cmd_rewrite)
+
+    comp = sub.add_parser("compile", help="compile testsprite_frontend_test_plan.json into TC scripts on harness.steps")
+    comp.add_argument("ids", nargs="*", help="plan ids to compile, e.g. TC003 (default: all)")
+    comp.add_argument("--force", action="store_true", help="overwrite hand-written scripts with the same name")
+    comp.add_argument("--prune", action="store_true", help="delete hand-written scripts a compiled one supersedes")
+    comp.add_argument("--check", action="store_true", help="write nothing; exit 1 if any compiled script is stale")
+    comp.set_defaults(func=cmd_compile)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""Vectorised synthetic question bank in the shape of ``Question`` (apps/admin/types.ts).
+
+Rows are built a chunk at a time with NumPy: categorical columns are drawn as
+index arrays, and bilingual text is built by drawing the words of every
+sentence in the chunk at once, joining them into one string and slicing each
+sentence out by cumulative word offsets. Chunks are written as they are
+produced, so memory stays flat at 1M+ rows.
+
+Output formats are the ones ``bulkUploadService.parseFile`` accepts (CSV,
+XLSX, JSON) plus Parquet. The words come from ``synth``'s English and
+Devanagari lists. Sentence lengths in words follow ``synth``'s ranges, or
+the observed distribution of a real export (``calibrate``, e.g. the app's
+``question sample.csv``), because rendering and search cost scale with
+text length.
+
+Requires NumPy (``pip install numpy``); Parquet also needs pyarrow.
+"""
+import csv
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from . import synth
+from .bulkupload import write_xlsx
+from .loader import TESTS_DIR
+
+SAMPLE_CSV = TESTS_DIR.parent / "apps" / "admin" / "question sample.csv"
+FORMATS = ("csv", "xlsx", "json", "parquet")
+CHUNK_ROWS = 20_000
+# One header row plus this many rows fill an XLSX sheet.
+XLSX_MAX_ROWS = 1_048_575
+
+COLUMNS = [
+    "id", "question_unique_id", "question_hin", "question_eng", "subject", "chapter",
+    "option1_hin", "option1_eng", "option2_hin", "option2_eng",
+    "option3_hin", "option3_eng", "option4_hin", "option4_eng",
+    "answer", "solution_hin", "solution_eng", "type", "difficulty", "language",
+    "tags", "createdDate", "topic", "collection", "exam", "section", "year", "date", "question_source",
+]
+# Text fields by kind; their lengths are drawn from that kind's model.
+TEXT_KINDS = {
+    "question": ["question_hin", "question_eng"],
+    "option": [f"option{n}_{lang}" for n in range(1, 5) for lang in ("hin", "eng")],
+    "solution": ["solution_hin", "solution_eng"],
+}
+DEFAULT_WORDS = {"question": synth.QUESTION_WORDS, "option": synth.OPTION_WORDS, "solution": synth.SOLUTION_WORDS}
+DIFFICULTY_WEIGHTS = (0.3, 0.5, 0.2)
+LANGUAGES = ("Bilingual", "Hindi", "English")
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError as exc:
+        raise SystemExit("generating the question bank needs NumPy: pip install numpy") from exc
+    return numpy
+
+
+class LengthModel:
+    """Words per sentence: uniform over ``bounds``, or resampled from observed ``counts``."""
+
+    def __init__(self, bounds: Sequence[int] = (1, 1), counts: Optional[Sequence[int]] = None):
+        self.bounds = tuple(bounds)
+        self.counts = [c for c in counts or () if c > 0]
+
+    def sample(self, np, rng, n: int):
+        if self.counts:
+            return rng.choice(np.asarray(self.counts), size=n)
+        return rng.integers(self.bounds[0], self.bounds[1] + 1, size=n)
+
+    def describe(self) -> str:
+        if self.counts:
+            return f"observed ({len(self.counts)} samples, median {sorted(self.counts)[len(self.counts) // 2]})"
+        return f"uniform {self.bounds[0]}-{self.bounds[1]}"
+
+
+def default_lengths() -> Dict[str, LengthModel]:
+    return {kind: LengthModel(bounds) for kind, bounds in DEFAULT_WORDS.items()}
+
+
+def calibrate(path: Path = SAMPLE_CSV) -> Dict[str, LengthModel]:
+    """Length models from the word counts in a CSV export; kinds it has no text for keep the defaults."""
+    models = default_lengths()
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    for kind, fields in TEXT_KINDS.items():
+        counts = [len(row[field].split()) for row in rows for field in fields if (row.get(field) or "").strip()]
+        if counts:
+            models[kind] = LengthModel(DEFAULT_WORDS[kind], counts)
+    return models
+
+
+class _Vocabulary:
+    def __init__(self, np, words: Sequence[str]):
+        self.words = np.asarray(words, dtype=object)
+        # +1 for the space that follows each word once joined.
+        self.widths = np.asarray([len(w) + 1 for w in words])
+
+    def sentences(self, np, rng, counts, end: str) -> List[str]:
+        """One sentence per entry of ``counts`` (words each), built from a single join."""
+        picks = rng.integers(0, len(self.words), size=int(counts.sum()))
+        text = " ".join(self.words[picks].tolist()) + " "
+        offsets = np.cumsum(self.widths[picks])
+        last = np.cumsum(counts) - 1
+        stops = offsets[last] - 1
+        starts = np.concatenate(([0], offsets[last[:-1]]))
+        return [text[a:b] + end for a, b in zip(starts.tolist(), stops.tolist())]
+
+
+class QuestionBank:
+    """Generates ``Question`` rows as column chunks."""
+
+    def __init__(self, seed: int = 0, lengths: Optional[Dict[str, LengthModel]] = None, chunk_rows: int = CHUNK_ROWS):
+        self.np = _numpy()
+        self.rng = self.np.random.default_rng(seed)
+        self.lengths = lengths or default_lengths()
+        self.chunk_rows = chunk_rows
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        self.english = _Vocabulary(self.np, synth.ENGLISH_WORDS)
+        self.hindi = _Vocabulary(self.np, synth.HINDI_WORDS)
+        np = self.np
+        self.subjects = np.asarray(synth.SUBJECTS, dtype=object)
+        chapters = [synth.CHAPTERS.get(s, ["General"]) for s in synth.SUBJECTS]
+        self.chapters = np.asarray([c for group in chapters for c in group], dtype=object)
+        self.chapter_counts = np.asarray([len(group) for group in chapters])
+        self.chapter_starts = np.concatenate(([0], np.cumsum(self.chapter_counts)[:-1]))
+
+    def _text(self, kind: str, n: int) -> Dict[str, List[str]]:
+        np, rng = self.np, self.rng
+        columns = {}
+        for field in TEXT_KINDS[kind]:
+            counts = self.lengths[kind].sample(np, rng, n)
+            hindi = field.endswith("_hin")
+            end = {"question": "?", "solution": "।" if hindi else "."}.get(kind, "")
+            columns[field] = (self.hindi if hindi else self.english).sentences(np, rng, counts, end)
+        return columns
+
+    def chunk(self, start: int, n: int) -> Dict[str, list]:
+        np, rng = self.np, self.rng
+        subject_idx = rng.integers(0, len(self.subjects), size=n)
+        chapter_idx = self.chapter_starts[subject_idx] + (rng.random(n) * self.chapter_counts[subject_idx]).astype(int)
+        subjects = self.subjects[subject_idx].tolist()
+        chapters = self.chapters[chapter_idx].tolist()
+        difficulties = np.asarray(synth.DIFFICULTIES, dtype=object)[
+            rng.choice(len(synth.DIFFICULTIES), size=n, p=DIFFICULTY_WEIGHTS)].tolist()
+        exams = np.asarray(synth.EXAMS, dtype=object)[rng.integers(0, len(synth.EXAMS), size=n)].tolist()
+        years = np.asarray(synth.YEARS, dtype=object)[rng.integers(0, len(synth.YEARS), size=n)].tolist()
+        # Spread over the last year.
+        created = np.datetime64(self.now, "s") - rng.integers(0, 365 * 86400, size=n).astype("timedelta64[s]")
+        created_iso = [f"{stamp}Z" for stamp in created.astype(str).tolist()]
+        ids = [f"gen-{i}" for i in range(start, start + n)]
+        columns = {
+            "id": ids,
+            "question_unique_id": ids,
+            "subject": subjects,
+            "chapter": chapters,
+            "answer": rng.integers(1, 5, size=n).astype(str).tolist(),
+            "type": ["MCQ"] * n,
+            "difficulty": difficulties,
+            "language": np.asarray(LANGUAGES, dtype=object)[rng.integers(0, len(LANGUAGES), size=n)].tolist(),
+            "tags": [list(tags) for tags in zip(subjects, chapters, exams, difficulties)],
+            "createdDate": created_iso,
+            "topic": chapters,
+            "collection": [f"Generated - {s}" for s in subjects],
+            "exam": exams,
+            "section": subjects,
+            "year": years,
+            "date": [stamp[:10] for stamp in created_iso],
+            "question_source": ["Generated"] * n,
+        }
+        for kind in TEXT_KINDS:
+            columns.update(self._text(kind, n))
+        return {name: columns[name] for name in COLUMNS}
+
+    def chunks(self, rows: int) -> Iterator[Dict[str, list]]:
+        for start in range(0, rows, self.chunk_rows):
+            yield self.chunk(start, min(self.chunk_rows, rows - start))
+
+
+def _records(chunk: Dict[str, list]) -> Iterator[Dict]:
+    for values in zip(*chunk.values()):
+        yield dict(zip(chunk, values))
+
+
+def _write_csv(path: Path, chunks: Iterator[Dict[str, list]]) -> None:
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for chunk in chunks:
+            chunk["tags"] = [", ".join(tags) for tags in chunk["tags"]]
+            writer.writerows(zip(*chunk.values()))
+
+
+def _write_json(path: Path, chunks: Iterator[Dict[str, list]]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        first = True
+        for chunk in chunks:
+            for record in _records(chunk):
+                f.write("\n" if first else ",\n")
+                f.write(json.dumps(record, ensure_ascii=False))
+                first = False
+        f.write("\n]\n")
+
+
+def _write_xlsx(path: Path, chunks: Iterator[Dict[str, list]]) -> None:
+    def rows():
+        for chunk in chunks:
+            chunk["tags"] = [", ".join(tags) for tags in chunk["tags"]]
+            yield from zip(*chunk.values())
+
+    write_xlsx(path, COLUMNS, rows())
+
+
+def _write_parquet(path: Path, chunks: Iterator[Dict[str, list]]) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise SystemExit("Parquet output needs pyarrow: pip install pyarrow") from exc
+    schema = pa.schema([(name, pa.list_(pa.string()) if name == "tags" else pa.string()) for name in COLUMNS])
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for chunk in chunks:
+            writer.write_table(pa.table(chunk, schema=schema))
+
+
+_WRITERS = {"csv": _write_csv, "xlsx": _write_xlsx, "json": _write_json, "parquet": _write_parquet}
+
+
+@dataclass
+class GenerateStats:
+    path: Path
+    rows: int
+    bytes: int
+    seconds: float
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def generate(
+    path: Path,
+    rows: int,
+    seed: int = 0,
+    lengths: Optional[Dict[str, LengthModel]] = None,
+    chunk_rows: int = CHUNK_ROWS,
+) -> GenerateStats:
+    """Write ``rows`` questions to ``path``; the suffix picks the format."""
+    path = Path(path)
+    fmt = path.suffix.lstrip(".").lower()
+    if fmt not in _WRITERS:
+        raise ValueError(f"unsupported format {fmt!r} (expected one of {', '.join(FORMATS)})")
+    if fmt == "xlsx" and rows > XLSX_MAX_ROWS:
+        raise ValueError(f"an XLSX sheet holds at most {XLSX_MAX_ROWS:,} rows and parseFile only reads the first "
+                         "sheet; use CSV, JSON or Parquet for more")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+    _WRITERS[fmt](path, QuestionBank(seed, lengths, chunk_rows).chunks(rows))
+    return GenerateStats(path, rows, path.stat().st_size, time.monotonic() - started)
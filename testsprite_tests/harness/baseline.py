@@ -0,0 +1,243 @@
+"""Local performance history for the TC suite and a regression gate.
+
+Every ``python -m harness run`` appends one row per test to a SQLite file
+(tmp/baselines.sqlite, or ``QBANK_BASELINE_DB``): the wall-clock duration
+plus the Web Vitals summary from the ``metrics`` block. Result files from
+elsewhere (shards, CI artifacts, TestSprite itself) can be imported with
+``python -m harness baseline record``.
+
+A run is compared against the last K passing runs of each test. Each metric
+is judged on a robust z-score, ``(value - median) / (1.4826 * MAD)``, so one
+slow outlier in the history neither hides nor triggers a regression. The
+spread is floored at a share of the median so a perfectly steady history does
+not flag a 1ms wobble. Every stored metric is lower-is-better.
+"""
+import os
+import sqlite3
+import statistics
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .loader import TESTS_DIR
+from .report import TMP_DIR, record_duration
+
+DEFAULT_DB = Path(os.environ.get("QBANK_BASELINE_DB", TMP_DIR / "baselines.sqlite"))
+DEFAULT_WINDOW = 10
+DEFAULT_MIN_RUNS = 5
+DEFAULT_Z = 3.5
+# Spread never drops below this share of the median, nor below the
+# metric's noise floor (which matters when the median is 0, e.g. TBT).
+MIN_RELATIVE_SPREAD = 0.05
+MIN_SPREAD = {
+    "duration_s": 0.5, "lcp_ms": 50.0, "cls": 0.01, "inp_ms": 16.0,
+    "tbt_ms": 25.0, "long_tasks": 1.0, "heap_mb": 1.0,
+}
+
+# metric name -> key in the vitals ``metrics.summary`` block.
+SUMMARY_METRICS = {
+    "lcp_ms": "lcpMax",
+    "cls": "clsMax",
+    "inp_ms": "inpMax",
+    "tbt_ms": "tbtTotal",
+    "long_tasks": "longTasks",
+    "heap_mb": "jsHeapPeak",
+}
+METRICS = ("duration_s",) + tuple(SUMMARY_METRICS)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded TEXT NOT NULL,
+    commit_sha TEXT,
+    label TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    status TEXT NOT NULL,
+    PRIMARY KEY (run_id, test)
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (run_id, test, metric)
+);
+CREATE INDEX IF NOT EXISTS samples_by_test ON samples (test, metric, run_id);
+"""
+
+
+def connect(path: Path = DEFAULT_DB) -> sqlite3.Connection:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def record_metrics(record: Dict) -> Dict[str, float]:
+    """The stored metrics of one test_results.json record."""
+    values: Dict[str, float] = {}
+    seconds = record_duration(record)
+    if seconds is not None and seconds >= 0:
+        values["duration_s"] = round(seconds, 3)
+    summary = record.get("metrics", {}).get("summary", {})
+    for metric, key in SUMMARY_METRICS.items():
+        value = summary.get(key)
+        if value is None:
+            continue
+        values[metric] = round(value / 1048576.0, 2) if metric == "heap_mb" else float(value)
+    return values
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=TESTS_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def record_run(conn: sqlite3.Connection, records: Iterable[Dict], label: Optional[str] = None) -> int:
+    """Append one run; returns its id."""
+    with conn:
+        run_id = conn.execute(
+            "INSERT INTO runs (recorded, commit_sha, label) VALUES (?, ?, ?)",
+            (datetime.now(timezone.utc).isoformat(timespec="seconds"), current_commit(), label),
+        ).lastrowid
+        for record in records:
+            test = record.get("title", "")
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (run_id, test, record.get("testStatus", "FAILED"))
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO samples VALUES (?, ?, ?, ?)",
+                [(run_id, test, metric, value) for metric, value in record_metrics(record).items()],
+            )
+    return run_id
+
+
+def latest_run(conn: sqlite3.Connection) -> Optional[int]:
+    row = conn.execute("SELECT MAX(id) FROM runs").fetchone()
+    return row[0] if row else None
+
+
+def history(conn: sqlite3.Connection, test: str, metric: str, before_run: int, window: int) -> List[float]:
+    """The last ``window`` values from passing runs older than ``before_run``, newest first."""
+    rows = conn.execute(
+        """
+        SELECT s.value FROM samples s
+        JOIN results r ON r.run_id = s.run_id AND r.test = s.test
+        WHERE s.test = ? AND s.metric = ? AND s.run_id < ? AND r.status = 'PASSED'
+        ORDER BY s.run_id DESC LIMIT ?
+        """,
+        (test, metric, before_run, window),
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def robust_z(value: float, values: Sequence[float], min_spread: float = 1e-9) -> Tuple[float, float, float]:
+    """``(z, median, mad)`` of ``value`` against ``values``."""
+    median = statistics.median(values)
+    mad = statistics.median(abs(v - median) for v in values)
+    spread = max(1.4826 * mad, MIN_RELATIVE_SPREAD * abs(median), min_spread)
+    return (value - median) / spread, median, mad
+
+
+@dataclass
+class Regression:
+    test: str
+    metric: str
+    value: float
+    median: float
+    mad: float
+    z: float
+    runs: int
+
+    def __str__(self) -> str:
+        change = (self.value - self.median) / self.median * 100 if self.median else float("inf")
+        return (f"{self.test}: {self.metric} {self.value:g} vs median {self.median:g} "
+                f"(MAD {self.mad:g}, z={self.z:.1f}, {change:+.0f}% over {self.runs} runs)")
+
+
+def compare(
+    conn: sqlite3.Connection,
+    run_id: Optional[int] = None,
+    window: int = DEFAULT_WINDOW,
+    z_limit: float = DEFAULT_Z,
+    min_runs: int = DEFAULT_MIN_RUNS,
+) -> List[Regression]:
+    """Metrics of passing tests in ``run_id`` (default: latest) that regressed."""
+    run_id = run_id or latest_run(conn)
+    if run_id is None:
+        return []
+    rows = conn.execute(
+        """
+        SELECT s.test, s.metric, s.value FROM samples s
+        JOIN results r ON r.run_id = s.run_id AND r.test = s.test
+        WHERE s.run_id = ? AND r.status = 'PASSED'
+        ORDER BY s.test, s.metric
+        """,
+        (run_id,),
+    ).fetchall()
+    regressions = []
+    for test, metric, value in rows:
+        past = history(conn, test, metric, run_id, window)
+        if len(past) < min_runs:
+            continue
+        z, median, mad = robust_z(value, past, MIN_SPREAD.get(metric, 1e-9))
+        if z > z_limit:
+            regressions.append(Regression(test, metric, value, median, mad, round(z, 2), len(past)))
+    return regressions
+
+
+def trend(conn: sqlite3.Connection, test: str, metric: str, last: int) -> List[Tuple[int, str, Optional[str], str, float]]:
+    """``(run id, recorded, commit, status, value)`` for the last ``last`` runs, oldest first."""
+    rows = conn.execute(
+        """
+        SELECT s.run_id, ru.recorded, ru.commit_sha, r.status, s.value FROM samples s
+        JOIN runs ru ON ru.id = s.run_id
+        JOIN results r ON r.run_id = s.run_id AND r.test = s.test
+        WHERE s.test = ? AND s.metric = ?
+        ORDER BY s.run_id DESC LIMIT ?
+        """,
+        (test, metric, last),
+    ).fetchall()
+    return rows[::-1]
+
+
+def tests(conn: sqlite3.Connection, patterns: Sequence[str] = ()) -> List[str]:
+    names = [row[0] for row in conn.execute("SELECT DISTINCT test FROM results ORDER BY test")]
+    if not patterns:
+        return names
+    return [n for n in names if any(p.lower() in n.lower() for p in patterns)]
+
+
+def render_trend(conn: sqlite3.Connection, test: str, metrics: Sequence[str], last: int) -> str:
+    """One table per test: a row per run, a column per metric."""
+    columns: Dict[str, Dict[int, float]] = {}
+    runs: Dict[int, Tuple[str, Optional[str], str]] = {}
+    for metric in metrics:
+        for run_id, recorded, commit, status, value in trend(conn, test, metric, last):
+            columns.setdefault(metric, {})[run_id] = value
+            runs[run_id] = (recorded, commit, status)
+    shown = [m for m in metrics if m in columns]
+    lines = [test, f"{'run':>5}  {'recorded':<20}{'commit':<9}{'status':<8}" + "".join(f"{m:>12}" for m in shown)]
+    for run_id in sorted(runs)[-last:]:
+        recorded, commit, status = runs[run_id]
+        cells = "".join(
+            f"{columns[m][run_id]:>12g}" if run_id in columns[m] else f"{'-':>12}" for m in shown
+        )
+        lines.append(f"{run_id:>5}  {recorded[:19]:<20}{(commit or '-'):<9}{status:<8}{cells}")
+    if len(lines) > 2:
+        medians = []
+        for m in shown:
+            values = [columns[m][r] for r in sorted(runs)[-last:] if r in columns[m] and runs[r][2] == "PASSED"]
+            medians.append(f"{statistics.median(values):>12g}" if values else f"{'-':>12}")
+        lines.append(f"{'':>5}  {'median (passed)':<37}" + "".join(medians))
+    return "\n".join(lines)
@@ -0,0 +1,407 @@
+"""Stage-by-stage benchmark of ``bulkUploadService`` on synthetic files.
+
+``write_file`` produces CSV, XLSX or JSON uploads in the column layout of
+``apps/admin/question sample.csv`` (the synthetic content comes from
+``synth``; a share of rows is left without question text or answer so the
+validator has something to reject). Files are written row by row, so a
+100K-row XLSX does not need the sheet in memory, and XLSX is written as
+plain SpreadsheetML with inline strings, which SheetJS reads like any other
+workbook.
+
+The benchmark imports ``/services/bulkUploadService.ts`` from the Vite dev
+server into a page and runs the service's own stages one after another on
+the file: ``parseFile`` (Papa, the streaming XLSX worker or JSON.parse
+through a ``File``), ``normalizeData``, ``validateRows`` and ``saveBatch``. Supabase writes are
+answered by the harness, so the save stage measures building and sending the
+insert payloads, not the database. While each stage runs, the JS heap is
+polled over CDP (``pdfexport.HeapPoller``) without collecting garbage, and
+the stage keeps its highest reading, so temporary allocations inside it
+count towards the peak. That is the page's heap only: an XLSX parse's
+reading happens in the worker, and only the rows it hands back show.
+"""
+import csv
+import json
+import random
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from playwright import async_api
+
+from . import synth, waits
+from .canvas import parse_levels
+from .pdfexport import HeapPoller
+from .report import TMP_DIR
+
+REPORT_PATH = TMP_DIR / "bulk_upload.json"
+FILES_DIR = TMP_DIR / "bulk"
+DEFAULT_SCALES = (1_000, 10_000, 100_000)
+FORMATS = ("csv", "xlsx", "json")
+# Share of rows the validator should reject.
+DEFAULT_INVALID = 0.02
+STAGES = ("parse", "normalize", "validate", "save")
+STAGE_TIMEOUT_MS = 600_000
+POOL_SIZE = 4096
+
+# Header of apps/admin/question sample.csv.
+SAMPLE_COLUMNS = [
+    "record_id", "question_unique_id", "question_hin", "question_eng", "subject", "chapter",
+    "option1_hin", "option1_eng", "option2_hin", "option2_eng", "option3_hin", "option3_eng",
+    "option4_hin", "option4_eng", "option5_hin", "option5_eng", "answer", "solution_hin", "solution_eng",
+    "collection", "previous_of", "video", "type", "airtable_table_name", "exam", "action", "current_status",
+    "sync_code", "error_report", "error_description", "created_date", "section", "year", "date",
+]
+
+_BENCH_JS = """
+async ({ module, url, name }) => {
+  const { bulkUploadService } = await import(module);
+  const blob = await (await fetch(url)).blob();
+  const state = window.__qbankBulk = { service: bulkUploadService, file: new File([blob], name), rows: null };
+  state.stages = {
+    parse: async () => (state.rows = await state.service.parseFile(state.file)),
+    normalize: async () => (state.rows = state.service.normalizeData(state.rows)),
+    validate: async () => (state.rows = state.service.validateRows(state.rows)),
+    save: async () => (state.saved = await state.service.saveBatch(state.rows, name)),
+  };
+  return blob.size;
+}
+"""
+
+_STAGE_JS = """
+async (stage) => {
+  const state = window.__qbankBulk;
+  const started = performance.now();
+  await state.stages[stage]();
+  const ms = performance.now() - started;
+  const rows = state.rows ? state.rows.length : 0;
+  return { ms, rows, valid: stage === 'validate' ? state.rows.filter((r) => r.isValid).length : null,
+           saved: stage === 'save' ? state.saved : null };
+}
+"""
+
+
+def sample_rows(total: int, seed: int = 0, invalid: float = DEFAULT_INVALID) -> Iterator[Dict[str, str]]:
+    """``total`` rows keyed by ``SAMPLE_COLUMNS``; about ``invalid`` of them fail validation."""
+    pool = synth.question_batch(seed, min(POOL_SIZE, max(total, 1)))
+    rng = random.Random(seed)
+    for i in range(total):
+        rec = pool[(i * 7919) % len(pool)]
+        row = dict.fromkeys(SAMPLE_COLUMNS, "")
+        row.update({key: rec[key] for key in SAMPLE_COLUMNS if key in rec})
+        row.update({
+            "record_id": f"bench{i:08d}",
+            "question_unique_id": str(i + 1),
+            "subject": rec["section"],
+            "answer": "ABCD"[int(rec["answer"]) - 1],
+            "collection": f"Bench - {rec['section']}",
+            "airtable_table_name": "bulk_bench",
+            "current_status": "UPDATED",
+            "created_date": "20 July 2024 4:42pm",
+        })
+        if rng.random() < invalid:
+            # Either failure validateRows checks for.
+            if i % 2:
+                row["question_hin"] = row["question_eng"] = ""
+            else:
+                row["answer"] = ""
+        yield row
+
+
+def _write_csv(path: Path, rows: Iterable[Dict[str, str]]) -> None:
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(f, fieldnames=SAMPLE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_json(path: Path, rows: Iterable[Dict[str, str]]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i, row in enumerate(rows):
+            f.write(",\n" if i else "\n")
+            f.write(json.dumps(row, ensure_ascii=False))
+        f.write("\n]\n")
+
+
+def _column(index: int) -> str:
+    name = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        name = chr(65 + rem) + name
+    return name
+
+
+def _sheet_row(number: int, columns: Sequence[str], values: Sequence[str]) -> str:
+    cells = "".join(
+        f'<c r="{columns[i]}{number}" t="inlineStr"><is><t xml:space="preserve">{escape(v)}</t></is></c>'
+        for i, v in enumerate(values) if v
+    )
+    return f'<row r="{number}">{cells}</row>'
+
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Questions" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '</Relationships>'
+    ),
+}
+
+
+def write_xlsx(path: Path, header: Sequence[str], rows: Iterable[Sequence[str]]) -> None:
+    """Stream ``rows`` of strings into a one-sheet workbook; empty cells are left out."""
+    columns = [_column(i) for i in range(len(header))]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as book:
+        for name, xml in _XLSX_PARTS.items():
+            book.writestr(name, xml)
+        with book.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+            sheet.write(_sheet_row(1, columns, header).encode("utf-8"))
+            for number, values in enumerate(rows, start=2):
+                sheet.write(_sheet_row(number, columns, values).encode("utf-8"))
+            sheet.write(b"</sheetData></worksheet>")
+
+
+def _write_xlsx(path: Path, rows: Iterable[Dict[str, str]]) -> None:
+    write_xlsx(path, SAMPLE_COLUMNS, ([row[c] for c in SAMPLE_COLUMNS] for row in rows))
+
+
+_WRITERS: Dict[str, Callable[[Path, Iterable[Dict[str, str]]], None]] = {
+    "csv": _write_csv,
+    "xlsx": _write_xlsx,
+    "json": _write_json,
+}
+
+
+def write_file(path: Path, rows: int, seed: int = 0, invalid: float = DEFAULT_INVALID) -> Path:
+    """Write ``rows`` synthetic questions to ``path``; the suffix picks the format."""
+    path = Path(path)
+    fmt = path.suffix.lstrip(".").lower()
+    if fmt not in _WRITERS:
+        raise ValueError(f"unsupported upload format {fmt!r} (expected one of {', '.join(FORMATS)})")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _WRITERS[fmt](path, sample_rows(rows, seed, invalid))
+    return path
+
+
+def bench_file(fmt: str, rows: int, seed: int = 0, invalid: float = DEFAULT_INVALID) -> Path:
+    """The cached upload for one format and size, generated on first use."""
+    path = FILES_DIR / f"questions_{rows}_s{seed}_i{invalid:g}.{fmt}"
+    return path if path.exists() else write_file(path, rows, seed, invalid)
+
+
+def parse_formats(spec: str) -> List[str]:
+    formats = [f.strip().lower() for f in spec.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown:
+        raise ValueError(f"unknown upload formats {unknown} (expected one of {', '.join(FORMATS)})")
+    return formats
+
+
+class SupabaseWrites:
+    """Answers the tables ``saveBatch`` writes to and counts what it sends."""
+
+    PATTERN = "**/rest/v1/{bulk_upload_batches,bulk_upload_rows,questions_master}*"
+
+    def __init__(self):
+        self.batches = 0
+        self.inserted: Dict[str, int] = {}
+        self.request_bytes = 0
+
+    async def attach(self, context: async_api.BrowserContext) -> None:
+        await context.route(self.PATTERN, self._handle)
+
+    async def detach(self, context: async_api.BrowserContext) -> None:
+        await context.unroute(self.PATTERN, self._handle)
+
+    async def _handle(self, route: async_api.Route, request: async_api.Request) -> None:
+        cors = {"Access-Control-Allow-Origin": "*", "Access-Control-Allow-Headers": "*",
+                "Access-Control-Allow-Methods": "GET, POST, PATCH, OPTIONS"}
+        if request.method == "OPTIONS":
+            await route.fulfill(status=204, headers=cors)
+            return
+        table = request.url.split("/rest/v1/", 1)[1].split("?", 1)[0]
+        body = request.post_data_buffer or b""
+        self.request_bytes += len(body)
+        if request.method != "POST":
+            await route.fulfill(status=204, headers=cors)
+            return
+        payload = json.loads(body or b"[]")
+        self.inserted[table] = self.inserted.get(table, 0) + (len(payload) if isinstance(payload, list) else 1)
+        if table == "bulk_upload_batches":
+            self.batches += 1
+            record = {**payload, "batch_id": f"bench-batch-{self.batches}"}
+            await route.fulfill(status=201, headers=cors, content_type="application/json", body=json.dumps(record))
+            return
+        await route.fulfill(status=201, headers=cors)
+
+
+@dataclass
+class StageResult:
+    stage: str
+    ms: float
+    rows: int
+    heap_kb: float  # highest reading while the stage ran
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows * 1000.0 / self.ms if self.ms else 0.0
+
+
+@dataclass
+class UploadResult:
+    format: str
+    rows: int
+    file_bytes: int
+    valid: int = 0
+    saved: int = 0
+    failed: int = 0
+    request_bytes: int = 0
+    baseline_kb: float = 0.0
+    stages: List[StageResult] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(s.ms for s in self.stages)
+
+    @property
+    def peak_kb(self) -> float:
+        return max((s.heap_kb for s in self.stages), default=self.baseline_kb)
+
+    @property
+    def slowest(self) -> Optional[StageResult]:
+        return max(self.stages, key=lambda s: s.ms) if self.stages else None
+
+
+async def run_upload(page: async_api.Page, app_url: str, path: Path, rows: int) -> UploadResult:
+    """Run every stage of ``bulkUploadService`` on ``path`` in ``page``."""
+    base = app_url.rstrip("/")
+    fmt = path.suffix.lstrip(".")
+    file_url = f"{base}/__qbank_bulk/{path.name}"
+    writes = SupabaseWrites()
+    await page.route(file_url, lambda route: route.fulfill(path=str(path)))
+    await writes.attach(page.context)
+    session = await page.context.new_cdp_session(page)
+    try:
+        await page.goto(base, wait_until="commit")
+        await waits.settle(page)
+        size = await page.evaluate(
+            _BENCH_JS, {"module": "/services/bulkUploadService.ts", "url": file_url, "name": path.name}
+        )
+        await session.send("HeapProfiler.collectGarbage")
+        result = UploadResult(fmt, rows, size)
+        result.baseline_kb = round((await session.send("Runtime.getHeapUsage"))["usedSize"] / 1024.0, 1)
+        for stage in STAGES:
+            poller = HeapPoller(session)
+            poller.start()
+            try:
+                done = await page.evaluate(_STAGE_JS, stage)
+            except async_api.Error as exc:
+                hint = " (saveBatch needs VITE_SUPABASE_URL/ANON_KEY set; any values will do)" if stage == "save" else ""
+                raise AssertionError(f"{path.name}: {stage} stage failed{hint}: {exc.message}") from None
+            finally:
+                heap_kb = await poller.stop()
+            result.stages.append(StageResult(stage, round(done["ms"], 1), done["rows"], heap_kb))
+            if done["valid"] is not None:
+                result.valid = done["valid"]
+            if done["saved"]:
+                result.saved, result.failed = done["saved"]["savedCount"], done["saved"]["failedCount"]
+        result.request_bytes = writes.request_bytes
+        return result
+    finally:
+        await session.detach()
+        await writes.detach(page.context)
+        await page.unroute(file_url)
+
+
+async def run(
+    context: async_api.BrowserContext,
+    app_url: str,
+    scales: Sequence[int] = DEFAULT_SCALES,
+    formats: Sequence[str] = FORMATS,
+    seed: int = 0,
+    invalid: float = DEFAULT_INVALID,
+    on_upload: Optional[Callable[[UploadResult], None]] = None,
+) -> List[UploadResult]:
+    """Benchmark each format at each scale, each upload on a fresh page of ``context``."""
+    results = []
+    for rows in scales:
+        for fmt in formats:
+            path = bench_file(fmt, rows, seed, invalid)
+            page = await context.new_page()
+            page.set_default_timeout(STAGE_TIMEOUT_MS)
+            try:
+                result = await run_upload(page, app_url, path, rows)
+            finally:
+                await page.close()
+            results.append(result)
+            if on_upload:
+                on_upload(result)
+    return results
+
+
+def check(results: List[UploadResult]) -> List[str]:
+    """Uploads that lost rows on the way: everything parsed, valid rows saved, the rest logged."""
+    problems = []
+    for r in results:
+        label = f"{r.format} {r.rows} rows"
+        parsed = r.stages[0].rows if r.stages else 0
+        if parsed != r.rows:
+            problems.append(f"{label}: parsed {parsed} rows")
+        if r.saved != r.valid or r.saved + r.failed != r.rows:
+            problems.append(f"{label}: {r.valid} valid, {r.saved} saved, {r.failed} failed")
+    return problems
+
+
+def render(results: List[UploadResult]) -> str:
+    lines = [f"{'format':<7}{'rows':>8}{'stage':>11}{'ms':>10}{'rows/s':>11}{'peak MB':>9}"]
+    for r in results:
+        lines.append(f"{r.format:<7}{r.rows:>8}{'file':>11}{'':>10}{'':>11}{r.file_bytes / 2**20:>9.1f}"
+                     f"  (baseline heap {r.baseline_kb / 1024:.1f} MB)")
+        for s in r.stages:
+            lines.append(f"{'':<7}{'':>8}{s.stage:>11}{s.ms:>10.1f}{s.rows_per_s:>11.0f}{s.heap_kb / 1024:>9.1f}")
+        slowest = r.slowest
+        share = f"{slowest.stage} {slowest.ms / r.total_ms:.0%}" if slowest and r.total_ms else "-"
+        lines.append(f"{'':<7}{'':>8}{'total':>11}{r.total_ms:>10.1f}{'':>11}{r.peak_kb / 1024:>9.1f}"
+                     f"  slowest: {share}, {r.saved} saved / {r.failed} rejected")
+    return "\n".join(lines)
+
+
+def write(results: List[UploadResult], path: Path = REPORT_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = [
+        {**asdict(r), "total_ms": round(r.total_ms, 1), "peak_kb": r.peak_kb,
+         "stages": [{**asdict(s), "rows_per_s": round(s.rows_per_s)} for s in r.stages]}
+        for r in results
+    ]
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
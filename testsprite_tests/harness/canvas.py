@@ -0,0 +1,250 @@
+"""SmartBoard canvas benchmark.
+
+Loads N synthetic strokes straight into ``useBoardStore`` (exposed as
+``window.__qbankBoardStore`` in dev builds), then scripts draw, laser and drag
+gestures over the canvas while a CDP trace is recording. Each gesture is
+bracketed by ``performance.mark`` calls; frames are the renderer's
+``DrawFrame`` events between the marks and scripting/rendering time is the
+main-thread time DevTools would show for the same window.
+
+BoardCanvas has no viewport pan or zoom, so the drag gesture (moving a text
+object with the cursor tool, which rewrites the stroke list on drop) stands in
+for the "move the board" case.
+"""
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+from playwright import async_api
+
+from . import waits
+from .report import TMP_DIR
+from .trace import RENDERING_EVENTS, SCRIPTING_EVENTS, Trace, cdp_trace, main_thread_ms
+
+REPORT_PATH = TMP_DIR / "canvas_bench.json"
+DEFAULT_LEVELS = (1000, 5000, 20000)
+DEFAULT_MIN_FPS = "1000=30"
+# A frame that takes longer than this is visibly janky; matches the
+# long-animation-frame threshold.
+LONG_FRAME_MS = 50.0
+
+# "20000", "5k", "1.5m": counts on the command line and in QBANK_* knobs.
+_COUNT = re.compile(r"^(\d+(?:\.\d+)?)([km]?)$")
+_SUFFIXES = {"": 1, "k": 1_000, "m": 1_000_000}
+
+_INJECT_JS = """
+({count, seed, width, height}) => {
+  const store = window.__qbankBoardStore;
+  if (!store) throw new Error('window.__qbankBoardStore is missing; run the app with the Vite dev server');
+  let state = seed >>> 0;
+  const rand = () => (state = (state * 1664525 + 1013904223) >>> 0) / 4294967296;
+  const colors = ['#3b82f6', '#ef4444', '#22c55e', '#eab308', '#ffffff'];
+  const shapes = ['rectangle', 'circle', 'line', 'arrow'];
+  const strokes = [];
+  for (let i = 0; i < count; i++) {
+    const x = rand() * width, y = rand() * height;
+    const color = colors[i % colors.length];
+    if (i % 10 === 9) {
+      // One in ten is a shape, the rest freehand pen strokes.
+      strokes.push({
+        id: `bench-${i}`, tool: shapes[((i / 10) | 0) % shapes.length], color, size: 3,
+        isComplete: true, opacity: 1,
+        points: [{ x, y }, { x: x + 20 + rand() * 80, y: y + 20 + rand() * 80 }],
+      });
+      continue;
+    }
+    const points = [];
+    let px = x, py = y;
+    for (let j = 0, n = 20 + ((rand() * 40) | 0); j < n; j++) {
+      px += (rand() - 0.5) * 12;
+      py += (rand() - 0.5) * 12;
+      points.push({ x: px, y: py, pressure: 0.5 });
+    }
+    strokes.push({ id: `bench-${i}`, tool: 'pen', color, size: 4, isComplete: true, points });
+  }
+  strokes.push({
+    id: 'bench-drag', tool: 'text', text: 'DRAG', color: '#ffffff', size: 48, isComplete: true,
+    opacity: 1, points: [{ x: 0, y: 0 }], x: width * 0.2, y: height * 0.4,
+  });
+  const started = performance.now();
+  store.getState().setStrokes(strokes);
+  return new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(
+    () => resolve(performance.now() - started))));
+}
+"""
+_SET_TOOL_JS = "tool => window.__qbankBoardStore.getState().setTool(tool)"
+_MARK_JS = "name => performance.mark(name)"
+_TWO_FRAMES_JS = "() => new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))"
+
+
+@dataclass
+class GestureStats:
+    name: str
+    duration_ms: float
+    frames: int
+    fps: float
+    long_frames: int
+    p95_frame_ms: float
+    max_frame_ms: float
+    scripting_ms: float
+    rendering_ms: float
+
+
+@dataclass
+class LevelResult:
+    strokes: int
+    inject_ms: float
+    gestures: List[GestureStats] = field(default_factory=list)
+
+
+def gesture_stats(trace: Trace, name: str) -> GestureStats:
+    start, end = trace.mark(f"bench:{name}:start"), trace.mark(f"bench:{name}:end")
+    if start is None or end is None:
+        raise RuntimeError(f"gesture {name!r} marks missing from the trace")
+    mark = next(e for e in trace.events if e.get("name") == f"bench:{name}:start")
+    renderer = mark["pid"]
+    main = [key for key in trace.renderer_main_threads() if key[0] == renderer] or [(renderer, mark["tid"])]
+    events = trace.window(start, end)
+    draws = sorted(e["ts"] for e in events if e.get("name") == "DrawFrame" and e.get("pid") == renderer)
+    intervals = sorted((b - a) / 1000.0 for a, b in zip(draws, draws[1:]))
+    duration_ms = (end - start) / 1000.0
+    p95 = intervals[min(len(intervals) - 1, int(len(intervals) * 0.95))] if intervals else 0.0
+    return GestureStats(
+        name=name,
+        duration_ms=round(duration_ms, 1),
+        frames=len(draws),
+        fps=round(len(draws) / (duration_ms / 1000.0), 1) if duration_ms else 0.0,
+        long_frames=sum(1 for i in intervals if i > LONG_FRAME_MS),
+        p95_frame_ms=round(p95, 1),
+        max_frame_ms=round(intervals[-1], 1) if intervals else 0.0,
+        scripting_ms=round(main_thread_ms(events, main, SCRIPTING_EVENTS), 1),
+        rendering_ms=round(main_thread_ms(events, main, RENDERING_EVENTS), 1),
+    )
+
+
+class CanvasBench:
+    """Runs the gestures against a page that is already showing the SmartBoard."""
+
+    def __init__(self, page: async_api.Page, seed: int = 0):
+        self.page = page
+        self.seed = seed
+        self.width = self.height = 0.0
+
+    async def _gesture(self, name: str, action: Callable[[], Awaitable[None]]) -> None:
+        await self.page.evaluate(_MARK_JS, f"bench:{name}:start")
+        await action()
+        await self.page.evaluate(_TWO_FRAMES_JS)
+        await self.page.evaluate(_MARK_JS, f"bench:{name}:end")
+
+    async def _draw(self) -> None:
+        mouse = self.page.mouse
+        await self.page.evaluate(_SET_TOOL_JS, "pen")
+        for row in range(3):
+            y = self.height * (0.35 + row * 0.1)
+            await mouse.move(self.width * 0.3, y)
+            await mouse.down()
+            for step in range(60):
+                await mouse.move(self.width * (0.3 + step * 0.004), y + (12 if step % 2 else -12))
+            await mouse.up()
+
+    async def _laser(self) -> None:
+        mouse = self.page.mouse
+        await self.page.evaluate(_SET_TOOL_JS, "laser")
+        await mouse.move(self.width * 0.3, self.height * 0.5)
+        await mouse.down()
+        for step in range(120):
+            await mouse.move(self.width * (0.3 + step * 0.002), self.height * (0.5 + (step % 20) * 0.005))
+        await mouse.up()
+
+    async def _drag(self) -> None:
+        mouse = self.page.mouse
+        await self.page.evaluate(_SET_TOOL_JS, "cursor")
+        await mouse.move(self.width * 0.2 + 20, self.height * 0.4 + 20)
+        await mouse.down()
+        await mouse.move(self.width * 0.55, self.height * 0.6, steps=60)
+        await mouse.up()
+
+    async def run_level(self, count: int) -> LevelResult:
+        viewport = self.page.viewport_size or {"width": 1280, "height": 720}
+        self.width, self.height = float(viewport["width"]), float(viewport["height"])
+        inject_ms = await self.page.evaluate(
+            _INJECT_JS, {"count": count, "seed": self.seed + count, "width": self.width, "height": self.height}
+        )
+        await waits.react_quiet(self.page, waits.DEFAULT_IDLE_MS, 60000)
+        gestures = {"draw": self._draw, "laser": self._laser, "drag": self._drag}
+        async with cdp_trace(self.page) as capture:
+            for name, action in gestures.items():
+                await self._gesture(name, action)
+        result = LevelResult(strokes=count, inject_ms=round(inject_ms, 1))
+        result.gestures = [gesture_stats(capture.trace, name) for name in gestures]
+        return result
+
+    async def run(self, levels: Sequence[int] = DEFAULT_LEVELS) -> List[LevelResult]:
+        return [await self.run_level(count) for count in levels]
+
+
+async def open_board(page: async_api.Page, app_url: str, set_id: Optional[str] = None) -> None:
+    """Get ``page`` onto the SmartBoard via TeacherView (first set if no id given)."""
+    if set_id:
+        await page.goto(f"{app_url}/?view=teacher&setId={set_id}")
+    else:
+        await page.goto(f"{app_url}/?view=teacher")
+        card = page.locator("div.cursor-pointer").filter(has=page.locator("h3")).first
+        await waits.settle(page, card)
+        await card.click()
+    await page.wait_for_function("() => !!window.__qbankBoardStore", timeout=30000)
+    await waits.settle(page, page.locator("canvas").last)
+
+
+def parse_levels(spec: str) -> List[int]:
+    """``"1k,5000,1.5m"`` -> ``[1000, 5000, 1500000]``."""
+    levels = []
+    for part in (p.strip().lower() for p in spec.split(",")):
+        if not part:
+            continue
+        found = _COUNT.match(part)
+        count = Decimal(found.group(1)) * _SUFFIXES[found.group(2)] if found else None
+        if count is None or count != count.to_integral_value():
+            raise ValueError(f"bad count {part!r} (expected a whole number like 500, 10k or 1.5m)")
+        levels.append(int(count))
+    return levels
+
+
+def parse_min_fps(spec: str) -> Dict[int, float]:
+    """``"1000=30,5000=20"`` -> minimum FPS per stroke count."""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        count, _, fps = item.partition("=")
+        limits[parse_levels(count)[0]] = float(fps)
+    return limits
+
+
+def check(results: List[LevelResult], min_fps: Dict[int, float]) -> List[str]:
+    violations = []
+    for level in results:
+        limit = min_fps.get(level.strokes)
+        for gesture in level.gestures:
+            if limit is not None and gesture.fps < limit:
+                violations.append(f"{level.strokes} strokes, {gesture.name}: {gesture.fps} fps < {limit}")
+    return violations
+
+
+def render(results: List[LevelResult]) -> str:
+    lines = [f"{'strokes':>8}  {'gesture':<6}{'fps':>7}{'frames':>8}{'long':>6}{'p95 ms':>8}"
+             f"{'max ms':>8}{'script ms':>11}{'render ms':>11}"]
+    for level in results:
+        lines.append(f"{level.strokes:>8}  inject {level.inject_ms:.0f}ms")
+        for g in level.gestures:
+            lines.append(
+                f"{'':>8}  {g.name:<6}{g.fps:>7.1f}{g.frames:>8}{g.long_frames:>6}{g.p95_frame_ms:>8.1f}"
+                f"{g.max_frame_ms:>8.1f}{g.scripting_ms:>11.0f}{g.rendering_ms:>11.0f}"
+            )
+    return "\n".join(lines)
+
+
+def write(results: List[LevelResult], path: Path = REPORT_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([asdict(r) for r in results], indent=2), encoding="utf-8")
@@ -0,0 +1,232 @@
+"""Record/replay of AI provider traffic at the Playwright route level.
+
+Gemini calls go straight to generativelanguage.googleapis.com and Replicate
+calls go through the Vite ``/replicate-api`` proxy. Both are intercepted on the
+browser context; a response is looked up by a hash of the normalized request
+and, in record mode, fetched from the network and stored.
+
+Store layout under ``cassettes/``::
+
+    requests/<request sha256>.json   request summary + ordered responses
+    bodies/<aa>/<body sha256>        response bodies, shared between requests
+
+Identical requests repeated within one test (Replicate polling
+``/predictions/{id}``) are kept as an ordered list, so replay walks the same
+``starting -> processing -> succeeded`` sequence; calls past the recorded end
+get the last response.
+"""
+import asyncio
+import hashlib
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from playwright import async_api
+
+from .loader import TESTS_DIR
+
+CASSETTE_DIR = TESTS_DIR / "cassettes"
+
+AI_ROUTES = (
+    "**/generativelanguage.googleapis.com/**",
+    "**/replicate-api/**",
+)
+
+OFF, RECORD, REPLAY, AUTO = "off", "record", "replay", "auto"
+MODES = (OFF, RECORD, REPLAY, AUTO)
+
+# Query parameters and headers that carry credentials, never part of the key
+# and never written to disk.
+_SECRET_PARAMS = {"key", "api_key"}
+_DROP_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie", "date"}
+
+# Prompts embed "today"; without scrubbing every recording expires overnight.
+DEFAULT_SCRUBBERS: Sequence[Pattern] = (
+    re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?Z?"),
+    re.compile(r"\b\d{4}-\d{2}-\d{2}\b"),
+    re.compile(r"\bq_\d{13}_[a-z0-9]{5}\b"),
+)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _canonical_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _SECRET_PARAMS)
+    # Replicate is reached through whatever host serves the app; key on the path only.
+    netloc = "" if parts.path.startswith("/replicate-api/") else parts.netloc
+    return urlunsplit(("", netloc, parts.path, urlencode(query), ""))
+
+
+def _canonical_body(body: Optional[bytes], scrubbers: Sequence[Pattern]) -> str:
+    if not body:
+        return ""
+    text = body.decode("utf-8", errors="replace")
+    try:
+        text = json.dumps(json.loads(text), sort_keys=True, ensure_ascii=False)
+    except ValueError:
+        pass
+    for pattern in scrubbers:
+        text = pattern.sub("<scrubbed>", text)
+    return text
+
+
+def request_key(method: str, url: str, body: Optional[bytes], scrubbers: Sequence[Pattern] = DEFAULT_SCRUBBERS) -> str:
+    canonical = "\n".join([method.upper(), _canonical_url(url), _canonical_body(body, scrubbers)])
+    return _sha256(canonical.encode("utf-8"))
+
+
+@dataclass
+class RecordedResponse:
+    status: int
+    headers: Dict[str, str]
+    body_sha: str
+    elapsed_ms: float
+
+
+@dataclass
+class CassetteEntry:
+    method: str
+    url: str
+    responses: List[RecordedResponse] = field(default_factory=list)
+
+
+class CassetteStore:
+    """Content-addressed storage for recorded requests and response bodies."""
+
+    def __init__(self, root: Path = CASSETTE_DIR):
+        self.root = Path(root)
+
+    def _request_path(self, key: str) -> Path:
+        return self.root / "requests" / f"{key}.json"
+
+    def _body_path(self, sha: str) -> Path:
+        return self.root / "bodies" / sha[:2] / sha
+
+    def get(self, key: str) -> Optional[CassetteEntry]:
+        path = self._request_path(key)
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        responses = [RecordedResponse(**r) for r in data["responses"]]
+        return CassetteEntry(data["method"], data["url"], responses)
+
+    def put(self, key: str, entry: CassetteEntry) -> None:
+        path = self._request_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "method": entry.method,
+            "url": entry.url,
+            "responses": [r.__dict__ for r in entry.responses],
+        }
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(path)
+
+    def read_body(self, sha: str) -> bytes:
+        return self._body_path(sha).read_bytes()
+
+    def write_body(self, body: bytes) -> str:
+        sha = _sha256(body)
+        path = self._body_path(sha)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(body)
+        return sha
+
+
+class CassetteRecorder:
+    """Per-test route handler. Attach with ``await recorder.attach(context)``.
+
+    ``latency`` controls replay timing: ``None`` answers immediately,
+    ``"recorded"`` waits as long as the original response took, and a number
+    waits that many milliseconds.
+    """
+
+    def __init__(
+        self,
+        store: CassetteStore,
+        mode: str = AUTO,
+        latency: Union[None, str, float] = None,
+        routes: Sequence[str] = AI_ROUTES,
+        scrubbers: Sequence[Pattern] = DEFAULT_SCRUBBERS,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"unknown cassette mode {mode!r}")
+        self.store = store
+        self.mode = mode
+        self.latency = latency
+        self.routes = routes
+        self.scrubbers = scrubbers
+        self.seen: Counter = Counter()
+        self.stats: Counter = Counter()
+        self._recording: Dict[str, CassetteEntry] = {}
+        # Responses recorded in this test by call index; identical requests in
+        # flight together can finish in any order.
+        self._recorded: Dict[str, Dict[int, RecordedResponse]] = {}
+        self._lock = asyncio.Lock()
+
+    async def attach(self, context: async_api.BrowserContext) -> None:
+        if self.mode == OFF:
+            return
+        for pattern in self.routes:
+            await context.route(pattern, self._handle)
+
+    async def _delay(self, recorded: RecordedResponse) -> None:
+        if self.latency is None:
+            return
+        ms = recorded.elapsed_ms if self.latency == "recorded" else float(self.latency)
+        await asyncio.sleep(ms / 1000.0)
+
+    async def _handle(self, route: async_api.Route, request: async_api.Request) -> None:
+        key = request_key(request.method, request.url, request.post_data_buffer, self.scrubbers)
+        index = self.seen[key]
+        self.seen[key] += 1
+
+        entry = self.store.get(key) if self.mode != RECORD else None
+        if entry and entry.responses:
+            recorded = entry.responses[min(index, len(entry.responses) - 1)]
+            await self._delay(recorded)
+            self.stats["hits"] += 1
+            await route.fulfill(status=recorded.status, headers=recorded.headers, body=self.store.read_body(recorded.body_sha))
+            return
+        if self.mode == REPLAY:
+            self.stats["misses"] += 1
+            await route.fulfill(
+                status=599,
+                content_type="application/json",
+                body=json.dumps({"error": {"message": f"no cassette for {request.method} {_canonical_url(request.url)}"}}),
+            )
+            return
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        response = await route.fetch()
+        body = await response.body()
+        elapsed_ms = (loop.time() - started) * 1000.0
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROP_RESPONSE_HEADERS}
+        recorded = RecordedResponse(response.status, headers, self.store.write_body(body), round(elapsed_ms, 1))
+        async with self._lock:
+            # The first call of a request in this test starts a fresh sequence.
+            entry = self._recording.setdefault(key, CassetteEntry(request.method, _canonical_url(request.url)))
+            by_index = self._recorded.setdefault(key, {})
+            by_index[index] = recorded
+            entry.responses = [by_index[i] for i in sorted(by_index)]
+            self.store.put(key, entry)
+        self.stats["recorded"] += 1
+        await route.fulfill(status=response.status, headers=headers, body=body)
+
+
+def parse_latency(value: Optional[str]) -> Union[None, str, float]:
+    """CLI form: ``none``, ``recorded`` or a number of milliseconds."""
+    if value is None or value == "none":
+        return None
+    if value == "recorded":
+        return value
+    return float(value)
@@ -0,0 +1,120 @@
+"""Rewrites generated TC scripts to use ``harness.waits`` instead of fixed sleeps.
+
+Runs of two or more ``expect(frame.locator('text=...').first).to_be_visible()``
+lines on the same frame and timeout are folded into one
+``waits.expect_texts`` call.
+
+TestSprite regenerates the scripts from scratch, so this is kept as a
+re-runnable source transform (``python -m harness rewrite``) rather than a
+one-off edit. It is idempotent.
+"""
+import ast
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+IMPORT_LINE = "from harness import waits\n"
+
+# await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+_SLEEP_BEFORE_ACTION = re.compile(r"await (\w+)\.wait_for_timeout\((\d+)\); await (\w+)\.")
+# await asyncio.sleep(3) right after a page.goto(...)
+_SLEEP_AFTER_GOTO = re.compile(r"(\n(\s*)await page\.goto\([^\n]*\)\n)\2await asyncio\.sleep\((\d+)\)\n")
+# trailing await asyncio.sleep(5) before the finally: block
+_TRAILING_SLEEP = re.compile(r"\n\s*await asyncio\.sleep\((\d+)\)\n(\s*\n)*(\s*finally:)")
+_NEW_CONTEXT = re.compile(r"(\n(\s*)context = await browser\.new_context\([^\n]*\)\n)")
+_PLAYWRIGHT_IMPORT = re.compile(r"^from playwright import async_api\n", re.M)
+# await expect(frame.locator('text=...').first).to_be_visible(timeout=30000)
+_EXPECT_TEXT = re.compile(r"^(\s*)await expect\((\w+)\.locator\((.+)\)\.first\)\.to_be_visible\(timeout=(\d+)\)\s*$")
+
+
+@dataclass
+class RewriteStats:
+    settles: int = 0
+    trailing_ms: int = 0
+    batched: int = 0
+
+    def __iadd__(self, other: "RewriteStats") -> "RewriteStats":
+        self.settles += other.settles
+        self.trailing_ms += other.trailing_ms
+        self.batched += other.batched
+        return self
+
+
+def _text_expectation(line: str) -> Optional[Tuple[str, str, str, str]]:
+    """``(indent, frame, text, timeout)`` of a ``text=`` visibility assertion line."""
+    match = _EXPECT_TEXT.match(line)
+    if not match:
+        return None
+    try:
+        selector = ast.literal_eval(match.group(3))
+    except (ValueError, SyntaxError):
+        return None  # not a plain string literal (or not valid Python to begin with)
+    if not isinstance(selector, str) or not selector.startswith("text="):
+        return None
+    return match.group(1), match.group(2), selector[len("text="):], match.group(4)
+
+
+def batch_text_assertions(source: str) -> Tuple[str, int]:
+    """Fold consecutive ``text=`` assertions into ``waits.expect_texts``; returns the count folded."""
+    lines = source.splitlines(keepends=True)
+    out: List[str] = []
+    folded = i = 0
+    while i < len(lines):
+        first = _text_expectation(lines[i])
+        run = [first] if first else []
+        while first and i + len(run) < len(lines):
+            following = _text_expectation(lines[i + len(run)])
+            if not following or following[:2] != first[:2] or following[3] != first[3]:
+                break
+            run.append(following)
+        if len(run) < 2:
+            out.append(lines[i])
+            i += 1
+            continue
+        indent, frame, _, timeout = first
+        out.append(f"{indent}await waits.expect_texts({frame}, [\n")
+        out += [f"{indent}    {text!r},\n" for _, _, text, _ in run]
+        out.append(f"{indent}], timeout_ms={timeout})\n")
+        folded += len(run)
+        i += len(run)
+    return "".join(out), folded
+
+
+def rewrite_source(source: str) -> Tuple[str, RewriteStats]:
+    stats = RewriteStats()
+
+    def before_action(match: re.Match) -> str:
+        page, ms, elem = match.group(1), int(match.group(2)), match.group(3)
+        stats.settles += 1
+        budget = "" if ms == 3000 else f", budget_ms={ms}"
+        return f"await waits.settle({page}, {elem}{budget}); await {elem}."
+
+    def after_goto(match: re.Match) -> str:
+        ms = int(match.group(3)) * 1000
+        stats.settles += 1
+        budget = "" if ms == 3000 else f", budget_ms={ms}"
+        return f"{match.group(1)}{match.group(2)}await waits.settle(page{budget})\n"
+
+    def trailing(match: re.Match) -> str:
+        stats.trailing_ms += int(match.group(1)) * 1000
+        return f"\n\n{match.group(3)}"
+
+    source = _SLEEP_BEFORE_ACTION.sub(before_action, source)
+    source = _SLEEP_AFTER_GOTO.sub(after_goto, source)
+    source = _TRAILING_SLEEP.sub(trailing, source)
+    source, stats.batched = batch_text_assertions(source)
+
+    if "waits.install(context)" not in source:
+        source = _NEW_CONTEXT.sub(r"\1\2await waits.install(context)\n", source, count=1)
+    if IMPORT_LINE not in source:
+        source = _PLAYWRIGHT_IMPORT.sub(lambda m: m.group(0) + IMPORT_LINE, source, count=1)
+    return source, stats
+
+
+def rewrite_file(path: Path, dry_run: bool = False) -> RewriteStats:
+    source = path.read_text(encoding="utf-8")
+    rewritten, stats = rewrite_source(source)
+    if rewritten != source and not dry_run:
+        path.write_text(rewritten, encoding="utf-8")
+    return stats
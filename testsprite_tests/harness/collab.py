@@ -0,0 +1,418 @@
+"""Multi-user collaboration simulator for the SmartBoard canvas.
+
+The app has no sync layer yet, so this module brings both halves of one:
+
+* ``make_server``: a local sync-server stand-in. Clients ``POST`` finished
+  strokes to ``/rooms/<room>/ops?client=<id>`` and listen on
+  ``/rooms/<room>/events?client=<id>`` (Server-Sent Events); every op is
+  relayed to the room's other clients with a server timestamp, optionally
+  after ``relay_delay_ms`` to stand in for a hosted relay. ``GET /__stats``
+  returns op and byte counters.
+* ``_BRIDGE_JS``: installed in each page after the board opens; it
+  subscribes to ``window.__qbankBoardStore`` and posts every new completed
+  stroke, and appends strokes arriving from the server to the store.
+
+``CollabSim`` opens N browser contexts on the same SmartBoard set and has
+them draw pen strokes at the same time. It reports:
+
+* propagation latency: from the moment a stroke lands in its author's store
+  to the first frame after it lands in another client's store (all pages run
+  on the same machine, so their ``performance.timeOrigin`` clocks agree);
+* convergence: how long after the last stroke every client holds the same
+  strokes, and whether they hold them in the same order (ops are appended on
+  arrival, so concurrent strokes can stack differently per client);
+* bytes on the wire per stroke, request bodies in and event frames out.
+"""
+import asyncio
+import json
+import queue
+import random
+import re
+import statistics
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from playwright import async_api
+
+from . import waits
+from .canvas import open_board
+from .report import TMP_DIR
+
+REPORT_PATH = TMP_DIR / "collab.json"
+DEFAULT_CLIENTS = 3
+DEFAULT_STROKES = 20
+DEFAULT_INTERVAL_MS = 250.0
+DEFAULT_MAX_P95_MS = 500.0
+CONVERGE_TIMEOUT_S = 60.0
+# SSE comment sent on idle streams so dead clients are noticed.
+KEEPALIVE_S = 15.0
+
+_ROOM_RE = re.compile(r"^/rooms/([\w.-]+)/(ops|events)$")
+
+
+class SyncState:
+    def __init__(self, relay_delay_ms: float = 0.0):
+        self.relay_delay_ms = relay_delay_ms
+        self.lock = threading.Lock()
+        self.rooms: Dict[str, Dict[str, "queue.Queue[bytes]"]] = {}
+        self.counters: Counter = Counter()
+
+    def subscribe(self, room: str, client: str) -> "queue.Queue[bytes]":
+        inbox: "queue.Queue[bytes]" = queue.Queue()
+        with self.lock:
+            self.rooms.setdefault(room, {})[client] = inbox
+            self.counters["subscribers"] += 1
+        return inbox
+
+    def unsubscribe(self, room: str, client: str, inbox: "queue.Queue[bytes]") -> None:
+        with self.lock:
+            members = self.rooms.get(room, {})
+            if members.get(client) is inbox:
+                del members[client]
+
+    def publish(self, room: str, client: str, op: dict) -> int:
+        op = {**op, "client": client, "serverAt": time.time() * 1000.0}
+        frame = f"data: {json.dumps(op, separators=(',', ':'), ensure_ascii=False)}\n\n".encode("utf-8")
+        with self.lock:
+            targets = [inbox for member, inbox in self.rooms.get(room, {}).items() if member != client]
+            self.counters["ops"] += 1
+            self.counters["deliveries"] += len(targets)
+            self.counters["bytesOut"] += len(frame) * len(targets)
+        for inbox in targets:
+            inbox.put(frame)
+        return len(targets)
+
+
+class SyncHandler(BaseHTTPRequestHandler):
+    state: SyncState  # set on the bound subclass in make_server
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _cors(self) -> None:
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Headers", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+
+    def _json(self, status: int, body) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self._cors()
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _route(self) -> Tuple[Optional[re.Match], str]:
+        parts = urlsplit(self.path)
+        client = parse_qs(parts.query).get("client", [""])[0]
+        return _ROOM_RE.match(parts.path), client
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._cors()
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        if urlsplit(self.path).path == "/__stats":
+            with self.state.lock:
+                rooms = {room: len(members) for room, members in self.state.rooms.items()}
+                return self._json(200, dict(self.state.counters, rooms=rooms))
+        match, client = self._route()
+        if not match or match.group(2) != "events" or not client:
+            return self._json(404, {"error": "not found"})
+        room = match.group(1)
+        inbox = self.state.subscribe(room, client)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self._cors()
+        self.end_headers()
+        try:
+            self.wfile.write(b": connected\n\n")
+            self.wfile.flush()
+            while True:
+                try:
+                    frame = inbox.get(timeout=KEEPALIVE_S)
+                except queue.Empty:
+                    frame = b": ping\n\n"
+                self.wfile.write(frame)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.state.unsubscribe(room, client, inbox)
+            self.close_connection = True
+
+    def do_POST(self):
+        match, client = self._route()
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not match or match.group(2) != "ops" or not client:
+            return self._json(404, {"error": "not found"})
+        try:
+            op = json.loads(raw or b"{}")
+        except ValueError:
+            return self._json(400, {"error": "ops are JSON objects"})
+        with self.state.lock:
+            self.state.counters["bytesIn"] += len(raw)
+        if self.state.relay_delay_ms:
+            time.sleep(self.state.relay_delay_ms / 1000.0)
+        delivered = self.state.publish(match.group(1), client, op)
+        self._json(202, {"delivered": delivered})
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8790, relay_delay_ms: float = 0.0) -> ThreadingHTTPServer:
+    handler = type("BoundSyncHandler", (SyncHandler,), {"state": SyncState(relay_delay_ms)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_in_thread(host: str = "127.0.0.1", port: int = 0, relay_delay_ms: float = 0.0) -> Tuple[ThreadingHTTPServer, str]:
+    """Start a sync server on a background thread; returns it and its base URL."""
+    server = make_server(host, port, relay_delay_ms)
+    threading.Thread(target=server.serve_forever, name="sync-server", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+_BRIDGE_JS = """
+({ server, room, client }) => new Promise((resolve, reject) => {
+  const store = window.__qbankBoardStore;
+  const now = () => performance.timeOrigin + performance.now();
+  const known = new Set(store.getState().strokes.map((s) => s.id));
+  const bridge = window.__qbankCollab = { client, sent: [], received: [], applying: false };
+  const events = new EventSource(`${server}/rooms/${room}/events?client=${client}`);
+  events.onopen = () => resolve();
+  events.onerror = () => reject(new Error(`sync server ${server} unreachable`));
+  events.onmessage = (message) => {
+    const op = JSON.parse(message.data);
+    const arrivedAt = now();
+    known.add(op.stroke.id);
+    bridge.applying = true;
+    try { store.setState((state) => ({ strokes: [...state.strokes, op.stroke] })); }
+    finally { bridge.applying = false; }
+    requestAnimationFrame(() => setTimeout(() => bridge.received.push({
+      id: op.stroke.id, from: op.client, sentAt: op.sentAt, serverAt: op.serverAt, arrivedAt, paintedAt: now(),
+    }), 0));
+  };
+  store.subscribe((state) => {
+    if (bridge.applying) return;
+    for (const stroke of state.strokes) {
+      if (known.has(stroke.id) || !stroke.isComplete) continue;
+      known.add(stroke.id);
+      const sentAt = now();
+      bridge.sent.push({ id: stroke.id, sentAt, points: stroke.points.length });
+      fetch(`${server}/rooms/${room}/ops?client=${client}`, {
+        method: 'POST', headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ type: 'add', sentAt, stroke }),
+      });
+    }
+  });
+})
+"""
+_STROKE_IDS_JS = "() => window.__qbankBoardStore.getState().strokes.map((s) => s.id)"
+_BRIDGE_LOG_JS = "() => ({ sent: window.__qbankCollab.sent, received: window.__qbankCollab.received })"
+_SET_PEN_JS = "() => window.__qbankBoardStore.getState().setTool('pen')"
+
+
+@dataclass
+class Delivery:
+    stroke: str
+    sender: str
+    receiver: str
+    ms: float
+    relay_ms: float
+
+
+@dataclass
+class CollabReport:
+    clients: int
+    strokes_per_client: int
+    sent: int = 0
+    points: int = 0
+    deliveries: List[Delivery] = field(default_factory=list)
+    converged: bool = False
+    converge_ms: Optional[float] = None
+    same_order: bool = False
+    missing: Dict[str, int] = field(default_factory=dict)
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+    @property
+    def expected_deliveries(self) -> int:
+        return self.sent * (self.clients - 1)
+
+    def latency(self) -> Dict[str, float]:
+        values = sorted(d.ms for d in self.deliveries)
+        if not values:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        return {
+            "count": len(values),
+            "p50": round(statistics.median(values), 1),
+            "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))], 1),
+            "max": round(values[-1], 1),
+        }
+
+    def bytes_per_stroke(self) -> Dict[str, float]:
+        sent = max(self.sent, 1)
+        return {"in": round(self.bytes_in / sent), "out": round(self.bytes_out / sent),
+                "total": round((self.bytes_in + self.bytes_out) / sent)}
+
+    def check(self, max_p95_ms: Optional[float] = DEFAULT_MAX_P95_MS) -> List[str]:
+        violations = []
+        if not self.converged:
+            lost = ", ".join(f"{client} missing {n}" for client, n in self.missing.items() if n)
+            violations.append(f"clients did not converge within {CONVERGE_TIMEOUT_S:.0f}s ({lost or 'order differs'})")
+        if len(self.deliveries) < self.expected_deliveries:
+            violations.append(f"{self.expected_deliveries - len(self.deliveries)} of {self.expected_deliveries} "
+                              "stroke deliveries never painted")
+        p95 = self.latency()["p95"]
+        if max_p95_ms is not None and p95 > max_p95_ms:
+            violations.append(f"p95 stroke propagation {p95:.0f}ms > {max_p95_ms:.0f}ms")
+        return violations
+
+    def render(self) -> str:
+        lat, size = self.latency(), self.bytes_per_stroke()
+        lines = [
+            f"{self.clients} clients x {self.strokes_per_client} strokes: {self.sent} sent, "
+            f"{len(self.deliveries)}/{self.expected_deliveries} delivered, "
+            f"{self.points / max(self.sent, 1):.0f} points/stroke",
+            f"propagation  p50 {lat['p50']:.1f}ms  p95 {lat['p95']:.1f}ms  max {lat['max']:.1f}ms",
+        ]
+        if self.deliveries:
+            relay = statistics.median(d.relay_ms for d in self.deliveries)
+            lines.append(f"             of which sender -> server p50 {relay:.1f}ms")
+        if self.converged:
+            order = "same order everywhere" if self.same_order else "ORDER DIFFERS between clients"
+            lines.append(f"convergence  {self.converge_ms:.0f}ms after the last stroke, {order}")
+        else:
+            lines.append("convergence  not reached")
+        lines.append(f"wire         {size['in']:.0f} B in + {size['out']:.0f} B out = {size['total']:.0f} B per stroke")
+        return "\n".join(lines)
+
+    def write(self, path: Path = REPORT_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {**asdict(self), "latency": self.latency(), "bytesPerStroke": self.bytes_per_stroke()}
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+class CollabSim:
+    """N browser contexts drawing on one SmartBoard set, synced through a sync server."""
+
+    def __init__(
+        self,
+        browser: async_api.Browser,
+        app_url: str,
+        server_url: str,
+        clients: int = DEFAULT_CLIENTS,
+        strokes: int = DEFAULT_STROKES,
+        interval_ms: float = DEFAULT_INTERVAL_MS,
+        set_id: Optional[str] = None,
+        seed: int = 0,
+    ):
+        self.browser = browser
+        self.app_url = app_url.rstrip("/")
+        self.server_url = server_url.rstrip("/")
+        self.clients = clients
+        self.strokes = strokes
+        self.interval_ms = interval_ms
+        self.set_id = set_id
+        self.seed = seed
+        self.room = f"board-{set_id or 'first'}-{int(time.time())}"
+        self.pages: Dict[str, async_api.Page] = {}
+        self.initial: Dict[str, int] = {}
+
+    async def _join(self, client: str) -> None:
+        context = await self.browser.new_context(viewport={"width": 1280, "height": 720})
+        await waits.install(context)
+        page = await context.new_page()
+        await open_board(page, self.app_url, self.set_id)
+        await page.evaluate(_BRIDGE_JS, {"server": self.server_url, "room": self.room, "client": client})
+        await page.evaluate(_SET_PEN_JS)
+        self.initial[client] = len(await page.evaluate(_STROKE_IDS_JS))
+        self.pages[client] = page
+
+    async def _draw(self, index: int, page: async_api.Page) -> None:
+        rng = random.Random(self.seed * 1000 + index)
+        viewport = page.viewport_size or {"width": 1280, "height": 720}
+        width, height = viewport["width"], viewport["height"]
+        for _ in range(self.strokes):
+            x, y = width * rng.uniform(0.2, 0.8), height * rng.uniform(0.3, 0.8)
+            await page.mouse.move(x, y)
+            await page.mouse.down()
+            for _ in range(20):
+                x, y = x + rng.uniform(-8, 12), y + rng.uniform(-6, 6)
+                await page.mouse.move(x, y)
+            await page.mouse.up()
+            await asyncio.sleep(self.interval_ms * rng.uniform(0.5, 1.5) / 1000.0)
+
+    async def _converge(self, expected: int) -> Tuple[bool, Optional[float], bool, Dict[str, int]]:
+        started = time.monotonic()
+        while True:
+            ids = dict(zip(self.pages, await asyncio.gather(*(p.evaluate(_STROKE_IDS_JS) for p in self.pages.values()))))
+            sets = {client: set(found) for client, found in ids.items()}
+            union = set().union(*sets.values())
+            missing = {client: len(union - found) for client, found in sets.items()}
+            if len(union) >= expected and not any(missing.values()):
+                orders = {tuple(found) for found in ids.values()}
+                return True, (time.monotonic() - started) * 1000.0, len(orders) == 1, missing
+            if time.monotonic() - started > CONVERGE_TIMEOUT_S:
+                return False, None, False, missing
+            await asyncio.sleep(0.02)
+
+    async def run(self, stats: Callable[[], Dict]) -> CollabReport:
+        clients = [f"c{i + 1}" for i in range(self.clients)]
+        try:
+            for client in clients:
+                await self._join(client)
+            await asyncio.gather(*(self._draw(i, page) for i, page in enumerate(self.pages.values())))
+            report = CollabReport(self.clients, self.strokes)
+            logs = {client: await page.evaluate(_BRIDGE_LOG_JS) for client, page in self.pages.items()}
+            report.sent = sum(len(log["sent"]) for log in logs.values())
+            report.points = sum(s["points"] for log in logs.values() for s in log["sent"])
+            report.converged, report.converge_ms, report.same_order, report.missing = \
+                await self._converge(max(self.initial.values(), default=0) + report.sent)
+            # Deliveries painted while converging are only in the logs now.
+            logs = {client: await page.evaluate(_BRIDGE_LOG_JS) for client, page in self.pages.items()}
+            report.deliveries = [
+                Delivery(r["id"], r["from"], client, round(r["paintedAt"] - r["sentAt"], 1),
+                         round(r["serverAt"] - r["sentAt"], 1))
+                for client, log in logs.items()
+                for r in log["received"]
+            ]
+            counters = stats()
+            report.bytes_in, report.bytes_out = counters.get("bytesIn", 0), counters.get("bytesOut", 0)
+            return report
+        finally:
+            for page in self.pages.values():
+                await page.context.close()
+
+
+async def run(
+    browser: async_api.Browser,
+    app_url: str,
+    clients: int = DEFAULT_CLIENTS,
+    strokes: int = DEFAULT_STROKES,
+    interval_ms: float = DEFAULT_INTERVAL_MS,
+    relay_delay_ms: float = 0.0,
+    set_id: Optional[str] = None,
+    seed: int = 0,
+) -> CollabReport:
+    """Run the simulation against a sync server started for it."""
+    server, url = start_in_thread(relay_delay_ms=relay_delay_ms)
+    state: SyncState = server.RequestHandlerClass.state
+    try:
+        sim = CollabSim(browser, app_url, url, clients, strokes, interval_ms, set_id, seed)
+        return await sim.run(lambda: dict(state.counters))
+    finally:
+        server.shutdown()
+        server.server_close()
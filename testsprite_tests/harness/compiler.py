@@ -0,0 +1,217 @@
+"""Compiles testsprite_frontend_test_plan.json into runnable TC scripts.
+
+Each plan entry becomes ``TCxxx_<Title>.py``: a ``run_test`` coroutine that
+opens a ``harness.steps.StepSession`` and makes one ``await s.<method>(...)``
+call per plan step, with the step's description kept as a comment above it.
+Steps no registered pattern matches compile to ``s.unsupported(...)``, which
+fails the test with the step text, and are listed in the coverage report.
+
+Compiled sources are cached under tmp/.compiled keyed by a step hash: the
+plan entry itself plus the step registry (patterns and method names) and the
+template version. Regenerating after a plan edit only rebuilds the entries
+whose hash changed; the others are copied from the cache, and files whose
+content is already current are not touched at all.
+
+Compiled files carry a header with the plan id and hash. A TC file without
+that header is hand-written and is never overwritten unless forced. Nor is a
+hand-written script under another name that implements the same plan entry
+(same TC id, matching title, found the way ``impact`` finds scripts): it is
+reported as superseded. The runner picks up both until the hand-written one
+is removed, which only happens on request (``compile --prune``).
+"""
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from . import steps
+from .impact import plan_scripts
+from .loader import TESTS_DIR, discover
+
+PLAN_PATH = TESTS_DIR / "testsprite_frontend_test_plan.json"
+CACHE_DIR = TESTS_DIR / "tmp" / ".compiled"
+# Bump when the generated source changes shape, so cached output is rebuilt.
+TEMPLATE_VERSION = 1
+
+HEADER = "# Compiled from {plan} ({id}, step hash {hash}) by `python -m harness compile`.\n" \
+         "# Edit the plan or harness/steps.py, not this file.\n"
+_HEADER_RE = re.compile(r"^# Compiled from .+ \((TC\d{3}), step hash ([0-9a-f]+)\)")
+
+_TEMPLATE = '''{header}import asyncio
+from playwright import async_api
+from harness import steps
+
+async def run_test():
+    async with steps.StepSession(async_api) as s:
+{body}
+
+asyncio.run(run_test())
+'''
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+SKIPPED = "skipped"
+
+
+@dataclass
+class CompiledStep:
+    kind: str
+    description: str
+    method: Optional[str]
+    kwargs: Dict[str, str] = field(default_factory=dict)
+
+    def render(self) -> str:
+        if self.method is None:
+            call = f"s.unsupported({self.kind!r}, {self.description!r})"
+        else:
+            args = ", ".join(f"{k}={v!r}" for k, v in self.kwargs.items())
+            call = f"s.{self.method}({args})"
+        prefix = "->" if self.kind == steps.ACTION else "-->"
+        return f"        # {prefix} {self.description}\n        await {call}"
+
+
+@dataclass
+class Compiled:
+    tc_id: str
+    title: str
+    path: Path
+    step_hash: str
+    steps: List[CompiledStep]
+    status: str = ""
+    cached: bool = False
+    superseded: List[Path] = field(default_factory=list)
+
+    @property
+    def unmatched(self) -> List[CompiledStep]:
+        return [s for s in self.steps if s.method is None]
+
+
+def load_plan(path: Path = PLAN_PATH) -> List[Dict]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def script_name(entry: Dict) -> str:
+    """``TC003`` + ``Undo/Redo Functionality ...`` -> ``TC003_Undo_Redo_Functionality_....py``."""
+    return f"{entry['id']}_{re.sub(r'[^0-9A-Za-z.]', '_', entry['title'])}.py"
+
+
+def registry_digest() -> str:
+    spec = [(d.kind, d.pattern.pattern, d.method) for d in steps.REGISTRY]
+    return hashlib.sha256(json.dumps(spec).encode("utf-8")).hexdigest()
+
+
+def step_hash(entry: Dict, registry: Optional[str] = None) -> str:
+    payload = json.dumps(
+        {"entry": entry, "registry": registry or registry_digest(), "template": TEMPLATE_VERSION}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def compile_steps(entry: Dict) -> List[CompiledStep]:
+    compiled = []
+    for item in entry.get("steps", []):
+        kind, description = item.get("type", steps.ACTION), item.get("description", "").strip()
+        found = steps.match(kind, description)
+        method, kwargs = found if found else (None, {})
+        compiled.append(CompiledStep(kind, description, method, kwargs))
+    return compiled
+
+
+def render(entry: Dict, digest: str, compiled: List[CompiledStep], plan: Path = PLAN_PATH) -> str:
+    header = HEADER.format(plan=Path(plan).name, id=entry["id"], hash=digest)
+    body = "\n\n".join(s.render() for s in compiled) or "        pass"
+    return _TEMPLATE.format(header=header, body=body)
+
+
+def compiled_header(path: Path) -> Optional[Tuple[str, str]]:
+    """``(tc id, step hash)`` from a compiled file's header; None for hand-written files."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            found = _HEADER_RE.match(f.readline())
+    except OSError:
+        return None
+    return (found.group(1), found.group(2)) if found else None
+
+
+class Compiler:
+    def __init__(
+        self,
+        plan: Path = PLAN_PATH,
+        out_dir: Path = TESTS_DIR,
+        cache_dir: Path = CACHE_DIR,
+        force: bool = False,
+        prune: bool = False,
+    ):
+        self.plan = Path(plan)
+        self.out_dir = Path(out_dir)
+        self.cache_dir = Path(cache_dir)
+        self.force = force
+        self.prune = prune
+        self.registry = registry_digest()
+
+    def _source(self, entry: Dict, digest: str, write: bool = True) -> Tuple[str, bool]:
+        cached = self.cache_dir / f"{digest}.py"
+        if cached.exists():
+            return cached.read_text(encoding="utf-8"), True
+        source = render(entry, digest, compile_steps(entry), self.plan)
+        if write:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cached.write_text(source, encoding="utf-8")
+        return source, False
+
+    def _superseded(self, entry: Dict, path: Path) -> List[Path]:
+        """Hand-written scripts under other names that implement ``entry``."""
+        return [
+            s.path for s in plan_scripts(entry, [], discover(self.out_dir))
+            if s.path != path and compiled_header(s.path) is None
+        ]
+
+    def compile_entry(self, entry: Dict, write: bool = True) -> Compiled:
+        digest = step_hash(entry, self.registry)
+        path = self.out_dir / script_name(entry)
+        result = Compiled(entry["id"], entry["title"], path, digest, compile_steps(entry))
+        source, result.cached = self._source(entry, digest, write)
+        result.superseded = self._superseded(entry, path)
+
+        if not path.exists():
+            result.status = CREATED
+        elif compiled_header(path) is None and not self.force:
+            result.status = SKIPPED
+        elif path.read_text(encoding="utf-8") == source:
+            result.status = UNCHANGED
+        else:
+            result.status = UPDATED
+        if write and result.status in (CREATED, UPDATED):
+            path.write_text(source, encoding="utf-8")
+        if write and self.prune:
+            for old in result.superseded:
+                old.unlink()
+        return result
+
+    def compile(self, ids: Iterable[str] = (), write: bool = True) -> List[Compiled]:
+        ids = {i.upper() for i in ids}
+        return [
+            self.compile_entry(entry, write)
+            for entry in load_plan(self.plan)
+            if not ids or entry["id"].upper() in ids
+        ]
+
+
+def render_report(results: List[Compiled]) -> str:
+    lines = []
+    total = matched = 0
+    for result in results:
+        total += len(result.steps)
+        matched += len(result.steps) - len(result.unmatched)
+        source = "cache" if result.cached else "built"
+        lines.append(f"{result.status:<10}{source:<7}{len(result.steps) - len(result.unmatched):>3}/"
+                     f"{len(result.steps):<3} {result.path.name}")
+        if result.status == SKIPPED:
+            lines.append("          hand-written file in the way; use --force to replace it")
+        lines += [f"          supersedes hand-written {p.name}; use --prune to remove it" for p in result.superseded]
+        lines += [f"          unsupported {s.kind}: {s.description}" for s in result.unmatched]
+    lines.append(f"\n{matched}/{total} plan steps map onto harness.steps")
+    return "\n".join(lines)
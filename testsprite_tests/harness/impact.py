@@ -0,0 +1,246 @@
+"""Diff-scoped test selection.
+
+Changed files are expanded to everything that imports them (transitively),
+then mapped to features through tmp/code_summary.json, to TC IDs through
+testsprite_frontend_test_plan.json, and finally to the TC scripts on disk.
+
+The import graph of the TS/TSX sources is cached in tmp/.impact_cache.json
+and only files whose mtime or size changed are re-parsed.
+"""
+import json
+import os
+import re
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .loader import TESTS_DIR, TestScript, discover
+from .report import TMP_DIR
+
+REPO_ROOT = TESTS_DIR.parent
+CODE_SUMMARY_PATH = TMP_DIR / "code_summary.json"
+TEST_PLAN_PATH = TESTS_DIR / "testsprite_frontend_test_plan.json"
+CACHE_PATH = TMP_DIR / ".impact_cache.json"
+
+SOURCE_SUFFIXES = (".ts", ".tsx", ".js", ".jsx")
+_SKIP_DIRS = {"node_modules", ".git", ".vite", "dist", "build", "testsprite_tests"}
+# Mirrors the '@' alias in apps/admin/vite.config.ts.
+ALIASES = {"@/": "apps/admin/"}
+
+_IMPORT_RE = re.compile(
+    r"""(?:import|export)\s[^'"]*?\sfrom\s*['"]([^'"]+)['"]"""
+    r"""|import\s*['"]([^'"]+)['"]"""
+    r"""|import\(\s*['"]([^'"]+)['"]\s*\)"""
+)
+_STOPWORDS = {"a", "an", "and", "the", "in", "of", "for", "with", "to", "on"}
+
+# Minimum share of a feature name's words that must appear in a test plan
+# entry (or of a plan title's words in a feature description, or in a script
+# name) to count as a match.
+MATCH_THRESHOLD = 0.6
+
+# Diffs with a known selection, checked by ``select --verify``.
+KNOWN_SELECTIONS = {
+    ("components/RichEditor.tsx",): ["TC001", "TC002", "TC003", "TC004", "TC005", "TC006", "TC007", "TC008"],
+}
+
+
+def _words(text: str) -> Set[str]:
+    words = (w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in _STOPWORDS)
+    return {w[:-1] if len(w) > 3 and w.endswith("s") else w for w in words}
+
+
+def _overlap(needle: str, haystack: str) -> float:
+    wanted = _words(needle)
+    return len(wanted & _words(haystack)) / len(wanted) if wanted else 0.0
+
+
+class ImportGraph:
+    """Reverse import graph of the repo's JS/TS sources, repo-relative paths."""
+
+    def __init__(self, root: Path = REPO_ROOT, cache_path: Path = CACHE_PATH):
+        self.root = root
+        self.cache_path = cache_path
+        self.imports: Dict[str, List[str]] = {}
+        self._reverse: Optional[Dict[str, Set[str]]] = None
+        self._cache: Dict[str, Dict] = {}
+
+    def _source_files(self) -> Iterable[Path]:
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS and not d.startswith(".")]
+            for name in filenames:
+                if name.endswith(SOURCE_SUFFIXES):
+                    yield Path(dirpath) / name
+
+    def _resolve(self, importer: Path, spec: str) -> Optional[str]:
+        for alias, target in ALIASES.items():
+            if spec.startswith(alias):
+                base = self.root / target / spec[len(alias):]
+                break
+        else:
+            if not spec.startswith("."):
+                return None  # package import
+            base = importer.parent / spec
+        candidates = [base] + [base.with_name(base.name + s) for s in SOURCE_SUFFIXES]
+        candidates += [base / f"index{s}" for s in SOURCE_SUFFIXES]
+        for candidate in candidates:
+            if candidate.is_file():
+                return os.path.relpath(os.path.normpath(candidate), self.root).replace(os.sep, "/")
+        return None
+
+    def _parse(self, path: Path) -> List[str]:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+        resolved = set()
+        for match in _IMPORT_RE.finditer(text):
+            spec = next(g for g in match.groups() if g)
+            target = self._resolve(path, spec)
+            if target:
+                resolved.add(target)
+        return sorted(resolved)
+
+    def load(self) -> "ImportGraph":
+        if self.cache_path.exists():
+            try:
+                self._cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except ValueError:
+                self._cache = {}
+        fresh: Dict[str, Dict] = {}
+        for path in self._source_files():
+            rel = os.path.relpath(path, self.root).replace(os.sep, "/")
+            stat = path.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            cached = self._cache.get(rel)
+            if cached and cached["stamp"] == stamp:
+                fresh[rel] = cached
+            else:
+                fresh[rel] = {"stamp": stamp, "imports": self._parse(path)}
+        if fresh != self._cache:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps(fresh), encoding="utf-8")
+        self._cache = fresh
+        self.imports = {rel: entry["imports"] for rel, entry in fresh.items()}
+        self._reverse = None
+        return self
+
+    def importers_of(self, files: Iterable[str]) -> Set[str]:
+        """``files`` plus every source that transitively imports one of them."""
+        if self._reverse is None:
+            self._reverse = {}
+            for importer, targets in self.imports.items():
+                for target in targets:
+                    self._reverse.setdefault(target, set()).add(importer)
+        reverse = self._reverse
+        seen = set(files)
+        stack = list(seen)
+        while stack:
+            for importer in reverse.get(stack.pop(), ()):
+                if importer not in seen:
+                    seen.add(importer)
+                    stack.append(importer)
+        return seen
+
+
+@dataclass
+class Selection:
+    changed: List[str]
+    impacted: Set[str] = field(default_factory=set)
+    features: List[str] = field(default_factory=list)
+    tc_ids: List[str] = field(default_factory=list)
+    scripts: List[TestScript] = field(default_factory=list)
+    unmapped: List[str] = field(default_factory=list)
+    unscripted: List[str] = field(default_factory=list)
+
+
+def changed_files(base: str = "HEAD", root: Path = REPO_ROOT) -> List[str]:
+    """Files changed relative to ``base``, including uncommitted and untracked ones."""
+    # -z: NUL-separated and unquoted, so paths with spaces come through whole.
+    diff = subprocess.run(
+        ["git", "diff", "--name-only", "-z", base, "--"], cwd=root, capture_output=True, text=True, check=True
+    ).stdout.split("\0")
+    untracked = subprocess.run(
+        ["git", "ls-files", "-z", "--others", "--exclude-standard"], cwd=root, capture_output=True, text=True, check=True
+    ).stdout.split("\0")
+    return sorted((set(diff) | set(untracked)) - {""})
+
+
+def plan_scripts(plan_entry: Dict, features: List[Dict], scripts: List[TestScript]) -> List[TestScript]:
+    """Scripts implementing a plan entry.
+
+    TC IDs are reused across TestSprite generations, so a script with the
+    right ID must also match the plan title, or failing that the name and
+    description of one of the impacted features.
+    """
+    same_id = [s for s in scripts if s.tc_id == plan_entry["id"]]
+    for reference in [plan_entry["title"]] + [f"{f['name']} {f.get('description', '')}" for f in features]:
+        matched = [s for s in same_id if _overlap(s.name.replace("_", " "), reference) >= MATCH_THRESHOLD]
+        if matched:
+            return matched
+    return []
+
+
+def _covers(feature: Dict, entry: Dict) -> bool:
+    """Whether a plan entry exercises a feature.
+
+    Either the feature is named in the entry's title, description or steps
+    ("Open the Advanced Rich Text Editor."), or the entry's title is one of
+    the capabilities the feature description lists ("Code View (HTML
+    source editing) with formatting").
+    """
+    steps = " ".join(step.get("description", "") for step in entry.get("steps", []))
+    text = f"{entry.get('title', '')} {entry.get('description', '')} {steps}"
+    return (_overlap(feature["name"], text) >= MATCH_THRESHOLD
+            or _overlap(entry.get("title", ""), feature.get("description", "")) >= MATCH_THRESHOLD)
+
+
+def select(changed: List[str], graph: Optional[ImportGraph] = None) -> Selection:
+    graph = graph or ImportGraph().load()
+    summary = json.loads(CODE_SUMMARY_PATH.read_text(encoding="utf-8"))
+    plan = json.loads(TEST_PLAN_PATH.read_text(encoding="utf-8"))
+    scripts = discover()
+
+    selection = Selection(changed=changed)
+    selection.impacted = graph.importers_of(changed)
+
+    covered: Set[str] = set()
+    features = []
+    for feature in summary.get("features", []):
+        files = set(feature.get("files", []))
+        if files & selection.impacted:
+            features.append(feature)
+            covered |= files
+    selection.features = [f["name"] for f in features]
+
+    for entry in plan:
+        if not any(_covers(feature, entry) for feature in features):
+            continue
+        selection.tc_ids.append(entry["id"])
+        matched = plan_scripts(entry, features, scripts)
+        if not matched:
+            selection.unscripted.append(entry["id"])
+        selection.scripts += matched
+
+    # Edits to the TC scripts themselves select those scripts directly.
+    by_path = {f"testsprite_tests/{s.path.name}": s for s in scripts}
+    selection.scripts += [by_path[f] for f in changed if f in by_path]
+    unique = {s.key: s for s in selection.scripts}
+    selection.scripts = [unique[k] for k in sorted(unique)]
+
+    # Changed sources that reach no feature: the selection says nothing about them.
+    selection.unmapped = [
+        f for f in changed
+        if f.endswith(SOURCE_SUFFIXES) and not graph.importers_of([f]) & covered
+    ]
+    return selection
+
+
+def verify(graph: Optional[ImportGraph] = None) -> List[str]:
+    """Failures of the ``KNOWN_SELECTIONS`` against the current plan and summary."""
+    graph = graph or ImportGraph().load()
+    failures = []
+    for changed, expected in KNOWN_SELECTIONS.items():
+        selected = select(list(changed), graph).tc_ids
+        missing = [tc for tc in expected if tc not in selected]
+        if missing:
+            failures.append(f"{', '.join(changed)} does not select {', '.join(missing)}")
+    return failures
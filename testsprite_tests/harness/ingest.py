@@ -0,0 +1,337 @@
+"""Server-side bulk ingestion of question files into ``questions_master``.
+
+The same mapping and validation as ``bulkUploadService`` (normalizeData,
+validateRows, saveBatch), but streamed: rows are read from CSV, XLSX or
+JSON one at a time, the header-to-column mapping is compiled once per header
+instead of rebuilding a lowercased-key object per row, and rows are encoded
+to COPY text format and loaded with ``COPY FROM STDIN``.
+
+Reading, mapping and encoding run on a worker thread that hands finished
+chunks to the loader through a small bounded queue, so the next chunk is
+prepared while the previous one is on the wire and memory stays at a few
+chunks whatever the file size. Each chunk is one transaction: its questions,
+its rejected rows in ``bulk_upload_rows`` and the counters on its
+``bulk_upload_batches`` row, so the counters always match what is saved.
+
+Beyond validateRows, values longer than their ``questions_master`` column
+are rejected per row, since one of them would otherwise fail a whole chunk.
+
+Requires psycopg 3. XLSX sheets are streamed by ``xlsxstream``.
+"""
+import csv
+import json
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from . import seed, xlsxstream
+
+CHUNK_ROWS = 20_000
+# Prepared chunks waiting for the loader.
+PIPELINE_DEPTH = 2
+READ_CHARS = 1 << 20
+
+# questions_master column -> upload header keys (lowercased, trimmed), in
+# the order normalizeData tries them, and the value when none is set.
+FIELDS = [
+    ("question_text", ("question_hin", "question_eng", "question", "question_text", "question text"), ""),
+    ("option_a", ("option1_hin", "option1_eng", "option1", "option a", "option_a", "a"), ""),
+    ("option_b", ("option2_hin", "option2_eng", "option2", "option b", "option_b", "b"), ""),
+    ("option_c", ("option3_hin", "option3_eng", "option3", "option c", "option_c", "c"), ""),
+    ("option_d", ("option4_hin", "option4_eng", "option4", "option d", "option_d", "d"), ""),
+    ("correct_answer", ("correct answer", "correct_answer", "answer"), ""),
+    ("answer_explanation", ("solution_hin", "solution_eng", "explanation", "answer_explanation", "solution"), ""),
+    ("subject_name", ("subject", "subject_name"), "General"),
+    ("topic_name", ("chapter", "topic", "topic_name"), "General"),
+    ("difficulty_level", ("difficulty",), "Medium"),
+    ("language_type", ("language",), None),
+    ("question_source", ("exam", "source"), "BulkUpload"),
+]
+QUESTION_COLUMNS = [name for name, _, _ in FIELDS] + ["question_type", "is_verified"]
+FAILURE_COLUMNS = ["batch_id", "row_number", "raw_question_text", "error_message", "error_type"]
+# VARCHAR widths from bulk_upload_schema.sql.
+COLUMN_LIMITS = {
+    "correct_answer": 10, "subject_name": 100, "topic_name": 150,
+    "difficulty_level": 20, "language_type": 20, "question_source": 50,
+}
+
+_QUESTION, _OPTION_A, _OPTION_B, _ANSWER, _DIFFICULTY = (
+    QUESTION_COLUMNS.index(c) for c in ("question_text", "option_a", "option_b", "correct_answer", "difficulty_level")
+)
+
+Row = Tuple[Tuple[str, ...], Sequence]
+
+_JSON_GAP = re.compile(r"[\s,]*")
+
+
+def _text(value) -> str:
+    """A cell as text, empty for the values JavaScript's ``||`` skips."""
+    if value is None or value is False or value == "" or (value == 0 and not isinstance(value, str)):
+        return ""
+    if value is True:
+        return "true"
+    return value if isinstance(value, str) else str(value)
+
+
+class ColumnMap:
+    """normalizeData's key lookup, resolved to column indexes for one header."""
+
+    def __init__(self, header: Sequence[str]):
+        index = {str(key).lower().strip(): i for i, key in enumerate(header)}
+        self.fields = [(name, tuple(index[k] for k in keys if k in index), default) for name, keys, default in FIELDS]
+        self.hindi = index.get("question_hin")
+
+    def record(self, values: Sequence) -> List[str]:
+        """Values in ``FIELDS`` order."""
+        width = len(values)
+        record = []
+        for name, indexes, default in self.fields:
+            value = ""
+            for i in indexes:
+                if i < width:
+                    value = _text(values[i])
+                    if value:
+                        break
+            if not value:
+                if default is None:
+                    # language_type: inferred from the Hindi question column.
+                    hindi = self.hindi is not None and self.hindi < width and _text(values[self.hindi])
+                    default = "Hindi" if hindi else "Bilingual"
+                value = default
+            record.append(value)
+        difficulty = record[_DIFFICULTY].lower()
+        record[_DIFFICULTY] = "Easy" if "easy" in difficulty else "Hard" if "hard" in difficulty else "Medium"
+        return record
+
+
+@lru_cache(maxsize=64)
+def column_map(header: Tuple[str, ...]) -> ColumnMap:
+    return ColumnMap(header)
+
+
+def validate(record: Sequence[str]) -> List[str]:
+    """validateRows' checks plus the column widths."""
+    errors = []
+    if len(record[_QUESTION].strip()) < 5:
+        errors.append("Question text is too short or missing.")
+    if not record[_OPTION_A] or not record[_OPTION_B]:
+        errors.append("At least Option A and B are required.")
+    if not record[_ANSWER]:
+        errors.append("Correct Answer is missing.")
+    for i, (name, _, _) in enumerate(FIELDS):
+        limit = COLUMN_LIMITS.get(name)
+        if limit and len(record[i]) > limit:
+            errors.append(f"{name} is longer than {limit} characters.")
+    return errors
+
+
+def _csv_rows(path: Path) -> Iterator[Row]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = tuple(next(reader, ()))
+        for values in reader:
+            # Papa's skipEmptyLines.
+            if values and values != [""]:
+                yield header, values
+
+
+def _json_rows(path: Path) -> Iterator[Row]:
+    """Objects of a top-level JSON array, decoded one at a time."""
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8-sig") as f:
+        buffer = f.read(READ_CHARS).lstrip()
+        if not buffer.startswith("["):
+            # parseFile wraps a single object; it is read whole.
+            obj = json.loads(buffer + f.read())
+            yield tuple(obj), tuple(obj.values())
+            return
+        pos = 1
+        while True:
+            pos = _JSON_GAP.match(buffer, pos).end()
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+            try:
+                obj, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                more = f.read(READ_CHARS)
+                if not more:
+                    raise
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+            if not isinstance(obj, dict):
+                raise ValueError(f"{path}: expected an array of objects, found {type(obj).__name__}")
+            yield tuple(obj), tuple(obj.values())
+            pos = end
+
+
+def _xlsx_rows(path: Path) -> Iterator[Row]:
+    rows = xlsxstream.iter_rows(path)
+    first = next(rows, None)
+    if first is None:
+        return
+    header = tuple("" if key is None else str(key) for key in first[1])
+    for _, values in rows:
+        yield header, values
+
+
+READERS = {"csv": _csv_rows, "xlsx": _xlsx_rows, "json": _json_rows}
+
+
+def read_rows(path: Path) -> Iterator[Row]:
+    """``(header, values)`` per data row; the suffix picks the reader."""
+    fmt = path.suffix.lstrip(".").lower()
+    if fmt not in READERS:
+        raise ValueError(f"unsupported file type {fmt!r} (expected one of {', '.join(READERS)})")
+    return READERS[fmt](path)
+
+
+@dataclass
+class Chunk:
+    rows: int
+    saved: int
+    failed: int
+    questions: bytes
+    failures: bytes
+
+
+def encode_chunks(rows: Iterator[Row], batch_id: int, chunk_rows: int = CHUNK_ROWS) -> Iterator[Chunk]:
+    """Map, validate and COPY-encode ``rows`` in chunks of ``chunk_rows``."""
+    questions: List[str] = []
+    failures: List[str] = []
+    count = 0
+    for number, (header, values) in enumerate(rows, 1):
+        record = column_map(header).record(values)
+        errors = validate(record)
+        if errors:
+            failures.append(seed.copy_line(
+                [batch_id, number, record[_QUESTION][:100] or "Unknown", ", ".join(errors), "Validation Error"]
+            ))
+        else:
+            questions.append(seed.copy_line(record + ["MCQ", True]))
+        count += 1
+        if count == chunk_rows:
+            yield Chunk(count, len(questions), len(failures),
+                        "".join(questions).encode("utf-8"), "".join(failures).encode("utf-8"))
+            questions.clear()
+            failures.clear()
+            count = 0
+    if count:
+        yield Chunk(count, len(questions), len(failures),
+                    "".join(questions).encode("utf-8"), "".join(failures).encode("utf-8"))
+
+
+def pipelined(items: Iterator, depth: int = PIPELINE_DEPTH) -> Iterator:
+    """Runs ``items`` on a worker thread, at most ``depth`` ahead of the consumer."""
+    handoff: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                handoff.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(done)
+        except BaseException as exc:  # handed to the consumer
+            put(exc)
+
+    worker = threading.Thread(target=produce, name="ingest-reader", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = handoff.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        worker.join()
+
+
+def _copy(cur, table: str, columns: Sequence[str], data: bytes) -> None:
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    with cur.copy(f"COPY {table} ({column_list}) FROM STDIN") as copy:
+        copy.write(data)
+
+
+@dataclass
+class IngestResult:
+    batch_id: int
+    rows: int = 0
+    saved: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def ingest(
+    path: Path,
+    dsn: str = seed.DEFAULT_DSN,
+    file_name: Optional[str] = None,
+    chunk_rows: int = CHUNK_ROWS,
+    on_chunk: Optional[Callable[[IngestResult], None]] = None,
+) -> IngestResult:
+    """Load ``path`` into questions_master as one bulk upload batch."""
+    path = Path(path)
+    # Readers open lazily; fail before a batch row is created.
+    path.stat()
+    rows = read_rows(path)
+    file_name = file_name or path.name
+    started = time.perf_counter()
+    with seed.connect(dsn) as conn:
+        batch_id = conn.execute(
+            "INSERT INTO bulk_upload_batches (upload_file_name, upload_file_type, upload_status) "
+            "VALUES (%s, %s, 'Processing') RETURNING batch_id",
+            (file_name[:255], file_name.rsplit(".", 1)[-1][:20]),
+        ).fetchone()[0]
+        conn.commit()
+        result = IngestResult(batch_id)
+        try:
+            with conn.cursor() as cur:
+                for chunk in pipelined(encode_chunks(rows, batch_id, chunk_rows)):
+                    if chunk.questions:
+                        _copy(cur, "questions_master", QUESTION_COLUMNS, chunk.questions)
+                    if chunk.failures:
+                        _copy(cur, "bulk_upload_rows", FAILURE_COLUMNS, chunk.failures)
+                    cur.execute(
+                        "UPDATE bulk_upload_batches SET total_rows_found = total_rows_found + %s, "
+                        "total_questions_saved = total_questions_saved + %s, "
+                        "total_failed_rows = total_failed_rows + %s WHERE batch_id = %s",
+                        (chunk.rows, chunk.saved, chunk.failed, batch_id),
+                    )
+                    conn.commit()
+                    result.rows += chunk.rows
+                    result.saved += chunk.saved
+                    result.failed += chunk.failed
+                    result.seconds = time.perf_counter() - started
+                    if on_chunk:
+                        on_chunk(result)
+        except BaseException:
+            conn.rollback()
+            conn.execute("UPDATE bulk_upload_batches SET upload_status = 'Failed' WHERE batch_id = %s", (batch_id,))
+            conn.commit()
+            raise
+        conn.execute("UPDATE bulk_upload_batches SET upload_status = 'Completed' WHERE batch_id = %s", (batch_id,))
+        conn.commit()
+        conn.execute("ANALYZE questions_master")
+    result.seconds = time.perf_counter() - started
+    return result
@@ -0,0 +1,75 @@
+"""Append-only JSONL journal of test results.
+
+The runner appends each result record (the test_results.json shape) as soon
+as its test finishes, and re-renders test_results.json and raw_report.md
+from the journal, so a long run shows progress as it goes and a crash keeps
+everything finished so far. ``run --resume`` reads the journal back and
+skips the tests that already passed.
+
+Each line is written and fsynced whole; a line cut short by a crash is
+ignored on read.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from .report import RESULTS_PATH, merge_records, normalize_title, write_report, write_results
+
+# Journals sit next to the results file they feed: test_results.jsonl.
+JOURNAL_PATH = RESULTS_PATH.with_suffix(".jsonl")
+
+
+class Journal:
+    def __init__(self, path: Path = JOURNAL_PATH):
+        self.path = Path(path)
+
+    def reset(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+
+    def append(self, record: Dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with open(self.path, "a+", encoding="utf-8") as f:
+            # After a crash mid-line, start on a fresh line rather than
+            # gluing this record onto the broken one.
+            if f.tell() and self._ends_mid_line():
+                line = "\n" + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _ends_mid_line(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def entries(self) -> List[Dict]:
+        """Every journaled record in append order."""
+        if not self.path.exists():
+            return []
+        entries = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+    def records(self) -> List[Dict]:
+        """One record per test; a re-run replaces the earlier attempt."""
+        return merge_records(self.entries())
+
+    def passed_titles(self) -> Set[str]:
+        return {normalize_title(r.get("title", "")) for r in self.records() if r.get("testStatus") == "PASSED"}
+
+    def render(self, results_path: Optional[Path] = None, report_path: Optional[Path] = None) -> List[Dict]:
+        """Rewrite the results file and report from the journal; returns the records."""
+        records = self.records()
+        if results_path:
+            write_results(records, results_path)
+        if report_path:
+            write_report(records, report_path)
+        return records
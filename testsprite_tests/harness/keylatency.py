@@ -0,0 +1,280 @@
+"""Keystroke-latency benchmark for the CreatorDashboard inventory.
+
+Serves N synthetic questions (``seed.legacy_rows``) as the app's Supabase
+``questions`` response, opens the Creator view's inventory and then types
+search queries one key at a time, deletes them again and toggles the filter
+row and the AdvancedFilterPanel selects.
+
+Every interaction is measured in the page from the input event to the next
+paint: a capture-phase listener marks ``kbench:<n>:input`` at the event's
+timestamp, and a ``requestAnimationFrame`` + ``setTimeout`` pair marks
+``kbench:<n>:paint`` once the frame with React's update has been presented.
+The two marks are joined with ``performance.measure`` so they also show up
+in a DevTools trace. The next key is only typed once the previous one has
+painted, so each sample is one keystroke's own cost.
+
+The check fails when the p95 at a scale is above its target.
+"""
+import json
+import re
+import statistics
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from playwright import async_api
+
+from . import seed, waits
+from .canvas import parse_levels
+from .report import TMP_DIR
+
+REPORT_PATH = TMP_DIR / "key_latency.json"
+DEFAULT_SCALES = (10_000, 100_000)
+DEFAULT_TARGETS = "10k=100,100k=200"
+DEFAULT_QUERIES = ("parliament", "संविधान")
+# Inside the runner's default 300s per-test timeout, so a load that never
+# finishes fails with its own message rather than as a timed-out test.
+LOAD_TIMEOUT_MS = 120_000
+PAINT_TIMEOUT_MS = 60_000
+
+_QUESTIONS_URL = re.compile(r"/rest/v1/questions(\?|$)")
+_MASTER_URL = re.compile(r"/rest/v1/questions_master(\?|$)")
+_CORS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PATCH, DELETE, OPTIONS",
+    "Access-Control-Expose-Headers": "Content-Range",
+}
+
+_INIT_SCRIPT = """
+(() => {
+  if (window.__qbankKeyBench) return;
+  const state = window.__qbankKeyBench = {
+    armed: null, results: [], waiters: [],
+    arm(label) { this.armed = label; },
+    wait(count, timeout) {
+      if (this.results.length >= count) return Promise.resolve(this.results[count - 1]);
+      return new Promise((resolve, reject) => {
+        const timer = setTimeout(() => reject(new Error(`no paint for interaction ${count}`)), timeout);
+        this.waiters.push(() => {
+          if (this.results.length < count) return false;
+          clearTimeout(timer); resolve(this.results[count - 1]); return true;
+        });
+      });
+    },
+  };
+  const measure = (event) => {
+    if (!state.armed) return;
+    const label = state.armed, n = state.results.length, start = event.timeStamp;
+    state.armed = null;
+    performance.mark(`kbench:${n}:input`, { startTime: start, detail: label });
+    requestAnimationFrame(() => setTimeout(() => {
+      const paint = performance.mark(`kbench:${n}:paint`);
+      performance.measure(`kbench:${n}`, `kbench:${n}:input`, `kbench:${n}:paint`);
+      state.results.push({ label, type: event.type, ms: paint.startTime - start });
+      state.waiters = state.waiters.filter((done) => !done());
+    }, 0));
+  };
+  for (const type of ['input', 'change', 'click']) document.addEventListener(type, measure, true);
+})();
+"""
+
+
+class LibraryRoute:
+    """Answers the inventory's Supabase reads with ``count`` seeded questions."""
+
+    def __init__(self, count: int, seed_value: int = 0):
+        self.count = count
+        # Encoded row by row; at 100K the body is a few hundred MB, as the
+        # real select('*') response would be.
+        encoded = [json.dumps(row, ensure_ascii=False).encode("utf-8") for row in seed.legacy_records(count, seed_value)]
+        self.body = b"[" + b",".join(encoded) + b"]"
+
+    async def attach(self, context: async_api.BrowserContext) -> None:
+        await context.route(_QUESTIONS_URL, self._questions)
+        await context.route(_MASTER_URL, self._empty)
+
+    async def detach(self, context: async_api.BrowserContext) -> None:
+        await context.unroute(_QUESTIONS_URL, self._questions)
+        await context.unroute(_MASTER_URL, self._empty)
+
+    async def _fulfill(self, route: async_api.Route, body: bytes, total: int) -> None:
+        if route.request.method == "OPTIONS":
+            await route.fulfill(status=204, headers=_CORS)
+            return
+        headers = {**_CORS, "Content-Range": f"0-{max(total - 1, 0)}/{total}"}
+        await route.fulfill(status=200, body=body, content_type="application/json", headers=headers)
+
+    async def _questions(self, route: async_api.Route, request: async_api.Request) -> None:
+        await self._fulfill(route, self.body, self.count)
+
+    async def _empty(self, route: async_api.Route, request: async_api.Request) -> None:
+        await self._fulfill(route, b"[]", 0)
+
+
+@dataclass
+class Sample:
+    label: str
+    group: str
+    ms: float
+
+
+@dataclass
+class ScaleResult:
+    questions: int
+    load_ms: float
+    samples: List[Sample] = field(default_factory=list)
+
+    def stats(self, group: Optional[str] = None) -> Dict[str, float]:
+        values = sorted(s.ms for s in self.samples if group is None or s.group == group)
+        if not values:
+            return {"count": 0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+        return {
+            "count": len(values),
+            "p50": round(statistics.median(values), 1),
+            "p95": round(values[min(len(values) - 1, int(len(values) * 0.95))], 1),
+            "max": round(values[-1], 1),
+        }
+
+
+class KeyLatencyBench:
+    def __init__(self, page: async_api.Page, queries: Sequence[str] = DEFAULT_QUERIES):
+        self.page = page
+        self.queries = queries
+        self.result: Optional[ScaleResult] = None
+
+    async def _interact(self, label: str, group: str, action: Callable) -> None:
+        count = len(self.result.samples) + 1
+        await self.page.evaluate("(label) => window.__qbankKeyBench.arm(label)", label)
+        await action()
+        sample = await self.page.evaluate(
+            "([n, timeout]) => window.__qbankKeyBench.wait(n, timeout)", [count, PAINT_TIMEOUT_MS]
+        )
+        self.result.samples.append(Sample(label, group, round(sample["ms"], 1)))
+
+    def _select_with(self, placeholder: str) -> async_api.Locator:
+        """The select whose "All" option reads ``placeholder``, e.g. "Quality: Global"."""
+        return self.page.locator("select").filter(has=self.page.locator("option", has_text=placeholder)).first
+
+    async def _select(self, label: str, select: async_api.Locator, value: Optional[str] = None) -> None:
+        if value is None:
+            # First real option after "All".
+            value = await select.locator("option").nth(1).get_attribute("value")
+        await self._interact(f"{label}={value}", "filter", lambda: select.select_option(value))
+
+    async def type_queries(self) -> None:
+        search = self.page.get_by_placeholder("Search inventory...")
+        await search.click()
+        for query in self.queries:
+            for i, char in enumerate(query):
+                await self._interact(f"type {query[:i + 1]!r}", "type", lambda c=char: self.page.keyboard.type(c))
+            for i in range(len(query)):
+                await self._interact(f"delete {query[:len(query) - i - 1]!r}", "delete",
+                                     lambda: self.page.keyboard.press("Backspace"))
+
+    async def toggle_filters(self) -> None:
+        page = self.page
+        # The compact filter row, narrowing and then widening again.
+        for label, value in (("Quality", "Hard"), ("Syntax", "Hindi"), ("Domain", None), ("Focus", None)):
+            await self._select(label, self._select_with(f"{label}: Global"), value)
+        for label in ("Focus", "Domain", "Syntax", "Quality"):
+            await self._select(label, self._select_with(f"{label}: Global"), "All")
+        # AdvancedFilterPanel. Seeded rows have sections and collections but no
+        # topics; "AI Generated" matches none of them, which brings up "Clear All".
+        toggle = page.get_by_test_id("advanced-filters-toggle")
+        await self._interact("advanced filters", "filter", toggle.click)
+        await self._select("Section", self._select_with("All Sections"))
+        await self._select("Collection", self._select_with("All Collections"))
+        await self._select("Source", page.get_by_test_id("ai-source-filter"), "AI")
+        clear = page.get_by_test_id("clear-all-filters")
+        await self._interact("clear all", "filter", clear.click)
+
+    async def run_scale(self, app_url: str, questions: int) -> ScaleResult:
+        page = self.page
+        await page.add_init_script(_INIT_SCRIPT)
+        await page.goto(f"{app_url.rstrip('/')}/?view=creator", wait_until="commit")
+        started = await page.evaluate("() => performance.now()")
+        loaded = page.get_by_text(re.compile(rf"^\s*{questions} Elements\s*$"))
+        try:
+            await loaded.wait_for(timeout=LOAD_TIMEOUT_MS)
+        except async_api.TimeoutError:
+            raise AssertionError(
+                f"the inventory never showed {questions} questions; the app needs VITE_SUPABASE_URL/ANON_KEY set "
+                "(any values: the questions requests are answered by the harness)"
+            ) from None
+        await waits.settle(page)
+        self.result = ScaleResult(questions, round(await page.evaluate("() => performance.now()") - started, 1))
+        await self.type_queries()
+        await self.toggle_filters()
+        return self.result
+
+
+def parse_targets(spec: str) -> Dict[int, float]:
+    """``"10k=100,100k=200"`` -> p95 target in ms per question count."""
+    targets = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        count, _, ms = item.partition("=")
+        targets[parse_levels(count)[0]] = float(ms)
+    return targets
+
+
+async def run(
+    context: async_api.BrowserContext,
+    app_url: str,
+    scales: Sequence[int] = DEFAULT_SCALES,
+    queries: Sequence[str] = DEFAULT_QUERIES,
+    seed_value: int = 0,
+    intercept: bool = True,
+    on_scale: Optional[Callable[[ScaleResult], None]] = None,
+) -> List[ScaleResult]:
+    """Run the benchmark at each scale, each on a fresh page of ``context``.
+
+    With ``intercept=False`` the app reads whatever its backend holds (e.g.
+    after ``python -m harness seed``) and ``scales`` must match that count.
+    """
+    results = []
+    for questions in scales:
+        library = LibraryRoute(questions, seed_value) if intercept else None
+        if library:
+            await library.attach(context)
+        page = await context.new_page()
+        try:
+            result = await KeyLatencyBench(page, queries).run_scale(app_url, questions)
+        finally:
+            await page.close()
+            if library:
+                await library.detach(context)
+        results.append(result)
+        if on_scale:
+            on_scale(result)
+    return results
+
+
+def check(results: List[ScaleResult], targets: Dict[int, float]) -> List[str]:
+    violations = []
+    for result in results:
+        target = targets.get(result.questions)
+        p95 = result.stats()["p95"]
+        if target is not None and p95 > target:
+            worst = max(result.samples, key=lambda s: s.ms)
+            violations.append(f"{result.questions} questions: p95 input-to-paint {p95:.0f}ms > {target:.0f}ms "
+                              f"(worst {worst.ms:.0f}ms on {worst.label})")
+    return violations
+
+
+def render(results: List[ScaleResult]) -> str:
+    lines = [f"{'questions':>9}  {'group':<8}{'count':>6}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"]
+    for result in results:
+        lines.append(f"{result.questions:>9}  load {result.load_ms:.0f}ms")
+        for group in ("type", "delete", "filter", None):
+            stats = result.stats(group)
+            lines.append(f"{'':>9}  {group or 'all':<8}{stats['count']:>6}{stats['p50']:>9.1f}"
+                         f"{stats['p95']:>9.1f}{stats['max']:>9.1f}")
+    return "\n".join(lines)
+
+
+def write(results: List[ScaleResult], path: Path = REPORT_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = [{**asdict(r), "stats": {g or "all": r.stats(g) for g in ("type", "delete", "filter", None)}}
+            for r in results]
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
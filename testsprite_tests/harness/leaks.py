@@ -0,0 +1,306 @@
+"""JS heap leak detector for repeated workflow transitions.
+
+Runs a cycle of in-app transitions N times on one page: Refinement Studio
+(with RichEditor remounts from the language switch), the SmartBoard in
+Teacher mode, the Creator dashboard and back to the landing page. Views are
+switched the way the app's back button does it (``pushState`` plus a
+``popstate`` event), so the document and its heap live through the whole
+loop.
+
+After every cycle the heap is garbage collected and its used size recorded.
+Full heap snapshots are taken once the warm-up cycles are done and again at
+the end; the report diffs object counts by constructor between the two and
+counts detached DOM nodes in each. The check fails when the retained heap
+keeps growing (least-squares slope per cycle) or detached nodes pile up
+faster than the thresholds allow.
+"""
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from playwright import async_api
+
+from . import waits
+from .report import TMP_DIR
+from .steps import switch_editor_language
+
+REPORT_PATH = TMP_DIR / "leak_report.json"
+DEFAULT_CYCLES = 20
+DEFAULT_WARMUP = 3
+DEFAULT_THRESHOLDS = "heap_kb_per_cycle=256,detached_per_cycle=20"
+TOP_GROWTH = 20
+
+_ROUTE_JS = """
+(query) => {
+  const url = new URL(location.href);
+  url.search = query;
+  history.pushState({}, '', url);
+  dispatchEvent(new PopStateEvent('popstate'));
+}
+"""
+
+
+@dataclass
+class HeapSnapshotSummary:
+    total_kb: float
+    nodes: int
+    detached_dom: int
+    by_constructor: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # name -> (count, self bytes)
+
+
+def summarize_snapshot(snapshot: Dict[str, Any]) -> HeapSnapshotSummary:
+    """Object counts per constructor and detached DOM nodes of a ``.heapsnapshot``."""
+    meta = snapshot["snapshot"]["meta"]
+    fields = meta["node_fields"]
+    width = len(fields)
+    type_names = meta["node_types"][0]
+    strings = snapshot["strings"]
+    nodes = snapshot["nodes"]
+    i_type, i_name, i_size = fields.index("type"), fields.index("name"), fields.index("self_size")
+    i_detached = fields.index("detachedness") if "detachedness" in fields else None
+
+    counts: Dict[str, List[int]] = {}
+    detached = 0
+    total = 0
+    for offset in range(0, len(nodes), width):
+        kind = type_names[nodes[offset + i_type]]
+        name = strings[nodes[offset + i_name]]
+        size = nodes[offset + i_size]
+        total += size
+        if kind == "native" and (
+            name.startswith("Detached ") or (i_detached is not None and nodes[offset + i_detached] == 2)
+        ):
+            detached += 1
+        if kind == "object":
+            key = name
+        elif kind in ("closure", "array", "string", "concatenated string", "sliced string", "regexp"):
+            key = f"({kind})"
+        else:
+            continue
+        entry = counts.setdefault(key, [0, 0])
+        entry[0] += 1
+        entry[1] += size
+    return HeapSnapshotSummary(
+        total_kb=round(total / 1024.0, 1),
+        nodes=len(nodes) // width,
+        detached_dom=detached,
+        by_constructor={k: (v[0], v[1]) for k, v in counts.items()},
+    )
+
+
+def constructor_growth(before: HeapSnapshotSummary, after: HeapSnapshotSummary, limit: int = TOP_GROWTH) -> List[Dict]:
+    """Constructors whose live object count grew the most between two snapshots."""
+    rows = []
+    for name, (count, size) in after.by_constructor.items():
+        old_count, old_size = before.by_constructor.get(name, (0, 0))
+        if count > old_count:
+            rows.append({"constructor": name, "before": old_count, "after": count,
+                         "delta": count - old_count, "deltaKb": round((size - old_size) / 1024.0, 1)})
+    rows.sort(key=lambda r: (r["delta"], r["deltaKb"]), reverse=True)
+    return rows[:limit]
+
+
+def slope(values: Sequence[float]) -> float:
+    """Least-squares slope of ``values`` against their index."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2.0
+    mean_y = sum(values) / n
+    num = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    den = sum((x - mean_x) ** 2 for x in range(n))
+    return num / den
+
+
+@dataclass
+class LeakThresholds:
+    """Parsed from ``"heap_kb_per_cycle=256,detached_per_cycle=20"``."""
+
+    heap_kb_per_cycle: float = 256.0
+    detached_per_cycle: float = 20.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LeakThresholds":
+        thresholds = cls()
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            key, _, value = item.partition("=")
+            if key not in ("heap_kb_per_cycle", "detached_per_cycle"):
+                raise ValueError(f"unknown threshold {key!r} (expected heap_kb_per_cycle or detached_per_cycle)")
+            setattr(thresholds, key, float(value))
+        return thresholds
+
+
+@dataclass
+class LeakReport:
+    cycles: int
+    warmup: int
+    transitions: List[str]
+    heap_kb: List[float]
+    heap_kb_per_cycle: float
+    baseline: HeapSnapshotSummary
+    final: HeapSnapshotSummary
+    growth: List[Dict]
+    violations: List[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.violations
+
+    @property
+    def detached_per_cycle(self) -> float:
+        measured = self.cycles - self.warmup
+        return (self.final.detached_dom - self.baseline.detached_dom) / measured if measured else 0.0
+
+    def check(self, thresholds: LeakThresholds) -> List[str]:
+        self.violations = []
+        if self.heap_kb_per_cycle > thresholds.heap_kb_per_cycle:
+            self.violations.append(
+                f"retained heap grows {self.heap_kb_per_cycle:.0f} KB/cycle > {thresholds.heap_kb_per_cycle:.0f}"
+            )
+        if self.detached_per_cycle > thresholds.detached_per_cycle:
+            self.violations.append(
+                f"detached DOM nodes grow {self.detached_per_cycle:.1f}/cycle > {thresholds.detached_per_cycle:.0f} "
+                f"({self.baseline.detached_dom} -> {self.final.detached_dom})"
+            )
+        return self.violations
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        for key in ("baseline", "final"):
+            data[key].pop("by_constructor")
+        data["detached_per_cycle"] = round(self.detached_per_cycle, 2)
+        data["passed"] = self.passed
+        return data
+
+    def write(self, path: Path = REPORT_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+
+    def render(self) -> str:
+        lines = [
+            f"{self.cycles} cycles of {' -> '.join(self.transitions)} ({self.warmup} warm-up)",
+            f"used heap after GC: {self.heap_kb[0]:.0f} KB -> {self.heap_kb[-1]:.0f} KB, "
+            f"{self.heap_kb_per_cycle:+.1f} KB/cycle",
+            f"detached DOM nodes: {self.baseline.detached_dom} -> {self.final.detached_dom} "
+            f"({self.detached_per_cycle:+.1f}/cycle)",
+            f"{'constructor':<40}{'before':>9}{'after':>9}{'delta':>9}{'KB':>9}",
+        ]
+        for row in self.growth[:10]:
+            lines.append(f"{row['constructor'][:39]:<40}{row['before']:>9}{row['after']:>9}"
+                         f"{row['delta']:>+9}{row['deltaKb']:>+9.1f}")
+        lines += [f"FAIL {v}" for v in self.violations] or ["no leak above thresholds"]
+        return "\n".join(lines)
+
+
+Transition = Callable[[async_api.Page], Awaitable[None]]
+
+
+class TransitionLoop:
+    """Drives the workflow cycle on a page that already has the app loaded."""
+
+    def __init__(self, page: async_api.Page, set_id: Optional[str] = None):
+        self.page = page
+        self.set_id = set_id
+        self.transitions: Dict[str, Transition] = {
+            "refinement-studio": self._refinement_studio,
+            "smartboard": self._smartboard,
+            "creator": lambda page: self._route("view=creator"),
+            "landing": lambda page: self._route(""),
+        }
+
+    async def _route(self, query: str) -> None:
+        await self.page.evaluate(_ROUTE_JS, query)
+        await waits.settle(self.page)
+
+    async def _refinement_studio(self, page: async_api.Page) -> None:
+        await self._route("view=refinement-studio")
+        # English -> Hindi -> Bilingual unmounts and remounts the RichEditors.
+        for language in ("English", "Hindi", "Bilingual"):
+            await switch_editor_language(page, language)
+
+    async def _smartboard(self, page: async_api.Page) -> None:
+        if self.set_id:
+            await self._route(f"view=teacher&setId={self.set_id}")
+        else:
+            await self._route("view=teacher")
+            card = page.locator("div.cursor-pointer").filter(has=page.locator("h3")).first
+            await waits.settle(page, card)
+            await card.click()
+        await waits.settle(page, page.locator("canvas").last)
+
+    async def cycle(self) -> None:
+        for transition in self.transitions.values():
+            await transition(self.page)
+
+
+class HeapProbe:
+    """CDP heap measurements for one page."""
+
+    def __init__(self, session: async_api.CDPSession):
+        self.session = session
+
+    @classmethod
+    async def attach(cls, page: async_api.Page) -> "HeapProbe":
+        session = await page.context.new_cdp_session(page)
+        await session.send("HeapProfiler.enable")
+        return cls(session)
+
+    async def used_kb(self) -> float:
+        await self.session.send("HeapProfiler.collectGarbage")
+        usage = await self.session.send("Runtime.getHeapUsage")
+        return round(usage["usedSize"] / 1024.0, 1)
+
+    async def snapshot(self) -> HeapSnapshotSummary:
+        chunks: List[str] = []
+        handler = lambda params: chunks.append(params["chunk"])
+        self.session.on("HeapProfiler.addHeapSnapshotChunk", handler)
+        try:
+            await self.session.send("HeapProfiler.collectGarbage")
+            await self.session.send("HeapProfiler.takeHeapSnapshot", {"reportProgress": False})
+        finally:
+            self.session.remove_listener("HeapProfiler.addHeapSnapshotChunk", handler)
+        return summarize_snapshot(json.loads("".join(chunks)))
+
+    async def detach(self) -> None:
+        await self.session.detach()
+
+
+async def run(
+    page: async_api.Page,
+    cycles: int = DEFAULT_CYCLES,
+    warmup: int = DEFAULT_WARMUP,
+    set_id: Optional[str] = None,
+    thresholds: Optional[LeakThresholds] = None,
+    on_cycle: Optional[Callable[[int, float], None]] = None,
+) -> LeakReport:
+    """Run ``cycles`` transition cycles on ``page`` (already on the app) and check for growth."""
+    if cycles <= warmup:
+        raise ValueError(f"need more cycles ({cycles}) than warm-up cycles ({warmup})")
+    loop = TransitionLoop(page, set_id)
+    probe = await HeapProbe.attach(page)
+    try:
+        for _ in range(warmup):
+            await loop.cycle()
+        baseline = await probe.snapshot()
+        heap_kb = [await probe.used_kb()]
+        for index in range(warmup, cycles):
+            await loop.cycle()
+            heap_kb.append(await probe.used_kb())
+            if on_cycle:
+                on_cycle(index + 1, heap_kb[-1])
+        final = await probe.snapshot()
+    finally:
+        await probe.detach()
+    report = LeakReport(
+        cycles=cycles,
+        warmup=warmup,
+        transitions=list(loop.transitions),
+        heap_kb=heap_kb,
+        heap_kb_per_cycle=round(slope(heap_kb), 1),
+        baseline=baseline,
+        final=final,
+        growth=constructor_growth(baseline, final),
+    )
+    report.check(thresholds or LeakThresholds.parse(DEFAULT_THRESHOLDS))
+    return report
@@ -0,0 +1,522 @@
+"""Virtual-user load engine behind TC013.
+
+Most virtual users are protocol-level: they replay the requests the app
+itself makes (the app shell from the dev server, then the PostgREST queries
+``storageService`` issues against Supabase or the local stand-in) through
+Playwright's ``APIRequestContext``, so hundreds of them fit in one process. A
+few run as real browser contexts and click through the same flows, which
+keeps render and JS cost in the picture. Every step is timed into a per-step
+sample list and reported as throughput plus p50/p95/p99.
+
+Flows:
+
+``student_practice``  StudentView: list public sets, open one, load the
+                      question bank, answer, save the result.
+``creator_browse``    CreatorDashboard: load questions and sets, search.
+"""
+import asyncio
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from playwright import async_api
+
+from . import synth, waits
+from .loader import TESTS_DIR
+from .report import TMP_DIR
+
+STANDIN_ENV_PATH = TESTS_DIR / "standin" / ".env.standin"
+REPORT_PATH = TMP_DIR / "load_report.json"
+
+DEFAULT_APP_URL = "http://localhost:3000"
+DEFAULT_FLOWS = {"student_practice": 0.6, "creator_browse": 0.4}
+DEFAULT_THRESHOLDS = "p95=3000,p99=8000,errors=0.01"
+
+PERCENTILES = (50, 95, 99)
+
+
+class StepError(Exception):
+    """A step finished but with a response the real app would treat as a failure."""
+
+
+def read_env_file(path: Path) -> Dict[str, str]:
+    values = {}
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, value = line.split("=", 1)
+                values[key.strip()] = value.strip()
+    return values
+
+
+def percentile(sorted_samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+@dataclass
+class StepStats:
+    samples: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed: float) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        attempts = len(ordered) + self.errors
+        result = {
+            "count": len(ordered),
+            "errors": self.errors,
+            "errorRate": round(self.errors / attempts, 4) if attempts else 0.0,
+            "rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        }
+        for pct in PERCENTILES:
+            result[f"p{pct}"] = round(percentile(ordered, pct), 1)
+        result["max"] = round(ordered[-1], 1) if ordered else 0.0
+        return result
+
+
+class LoadStats:
+    """Per-step latency samples (ms) and error counts shared by all users."""
+
+    def __init__(self):
+        self.steps: Dict[str, StepStats] = {}
+        self.flows: Counter = Counter()
+
+    def _get(self, name: str) -> StepStats:
+        return self.steps.setdefault(name, StepStats())
+
+    def record(self, name: str, ms: float) -> None:
+        self._get(name).samples.append(ms)
+
+    def error(self, name: str) -> None:
+        self._get(name).errors += 1
+
+    @asynccontextmanager
+    async def step(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.error(name)
+            raise
+        self.record(name, (time.perf_counter() - started) * 1000.0)
+
+    def summary(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        return {name: self.steps[name].summary(elapsed) for name in sorted(self.steps)}
+
+
+@dataclass
+class Thresholds:
+    """Pass/fail limits. Latencies are ms, ``errors`` a rate, ``rps`` a floor.
+
+    Parsed from ``"p95=3000,p99=8000,errors=0.01"``; a ``step:`` prefix
+    (``"ui.student.answer:p95=1500"``) overrides a limit for one step, and
+    ``flows_per_s=N`` sets a floor on completed flows per second.
+    """
+
+    limits: Dict[str, float] = field(default_factory=dict)
+    per_step: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    flows_per_s: float = 0.0
+
+    KEYS = ("p50", "p95", "p99", "max", "errors", "rps")
+
+    @classmethod
+    def parse(cls, spec: str) -> "Thresholds":
+        thresholds = cls()
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            key, _, value = item.partition("=")
+            step, _, key = key.rpartition(":")
+            if key == "flows_per_s" and not step:
+                thresholds.flows_per_s = float(value)
+                continue
+            if key not in cls.KEYS:
+                raise ValueError(f"unknown threshold {key!r} (expected one of {', '.join(cls.KEYS)})")
+            target = thresholds.per_step.setdefault(step, {}) if step else thresholds.limits
+            target[key] = float(value)
+        return thresholds
+
+    def check(self, steps: Dict[str, Dict[str, float]], flows_per_s: float) -> List[str]:
+        violations = []
+        for name, summary in steps.items():
+            for key, limit in {**self.limits, **self.per_step.get(name, {})}.items():
+                if key == "errors":
+                    if summary["errorRate"] > limit:
+                        violations.append(f"{name}: error rate {summary['errorRate']:.2%} > {limit:.2%}")
+                elif key == "rps":
+                    if summary["rps"] < limit:
+                        violations.append(f"{name}: {summary['rps']} req/s < {limit}")
+                elif summary["count"] and summary[key] > limit:
+                    violations.append(f"{name}: {key} {summary[key]:.0f}ms > {limit:.0f}ms")
+        if flows_per_s < self.flows_per_s:
+            violations.append(f"throughput {flows_per_s:.2f} flows/s < {self.flows_per_s}")
+        return violations
+
+
+@dataclass
+class LoadConfig:
+    users: int = 500
+    browser_users: int = 10
+    browsers: int = 2
+    duration: float = 60.0
+    ramp_up: float = 10.0
+    think_time: Tuple[float, float] = (0.5, 2.0)
+    answers: int = 5
+    flows: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_FLOWS))
+    thresholds: str = DEFAULT_THRESHOLDS
+    app_url: str = DEFAULT_APP_URL
+    supabase_url: str = ""
+    anon_key: str = ""
+    step_timeout: float = 30.0
+    seed: int = 0
+
+    @classmethod
+    def from_env(cls, environ: Optional[Dict[str, str]] = None) -> "LoadConfig":
+        """Config for TC013: ``QBANK_LOAD_*`` variables over the stand-in defaults."""
+        env = {**read_env_file(STANDIN_ENV_PATH), **(environ if environ is not None else os.environ)}
+        config = cls(
+            supabase_url=env.get("VITE_SUPABASE_URL", ""),
+            anon_key=env.get("VITE_SUPABASE_ANON_KEY", ""),
+            app_url=env.get("QBANK_APP_URL", DEFAULT_APP_URL),
+        )
+        numeric = {
+            "QBANK_LOAD_USERS": ("users", int),
+            "QBANK_LOAD_BROWSER_USERS": ("browser_users", int),
+            "QBANK_LOAD_BROWSERS": ("browsers", int),
+            "QBANK_LOAD_DURATION": ("duration", float),
+            "QBANK_LOAD_RAMP": ("ramp_up", float),
+            "QBANK_LOAD_ANSWERS": ("answers", int),
+            "QBANK_LOAD_SEED": ("seed", int),
+        }
+        for name, (attr, convert) in numeric.items():
+            if name in env:
+                setattr(config, attr, convert(env[name]))
+        if "QBANK_LOAD_FLOWS" in env:
+            config.flows = parse_flows(env["QBANK_LOAD_FLOWS"])
+        if "QBANK_LOAD_THRESHOLDS" in env:
+            config.thresholds = env["QBANK_LOAD_THRESHOLDS"]
+        return config
+
+
+def parse_flows(spec: str) -> Dict[str, float]:
+    """``"student_practice=0.7,creator_browse=0.3"`` -> weights."""
+    flows = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, weight = item.partition("=")
+        if name not in FLOWS:
+            raise ValueError(f"unknown flow {name!r} (expected one of {', '.join(FLOWS)})")
+        flows[name] = float(weight or 1)
+    return flows
+
+
+@dataclass
+class LoadReport:
+    config: LoadConfig
+    started: str
+    elapsed: float
+    steps: Dict[str, Dict[str, float]]
+    flows: Dict[str, int]
+    violations: List[str]
+
+    @property
+    def passed(self) -> bool:
+        return not self.violations
+
+    @property
+    def flows_per_s(self) -> float:
+        return sum(self.flows.values()) / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        config = asdict(self.config)
+        config.pop("anon_key")
+        return {
+            "config": config,
+            "started": self.started,
+            "elapsedSeconds": round(self.elapsed, 1),
+            "flowsPerSecond": round(self.flows_per_s, 2),
+            "flows": self.flows,
+            "steps": self.steps,
+            "violations": self.violations,
+            "passed": self.passed,
+        }
+
+    def write(self, path: Path = REPORT_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+
+    def render(self) -> str:
+        lines = [
+            f"{self.config.users} users ({self.config.browser_users} in browsers) for {self.elapsed:.0f}s: "
+            f"{sum(self.flows.values())} flows, {self.flows_per_s:.2f} flows/s",
+            f"{'step':<28}{'count':>8}{'err':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}",
+        ]
+        for name, s in self.steps.items():
+            lines.append(
+                f"{name:<28}{s['count']:>8}{s['errors']:>6}{s['rps']:>9.2f}"
+                f"{s['p50']:>9.0f}{s['p95']:>9.0f}{s['p99']:>9.0f}{s['max']:>9.0f}"
+            )
+        lines += [f"FAIL {v}" for v in self.violations] or ["all thresholds met"]
+        return "\n".join(lines)
+
+
+class VirtualUser:
+    def __init__(self, engine: "LoadEngine", index: int):
+        self.engine = engine
+        self.config = engine.config
+        self.stats = engine.stats
+        self.rng = random.Random(self.config.seed * 100_003 + index)
+
+    async def think(self) -> None:
+        await asyncio.sleep(self.rng.uniform(*self.config.think_time))
+
+    async def setup(self) -> None:
+        pass
+
+    async def teardown(self) -> None:
+        pass
+
+
+class ProtocolUser(VirtualUser):
+    """Replays the app's own HTTP traffic without a browser."""
+
+    def _rest(self, table: str, query: str) -> str:
+        return f"{self.config.supabase_url.rstrip('/')}/rest/v1/{table}?{query}"
+
+    async def _get(self, step: str, url: str, headers: Optional[Dict[str, str]] = None, parse: bool = False):
+        async with self.stats.step(step):
+            response = await self.engine.http.get(url, headers=headers, timeout=self.config.step_timeout * 1000)
+            try:
+                if not response.ok:
+                    raise StepError(f"{step}: HTTP {response.status}")
+                body = await response.body()
+                if not parse:
+                    return body
+                try:
+                    return json.loads(body)
+                except ValueError:
+                    raise StepError(f"{step}: invalid JSON") from None
+            finally:
+                await response.dispose()
+
+    async def _questions(self, step: str) -> None:
+        # storageService.getQuestions: both tables in parallel, full result sets.
+        async with self.stats.step(step):
+            await asyncio.gather(
+                self._get(f"{step}.legacy", self._rest("questions", "select=*&order=createdDate.desc")),
+                self._get(f"{step}.master", self._rest("questions_master", "select=*&order=created_at.desc")),
+            )
+
+    async def student_practice(self) -> None:
+        await self._get("student.shell", f"{self.config.app_url}/?view=student")
+        sets = await self._get("student.sets", self._rest("sets", "select=*&order=createdDate.desc"), parse=True)
+        public = [s for s in sets if s.get("status") == "public"]
+        if not public:
+            raise StepError("student.sets: no public sets (seed the stand-in first)")
+        chosen = self.rng.choice(public)
+        practice_set = await self._get(
+            "student.open_set",
+            self._rest("sets", f"select=*&setId=eq.{chosen['setId']}"),
+            headers={"Accept": "application/vnd.pgrst.object+json"},
+            parse=True,
+        )
+        await self._questions("student.questions")
+        question_count = len(practice_set.get("questionIds") or [])
+        answers = {}
+        for index in range(min(self.config.answers, question_count)):
+            await self.think()
+            answers[str(index)] = self.rng.choice("ABCD")
+        result = {
+            "id": f"res_load_{self.rng.getrandbits(48):012x}",
+            "setId": chosen["setId"],
+            "studentName": "Load Test",
+            "score": self.rng.randint(0, len(answers)),
+            "totalQuestions": question_count,
+            "answers": answers,
+            "timeTaken": 0,
+            "completedDate": datetime.now(timezone.utc).isoformat(),
+        }
+        async with self.stats.step("student.save_result"):
+            response = await self.engine.http.post(
+                self._rest("results", "on_conflict=id"),
+                data=result,
+                headers={"Prefer": "resolution=merge-duplicates,return=minimal"},
+                timeout=self.config.step_timeout * 1000,
+            )
+            await response.dispose()
+            if not response.ok:
+                raise StepError(f"student.save_result: HTTP {response.status}")
+
+    async def creator_browse(self) -> None:
+        await self._get("creator.shell", f"{self.config.app_url}/?view=creator")
+        # CreatorDashboard loads questions and sets together on mount.
+        await asyncio.gather(
+            self._questions("creator.questions"),
+            self._get("creator.sets", self._rest("sets", "select=*&order=createdDate.desc")),
+        )
+        await self.think()
+
+
+class BrowserUser(VirtualUser):
+    """Clicks through the flows in its own browser context."""
+
+    def __init__(self, engine: "LoadEngine", index: int, browser):
+        super().__init__(engine, index)
+        self.browser = browser
+        self.context: Optional[async_api.BrowserContext] = None
+
+    async def setup(self) -> None:
+        self.context = await self.browser.new_context()
+        await waits.install(self.context)
+        self.context.set_default_timeout(self.config.step_timeout * 1000)
+
+    async def teardown(self) -> None:
+        if self.context:
+            try:
+                await self.context.close()
+            except async_api.Error:
+                pass
+
+    async def student_practice(self) -> None:
+        page = await self.context.new_page()
+        try:
+            start = page.get_by_text("Initialize Practice")
+            async with self.stats.step("ui.student.open"):
+                await page.goto(f"{self.config.app_url}/?view=student")
+                await start.first.wait_for(state="visible")
+            count = await start.count()
+            validate = page.get_by_role("button", name="Validate Choice")
+            async with self.stats.step("ui.student.load_set"):
+                await start.nth(self.rng.randrange(count)).click()
+                await validate.wait_for(state="visible")
+            advance = page.get_by_role("button", name="Advance Objective").or_(
+                page.get_by_role("button", name="Finalize Synthesis")
+            )
+            for _ in range(self.config.answers):
+                await self.think()
+                await page.get_by_text(self.rng.choice("ABCD"), exact=True).first.click()
+                async with self.stats.step("ui.student.answer"):
+                    await validate.click()
+                    await advance.first.wait_for(state="visible")
+                if await page.get_by_role("button", name="Finalize Synthesis").count():
+                    break
+                await advance.first.click()
+        finally:
+            await page.close()
+
+    async def creator_browse(self) -> None:
+        page = await self.context.new_page()
+        try:
+            search = page.get_by_placeholder("Search inventory...")
+            async with self.stats.step("ui.creator.open"):
+                await page.goto(f"{self.config.app_url}/?view=creator")
+                await search.wait_for(state="visible")
+                await waits.settle(page)
+            for _ in range(2):
+                await self.think()
+                async with self.stats.step("ui.creator.search"):
+                    await search.fill(self.rng.choice(synth.ENGLISH_WORDS))
+                    await waits.react_quiet(page, waits.DEFAULT_IDLE_MS, self.config.step_timeout * 1000)
+        finally:
+            await page.close()
+
+
+FLOWS = ("student_practice", "creator_browse")
+
+
+class LoadEngine:
+    """Runs ``config.users`` virtual users against the app.
+
+    ``playwright`` is anything shaped like a started Playwright object: the
+    real one, or the pooled handle a TC script gets from the runner.
+    """
+
+    def __init__(self, playwright, config: LoadConfig, stats: Optional[LoadStats] = None,
+                 on_progress: Optional[Callable[[LoadStats, float], None]] = None):
+        if not config.supabase_url:
+            raise ValueError("supabase_url is required (VITE_SUPABASE_URL or testsprite_tests/standin/.env.standin)")
+        self.playwright = playwright
+        self.config = config
+        self.stats = stats or LoadStats()
+        self.on_progress = on_progress
+        self.http: Optional[async_api.APIRequestContext] = None
+        self.browsers: List[Any] = []
+        self._deadline = 0.0
+
+    def _is_browser_user(self, index: int) -> bool:
+        # Spread browser users evenly through the ramp instead of front-loading them.
+        if not self.config.browser_users:
+            return False
+        stride = max(1, self.config.users // self.config.browser_users)
+        return index % stride == 0 and index // stride < self.config.browser_users
+
+    async def _user(self, index: int, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._is_browser_user(index):
+            user: VirtualUser = BrowserUser(self, index, self.browsers[index % len(self.browsers)])
+        else:
+            user = ProtocolUser(self, index)
+        names = list(self.config.flows)
+        weights = [self.config.flows[n] for n in names]
+        loop = asyncio.get_running_loop()
+        try:
+            await user.setup()
+            while loop.time() < self._deadline:
+                name = user.rng.choices(names, weights)[0]
+                try:
+                    await getattr(user, name)()
+                    self.stats.flows[name] += 1
+                except (StepError, async_api.Error, asyncio.TimeoutError):
+                    # Already counted against the failing step; start over like a user would.
+                    await user.think()
+                except Exception:
+                    # Anything else (a KeyError on an odd response, say) is counted against
+                    # the flow, so it shows in the report without stopping the other users.
+                    self.stats.error(name)
+                    await user.think()
+        finally:
+            await user.teardown()
+
+    async def _report_progress(self, started: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(5)
+            self.on_progress(self.stats, loop.time() - started)
+
+    async def run(self) -> LoadReport:
+        config = self.config
+        loop = asyncio.get_running_loop()
+        headers = {"apikey": config.anon_key, "Authorization": f"Bearer {config.anon_key}"} if config.anon_key else {}
+        self.http = await self.playwright.request.new_context(extra_http_headers=headers)
+        browser_count = min(max(config.browsers, 1), config.browser_users)
+        self.browsers = [await self.playwright.chromium.launch(headless=True) for _ in range(browser_count)]
+        started_at = datetime.now(timezone.utc).isoformat()
+        started = loop.time()
+        self._deadline = started + config.ramp_up + config.duration
+        progress = asyncio.ensure_future(self._report_progress(started)) if self.on_progress else None
+        try:
+            step = config.ramp_up / config.users if config.users else 0.0
+            await asyncio.gather(*(self._user(i, i * step) for i in range(config.users)))
+        finally:
+            if progress:
+                progress.cancel()
+            for browser in self.browsers:
+                try:
+                    await browser.close()
+                except async_api.Error:
+                    pass
+            await self.http.dispose()
+        elapsed = loop.time() - started
+        steps = self.stats.summary(elapsed)
+        report = LoadReport(config, started_at, elapsed, steps, dict(self.stats.flows), [])
+        report.violations = Thresholds.parse(config.thresholds).check(steps, report.flows_per_s)
+        return report
@@ -0,0 +1,85 @@
+"""Discovery and loading of the generated TCxxx_*.py scripts.
+
+Every generated script ends with a module-level ``asyncio.run(run_test())``.
+The loader strips that call so the ``run_test`` coroutine can be driven by the
+harness event loop instead of starting one of its own.
+"""
+import ast
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterable, List, Optional
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+
+_SCRIPT_RE = re.compile(r"^(TC\d{3})_(.+)\.py$")
+
+
+@dataclass(frozen=True)
+class TestScript:
+    path: Path
+    tc_id: str
+    name: str
+
+    @property
+    def key(self) -> str:
+        """Stable identifier, the file name without extension."""
+        return self.path.stem
+
+    @property
+    def title(self) -> str:
+        """Title in the form used by test_results.json, e.g. ``TC008-Content Persistence ...``."""
+        return f"{self.tc_id}-{self.name.replace('___', ' - ').replace('_', ' ')}"
+
+
+def discover(root: Path = TESTS_DIR, patterns: Optional[Iterable[str]] = None) -> List[TestScript]:
+    """Return the TC scripts under ``root`` sorted by file name.
+
+    ``patterns`` are matched as substrings against the file stem, so both
+    ``TC008`` and ``Editor_Remount`` select a script.
+    """
+    patterns = list(patterns or [])
+    scripts = []
+    for path in sorted(root.glob("TC*.py")):
+        match = _SCRIPT_RE.match(path.name)
+        if not match:
+            continue
+        if patterns and not any(p in path.stem for p in patterns):
+            continue
+        scripts.append(TestScript(path=path, tc_id=match.group(1), name=match.group(2)))
+    return scripts
+
+
+def _is_asyncio_run(node: ast.stmt) -> bool:
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return False
+    func = node.value.func
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr == "run"
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "asyncio"
+    )
+
+
+def load_module(script: TestScript) -> ModuleType:
+    """Execute ``script`` without its trailing ``asyncio.run`` and return the module.
+
+    Raises ``SyntaxError`` for scripts the generator emitted broken.
+    """
+    source = script.path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(script.path))
+    tree.body = [node for node in tree.body if not _is_asyncio_run(node)]
+    module = ModuleType(f"testsprite_tests.{script.key}")
+    module.__file__ = str(script.path)
+    exec(compile(tree, str(script.path), "exec"), module.__dict__)
+    return module
+
+
+def load_run_test(script: TestScript) -> Callable:
+    module = load_module(script)
+    run_test = getattr(module, "run_test", None)
+    if run_test is None:
+        raise AttributeError(f"{script.path.name} does not define run_test()")
+    return run_test
@@ -0,0 +1,412 @@
+"""Local stand-in for the parts of the Gemini and Replicate APIs the app uses.
+
+Gemini::
+
+    POST /v1beta/models/{model}:generateContent
+    POST /v1beta/models/{model}:streamGenerateContent?alt=sse
+
+Replicate (with or without the ``/v1`` prefix, so it works both as the Vite
+``/replicate-api`` proxy target and behind ``MockAIRouter``)::
+
+    POST /v1/models/{owner}/{name}/predictions
+    GET  /v1/predictions/{id}
+
+Gemini answers follow the request's ``responseSchema``: a string array for
+``suggestTopics``-style calls, plain text when no JSON was asked for, and
+otherwise question arrays from ``harness.synth``. Arrays are sized from the
+"Generate N ..." (or "List N ...") line of the prompt, up to ``MAX_COUNT``.
+A ``MockProfile`` injects latency drawn from a distribution, random and
+concurrency-triggered 429s, and slow token streaming. ``GET /__stats`` returns request counters.
+
+Point the app at it with ``VITE_GEMINI_BASE_URL=http://localhost:8787`` and
+``REPLICATE_API_TARGET=http://localhost:8787/v1``, or let the harness redirect
+traffic with ``python -m harness run --mock-ai http://localhost:8787``.
+"""
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from . import synth
+
+_GEMINI_RE = re.compile(r"^/v1(?:beta|alpha)?/models/([^/:]+):(generateContent|streamGenerateContent)$")
+_REPLICATE_CREATE_RE = re.compile(r"^(?:/v1)?/models/([^/]+)/([^/]+)/predictions$")
+_REPLICATE_GET_RE = re.compile(r"^(?:/v1)?/predictions/([^/]+)$")
+_COUNT_RE = re.compile(r"(?:Generate|List)\s+(\d+)")
+_SUBJECT_RE = re.compile(r"Subject:\s*([^\n]+)")
+
+DEFAULT_COUNT = 5
+# A prompt asking for thousands of items would otherwise make the mock build
+# (and the harness stream) a response far past anything the app requests.
+MAX_COUNT = 100
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Latency distribution in milliseconds: ``fixed:MS``, ``uniform:LO:HI`` or ``lognormal:MEDIAN:SIGMA``."""
+
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, *args = spec.split(":")
+        values = [float(v) for v in args]
+        if kind == "fixed" and len(values) == 1:
+            return cls(kind, values[0])
+        if kind in ("uniform", "lognormal") and len(values) == 2:
+            return cls(kind, values[0], values[1])
+        raise ValueError(f"bad latency spec {spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        """One latency in seconds."""
+        if self.kind == "uniform":
+            ms = rng.uniform(self.a, self.b)
+        elif self.kind == "lognormal":
+            ms = rng.lognormvariate(math.log(max(self.a, 1e-3)), self.b)
+        else:
+            ms = self.a
+        return max(0.0, ms) / 1000.0
+
+
+@dataclass(frozen=True)
+class MockProfile:
+    latency: Latency = Latency()
+    # Probability that any request is answered with 429.
+    rate_limit: float = 0.0
+    # Requests in flight above this get 429 (0 = unlimited).
+    max_concurrency: int = 0
+    # Delay between streamed chunks; 0 sends the whole answer at once.
+    stream_chunk_ms: float = 0.0
+    stream_chunks: int = 8
+    seed: int = 0
+
+
+PROFILES: Dict[str, MockProfile] = {
+    "instant": MockProfile(),
+    "fast": MockProfile(latency=Latency("fixed", 150)),
+    # Roughly what gemini-3-flash-preview does for a 5-10 question prompt.
+    "realistic": MockProfile(latency=Latency("lognormal", 2500, 0.5)),
+    "slow": MockProfile(latency=Latency("lognormal", 12000, 0.4)),
+    "rate-limited": MockProfile(latency=Latency("lognormal", 2500, 0.5), rate_limit=0.25, max_concurrency=4),
+    "slow-stream": MockProfile(latency=Latency("lognormal", 1500, 0.5), stream_chunk_ms=400, stream_chunks=20),
+}
+
+
+@dataclass
+class _Prediction:
+    id: str
+    model: str
+    created: float
+    ready_at: float
+    output: list
+
+
+@dataclass
+class MockState:
+    profile: MockProfile
+    rng: random.Random = field(init=False)
+    predictions: Dict[str, _Prediction] = field(default_factory=dict)
+    counters: Counter = field(default_factory=Counter)
+    inflight: int = 0
+    peak_inflight: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self):
+        self.rng = random.Random(self.profile.seed)
+
+    def sample_latency(self) -> float:
+        with self.lock:
+            return self.profile.latency.sample(self.rng)
+
+    def should_throttle(self) -> bool:
+        with self.lock:
+            over = self.profile.max_concurrency and self.inflight > self.profile.max_concurrency
+            return bool(over) or self.rng.random() < self.profile.rate_limit
+
+
+def _seed_for(profile_seed: int, prompt: str) -> int:
+    """Same prompt, same questions: keeps runs against the mock reproducible."""
+    return int(hashlib.sha256(f"{profile_seed}:{prompt}".encode("utf-8")).hexdigest()[:8], 16)
+
+
+def _count_for(prompt: str) -> int:
+    found = _COUNT_RE.search(prompt)
+    return min(int(found.group(1)), MAX_COUNT) if found else DEFAULT_COUNT
+
+
+def _questions_for(prompt: str, seed: int) -> list:
+    subject_match = _SUBJECT_RE.search(prompt)
+    subject = subject_match.group(1).strip() if subject_match else ""
+    return synth.question_batch(seed, _count_for(prompt), subject)
+
+
+def _answer_for(payload: dict, prompt: str, seed: int) -> str:
+    """Response text in the shape the request's generation config asks for."""
+    config = payload.get("generationConfig") or {}
+    schema = config.get("responseSchema") or {}
+    items = schema.get("items") or {}
+    rng = random.Random(seed)
+    if str(schema.get("type", "")).upper() == "ARRAY" and str(items.get("type", "")).upper() == "STRING":
+        strings = [synth.sentence(rng, synth.ENGLISH_WORDS, (1, 4)) for _ in range(_count_for(prompt))]
+        return json.dumps(strings, ensure_ascii=False)
+    if not schema and config.get("responseMimeType") != "application/json":
+        return synth.sentence(rng, synth.ENGLISH_WORDS, synth.SOLUTION_WORDS, ".")
+    return json.dumps(_questions_for(prompt, seed), ensure_ascii=False)
+
+
+def _prompt_text(payload: dict) -> str:
+    texts = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if isinstance(node.get("text"), str):
+                texts.append(node["text"])
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+        elif isinstance(node, str) and not texts:
+            texts.append(node)
+
+    walk(payload.get("contents", payload.get("input", payload)))
+    return "\n".join(texts)
+
+
+def _split(text: str, parts: int) -> list:
+    size = max(1, math.ceil(len(text) / max(parts, 1)))
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class MockAIHandler(BaseHTTPRequestHandler):
+    server_version = "QBankMockAI/1.0"
+    state: MockState  # set on the subclass built by make_server
+
+    def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+        pass
+
+    def _cors(self) -> None:
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Headers", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
+
+    def _json(self, status: int, body, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self._cors()
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(raw or b"{}")
+        except ValueError:
+            return {}
+
+    def _throttled(self, gemini: bool) -> None:
+        self.state.counters["429"] += 1
+        if gemini:
+            body = {"error": {"code": 429, "message": "Resource has been exhausted (e.g. check quota).",
+                              "status": "RESOURCE_EXHAUSTED"}}
+        else:
+            body = {"detail": "Request was throttled.", "status": 429}
+        self._json(429, body, {"Retry-After": "1"})
+
+    def _enter(self) -> None:
+        with self.state.lock:
+            self.state.inflight += 1
+            self.state.peak_inflight = max(self.state.peak_inflight, self.state.inflight)
+            self.state.counters["requests"] += 1
+
+    def _leave(self) -> None:
+        with self.state.lock:
+            self.state.inflight -= 1
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._cors()
+        self.end_headers()
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/__stats":
+            with self.state.lock:
+                stats = dict(self.state.counters, inflight=self.state.inflight, peakInflight=self.state.peak_inflight)
+            return self._json(200, stats)
+        match = _REPLICATE_GET_RE.match(path)
+        if not match:
+            return self._json(404, {"detail": "Not found."})
+        self._enter()
+        try:
+            self.state.counters["replicate_poll"] += 1
+            if self.state.should_throttle():
+                return self._throttled(gemini=False)
+            prediction = self.state.predictions.get(match.group(1))
+            if prediction is None:
+                return self._json(404, {"detail": "Not found."})
+            self._json(200, self._prediction_body(prediction))
+        finally:
+            self._leave()
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        gemini = _GEMINI_RE.match(path)
+        replicate = _REPLICATE_CREATE_RE.match(path)
+        if not (gemini or replicate):
+            return self._json(404, {"error": {"code": 404, "message": f"{path} is not mocked"}})
+        payload = self._read_json()
+        self._enter()
+        try:
+            if self.state.should_throttle():
+                return self._throttled(gemini=bool(gemini))
+            if gemini:
+                self._gemini(gemini.group(1), gemini.group(2) == "streamGenerateContent", payload)
+            else:
+                self._replicate_create(f"{replicate.group(1)}/{replicate.group(2)}", payload)
+        finally:
+            self._leave()
+
+    def _gemini(self, model: str, stream: bool, payload: dict) -> None:
+        self.state.counters["gemini"] += 1
+        prompt = _prompt_text(payload)
+        seed = _seed_for(self.state.profile.seed, prompt)
+        text = _answer_for(payload, prompt, seed)
+        time.sleep(self.state.sample_latency())
+
+        def chunk(part: str, final: bool) -> dict:
+            candidate = {"content": {"parts": [{"text": part}], "role": "model"}, "index": 0}
+            if final:
+                candidate["finishReason"] = "STOP"
+            return {
+                "candidates": [candidate],
+                "usageMetadata": {"promptTokenCount": len(prompt) // 4, "candidatesTokenCount": len(text) // 4,
+                                  "totalTokenCount": (len(prompt) + len(text)) // 4},
+                "modelVersion": model,
+            }
+
+        if not stream:
+            return self._json(200, chunk(text, True))
+        parts = _split(text, self.state.profile.stream_chunks)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self._cors()
+        self.end_headers()
+        try:
+            for i, part in enumerate(parts):
+                data = json.dumps(chunk(part, i == len(parts) - 1), ensure_ascii=False)
+                self.wfile.write(f"data: {data}\r\n\r\n".encode("utf-8"))
+                self.wfile.flush()
+                if self.state.profile.stream_chunk_ms and i < len(parts) - 1:
+                    time.sleep(self.state.profile.stream_chunk_ms / 1000.0)
+        except (BrokenPipeError, ConnectionResetError):
+            # The UI cancelled the generation mid-stream.
+            self.state.counters["stream_aborted"] += 1
+
+    def _replicate_create(self, model: str, payload: dict) -> None:
+        self.state.counters["replicate_create"] += 1
+        prompt = _prompt_text(payload)
+        seed = _seed_for(self.state.profile.seed, prompt)
+        text = _answer_for(payload, prompt, seed)
+        now = time.time()
+        prediction = _Prediction(
+            id=uuid.uuid4().hex[:26],
+            model=model,
+            created=now,
+            ready_at=now + self.state.sample_latency(),
+            # Replicate language models return a list of tokens.
+            output=_split(text, max(1, len(text) // 16)),
+        )
+        with self.state.lock:
+            self.state.predictions[prediction.id] = prediction
+        self._json(201, self._prediction_body(prediction))
+
+    def _prediction_body(self, prediction: _Prediction) -> dict:
+        now = time.time()
+        done = now >= prediction.ready_at
+        if done:
+            status = "succeeded"
+        elif now - prediction.created < 0.5:
+            status = "starting"
+        else:
+            status = "processing"
+        return {
+            "id": prediction.id,
+            "model": prediction.model,
+            "status": status,
+            "output": prediction.output if done else None,
+            "error": None,
+            "logs": "",
+            "urls": {"get": f"/v1/predictions/{prediction.id}"},
+            "metrics": {"predict_time": round(prediction.ready_at - prediction.created, 3)} if done else {},
+        }
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8787, profile: MockProfile = PROFILES["realistic"]) -> ThreadingHTTPServer:
+    handler = type("BoundMockAIHandler", (MockAIHandler,), {"state": MockState(profile)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_in_thread(host: str = "127.0.0.1", port: int = 0, profile: MockProfile = PROFILES["realistic"]) -> Tuple[ThreadingHTTPServer, str]:
+    """Start a server on a background thread; returns it and its base URL."""
+    server = make_server(host, port, profile)
+    threading.Thread(target=server.serve_forever, name="mock-ai", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def build_profile(name: str, latency: Optional[str] = None, rate_limit: Optional[float] = None,
+                  max_concurrency: Optional[int] = None, stream_chunk_ms: Optional[float] = None,
+                  seed: Optional[int] = None) -> MockProfile:
+    """A named profile with any explicitly given settings overridden."""
+    overrides = {
+        "latency": Latency.parse(latency) if latency else None,
+        "rate_limit": rate_limit,
+        "max_concurrency": max_concurrency,
+        "stream_chunk_ms": stream_chunk_ms,
+        "seed": seed,
+    }
+    return replace(PROFILES[name], **{k: v for k, v in overrides.items() if v is not None})
+
+
+class MockAIRouter:
+    """Redirects the app's AI traffic in a browser context to a mock server."""
+
+    ROUTES = ("**/generativelanguage.googleapis.com/**", "**/replicate-api/**")
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    async def attach(self, context) -> None:
+        for pattern in self.ROUTES:
+            await context.route(pattern, self._handle)
+
+    def target_url(self, url: str) -> str:
+        parts = urlsplit(url)
+        path = parts.path
+        if path.startswith("/replicate-api/"):
+            path = "/v1" + path[len("/replicate-api"):]
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self.base_url}{path}{query}"
+
+    async def _handle(self, route, request) -> None:
+        response = await route.fetch(url=self.target_url(request.url))
+        await route.fulfill(response=response)
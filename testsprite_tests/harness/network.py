@@ -0,0 +1,295 @@
+"""Network condition profiles for running TCs on slow and flaky links.
+
+``NetworkEmulator.attach`` is a context hook: every page the script opens
+gets ``Network.emulateNetworkConditions`` over its own CDP session before
+its first request goes out (requests are held at a route until the session
+is set up). Profiles follow the DevTools presets:
+
+* ``offline``: the page loads normally, then the context goes offline after
+  its first ``load`` event, which is what a student losing signal mid-session
+  sees; starting offline would only test Chromium's error page.
+* ``slow-3g``, ``fast-3g``, ``4g``: latency plus download/upload throughput.
+* ``lossy``: fast-3G with a share of fetch/XHR requests failed at random
+  (seeded). Chromium's throttling has no packet loss for HTTP, so loss is
+  emulated as the connection errors an app sees when packets go missing;
+  scripts and styles are never dropped so the app still boots.
+
+Supabase traffic (``/rest/v1``, ``/auth/v1``, ``/storage/v1``,
+``/functions/v1``) is tracked per request signature (method, URL, body): a
+repeat after a failed attempt counts as a retry, a repeat after a success as
+a duplicate.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import statistics
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from playwright import async_api
+
+from .loader import TESTS_DIR
+
+# Not report.TMP_DIR: report imports the runner, which imports this module.
+REPORT_PATH = TESTS_DIR / "tmp" / "network_matrix.json"
+DROPPABLE_TYPES = ("fetch", "xhr")
+# The error a dropped request fails with, after this many round trips.
+DROP_ERROR = "timedout"
+DROP_AFTER_RTTS = 3
+
+_SUPABASE_PATH = re.compile(r"/(rest|auth|storage|functions)/v1/")
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    name: str
+    latency_ms: float = 0.0
+    download_kbps: float = -1.0
+    upload_kbps: float = -1.0
+    loss: float = 0.0
+    offline: bool = False
+
+    def conditions(self) -> Dict[str, Any]:
+        """Parameters for ``Network.emulateNetworkConditions``."""
+        kbps = lambda value: value * 1000 / 8 if value > 0 else -1
+        return {
+            "offline": False,
+            "latency": self.latency_ms,
+            "downloadThroughput": kbps(self.download_kbps),
+            "uploadThroughput": kbps(self.upload_kbps),
+        }
+
+
+PROFILES = {
+    "offline": NetworkProfile("offline", offline=True),
+    "slow-3g": NetworkProfile("slow-3g", latency_ms=2000, download_kbps=400, upload_kbps=400),
+    "fast-3g": NetworkProfile("fast-3g", latency_ms=562.5, download_kbps=1440, upload_kbps=675),
+    "4g": NetworkProfile("4g", latency_ms=170, download_kbps=9000, upload_kbps=9000),
+    "lossy": NetworkProfile("lossy", latency_ms=562.5, download_kbps=1440, upload_kbps=675, loss=0.1),
+}
+DEFAULT_MATRIX = tuple(PROFILES)
+
+
+def parse_profiles(spec: str) -> List[NetworkProfile]:
+    profiles = []
+    for name in filter(None, (part.strip().lower() for part in spec.split(","))):
+        if name not in PROFILES:
+            raise ValueError(f"unknown network profile {name!r} (expected one of {', '.join(PROFILES)})")
+        profiles.append(PROFILES[name])
+    return profiles
+
+
+def is_supabase(url: str) -> bool:
+    return bool(_SUPABASE_PATH.search(url))
+
+
+@dataclass
+class SupabaseStats:
+    requests: int = 0
+    failed: int = 0
+    retried: int = 0
+    duplicated: int = 0
+
+
+class SupabaseMonitor:
+    """Counts Supabase requests that repeat an earlier identical one."""
+
+    def __init__(self):
+        self.stats = SupabaseStats()
+        self._last_ok: Dict[str, bool] = {}
+        self._signatures: Dict[async_api.Request, str] = {}
+
+    def attach(self, context: async_api.BrowserContext) -> None:
+        context.on("request", self._on_request)
+        context.on("requestfinished", lambda request: self._on_done(request, None))
+        context.on("requestfailed", lambda request: self._on_done(request, False))
+
+    @staticmethod
+    def signature(request: async_api.Request) -> str:
+        body = request.post_data_buffer or b""
+        return f"{request.method} {request.url} {hashlib.sha256(body).hexdigest()[:16]}"
+
+    def _on_request(self, request: async_api.Request) -> None:
+        if not is_supabase(request.url):
+            return
+        key = self.signature(request)
+        self.stats.requests += 1
+        if key in self._last_ok:
+            if self._last_ok[key]:
+                self.stats.duplicated += 1
+            else:
+                self.stats.retried += 1
+        self._signatures[request] = key
+
+    def _on_done(self, request: async_api.Request, ok: Optional[bool]) -> None:
+        key = self._signatures.pop(request, None)
+        if key is None:
+            return
+        asyncio.ensure_future(self._settle(request, key, ok))
+
+    async def _settle(self, request: async_api.Request, key: str, ok: Optional[bool]) -> None:
+        if ok is None:
+            try:
+                response = await request.response()
+                ok = response is not None and response.status < 500 and response.status != 429
+            except async_api.Error:
+                ok = False
+        if not ok:
+            self.stats.failed += 1
+        self._last_ok[key] = ok
+
+
+class NetworkEmulator:
+    """Applies one ``NetworkProfile`` to every page of the contexts it is attached to."""
+
+    def __init__(self, profile: NetworkProfile, seed: int = 0):
+        self.profile = profile
+        self.random = random.Random(seed)
+        self.dropped = 0
+        self.supabase = SupabaseMonitor()
+        self._ready: Dict[async_api.Page, asyncio.Future] = {}
+
+    async def attach(self, context: async_api.BrowserContext) -> None:
+        self.supabase.attach(context)
+        if self.profile.offline:
+            context.on("page", lambda page: page.once("load", lambda _: self._go_offline(context)))
+            return
+        context.on("page", self._on_page)
+        await context.route("**/*", self._gate)
+
+    def _go_offline(self, context: async_api.BrowserContext) -> None:
+        asyncio.ensure_future(context.set_offline(True))
+
+    def _on_page(self, page: async_api.Page) -> asyncio.Future:
+        if page not in self._ready:
+            self._ready[page] = asyncio.get_running_loop().create_future()
+            asyncio.ensure_future(self._emulate(page, self._ready[page]))
+        return self._ready[page]
+
+    async def _emulate(self, page: async_api.Page, ready: asyncio.Future) -> None:
+        try:
+            session = await page.context.new_cdp_session(page)
+            await session.send("Network.enable")
+            await session.send("Network.emulateNetworkConditions", self.profile.conditions())
+        except async_api.Error:
+            pass
+        finally:
+            ready.done() or ready.set_result(None)
+
+    async def _gate(self, route: async_api.Route, request: async_api.Request) -> None:
+        try:
+            page = request.frame.page
+        except async_api.Error:
+            page = None  # service worker requests have no frame
+        if page is not None:
+            # The first request can beat the "page" event; either one starts the emulation.
+            await self._on_page(page)
+        if (
+            self.profile.loss
+            and request.resource_type in DROPPABLE_TYPES
+            and self.random.random() < self.profile.loss
+        ):
+            self.dropped += 1
+            await asyncio.sleep(self.profile.latency_ms * DROP_AFTER_RTTS / 1000.0)
+            await route.abort(DROP_ERROR)
+            return
+        await route.fallback()
+
+    def stats(self) -> Dict[str, Any]:
+        """The ``network`` block written to test_results.json."""
+        return {"profile": self.profile.name, "dropped": self.dropped, "supabase": asdict(self.supabase.stats)}
+
+
+@dataclass
+class MatrixCell:
+    test: str
+    profile: str
+    status: str
+    duration_s: float
+    steps: List[Dict] = field(default_factory=list)
+    supabase: Dict[str, int] = field(default_factory=dict)
+    dropped: int = 0
+    error: str = ""
+
+    @property
+    def slowest(self) -> Optional[Dict]:
+        return max(self.steps, key=lambda s: s["ms"]) if self.steps else None
+
+
+def cell_from_outcome(outcome: Any) -> MatrixCell:
+    """``MatrixCell`` of a ``runner.TestOutcome`` run with a network profile."""
+    network = outcome.extra.get("network", {})
+    return MatrixCell(
+        test=outcome.script.title,
+        profile=network.get("profile", "none"),
+        status=outcome.status,
+        duration_s=round(outcome.duration, 1),
+        steps=outcome.extra.get("steps", []),
+        supabase=network.get("supabase", {}),
+        dropped=network.get("dropped", 0),
+        error=outcome.error[:200],
+    )
+
+
+def step_slowdown(cells: Sequence[MatrixCell], baseline: str) -> List[Dict]:
+    """Per test and step, latency under each profile next to ``baseline``'s (same step order)."""
+    rows = []
+    by_test: Dict[str, Dict[str, MatrixCell]] = {}
+    for cell in cells:
+        by_test.setdefault(cell.test, {})[cell.profile] = cell
+    for test, profiles in by_test.items():
+        base = profiles.get(baseline)
+        if not base:
+            continue
+        for profile, cell in profiles.items():
+            if profile == baseline:
+                continue
+            for before, after in zip(base.steps, cell.steps):
+                if before["step"] != after["step"]:
+                    break
+                rows.append({"test": test, "profile": profile, "step": after["step"], "baselineMs": before["ms"],
+                             "ms": after["ms"], "ratio": round(after["ms"] / before["ms"], 1) if before["ms"] else None})
+    rows.sort(key=lambda r: r["ms"] - r["baselineMs"], reverse=True)
+    return rows
+
+
+@dataclass
+class MatrixReport:
+    cells: List[MatrixCell]
+    baseline: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "cells": [asdict(c) for c in self.cells],
+            "slowdowns": step_slowdown(self.cells, self.baseline) if self.baseline else [],
+        }
+
+    def write(self, path: Path = REPORT_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+
+    def render(self, top: int = 10) -> str:
+        lines = [f"{'test':<44}{'profile':<9}{'status':<8}{'secs':>7}{'p50 ms':>8}{'max ms':>8}"
+                 f"{'supa':>6}{'retry':>6}{'dup':>5}{'fail':>5}{'drop':>5}"]
+        for cell in self.cells:
+            times = [s["ms"] for s in cell.steps]
+            p50 = f"{statistics.median(times):>8.0f}" if times else f"{'-':>8}"
+            worst = f"{max(times):>8.0f}" if times else f"{'-':>8}"
+            supa = cell.supabase
+            lines.append(
+                f"{cell.test[:43]:<44}{cell.profile:<9}{cell.status:<8}{cell.duration_s:>7.1f}{p50}{worst}"
+                f"{supa.get('requests', 0):>6}{supa.get('retried', 0):>6}{supa.get('duplicated', 0):>5}"
+                f"{supa.get('failed', 0):>5}{cell.dropped:>5}"
+            )
+        if self.baseline:
+            slowdowns = step_slowdown(self.cells, self.baseline)[:top]
+            if slowdowns:
+                lines += ["", f"steps that degrade most against {self.baseline}:"]
+                for row in slowdowns:
+                    ratio = f"x{row['ratio']}" if row["ratio"] is not None else ""
+                    lines.append(f"  {row['profile']:<8}{row['baselineMs']:>8.0f} -> {row['ms']:>8.0f} ms {ratio:<6} "
+                                 f"{row['test'][:30]}: {row['step'][:60]}")
+        return "\n".join(lines)
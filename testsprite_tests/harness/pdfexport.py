@@ -0,0 +1,268 @@
+"""PDF export benchmark across the app's three PDF paths.
+
+Exports bilingual question sets (``seed.legacy_records``) of 50/500/2000
+questions through:
+
+* ``generatePDF``: pdfGeneratorService's jsPDF text layout, two columns with
+  ``splitTextToSize`` per question and option; returns a Blob.
+* ``downloadPDFFromElement``: pdfGeneratorService's raster path, html2canvas
+  at scale 3 over a rendered paper, sliced into A4 pages. Nothing in the app
+  renders a paper for it yet, so the benchmark lays the set out as an A4-wide
+  two-column sheet (question, options, both languages) and hands that in.
+  When html2canvas fails (tall papers exceed Chromium's canvas limits) the
+  service falls back to ``generatePDF``; that is reported, not hidden.
+* ``generateQuestionSetPDF`` (utils/pdfGenerator.ts): the template renderer,
+  ``exam_paper`` with answers and explanations.
+
+Modules are imported from the Vite dev server, each export runs on a fresh
+page, and the time is measured in the page around the call. The two
+download paths are caught as Playwright downloads for their size. Peak heap
+is the highest of ``Runtime.getHeapUsage`` polls during the export and
+right after it; long synchronous stretches (jsPDF layout) are only sampled
+at their end, so it is a lower bound there.
+"""
+import asyncio
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+from playwright import async_api
+
+from . import seed, waits
+from .canvas import parse_levels
+from .report import TMP_DIR
+
+REPORT_PATH = TMP_DIR / "pdf_export.json"
+DEFAULT_SIZES = (50, 500, 2000)
+ENGINES = ("generatePDF", "downloadPDFFromElement", "generateQuestionSetPDF")
+DOWNLOADS = ("downloadPDFFromElement", "generateQuestionSetPDF")
+EXPORT_TIMEOUT_MS = 600_000
+HEAP_POLL_S = 0.05
+
+_PAGE_OBJECT = re.compile(rb"/Type\s*/Page\b")
+
+_SETUP_JS = """
+async ({ questions, set }) => {
+  const [{ pdfGeneratorService }, { generateQuestionSetPDF }] = await Promise.all([
+    import('/services/pdfGeneratorService.ts'), import('/utils/pdfGenerator.ts'),
+  ]);
+  window.__qbankPdf = { questions, set, pdfGeneratorService, generateQuestionSetPDF };
+}
+"""
+
+# An A4-wide (794 CSS px) two-column paper for the raster path.
+_PAPER_JS = """
+() => {
+  const { questions, set } = window.__qbankPdf;
+  const esc = (s) => String(s ?? '').replace(/[&<>]/g, (c) => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;' })[c]);
+  const paper = document.createElement('div');
+  paper.id = 'qbank-pdf-paper';
+  paper.style.cssText = 'position:absolute;left:0;top:0;width:794px;padding:38px;box-sizing:border-box;'
+    + 'background:#fff;color:#000;font:13px/1.45 sans-serif;column-count:2;column-gap:38px;z-index:99999';
+  const items = questions.map((q, i) => {
+    const options = [1, 2, 3, 4].map((n) =>
+      `<div>(${'abcd'[n - 1]}) ${esc(q[`option${n}_hin`])} / ${esc(q[`option${n}_eng`])}</div>`).join('');
+    return `<div style="break-inside:avoid;margin-bottom:18px"><b>Q${i + 1}.</b> ${esc(q.question_hin)}`
+      + `<div>${esc(q.question_eng)}</div>${options}</div>`;
+  });
+  paper.innerHTML = `<h2 style="column-span:all;text-align:center">${esc(set.name)}</h2>${items.join('')}`;
+  document.body.appendChild(paper);
+  return paper.scrollHeight;
+}
+"""
+
+_EXPORT_JS = """
+async (engine) => {
+  const bench = window.__qbankPdf;
+  const { questions, set, pdfGeneratorService } = bench;
+  let fellBack = false;
+  const consoleError = console.error;
+  console.error = (...args) => {
+    if (String(args[0]).startsWith('Canvas PDF Failed')) fellBack = true;
+    consoleError.apply(console, args);
+  };
+  const started = performance.now();
+  let blob = null;
+  try {
+    if (engine === 'generatePDF') {
+      blob = await pdfGeneratorService.generatePDF(set, questions);
+    } else if (engine === 'downloadPDFFromElement') {
+      await pdfGeneratorService.downloadPDFFromElement(document.getElementById('qbank-pdf-paper'), set);
+    } else {
+      await bench.generateQuestionSetPDF(questions, {
+        template: 'exam_paper', title: set.name, headerText: set.name, footerText: 'Benchmark',
+        includeAnswerKey: true, includeExplanations: true,
+      });
+    }
+  } finally {
+    console.error = consoleError;
+  }
+  const ms = performance.now() - started;
+  const result = { ms, fellBack, bytes: null, pages: null };
+  if (blob) {
+    result.bytes = blob.size;
+    result.pages = ((await blob.text()).match(/\\/Type\\s*\\/Page\\b/g) || []).length;
+  }
+  return result;
+}
+"""
+
+
+def question_set(questions: List[dict]) -> dict:
+    """A ``QuestionSet`` over ``questions``, as the Creator saves one."""
+    return {
+        "setId": f"pdf-bench-{len(questions)}",
+        "name": f"Benchmark Paper {len(questions)}",
+        "description": "PDF export benchmark",
+        "questionIds": [q["id"] for q in questions],
+        "createdDate": "2026-01-01T00:00:00Z",
+        "settings": {"timerEnabled": False, "timePerQuestion": 60, "showQuestionNumbers": True, "randomize": False},
+    }
+
+
+def parse_engines(spec: str) -> List[str]:
+    engines = [e.strip() for e in spec.split(",") if e.strip()]
+    unknown = [e for e in engines if e not in ENGINES]
+    if unknown:
+        raise ValueError(f"unknown PDF engines {unknown} (expected one of {', '.join(ENGINES)})")
+    return engines
+
+
+@dataclass
+class ExportResult:
+    engine: str
+    questions: int
+    ms: float = 0.0
+    bytes: int = 0
+    pages: int = 0
+    baseline_kb: float = 0.0
+    peak_kb: float = 0.0
+    fell_back: bool = False
+    error: str = ""
+
+    @property
+    def peak_growth_kb(self) -> float:
+        return max(self.peak_kb - self.baseline_kb, 0.0)
+
+
+class HeapPoller:
+    """Polls the page's JS heap until stopped and keeps the highest reading."""
+
+    def __init__(self, session: async_api.CDPSession):
+        self.session = session
+        self.peak_kb = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def read(self) -> float:
+        usage = await self.session.send("Runtime.getHeapUsage")
+        kb = round(usage["usedSize"] / 1024.0, 1)
+        self.peak_kb = max(self.peak_kb, kb)
+        return kb
+
+    async def _poll(self) -> None:
+        while True:
+            await self.read()
+            await asyncio.sleep(HEAP_POLL_S)
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._poll())
+
+    async def stop(self) -> float:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, async_api.Error):
+                pass
+        await self.read()
+        return self.peak_kb
+
+
+async def export(page: async_api.Page, app_url: str, engine: str, questions: List[dict]) -> ExportResult:
+    """Run one export of ``questions`` through ``engine`` on ``page``."""
+    result = ExportResult(engine, len(questions))
+    await page.goto(app_url, wait_until="commit")
+    await waits.settle(page)
+    await page.evaluate(_SETUP_JS, {"questions": questions, "set": question_set(questions)})
+    if engine == "downloadPDFFromElement":
+        await page.evaluate(_PAPER_JS)
+    session = await page.context.new_cdp_session(page)
+    try:
+        await session.send("HeapProfiler.collectGarbage")
+        poller = HeapPoller(session)
+        result.baseline_kb = await poller.read()
+        poller.start()
+        try:
+            if engine in DOWNLOADS:
+                async with page.expect_download(timeout=EXPORT_TIMEOUT_MS) as info:
+                    done = await page.evaluate(_EXPORT_JS, engine)
+                data = Path(await (await info.value).path()).read_bytes()
+                done["bytes"], done["pages"] = len(data), len(_PAGE_OBJECT.findall(data))
+            else:
+                done = await page.evaluate(_EXPORT_JS, engine)
+        finally:
+            result.peak_kb = await poller.stop()
+    except async_api.Error as exc:
+        result.error = exc.message.splitlines()[0][:200]
+        return result
+    finally:
+        await session.detach()
+    result.ms = round(done["ms"], 1)
+    result.bytes, result.pages, result.fell_back = done["bytes"] or 0, done["pages"] or 0, done["fellBack"]
+    return result
+
+
+async def run(
+    context: async_api.BrowserContext,
+    app_url: str,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    engines: Sequence[str] = ENGINES,
+    seed_value: int = 0,
+    on_export: Optional[Callable[[ExportResult], None]] = None,
+) -> List[ExportResult]:
+    """Export each size through each engine, every export on a fresh page of ``context``."""
+    results = []
+    for size in sizes:
+        questions = list(seed.legacy_records(size, seed_value))
+        for engine in engines:
+            page = await context.new_page()
+            page.set_default_timeout(EXPORT_TIMEOUT_MS)
+            try:
+                result = await export(page, app_url.rstrip("/"), engine, questions)
+            finally:
+                await page.close()
+            results.append(result)
+            if on_export:
+                on_export(result)
+    return results
+
+
+def check(results: List[ExportResult]) -> List[str]:
+    failures = [f"{r.engine} with {r.questions} questions: {r.error}" for r in results if r.error]
+    # The fallback is generatePDF over storageService.getQuestions(), not this
+    # paper, so its time, size and pages say nothing about the raster path.
+    failures += [
+        f"{r.engine} with {r.questions} questions: html2canvas failed and the export fell back to generatePDF"
+        for r in results if r.fell_back
+    ]
+    return failures
+
+
+def render(results: List[ExportResult]) -> str:
+    lines = [f"{'engine':<24}{'questions':>10}{'ms':>10}{'pages':>7}{'size KB':>10}{'peak MB':>9}{'+heap MB':>10}"]
+    for r in results:
+        if r.error:
+            lines.append(f"{r.engine:<24}{r.questions:>10}  error: {r.error}")
+            continue
+        note = "  (html2canvas failed, fell back to generatePDF)" if r.fell_back else ""
+        lines.append(f"{r.engine:<24}{r.questions:>10}{r.ms:>10.0f}{r.pages:>7}{r.bytes / 1024:>10.0f}"
+                     f"{r.peak_kb / 1024:>9.1f}{r.peak_growth_kb / 1024:>10.1f}{note}")
+    return "\n".join(lines)
+
+
+def write(results: List[ExportResult], path: Path = REPORT_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = [{**asdict(r), "peak_growth_kb": round(r.peak_growth_kb, 1)} for r in results]
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
@@ -0,0 +1,238 @@
+"""A pool of warm Chromium browsers shared by the TC scripts.
+
+The generated scripts each start their own Playwright driver and launch a
+fresh browser. ``PooledAsyncApi`` stands in for ``playwright.async_api`` inside
+a loaded script: ``async_playwright().start()`` and ``chromium.launch()``
+return lightweight handles onto a browser that is already running, and the
+script's own ``browser.close()`` / ``pw.stop()`` only close the contexts that
+script opened. Each test therefore still gets its own isolated context.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from playwright import async_api
+
+# Same flags the generated scripts use, minus --single-process: a single
+# process browser cannot safely host several concurrent contexts.
+DEFAULT_LAUNCH_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+    "--ipc=host",
+]
+
+ContextHook = Callable[[async_api.BrowserContext], Awaitable[None]]
+
+
+class BrowserPool:
+    """Keeps ``size`` browsers running and leases them out to tests.
+
+    A browser may serve several tests at once; ``acquire`` picks the one with
+    the fewest active leases. Browsers that crash are relaunched on release.
+    """
+
+    def __init__(self, size: int = 2, headless: bool = True, launch_args: Optional[List[str]] = None):
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.size = size
+        self.headless = headless
+        self.launch_args = list(launch_args if launch_args is not None else DEFAULT_LAUNCH_ARGS)
+        self._playwright = None
+        self._browsers: List[async_api.Browser] = []
+        self._leases: Dict[int, int] = {}
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> "BrowserPool":
+        self._playwright = await async_api.async_playwright().start()
+        self._browsers = list(await asyncio.gather(*(self._launch() for _ in range(self.size))))
+        self._leases = {id(b): 0 for b in self._browsers}
+        return self
+
+    async def close(self) -> None:
+        for browser in self._browsers:
+            try:
+                await browser.close()
+            except async_api.Error:
+                pass
+        self._browsers = []
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "BrowserPool":
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _launch(self) -> async_api.Browser:
+        return await self._playwright.chromium.launch(headless=self.headless, args=self.launch_args)
+
+    @property
+    def playwright(self):
+        return self._playwright
+
+    async def acquire(self) -> async_api.Browser:
+        async with self._lock:
+            browser = min(self._browsers, key=lambda b: self._leases[id(b)])
+            if not browser.is_connected():
+                browser = await self._replace(browser)
+            self._leases[id(browser)] += 1
+            return browser
+
+    async def release(self, browser: async_api.Browser) -> None:
+        async with self._lock:
+            if id(browser) not in self._leases:
+                return
+            self._leases[id(browser)] -= 1
+            if self._leases[id(browser)]:
+                return
+            if browser not in self._browsers:
+                # Already replaced; its last holder is gone.
+                del self._leases[id(browser)]
+            elif not browser.is_connected():
+                await self._replace(browser)
+
+    async def _replace(self, browser: async_api.Browser) -> async_api.Browser:
+        """Swap a disconnected browser for a fresh one with no leases.
+
+        The old browser keeps its count until its holders release it.
+        """
+        fresh = await self._launch()
+        index = self._browsers.index(browser)
+        self._browsers[index] = fresh
+        self._leases[id(fresh)] = 0
+        if not self._leases[id(browser)]:
+            del self._leases[id(browser)]
+        return fresh
+
+    @asynccontextmanager
+    async def lease(self):
+        browser = await self.acquire()
+        try:
+            yield browser
+        finally:
+            await self.release(browser)
+
+
+class LeasedBrowser:
+    """Browser handle given to a single test.
+
+    Contexts created through it are tracked and closed on ``close()``; the
+    underlying browser keeps running for the next test.
+    """
+
+    def __init__(
+        self,
+        pool: BrowserPool,
+        browser: async_api.Browser,
+        context_options: Optional[Dict[str, Any]] = None,
+        context_hooks: Optional[List[ContextHook]] = None,
+    ):
+        self._pool = pool
+        self._browser = browser
+        self._context_options = dict(context_options or {})
+        self._context_hooks = list(context_hooks or [])
+        self._contexts: List[async_api.BrowserContext] = []
+        self._closed = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._browser, name)
+
+    @property
+    def contexts(self) -> List[async_api.BrowserContext]:
+        return list(self._contexts)
+
+    async def new_context(self, **kwargs) -> async_api.BrowserContext:
+        context = await self._browser.new_context(**{**self._context_options, **kwargs})
+        self._contexts.append(context)
+        for hook in self._context_hooks:
+            await hook(context)
+        return context
+
+    async def new_page(self, **kwargs) -> async_api.Page:
+        context = await self.new_context(**kwargs)
+        return await context.new_page()
+
+    async def close(self, **_kwargs) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for context in self._contexts:
+            try:
+                await context.close()
+            except async_api.Error:
+                pass
+        await self._pool.release(self._browser)
+
+
+class _PooledBrowserType:
+    def __init__(self, session: "PooledPlaywright", real_type):
+        self._session = session
+        self._real_type = real_type
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._real_type, name)
+
+    async def launch(self, **_kwargs) -> LeasedBrowser:
+        return await self._session.lease_browser()
+
+
+class PooledPlaywright:
+    """What a script gets back from ``async_playwright().start()``."""
+
+    def __init__(
+        self,
+        pool: BrowserPool,
+        context_options: Optional[Dict[str, Any]] = None,
+        context_hooks: Optional[List[ContextHook]] = None,
+    ):
+        self._pool = pool
+        self._context_options = context_options
+        self._context_hooks = context_hooks
+        self._leased: List[LeasedBrowser] = []
+        self.chromium = _PooledBrowserType(self, pool.playwright.chromium)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool.playwright, name)
+
+    @property
+    def browsers(self) -> List[LeasedBrowser]:
+        return list(self._leased)
+
+    async def lease_browser(self) -> LeasedBrowser:
+        browser = LeasedBrowser(
+            self._pool, await self._pool.acquire(), self._context_options, self._context_hooks
+        )
+        self._leased.append(browser)
+        return browser
+
+    async def start(self) -> "PooledPlaywright":
+        return self
+
+    async def stop(self) -> None:
+        # Scripts that bail out before browser.close() still give their lease back.
+        for browser in self._leased:
+            await browser.close()
+
+
+class PooledAsyncApi:
+    """Drop-in for the ``async_api`` module global of a loaded TC script.
+
+    ``context_hooks`` run against every context the script creates, before the
+    script sees it; the runner uses them to attach per-test instrumentation.
+    """
+
+    def __init__(
+        self,
+        pool: BrowserPool,
+        context_options: Optional[Dict[str, Any]] = None,
+        context_hooks: Optional[List[ContextHook]] = None,
+    ):
+        self.session = PooledPlaywright(pool, context_options, context_hooks)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(async_api, name)
+
+    def async_playwright(self) -> PooledPlaywright:
+        return self.session
@@ -0,0 +1,240 @@
+"""Opt-in per-test CDP profiling and the offline trace analyzer.
+
+With ``python -m harness run --profile`` every test records a browser-wide
+trace (timeline plus V8 CPU sampling) into ``tmp/profiles/<script>.trace.json.gz``.
+Chromium allows one trace per browser at a time, so profiling runs at most
+one test per pooled browser, and tests that trace on their own (TC011) cannot
+be profiled.
+
+The analyzer works on saved traces and reports, per test:
+
+* the JS functions with the most self time, source-mapped through the
+  Vite build's ``.map`` files when they are available,
+* the longest React commits: the main-thread task around each
+  ``onCommitFiberRoot`` call, which React reports through the devtools hook,
+* layout, style and paint cost by event type.
+
+``write_summary`` puts the results in ``tmp/profile_summary.json`` and
+``tmp/profile_summary.html`` next to raw_report.md.
+"""
+import gzip
+import html
+import json
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from playwright import async_api
+
+from .loader import TESTS_DIR
+from .sourcemap import SourceMapResolver
+from .trace import PROFILE_CATEGORIES, RENDERING_EVENTS, Trace, start_tracing, stop_tracing
+
+# report.TMP_DIR; not imported from there because the runner imports this module.
+_TMP_DIR = TESTS_DIR / "tmp"
+PROFILE_DIR = _TMP_DIR / "profiles"
+SUMMARY_JSON_PATH = _TMP_DIR / "profile_summary.json"
+SUMMARY_HTML_PATH = _TMP_DIR / "profile_summary.html"
+
+COMMIT_MARK = "react:commit"
+TOP_FUNCTIONS = 15
+TOP_COMMITS = 10
+# V8 pseudo-frames that are not JS the app can optimize.
+_PSEUDO_FRAMES = {"(root)", "(idle)", "(program)"}
+
+_COMMIT_MARK_SCRIPT = """
+(() => {
+  const hook = window.__REACT_DEVTOOLS_GLOBAL_HOOK__;
+  if (!hook || hook.__qbankCommitMarks) return;
+  hook.__qbankCommitMarks = true;
+  const original = hook.onCommitFiberRoot;
+  hook.onCommitFiberRoot = function (...args) {
+    performance.mark('%s');
+    return original ? original.apply(this, args) : undefined;
+  };
+})();
+""" % COMMIT_MARK
+
+
+class TraceProfiler:
+    """Records one browser-wide trace per test. Attach as a context hook.
+
+    Must be installed after ``waits.install`` so the React devtools hook
+    already exists when the commit-mark script runs.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._session: Optional[async_api.CDPSession] = None
+
+    async def attach(self, context: async_api.BrowserContext) -> None:
+        await context.add_init_script(_COMMIT_MARK_SCRIPT)
+        if self._session is None:
+            self._session = await context.browser.new_browser_cdp_session()
+            await start_tracing(self._session, PROFILE_CATEGORIES)
+
+    async def finish(self) -> Optional[Path]:
+        """Stop tracing and write the gzipped trace; ``None`` if nothing was traced."""
+        if self._session is None:
+            return None
+        session, self._session = self._session, None
+        try:
+            trace = await stop_tracing(session)
+        finally:
+            await session.detach()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace.events}, f)
+        return self.path
+
+
+def load_trace(path: Path) -> Trace:
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    return Trace(data["traceEvents"] if isinstance(data, dict) else data)
+
+
+def _frame_label(call_frame: Dict, resolver: Optional[SourceMapResolver]) -> Dict[str, Any]:
+    name = call_frame.get("functionName") or "(anonymous)"
+    url = call_frame.get("url", "")
+    line, column = call_frame.get("lineNumber", -1), call_frame.get("columnNumber", -1)
+    mapped = resolver.resolve(url, line, column) if resolver else None
+    if mapped:
+        source, line, column, original = mapped
+        return {"function": original or name, "source": source, "line": line + 1, "mapped": True}
+    return {"function": name, "source": os.path.basename(url.split("?")[0]) or url, "line": line + 1, "mapped": False}
+
+
+def hot_functions(trace: Trace, resolver: Optional[SourceMapResolver] = None, limit: int = TOP_FUNCTIONS) -> List[Dict]:
+    """Top JS functions by self time from the V8 ``ProfileChunk`` samples."""
+    nodes: Dict[tuple, Dict] = {}
+    self_us: Dict[tuple, float] = defaultdict(float)
+    hits: Dict[tuple, int] = defaultdict(int)
+    for event in trace.events:
+        if event.get("name") != "ProfileChunk":
+            continue
+        profile_key = (event.get("pid"), event.get("id"))
+        data = event.get("args", {}).get("data", {})
+        profile = data.get("cpuProfile", {})
+        for node in profile.get("nodes", []):
+            nodes[profile_key + (node["id"],)] = node.get("callFrame", {})
+        samples = profile.get("samples", [])
+        deltas = data.get("timeDeltas", [])
+        # timeDeltas[i] is the gap before sample i, so sample i lasted deltas[i + 1].
+        for sample, delta in zip(samples, deltas[1:]):
+            self_us[profile_key + (sample,)] += max(delta, 0)
+            hits[profile_key + (sample,)] += 1
+
+    merged: Dict[tuple, Dict[str, Any]] = {}
+    for key, micros in self_us.items():
+        call_frame = nodes.get(key)
+        if call_frame is None or call_frame.get("functionName") in _PSEUDO_FRAMES:
+            continue
+        label = _frame_label(call_frame, resolver)
+        entry = merged.setdefault(
+            (label["function"], label["source"], label["line"]), {**label, "selfMs": 0.0, "samples": 0}
+        )
+        entry["selfMs"] += micros / 1000.0
+        entry["samples"] += hits[key]
+    ranked = sorted(merged.values(), key=lambda e: e["selfMs"], reverse=True)[:limit]
+    for entry in ranked:
+        entry["selfMs"] = round(entry["selfMs"], 1)
+    return ranked
+
+
+def react_commits(trace: Trace, limit: int = TOP_COMMITS) -> List[Dict]:
+    """Longest main-thread tasks that contained a React commit."""
+    main = set(trace.renderer_main_threads())
+    tasks = sorted(
+        (e["ts"], e["ts"] + e.get("dur", 0), e["pid"], e["tid"])
+        for e in trace.events
+        if e.get("ph") == "X" and e.get("name") in ("RunTask", "ThreadControllerImpl::RunTask")
+        and (e.get("pid"), e.get("tid")) in main
+    )
+    origin = min((e["ts"] for e in trace.events if e.get("ts")), default=0)
+    commits: Dict[tuple, Dict] = {}
+    for mark in trace.events:
+        if mark.get("name") != COMMIT_MARK:
+            continue
+        ts = mark["ts"]
+        enclosing = [t for t in tasks if t[0] <= ts <= t[1] and t[2] == mark.get("pid")]
+        if not enclosing:
+            continue
+        start, end, _, _ = max(enclosing, key=lambda t: t[1] - t[0])
+        entry = commits.setdefault((mark.get("pid"), start), {
+            "atMs": round((start - origin) / 1000.0, 1),
+            "taskMs": round((end - start) / 1000.0, 1),
+            "commits": 0,
+        })
+        entry["commits"] += 1
+    return sorted(commits.values(), key=lambda c: c["taskMs"], reverse=True)[:limit]
+
+
+def layout_paint(trace: Trace) -> Dict[str, Dict[str, float]]:
+    main = set(trace.renderer_main_threads())
+    costs: Dict[str, Dict[str, float]] = {}
+    for event in trace.events:
+        if event.get("ph") != "X" or event.get("name") not in RENDERING_EVENTS:
+            continue
+        if (event.get("pid"), event.get("tid")) not in main:
+            continue
+        ms = event.get("dur", 0) / 1000.0
+        entry = costs.setdefault(event["name"], {"count": 0, "totalMs": 0.0, "maxMs": 0.0})
+        entry["count"] += 1
+        entry["totalMs"] += ms
+        entry["maxMs"] = max(entry["maxMs"], ms)
+    for entry in costs.values():
+        entry["totalMs"] = round(entry["totalMs"], 1)
+        entry["maxMs"] = round(entry["maxMs"], 1)
+    return dict(sorted(costs.items(), key=lambda item: item[1]["totalMs"], reverse=True))
+
+
+def analyze(trace: Trace, resolver: Optional[SourceMapResolver] = None) -> Dict[str, Any]:
+    stamps = [e["ts"] for e in trace.events if e.get("ts")]
+    return {
+        "traceMs": round((max(stamps) - min(stamps)) / 1000.0, 1) if stamps else 0.0,
+        "hotFunctions": hot_functions(trace, resolver),
+        "reactCommits": react_commits(trace),
+        "layoutPaint": layout_paint(trace),
+    }
+
+
+def analyze_files(paths: Iterable[Path], resolver: Optional[SourceMapResolver] = None) -> Dict[str, Dict]:
+    """``{script key: analysis}`` for saved ``<key>.trace.json.gz`` files."""
+    resolver = resolver or SourceMapResolver()
+    return {Path(p).name.split(".trace.")[0]: analyze(load_trace(Path(p)), resolver) for p in paths}
+
+
+def render_html(summary: Dict[str, Dict]) -> str:
+    esc = html.escape
+    parts = [
+        "<!doctype html><meta charset='utf-8'><title>Profile summary</title>",
+        "<style>body{font:13px system-ui;margin:2em}table{border-collapse:collapse;margin:.5em 0 1.5em}"
+        "td,th{border:1px solid #ddd;padding:2px 8px;text-align:left}td.n{text-align:right}"
+        "h2{margin-top:2em}</style>",
+        "<h1>Profile summary</h1>",
+    ]
+    for key, result in summary.items():
+        parts.append(f"<h2>{esc(key)}</h2><p>trace {result['traceMs']:.0f} ms</p>")
+        parts.append("<table><tr><th>Self ms</th><th>Function</th><th>Source</th></tr>")
+        for f in result["hotFunctions"]:
+            source = f"{f['source']}:{f['line']}" + ("" if f["mapped"] else " (unmapped)")
+            parts.append(f"<tr><td class=n>{f['selfMs']:.1f}</td><td>{esc(f['function'])}</td><td>{esc(source)}</td></tr>")
+        parts.append("</table><table><tr><th>React commit task ms</th><th>At ms</th><th>Commits</th></tr>")
+        for c in result["reactCommits"]:
+            parts.append(f"<tr><td class=n>{c['taskMs']:.1f}</td><td class=n>{c['atMs']:.0f}</td><td class=n>{c['commits']}</td></tr>")
+        parts.append("</table><table><tr><th>Layout/paint</th><th>Count</th><th>Total ms</th><th>Max ms</th></tr>")
+        for name, cost in result["layoutPaint"].items():
+            parts.append(f"<tr><td>{esc(name)}</td><td class=n>{cost['count']}</td>"
+                         f"<td class=n>{cost['totalMs']:.1f}</td><td class=n>{cost['maxMs']:.1f}</td></tr>")
+        parts.append("</table>")
+    return "\n".join(parts)
+
+
+def write_summary(summary: Dict[str, Dict], json_path: Path = SUMMARY_JSON_PATH,
+                  html_path: Path = SUMMARY_HTML_PATH) -> None:
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    json_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    html_path.write_text(render_html(summary), encoding="utf-8")
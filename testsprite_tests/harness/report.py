@@ -0,0 +1,179 @@
+"""Reading and writing tmp/test_results.json and tmp/raw_report.md.
+
+Records keep the TestSprite field names (``testStatus``, ``created``, ...) so
+files written by the harness can be merged with, and read alongside, the ones
+TestSprite produces.
+"""
+import json
+import os
+import re
+from collections import OrderedDict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .loader import TESTS_DIR, TestScript
+from .runner import TestOutcome, utc_iso
+
+TMP_DIR = TESTS_DIR / "tmp"
+RESULTS_PATH = TMP_DIR / "test_results.json"
+REPORT_PATH = TMP_DIR / "raw_report.md"
+CONFIG_PATH = TMP_DIR / "config.json"
+
+_STATUS_ICON = {"PASSED": "✅ Passed", "FAILED": "❌ Failed", "ERROR": "❌ Failed"}
+
+
+def normalize_title(title: str) -> str:
+    """Key used to match a result record to a script regardless of punctuation."""
+    return re.sub(r"[^a-z0-9]", "", title.lower())
+
+
+def parse_timestamp(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def record_duration(record: Dict) -> Optional[float]:
+    """Seconds between ``created`` and ``modified``, or None if either is missing."""
+    try:
+        return (parse_timestamp(record["modified"]) - parse_timestamp(record["created"])).total_seconds()
+    except (KeyError, ValueError):
+        return None
+
+
+def load_results(path: Path = RESULTS_PATH) -> List[Dict]:
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _replace(path: Path, text: str) -> None:
+    """Write via a temp file and rename, so readers never see a half-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def write_results(records: List[Dict], path: Path = RESULTS_PATH) -> None:
+    _replace(path, json.dumps(records, indent=2, ensure_ascii=False))
+
+
+def to_record(outcome: TestOutcome) -> Dict:
+    script: TestScript = outcome.script
+    record = {
+        "title": script.title,
+        "description": "",
+        "code": script.path.read_text(encoding="utf-8"),
+        "testStatus": "PASSED" if outcome.passed else "FAILED",
+        "testError": outcome.error,
+        "testType": "FRONTEND",
+        "createFrom": "harness",
+        "created": utc_iso(outcome.started),
+        "modified": utc_iso(outcome.finished),
+    }
+    record.update(outcome.extra)
+    return record
+
+
+def merge_records(*record_lists: Iterable[Dict]) -> List[Dict]:
+    """Combine result lists; for a title seen twice the most recent record wins."""
+    merged: Dict[str, Dict] = {}
+    for records in record_lists:
+        for record in records:
+            key = normalize_title(record.get("title", ""))
+            current = merged.get(key)
+            if current is None or record.get("modified", "") >= current.get("modified", ""):
+                merged[key] = record
+    return sorted(merged.values(), key=lambda r: r.get("title", ""))
+
+
+def _script_link(title: str) -> str:
+    tc_id, _, name = title.partition("-")
+    stem = f"{tc_id}_{re.sub(r'[^A-Za-z0-9.]', '_', name)}"
+    return f"[{stem}.py](./{stem}.py)"
+
+
+def _metrics_line(metrics: Dict) -> str:
+    summary = metrics.get("summary", {})
+    parts = []
+    for label, key, fmt in (("LCP", "lcpMax", "{:.0f}ms"), ("CLS", "clsMax", "{:.3f}"), ("INP", "inpMax", "{:.0f}ms")):
+        if summary.get(key) is not None:
+            parts.append(f"{label} {fmt.format(summary[key])}")
+    parts.append(f"TBT {summary.get('tbtTotal', 0):.0f}ms")
+    parts.append(f"{summary.get('longTasks', 0)} long tasks")
+    if summary.get("jsHeapPeak"):
+        parts.append(f"heap {summary['jsHeapPeak'] / 1048576:.1f}MB")
+    return " · ".join(parts)
+
+
+def render_report(records: List[Dict], project_name: Optional[str] = None) -> str:
+    """Render records in the raw_report.md layout TestSprite uses."""
+    if project_name is None:
+        project_name = "Q_Bank"
+        if CONFIG_PATH.exists():
+            config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+            project_name = config.get("executionArgs", {}).get("projectName", project_name)
+
+    lines = [
+        "",
+        "# TestSprite AI Testing Report(MCP)",
+        "",
+        "---",
+        "",
+        "## 1️⃣ Document Metadata",
+        f"- **Project Name:** {project_name}",
+        f"- **Date:** {date.today().isoformat()}",
+        "- **Prepared by:** TestSprite AI Team",
+        "",
+        "---",
+        "",
+        "## 2️⃣ Requirement Validation Summary",
+        "",
+    ]
+    for record in records:
+        status = record.get("testStatus", "FAILED")
+        lines.append(f"#### Test {record['title'].replace('-', ' ', 1)}")
+        lines.append(f"- **Test Code:** {_script_link(record['title'])}")
+        if record.get("testError"):
+            lines.append(f"- **Test Error:** {record['testError']}")
+        if record.get("testVisualization"):
+            lines.append(f"- **Test Visualization and Result:** {record['testVisualization']}")
+        lines.append(f"- **Status:** {_STATUS_ICON.get(status, status)}")
+        if record.get("metrics", {}).get("navigations"):
+            lines.append(f"- **Performance:** {_metrics_line(record['metrics'])}")
+        lines.append("- **Analysis / Findings:** {{TODO:AI_ANALYSIS}}.")
+        lines.append("---")
+        lines.append("")
+
+    groups: "OrderedDict[str, List[Dict]]" = OrderedDict()
+    for record in records:
+        groups.setdefault(record["title"].split("-", 1)[0], []).append(record)
+    passed = sum(r.get("testStatus") == "PASSED" for r in records)
+    rate = 100.0 * passed / len(records) if records else 0.0
+
+    lines += [
+        "",
+        "## 3️⃣ Coverage & Matching Metrics",
+        "",
+        f"- **{rate:.2f}** of tests passed",
+        "",
+        "| Requirement        | Total Tests | ✅ Passed | ❌ Failed  |",
+        "|--------------------|-------------|-----------|------------|",
+    ]
+    for requirement, group in groups.items():
+        ok = sum(r.get("testStatus") == "PASSED" for r in group)
+        lines.append(f"| {requirement:<18} | {len(group):<11} | {ok:<9} | {len(group) - ok:<10} |")
+    lines += [
+        "---",
+        "",
+        "",
+        "## 4️⃣ Key Gaps / Risks",
+        "{AI_GNERATED_KET_GAPS_AND_RISKS}",
+        "---",
+    ]
+    return "\n".join(lines)
+
+
+def write_report(records: List[Dict], path: Path = REPORT_PATH) -> None:
+    _replace(path, render_report(records))
@@ -0,0 +1,158 @@
+"""Runs TC scripts concurrently on a shared ``BrowserPool``."""
+import asyncio
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from playwright import async_api
+
+from . import cassettes, timeline, waits
+from .mock_ai import MockAIRouter
+from .network import NetworkEmulator, NetworkProfile
+from .vitals import VitalsCollector
+from .loader import TestScript, load_module
+from .profile import PROFILE_DIR, TraceProfiler
+from .pool import BrowserPool, PooledAsyncApi
+
+PASSED = "PASSED"
+FAILED = "FAILED"
+ERROR = "ERROR"
+
+
+@dataclass
+class TestOutcome:
+    script: TestScript
+    status: str
+    error: str = ""
+    started: float = 0.0
+    finished: float = 0.0
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.finished - self.started
+
+    @property
+    def passed(self) -> bool:
+        return self.status == PASSED
+
+
+def utc_iso(ts: float) -> str:
+    """Format a UNIX timestamp the way test_results.json does (``...T12:32:30.283Z``)."""
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+@dataclass
+class RunConfig:
+    workers: int = 4
+    browsers: int = 2
+    timeout: float = 300.0
+    headless: bool = True
+    context_options: Dict[str, Any] = field(default_factory=dict)
+    cassette_mode: str = cassettes.OFF
+    cassette_dir: Path = cassettes.CASSETTE_DIR
+    replay_latency: Union[None, str, float] = None
+    mock_ai_url: Optional[str] = None
+    collect_vitals: bool = True
+    profile: bool = False
+    profile_dir: Path = PROFILE_DIR
+    network: Optional[NetworkProfile] = None
+    network_seed: int = 0
+
+
+class SuiteRunner:
+    """Schedules scripts onto a browser pool, ``workers`` at a time.
+
+    ``on_result`` is called with each ``TestOutcome`` as soon as the test
+    finishes, in completion order.
+    """
+
+    def __init__(self, config: Optional[RunConfig] = None, on_result: Optional[Callable[[TestOutcome], None]] = None):
+        self.config = config or RunConfig()
+        self.on_result = on_result
+
+    async def run(self, scripts: Iterable[TestScript]) -> List[TestOutcome]:
+        scripts = list(scripts)
+        workers = self.config.workers
+        if self.config.profile:
+            # One browser-wide trace at a time per browser, and no other test's
+            # work mixed into it: give every running test a browser of its own.
+            workers = min(workers, self.config.browsers)
+        semaphore = asyncio.Semaphore(workers)
+        async with BrowserPool(size=self.config.browsers, headless=self.config.headless) as pool:
+
+            async def guarded(script: TestScript) -> TestOutcome:
+                async with semaphore:
+                    outcome = await self.run_one(pool, script)
+                if self.on_result:
+                    self.on_result(outcome)
+                return outcome
+
+            return list(await asyncio.gather(*(guarded(s) for s in scripts)))
+
+    async def run_one(self, pool: BrowserPool, script: TestScript) -> TestOutcome:
+        started = time.time()
+        try:
+            module = load_module(script)
+        except SyntaxError as exc:
+            return TestOutcome(script, ERROR, f"SyntaxError: {exc}", started, time.time())
+        except Exception:
+            # Module-level code failed (an import, a name): this test errors, the suite goes on.
+            return TestOutcome(script, ERROR, traceback.format_exc(limit=5), started, time.time())
+
+        hooks = [waits.install]
+        recorder = None
+        if self.config.cassette_mode != cassettes.OFF:
+            store = cassettes.CassetteStore(self.config.cassette_dir)
+            recorder = cassettes.CassetteRecorder(store, self.config.cassette_mode, self.config.replay_latency)
+            hooks.append(recorder.attach)
+        if self.config.mock_ai_url:
+            hooks.append(MockAIRouter(self.config.mock_ai_url).attach)
+        vitals = VitalsCollector() if self.config.collect_vitals else None
+        if vitals:
+            hooks.append(vitals.attach)
+        profiler = TraceProfiler(self.config.profile_dir / f"{script.key}.trace.json.gz") if self.config.profile else None
+        if profiler:
+            hooks.append(profiler.attach)
+        emulator = NetworkEmulator(self.config.network, self.config.network_seed) if self.config.network else None
+        if emulator:
+            # Last, so its route runs before the cassette and mock AI routes.
+            hooks.append(emulator.attach)
+        profile_path = None
+        shim = PooledAsyncApi(pool, self.config.context_options, hooks)
+        module.async_api = shim
+        ledger = waits.start_ledger()
+        steps = timeline.start(script.path)
+        try:
+            await asyncio.wait_for(module.run_test(), timeout=self.config.timeout)
+            status, error = PASSED, ""
+        except AssertionError as exc:
+            status, error = FAILED, str(exc) or traceback.format_exc(limit=3)
+        except asyncio.TimeoutError:
+            status, error = ERROR, f"Timed out after {self.config.timeout:.0f}s"
+        except Exception:
+            status, error = ERROR, traceback.format_exc(limit=5)
+        finally:
+            if profiler:
+                try:
+                    profile_path = await profiler.finish()
+                except async_api.Error:
+                    pass
+            await shim.session.stop()
+        extra = {"waits": ledger.as_dict(), "steps": [asdict(s) for s in steps.finish()]}
+        if recorder:
+            extra["cassettes"] = dict(recorder.stats)
+        if vitals:
+            extra["metrics"] = vitals.metrics()
+        if profile_path:
+            extra["profile"] = str(profile_path)
+        if emulator:
+            extra["network"] = emulator.stats()
+        return TestOutcome(script, status, error, started, time.time(), extra)
+
+
+def run_suite(scripts: Iterable[TestScript], config: Optional[RunConfig] = None, on_result=None) -> List[TestOutcome]:
+    return asyncio.run(SuiteRunner(config, on_result).run(scripts))
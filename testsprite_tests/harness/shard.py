@@ -0,0 +1,120 @@
+"""Duration-aware sharding of the TC scripts.
+
+Historical runtimes come from ``created``/``modified`` in test_results.json.
+Scripts are packed longest-first onto the least loaded shard, then a few
+rounds of moves and swaps between the heaviest and lightest shards bring the
+longest shard close to the mean.
+"""
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .loader import TestScript
+from .report import RESULTS_PATH, load_results, normalize_title, record_duration
+
+# Used when no script has any history yet.
+DEFAULT_DURATION = 60.0
+
+
+@dataclass
+class Shard:
+    index: int
+    scripts: List[TestScript] = field(default_factory=list)
+    total: float = 0.0
+
+
+@dataclass
+class ShardPlan:
+    shards: List[Shard]
+    durations: Dict[str, float]
+
+    @property
+    def mean(self) -> float:
+        return sum(s.total for s in self.shards) / len(self.shards)
+
+    @property
+    def imbalance(self) -> float:
+        """How far the longest shard is above the mean, as a fraction."""
+        mean = self.mean
+        return (max(s.total for s in self.shards) - mean) / mean if mean else 0.0
+
+
+def historical_durations(paths: Iterable[Path] = (RESULTS_PATH,)) -> Dict[str, float]:
+    """Median runtime per normalized test title across the given result files."""
+    samples: Dict[str, List[float]] = {}
+    for path in paths:
+        for record in load_results(path):
+            seconds = record_duration(record)
+            if seconds is not None and seconds >= 0:
+                samples.setdefault(normalize_title(record.get("title", "")), []).append(seconds)
+    return {key: statistics.median(values) for key, values in samples.items()}
+
+
+def estimate(scripts: List[TestScript], history: Dict[str, float]) -> Dict[str, float]:
+    """Expected runtime per script key; unseen scripts get the median of the known ones."""
+    known = [history[normalize_title(s.title)] for s in scripts if normalize_title(s.title) in history]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    return {s.key: history.get(normalize_title(s.title), fallback) for s in scripts}
+
+
+def _best_exchange(heavy: Shard, light: Shard, durations: Dict[str, float]):
+    """The move or swap between two shards that most lowers the heavier one."""
+    best_peak, best = heavy.total, None
+    for a in heavy.scripts:
+        da = durations[a.key]
+        options = [(da, None)] + [(da - durations[b.key], b) for b in light.scripts]
+        for delta, b in options:
+            if delta <= 0:
+                continue
+            peak = max(heavy.total - delta, light.total + delta)
+            if peak < best_peak - 1e-9:
+                best_peak, best = peak, (a, b)
+    return best
+
+
+def _rebalance(shards: List[Shard], durations: Dict[str, float], rounds: int = 200) -> None:
+    for _ in range(rounds):
+        heavy = max(shards, key=lambda s: s.total)
+        light = min(shards, key=lambda s: s.total)
+        exchange = _best_exchange(heavy, light, durations)
+        if exchange is None:
+            return
+        a, b = exchange
+        heavy.scripts.remove(a)
+        light.scripts.append(a)
+        heavy.total -= durations[a.key]
+        light.total += durations[a.key]
+        if b is not None:
+            light.scripts.remove(b)
+            heavy.scripts.append(b)
+            light.total -= durations[b.key]
+            heavy.total += durations[b.key]
+
+
+def plan_shards(
+    scripts: List[TestScript],
+    count: int,
+    history: Optional[Dict[str, float]] = None,
+) -> ShardPlan:
+    if count < 1:
+        raise ValueError("shard count must be at least 1")
+    durations = estimate(scripts, historical_durations() if history is None else history)
+    shards = [Shard(i) for i in range(count)]
+    for script in sorted(scripts, key=lambda s: (-durations[s.key], s.key)):
+        target = min(shards, key=lambda s: (s.total, s.index))
+        target.scripts.append(script)
+        target.total += durations[script.key]
+    _rebalance(shards, durations)
+    for shard in shards:
+        shard.scripts.sort(key=lambda s: s.key)
+    return ShardPlan(shards, durations)
+
+
+def parse_shard_spec(spec: str) -> tuple:
+    """Parse ``"2/4"`` (1-based) into ``(1, 4)``."""
+    index, _, count = spec.partition("/")
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise ValueError(f"shard {spec!r} out of range")
+    return index - 1, count
@@ -0,0 +1,120 @@
+"""Source map (v3) lookups for minified frames in CPU profiles.
+
+Build with ``VITE_BUILD_SOURCEMAP=true vite build`` to get ``dist/assets/*.map``
+files next to the bundles; ``SourceMapResolver`` finds the map for a script
+URL by file name.
+"""
+import bisect
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .loader import TESTS_DIR
+
+DEFAULT_MAP_DIRS = (TESTS_DIR.parent / "apps" / "admin" / "dist" / "assets",)
+
+_BASE64 = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")}
+
+
+def decode_vlq(segment: str) -> List[int]:
+    values = []
+    value = shift = 0
+    for char in segment:
+        digit = _BASE64[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+    return values
+
+
+class SourceMap:
+    """Decoded mappings: per generated line, sorted segments
+    ``(column, source index, original line, original column, name index)``."""
+
+    def __init__(self, data: Dict):
+        self.sources: List[str] = data.get("sources", [])
+        self.names: List[str] = data.get("names", [])
+        root = data.get("sourceRoot") or ""
+        if root:
+            self.sources = [os.path.join(root, s) for s in self.sources]
+        self.lines: List[List[Tuple[int, int, int, int, int]]] = []
+        self._columns: List[List[int]] = []
+        source = line = column = name = 0
+        for generated in data.get("mappings", "").split(";"):
+            segments = []
+            generated_column = 0
+            for raw in filter(None, generated.split(",")):
+                fields = decode_vlq(raw)
+                generated_column += fields[0]
+                if len(fields) >= 4:
+                    source += fields[1]
+                    line += fields[2]
+                    column += fields[3]
+                    if len(fields) >= 5:
+                        name += fields[4]
+                    segments.append((generated_column, source, line, column, name if len(fields) >= 5 else -1))
+            self.lines.append(segments)
+            self._columns.append([s[0] for s in segments])
+
+    @classmethod
+    def load(cls, path: Path) -> "SourceMap":
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def source_bytes(self, line_lengths: Optional[List[int]] = None) -> Dict[str, int]:
+        """Generated bytes attributed to each original source.
+
+        A segment runs to the next one on its line; without ``line_lengths``
+        the last segment of each line is not counted.
+        """
+        totals: Dict[str, int] = {}
+        for index, segments in enumerate(self.lines):
+            for i, (column, source, _, _, _) in enumerate(segments):
+                if i + 1 < len(segments):
+                    end = segments[i + 1][0]
+                elif line_lengths is not None and index < len(line_lengths):
+                    end = line_lengths[index]
+                else:
+                    continue
+                name = self.sources[source]
+                totals[name] = totals.get(name, 0) + max(0, end - column)
+        return totals
+
+    def lookup(self, line: int, column: int) -> Optional[Tuple[str, int, int, Optional[str]]]:
+        """Original ``(source, line, column, name)`` for a 0-based generated position."""
+        if not 0 <= line < len(self.lines) or not self.lines[line]:
+            return None
+        index = bisect.bisect_right(self._columns[line], column) - 1
+        if index < 0:
+            return None
+        _, source, orig_line, orig_column, name = self.lines[line][index]
+        return self.sources[source], orig_line, orig_column, (self.names[name] if name >= 0 else None)
+
+
+class SourceMapResolver:
+    """Maps ``(url, line, column)`` from a profile to original source positions."""
+
+    def __init__(self, directories: Iterable[Path] = DEFAULT_MAP_DIRS):
+        self.directories = [Path(d) for d in directories]
+        self._maps: Dict[str, Optional[SourceMap]] = {}
+
+    def map_for(self, url: str) -> Optional[SourceMap]:
+        name = os.path.basename(urlsplit(url).path)
+        if name not in self._maps:
+            self._maps[name] = None
+            for directory in self.directories:
+                candidate = directory / f"{name}.map"
+                if candidate.is_file():
+                    self._maps[name] = SourceMap.load(candidate)
+                    break
+        return self._maps[name]
+
+    def resolve(self, url: str, line: int, column: int) -> Optional[Tuple[str, int, int, Optional[str]]]:
+        if not url or line < 0:
+            return None
+        source_map = self.map_for(url)
+        return source_map.lookup(line, column) if source_map else None
@@ -0,0 +1,413 @@
+"""Cold and warm startup benchmark for the app entry routes.
+
+Each run opens a fresh browser context (empty HTTP and code cache), loads
+the route once cold, goes to ``about:blank`` and loads it again warm from
+the same context. Per load it records first paint, first contentful paint,
+time to interactive, and every script the page fetched: module count, the
+decoded bytes V8 had to parse, and the bytes that actually came over the
+wire.
+
+Time to interactive follows the Lighthouse definition: the end of the last
+long task before the first window of ``quiet_ms`` after FCP with no long
+tasks and at most two requests in flight (FCP itself if there were none).
+
+Scripts are grouped into chunks so heavy dependencies stand out. Against
+the Vite dev server a chunk is a pre-bundled dependency
+(``node_modules/.vite/deps/xlsx.js``) or a source directory; against a
+production build it is the emitted asset, and when the build was made with
+``VITE_BUILD_SOURCEMAP=true`` the bytes of each asset are further split by
+npm package through its source map.
+"""
+import json
+import posixpath
+import re
+import statistics
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from playwright import async_api
+
+from .report import TMP_DIR
+from .sourcemap import SourceMap, SourceMapResolver
+
+REPORT_PATH = TMP_DIR / "startup_report.json"
+DEFAULT_APP_URLS = {"admin": "http://localhost:3000", "canvas": "http://localhost:3003"}
+# route name -> (app, path and query)
+ROUTES = {
+    "creator": ("admin", "/?view=creator"),
+    "student": ("admin", "/?view=student"),
+    "smartboard": ("admin", "/?view=teacher"),
+    "canvas": ("canvas", "/infinite-canvas"),
+}
+COLD = "cold"
+WARM = "warm"
+DEFAULT_RUNS = 3
+QUIET_MS = 5000.0
+MAX_INFLIGHT = 2
+LOAD_TIMEOUT_MS = 60000.0
+# Dependencies that should never be on the startup path; flagged in the report.
+HEAVY_DEPENDENCIES = ("xlsx", "jspdf", "html2canvas", "pptxgenjs")
+TOP_CHUNKS = 12
+
+_INIT_SCRIPT = """
+(() => {
+  if (window.__qbankStartup) return;
+  // Vite's dev server serves every module separately; keep all their entries.
+  performance.setResourceTimingBufferSize(10000);
+  const state = window.__qbankStartup = { longTasks: [] };
+  try {
+    new PerformanceObserver((list) => list.getEntries().forEach(
+      (e) => state.longTasks.push([e.startTime, e.duration]))).observe({ type: 'longtask', buffered: true });
+  } catch (e) {}
+})();
+"""
+
+_COLLECT_JS = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const paints = Object.fromEntries(performance.getEntriesByType('paint').map((p) => [p.name, p.startTime]));
+  return {
+    now: performance.now(),
+    firstPaint: paints['first-paint'] ?? null,
+    fcp: paints['first-contentful-paint'] ?? null,
+    domContentLoaded: nav ? nav.domContentLoadedEventEnd || null : null,
+    load: nav ? nav.loadEventEnd || null : null,
+    document: nav ? [nav.startTime, nav.responseEnd || performance.now()] : null,
+    longTasks: window.__qbankStartup ? window.__qbankStartup.longTasks : [],
+    resources: performance.getEntriesByType('resource').map((r) => ({
+      url: r.name, start: r.startTime, end: r.responseEnd,
+      transfer: r.transferSize, encoded: r.encodedBodySize, decoded: r.decodedBodySize,
+    })),
+  };
+}
+"""
+
+_DEV_DEP = re.compile(r"/node_modules/\.vite/deps/([^/?]+?)\.js$")
+_NODE_MODULE = re.compile(r"node_modules/((?:@[^/]+/)?[^/.][^/]*)/")
+# Rollup's default asset names: [name]-[hash].js
+_HASHED_ASSET = re.compile(r"^(.+)-[\w-]{8}\.js$")
+
+
+def chunk_name(url: str) -> str:
+    """The chunk a script URL belongs to, e.g. ``xlsx`` or ``app:components/Tools``."""
+    path = urlsplit(url).path
+    found = _DEV_DEP.search(path)
+    if found:
+        return found.group(1)
+    found = _NODE_MODULE.search(path)
+    if found:
+        return found.group(1)
+    if path.startswith("/@"):
+        return "vite:" + path.split("/")[1][1:]
+    name = posixpath.basename(path)
+    if posixpath.basename(posixpath.dirname(path)) == "assets":
+        found = _HASHED_ASSET.match(name)
+        return found.group(1) if found else name
+    return "app:" + (posixpath.dirname(path).strip("/") or ".")
+
+
+def package_name(source: str) -> str:
+    """npm package of a source-map source path, or ``app`` for the app's own code."""
+    found = _NODE_MODULE.search(source.replace("\\", "/"))
+    return found.group(1) if found else "app"
+
+
+@lru_cache(maxsize=None)
+def package_shares(source_map: SourceMap) -> Dict[str, float]:
+    """Share of a bundle's generated code that comes from each npm package."""
+    totals: Dict[str, int] = {}
+    for source, size in source_map.source_bytes().items():
+        package = package_name(source)
+        totals[package] = totals.get(package, 0) + size
+    mapped = sum(totals.values()) or 1
+    return {package: size / mapped for package, size in totals.items()}
+
+
+def max_inflight(requests: Sequence[Tuple[float, float]], start: float, end: float) -> int:
+    """Most requests in flight at any one moment of ``[start, end]``."""
+    edges = []
+    for begin, finish in requests:
+        if begin < end and finish > start:
+            edges.append((max(begin, start), 1))
+            edges.append((min(finish, end), -1))
+    peak = current = 0
+    for _, delta in sorted(edges, key=lambda e: (e[0], e[1])):
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def time_to_interactive(
+    fcp: Optional[float],
+    long_tasks: Sequence[Tuple[float, float]],
+    requests: Sequence[Tuple[float, float]],
+    now: float,
+    quiet_ms: float = QUIET_MS,
+) -> Optional[float]:
+    """TTI in ms, or None while no quiet window has been observed yet."""
+    if fcp is None:
+        return None
+    tasks = sorted((start, start + duration) for start, duration in long_tasks)
+    # The quiet window can open at FCP or whenever a long task or request ends.
+    candidates = sorted({fcp, *(end for _, end in tasks if end > fcp), *(end for _, end in requests if end > fcp)})
+    for start in candidates:
+        end = start + quiet_ms
+        if end > now:
+            return None
+        if any(s < end and e > start for s, e in tasks):
+            continue
+        if max_inflight(requests, start, end) > MAX_INFLIGHT:
+            continue
+        return max([fcp] + [e for _, e in tasks if e <= start])
+    return None
+
+
+@dataclass
+class ChunkStats:
+    chunk: str
+    modules: int = 0
+    bytes: int = 0
+    transfer_bytes: int = 0
+    loaded_ms: float = 0.0
+    packages: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class LoadStats:
+    route: str
+    mode: str
+    url: str
+    first_paint_ms: Optional[float]
+    fcp_ms: Optional[float]
+    tti_ms: Optional[float]
+    dom_content_loaded_ms: Optional[float]
+    load_ms: Optional[float]
+    modules: int
+    js_bytes: int
+    js_transfer_bytes: int
+    long_tasks: int
+    chunks: List[ChunkStats] = field(default_factory=list)
+
+    @property
+    def packages(self) -> Dict[str, int]:
+        totals: Dict[str, int] = {}
+        for chunk in self.chunks:
+            for name, size in (chunk.packages or {chunk.chunk: chunk.bytes}).items():
+                totals[name] = totals.get(name, 0) + size
+        return totals
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 1)
+
+
+def summarize_load(
+    route: str,
+    mode: str,
+    url: str,
+    sample: Dict[str, Any],
+    scripts: Iterable[str],
+    tti: Optional[float],
+    resolver: Optional[SourceMapResolver] = None,
+) -> LoadStats:
+    """Build ``LoadStats`` from a ``_COLLECT_JS`` sample and the script URLs the page requested."""
+    scripts = set(scripts)
+    chunks: Dict[str, ChunkStats] = {}
+    for entry in sample["resources"]:
+        if entry["url"] not in scripts:
+            continue
+        name = chunk_name(entry["url"])
+        chunk = chunks.setdefault(name, ChunkStats(name))
+        chunk.modules += 1
+        chunk.bytes += entry["decoded"]
+        chunk.transfer_bytes += entry["transfer"]
+        chunk.loaded_ms = round(max(chunk.loaded_ms, entry["end"]), 1)
+        source_map = resolver.map_for(entry["url"]) if resolver else None
+        if source_map:
+            for package, share in package_shares(source_map).items():
+                chunk.packages[package] = chunk.packages.get(package, 0) + int(entry["decoded"] * share)
+    ordered = sorted(chunks.values(), key=lambda c: c.bytes, reverse=True)
+    return LoadStats(
+        route=route,
+        mode=mode,
+        url=url,
+        first_paint_ms=_round(sample["firstPaint"]),
+        fcp_ms=_round(sample["fcp"]),
+        tti_ms=_round(tti),
+        dom_content_loaded_ms=_round(sample["domContentLoaded"]),
+        load_ms=_round(sample["load"]),
+        modules=sum(c.modules for c in ordered),
+        js_bytes=sum(c.bytes for c in ordered),
+        js_transfer_bytes=sum(c.transfer_bytes for c in ordered),
+        long_tasks=len(sample["longTasks"]),
+        chunks=ordered,
+    )
+
+
+async def measure(
+    page: async_api.Page,
+    route: str,
+    mode: str,
+    url: str,
+    quiet_ms: float = QUIET_MS,
+    timeout_ms: float = LOAD_TIMEOUT_MS,
+    resolver: Optional[SourceMapResolver] = None,
+) -> LoadStats:
+    """Load ``url`` on ``page`` and wait for TTI (or ``timeout_ms``)."""
+    scripts: List[str] = []
+    on_request = lambda request: request.resource_type == "script" and scripts.append(request.url)
+    page.on("request", on_request)
+    try:
+        await page.goto(url, wait_until="load", timeout=timeout_ms)
+        while True:
+            sample = await page.evaluate(_COLLECT_JS)
+            requests = [(r["start"], r["end"]) for r in sample["resources"]]
+            if sample["document"]:
+                requests.append(tuple(sample["document"]))
+            tti = time_to_interactive(sample["fcp"], sample["longTasks"], requests, sample["now"], quiet_ms)
+            if tti is not None or sample["now"] >= timeout_ms:
+                break
+            await page.wait_for_timeout(250)
+    finally:
+        page.remove_listener("request", on_request)
+    return summarize_load(route, mode, url, sample, scripts, tti, resolver)
+
+
+def route_url(route: str, app_urls: Dict[str, str], set_id: Optional[str] = None) -> str:
+    app, path = ROUTES[route]
+    if route == "smartboard" and set_id:
+        path += f"&setId={set_id}"
+    return app_urls[app].rstrip("/") + path
+
+
+class StartupBench:
+    def __init__(
+        self,
+        browser: async_api.Browser,
+        app_urls: Optional[Dict[str, str]] = None,
+        set_id: Optional[str] = None,
+        quiet_ms: float = QUIET_MS,
+        resolver: Optional[SourceMapResolver] = None,
+    ):
+        self.browser = browser
+        self.app_urls = {**DEFAULT_APP_URLS, **(app_urls or {})}
+        self.set_id = set_id
+        self.quiet_ms = quiet_ms
+        self.resolver = resolver
+
+    async def run_route(self, route: str) -> List[LoadStats]:
+        """One cold and one warm load of ``route`` in a fresh context."""
+        url = route_url(route, self.app_urls, self.set_id)
+        context = await self.browser.new_context(viewport={"width": 1280, "height": 720})
+        try:
+            await context.add_init_script(_INIT_SCRIPT)
+            page = await context.new_page()
+            cold = await measure(page, route, COLD, url, self.quiet_ms, resolver=self.resolver)
+            await page.goto("about:blank")
+            warm = await measure(page, route, WARM, url, self.quiet_ms, resolver=self.resolver)
+            return [cold, warm]
+        finally:
+            await context.close()
+
+    async def run(
+        self, routes: Sequence[str], runs: int = DEFAULT_RUNS, on_load: Optional[Callable[[LoadStats], None]] = None
+    ) -> "StartupReport":
+        loads = []
+        for _ in range(runs):
+            for route in routes:
+                for stats in await self.run_route(route):
+                    loads.append(stats)
+                    if on_load:
+                        on_load(stats)
+        return StartupReport(loads)
+
+
+def _median(values: Iterable[Optional[float]]) -> Optional[float]:
+    present = [v for v in values if v is not None]
+    return round(statistics.median(present), 1) if present else None
+
+
+def _kb(size: float) -> str:
+    return f"{size / 1024:.0f}"
+
+
+@dataclass
+class StartupReport:
+    loads: List[LoadStats]
+
+    def groups(self) -> Dict[Tuple[str, str], List[LoadStats]]:
+        grouped: Dict[Tuple[str, str], List[LoadStats]] = {}
+        for stats in self.loads:
+            grouped.setdefault((stats.route, stats.mode), []).append(stats)
+        return grouped
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Median of each metric per route and cache mode."""
+        rows = []
+        for (route, mode), loads in self.groups().items():
+            rows.append({
+                "route": route,
+                "mode": mode,
+                "runs": len(loads),
+                **{key: _median(getattr(s, key) for s in loads) for key in (
+                    "first_paint_ms", "fcp_ms", "tti_ms", "dom_content_loaded_ms", "load_ms",
+                    "modules", "js_bytes", "js_transfer_bytes", "long_tasks",
+                )},
+            })
+        return rows
+
+    def heavy(self) -> Dict[str, Dict[str, int]]:
+        """Bytes of each ``HEAVY_DEPENDENCIES`` entry loaded at startup, per route (cold loads)."""
+        found: Dict[str, Dict[str, int]] = {}
+        for (route, mode), loads in self.groups().items():
+            if mode != COLD:
+                continue
+            for name, size in loads[-1].packages.items():
+                if name in HEAVY_DEPENDENCIES and size:
+                    found.setdefault(name, {})[route] = size
+        return found
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "summary": self.summary(),
+            "heavyDependencies": self.heavy(),
+            "loads": [asdict(s) for s in self.loads],
+        }
+
+    def write(self, path: Path = REPORT_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=2), encoding="utf-8")
+
+    def render(self, top: int = TOP_CHUNKS) -> str:
+        cell = lambda value, width: f"{value:>{width}.0f}" if value is not None else f"{'-':>{width}}"
+        lines = [f"{'route':<12}{'mode':<6}{'FP ms':>8}{'FCP ms':>8}{'TTI ms':>8}{'modules':>9}"
+                 f"{'JS KB':>9}{'wire KB':>9}{'long':>6}"]
+        for row in self.summary():
+            lines.append(
+                f"{row['route']:<12}{row['mode']:<6}{cell(row['first_paint_ms'], 8)}{cell(row['fcp_ms'], 8)}"
+                f"{cell(row['tti_ms'], 8)}{cell(row['modules'], 9)}{cell((row['js_bytes'] or 0) / 1024, 9)}"
+                f"{cell((row['js_transfer_bytes'] or 0) / 1024, 9)}{cell(row['long_tasks'], 6)}"
+            )
+        for (route, mode), loads in self.groups().items():
+            if mode != COLD:
+                continue
+            stats = loads[-1]
+            lines += ["", f"{route} (cold): largest chunks", f"  {'chunk':<40}{'modules':>8}{'KB':>9}{'loaded ms':>11}"]
+            for chunk in stats.chunks[:top]:
+                mark = " *" if chunk.chunk in HEAVY_DEPENDENCIES else ""
+                lines.append(f"  {chunk.chunk[:39]:<40}{chunk.modules:>8}{_kb(chunk.bytes):>9}"
+                             f"{chunk.loaded_ms:>11.0f}{mark}")
+                for name, size in sorted(chunk.packages.items(), key=lambda p: p[1], reverse=True)[:5]:
+                    lines.append(f"    {name[:37]:<38}{'':>8}{_kb(size):>9}")
+        heavy = self.heavy()
+        lines.append("")
+        if heavy:
+            for name, routes in heavy.items():
+                lines.append(f"heavy on startup path: {name} ("
+                             + ", ".join(f"{route} {_kb(size)} KB" for route, size in routes.items()) + ")")
+        else:
+            lines.append("none of " + ", ".join(HEAVY_DEPENDENCIES) + " loads at startup")
+        return "\n".join(lines)
@@ -0,0 +1,429 @@
+"""Shared step library for scripts compiled from the frontend test plan.
+
+testsprite_frontend_test_plan.json describes each TC as ``action`` and
+``assertion`` steps in plain English. Every method below registers the
+phrasing it implements with ``@step``; ``harness.compiler`` matches each plan
+step against those patterns and emits one ``await s.<method>(...)`` call per
+step, passing the named groups of the match as keyword arguments.
+
+``StepSession`` replaces the launch/context/teardown boilerplate of the
+generated scripts and is the one place that decides how to wait: every
+action settles through ``harness.waits`` and locates elements by role, title
+or label instead of absolute XPaths. It takes the script's ``async_api``
+global, so compiled scripts run on the pooled browsers like any other.
+"""
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from playwright import async_api
+
+from . import waits
+from .pool import DEFAULT_LAUNCH_ARGS
+
+ACTION = "action"
+ASSERTION = "assertion"
+
+DEFAULT_APP_URL = "http://localhost:3000"
+# RichEditor saves an undo entry 500ms after the last input; there is no DOM
+# signal for it, so edits that should be separate undo steps wait this long.
+HISTORY_DEBOUNCE_MS = 600
+FONT_SIZE_NAMES = {"small": "12px", "medium": "16px", "large": "24px"}
+TEXT_COLOR = "#e74c3c"
+BACKGROUND_COLOR = "#f39c12"
+
+# The language picker in RefinementStudio reads "<abbr><label>", e.g. "BilBilingual".
+LANGUAGE_BUTTON = re.compile(r"^\s*(Eng|Hin|Bil)\s*(English|Hindi|Bilingual)\s*$")
+
+
+@dataclass(frozen=True)
+class StepDef:
+    kind: str
+    pattern: Pattern
+    method: str
+
+
+REGISTRY: List[StepDef] = []
+
+
+def step(kind: str, pattern: str):
+    """Register the decorated ``StepSession`` method for plan steps matching ``pattern``."""
+    def register(fn):
+        REGISTRY.append(StepDef(kind, re.compile(pattern, re.I), fn.__name__))
+        return fn
+    return register
+
+
+def match(kind: str, description: str) -> Optional[Tuple[str, Dict[str, str]]]:
+    """``(method, kwargs)`` of the first registered step matching ``description``."""
+    for definition in REGISTRY:
+        if definition.kind != kind:
+            continue
+        found = definition.pattern.search(description)
+        if found:
+            return definition.method, {k: v.strip() for k, v in found.groupdict().items() if v}
+    return None
+
+
+def _csv(value: str) -> List[str]:
+    return [part.strip() for part in re.split(r",|\band\b", value) if part.strip()]
+
+
+async def switch_editor_language(page: async_api.Page, language: str) -> None:
+    """Pick ``language`` in RefinementStudio's editor-language dropdown."""
+    await page.locator("button", has_text=LANGUAGE_BUTTON).first.click()
+    option = page.locator("div.absolute button", has_text=re.compile(rf"{language}\s*$", re.I)).first
+    await waits.settle(page, option)
+    await option.click()
+    await waits.settle(page)
+
+
+class StepSession:
+    """One browser page plus what earlier steps did, for later assertions to check."""
+
+    def __init__(self, api=async_api, app_url: Optional[str] = None, headless: bool = True):
+        self.api = api
+        self.app_url = app_url or os.environ.get("QBANK_APP_URL", DEFAULT_APP_URL)
+        self.headless = headless
+        self.page: Optional[async_api.Page] = None
+        self._pw = self._browser = self._context = None
+        self.markers: Dict[str, str] = {}
+        self.states: List[str] = []
+        self.history_states: Dict[str, List[str]] = {"undo": [], "redo": []}
+        self.applied: Dict[str, str] = {}
+        self.symbols: List[str] = []
+        self.missing_symbols: List[str] = []
+        self.source_edit: Optional[str] = None
+        self.focus_path: List[str] = []
+
+    async def __aenter__(self) -> "StepSession":
+        self._pw = await self.api.async_playwright().start()
+        self._browser = await self._pw.chromium.launch(headless=self.headless, args=DEFAULT_LAUNCH_ARGS)
+        self._context = await self._browser.new_context(viewport={"width": 1280, "height": 720})
+        await waits.install(self._context)
+        self._context.set_default_timeout(10000)
+        self.page = await self._context.new_page()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._context:
+            await self._context.close()
+        if self._browser:
+            await self._browser.close()
+        if self._pw:
+            await self._pw.stop()
+
+    # -- helpers -----------------------------------------------------------
+
+    async def _goto(self, query: str) -> None:
+        await self.page.goto(f"{self.app_url}/?{query}", wait_until="commit")
+        await waits.settle(self.page)
+
+    async def _ensure_editor(self) -> None:
+        if not await self.page.locator("[contenteditable]").count():
+            await self.open_editor()
+
+    def _editor(self, language: Optional[str] = None) -> async_api.Locator:
+        """The contenteditable of the editor labelled ``(<language>)``, or the first one."""
+        editors = self.page.locator("[contenteditable]")
+        if not language:
+            return editors.first
+        wrapper = self.page.locator("div.flex.flex-col.border").filter(
+            has=self.page.get_by_text(re.compile(rf"\({language}\)", re.I))
+        )
+        return wrapper.locator("[contenteditable]").first
+
+    def _toolbar(self, title: str) -> async_api.Locator:
+        return self.page.locator(f'button[title="{title}"]').first
+
+    async def _text(self, language: Optional[str] = None) -> str:
+        return await self._editor(language).inner_text()
+
+    async def _select_marker(self) -> None:
+        marker = self.markers.get("selection") or next(iter(self.markers.values()), None)
+        if marker is None:
+            raise AssertionError("Test case failed: there is no entered text to select.")
+        await self._editor().evaluate(
+            """(el, marker) => {
+                const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+                for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                    const at = node.textContent.indexOf(marker);
+                    if (at < 0) continue;
+                    const range = document.createRange();
+                    range.setStart(node, at);
+                    range.setEnd(node, at + marker.length);
+                    const sel = getSelection();
+                    sel.removeAllRanges();
+                    sel.addRange(range);
+                    return;
+                }
+                throw new Error(`marker ${marker} not found in the editor`);
+            }""",
+            marker,
+        )
+
+    async def _marker_style(self, prop: str) -> str:
+        marker = self.markers.get("selection") or next(iter(self.markers.values()), None)
+        if marker is None:
+            raise AssertionError("Test case failed: no text was entered in the editor to check the style of.")
+        return await self._editor().evaluate(
+            """(el, [marker, prop]) => {
+                const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+                for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                    if (node.textContent.includes(marker)) return getComputedStyle(node.parentElement)[prop];
+                }
+                return '';
+            }""",
+            [marker, prop],
+        )
+
+    # -- actions -----------------------------------------------------------
+
+    @step(ACTION, r"open the (?:bilingual )?refinement studio(?: in (?P<language>english|hindi) mode)?")
+    async def open_refinement_studio(self, language: Optional[str] = None) -> None:
+        await self._goto("view=refinement-studio")
+        await waits.settle(self.page, self.page.locator("[contenteditable]").first)
+        if language:
+            await switch_editor_language(self.page, language)
+
+    @step(ACTION, r"open the advanced rich text editor")
+    async def open_editor(self) -> None:
+        # The Refinement Studio is where the app mounts RichEditor for a question.
+        await self.open_refinement_studio()
+
+    @step(ACTION, r"switch (?:the editor language to|back to) (?P<language>english|hindi|bilingual)")
+    async def switch_language(self, language: str) -> None:
+        await switch_editor_language(self.page, language)
+
+    @step(ACTION, r"enter some formatted content")
+    async def enter_formatted(self) -> None:
+        await self.enter_text()
+        await self._select_marker()
+        await self._toolbar("Bold (Ctrl+B)").click()
+        await self.set_color("text")
+        await self.focus_editor()
+        await self.insert_math_symbols("π")
+
+    @step(ACTION, r"(?:enter|input) .*?(?:content|text|paragraph)(?: in (?P<language>english|hindi))?")
+    async def enter_text(self, language: Optional[str] = None) -> None:
+        await self._ensure_editor()
+        key = (language or "text").lower()
+        marker = f"qbank{key}{len(self.markers) + 1}"
+        editor = self._editor(language)
+        await waits.settle(self.page, editor)
+        await editor.click()
+        await self.page.keyboard.press("Control+End")
+        await self.page.keyboard.type(f" {marker}")
+        self.markers[key] = marker
+        self.markers["selection"] = marker
+        await self.page.wait_for_timeout(HISTORY_DEBOUNCE_MS)
+        self.states.append(await editor.inner_html())
+
+    @step(ACTION, r"place cursor inside the editor")
+    async def focus_editor(self) -> None:
+        await self._ensure_editor()
+        await self._editor().click()
+        await self.page.keyboard.press("Control+End")
+
+    @step(ACTION, r"make several edits")
+    async def several_edits(self) -> None:
+        keyboard = self.page.keyboard
+        edits = [
+            lambda: keyboard.type(" added"),
+            lambda: keyboard.press("Backspace"),
+            lambda: self._toolbar("Bold (Ctrl+B)").click(),
+        ]
+        await self.focus_editor()
+        for edit in edits:
+            if edit is edits[-1]:
+                await self._select_marker()
+            await edit()
+            await self.page.wait_for_timeout(HISTORY_DEBOUNCE_MS)
+            self.states.append(await self._editor().inner_html())
+
+    @step(ACTION, r"trigger (?P<action>undo|redo)(?: multiple times)?")
+    async def press_history(self, action: str, times: int = 3) -> None:
+        button = self._toolbar("Undo (Ctrl+Z)" if action.lower() == "undo" else "Redo (Ctrl+Y)")
+        for _ in range(times):
+            await button.click()
+            await waits.react_quiet(self.page, waits.DEFAULT_IDLE_MS, waits.DEFAULT_MAX_WAIT_MS)
+            self.history_states[action.lower()].append(await self._editor().inner_html())
+
+    @step(ACTION, r"insert .*math(?:ematical)? symbols?(?: \(e\.g\., (?P<symbols>[^)]*)\))?")
+    async def insert_math_symbols(self, symbols: str = "∑, √, π") -> None:
+        for symbol in _csv(symbols):
+            await self._toolbar("Insert Math Symbol").click()
+            option = self.page.locator("div.absolute button").filter(has_text=re.compile(rf"^{re.escape(symbol)}$"))
+            if not await option.count():
+                self.missing_symbols.append(symbol)
+                await self._toolbar("Insert Math Symbol").click()
+                continue
+            await option.first.click()
+            self.symbols.append(symbol)
+
+    @step(ACTION, r"select (?:a portion|a section) of the text")
+    async def select_text(self) -> None:
+        await self._select_marker()
+
+    @step(ACTION, r"change font size(?: using .*? to various sizes \((?P<sizes>[^)]*)\))?")
+    async def set_font_size(self, sizes: str = "large") -> None:
+        picker = self._toolbar("Font Size")
+        for name in _csv(sizes):
+            size = FONT_SIZE_NAMES.get(name.lower(), name)
+            await self._select_marker()
+            await picker.click()
+            await self.page.locator("div.absolute button", has_text=re.compile(rf"^{size}$")).first.click()
+            self.applied["font size"] = size
+
+    @step(ACTION, r"change the (?:background color|(?P<target>text) color)")
+    async def set_color(self, target: str = "background") -> None:
+        await self._select_marker()
+        await self._toolbar("Text Color").click()
+        color = TEXT_COLOR if target == "text" else BACKGROUND_COLOR
+        if target != "text":
+            await self.page.get_by_text("Switch to Highlight").click()
+        await self.page.locator(f'div.absolute button[style*="{_rgb(color)}"]').first.click()
+        self.applied[f"{target} color"] = _rgb(color)
+
+    @step(ACTION, r"save changes and reload")
+    async def save_and_reload(self) -> None:
+        await self.page.get_by_role("button", name=re.compile("Save Changes")).click()
+        await waits.settle(self.page)
+        await self.page.reload(wait_until="commit")
+        await waits.settle(self.page, self.page.locator("[contenteditable]").first)
+
+    @step(ACTION, r"toggle (?:to|back to) (?P<mode>code|visual)")
+    async def code_view(self, mode: str) -> None:
+        await self._toolbar("Code View" if mode.lower() == "code" else "Visual Editor").click()
+        await waits.settle(self.page)
+
+    @step(ACTION, r"edit the html source")
+    async def edit_source(self) -> None:
+        source = self.page.locator("textarea").first
+        html = await source.input_value()
+        marker = self.markers.get("selection", "")
+        self.source_edit = f"<h3>{marker}edited</h3>"
+        await source.fill(html + self.source_edit)
+
+    @step(ACTION, r"navigate toolbar using keyboard")
+    async def keyboard_toolbar(self) -> None:
+        await self._ensure_editor()
+        await self._toolbar("Undo (Ctrl+Z)").focus()
+        for key in ["Tab"] * 4 + ["ArrowRight"] * 2:
+            await self.page.keyboard.press(key)
+            self.focus_path.append(await self.page.evaluate(
+                "() => document.activeElement?.getAttribute('title') || document.activeElement?.tagName || ''"
+            ))
+
+    # -- assertions --------------------------------------------------------
+
+    @step(ASSERTION, r"(?P<language>english|hindi) content is cleared")
+    async def expect_language_cleared(self, language: str) -> None:
+        marker = self.markers.get(language.lower())
+        visible = await self.page.get_by_text(re.compile(rf"\({language}\)", re.I)).count()
+        shown = marker and await self.page.locator("[contenteditable]", has_text=marker).count()
+        if visible or shown:
+            raise AssertionError(f"Test case failed: {language} editor content is still shown after the language switch.")
+
+    @step(ASSERTION, r"columns labell?ed (?P<labels>.+?) are visible")
+    async def expect_labels(self, labels: str) -> None:
+        missing = [label for label in _csv(labels) if not await self.page.get_by_text(label, exact=True).count()]
+        if missing:
+            raise AssertionError(f"Test case failed: columns not found: {', '.join(missing)}.")
+
+    @step(ASSERTION, r"scrolled independently")
+    async def expect_independent_scroll(self) -> None:
+        independent = await self.page.evaluate("""() => {
+            const panes = [...document.querySelectorAll('*')].filter(el => {
+                const style = getComputedStyle(el);
+                return /(auto|scroll)/.test(style.overflowY) && el.scrollHeight > el.clientHeight;
+            });
+            if (panes.length < 2) return false;
+            const before = panes.map(p => p.scrollTop);
+            panes[0].scrollTop += 200;
+            return panes.slice(1).every((p, i) => p.scrollTop === before[i + 1]);
+        }""")
+        if not independent:
+            raise AssertionError("Test case failed: the columns do not scroll independently.")
+
+    @step(ASSERTION, r"reverts step by step")
+    async def expect_undo_steps(self) -> None:
+        undone = self.history_states["undo"]
+        expected = self.states[-2::-1][:len(undone)]
+        if not undone or undone != expected:
+            raise AssertionError("Test case failed: Undo did not step back through the previous edits in order.")
+
+    @step(ASSERTION, r"undone changes are restored")
+    async def expect_redo_steps(self) -> None:
+        redone = self.history_states["redo"]
+        undone = self.history_states["undo"]
+        expected = (undone[-2::-1] + self.states[-1:])[:len(redone)]
+        if not redone or redone != expected:
+            raise AssertionError("Test case failed: Redo did not restore the undone edits in order.")
+
+    @step(ASSERTION, r"symbol is inserted at the correct cursor position")
+    async def expect_symbols_inserted(self) -> None:
+        text = await self._text()
+        expected = "".join(self.symbols)
+        if self.missing_symbols or not text.rstrip().endswith(expected):
+            missing = f" (not offered: {', '.join(self.missing_symbols)})" if self.missing_symbols else ""
+            raise AssertionError(f"Test case failed: math symbols were not inserted at the cursor{missing}.")
+
+    @step(ASSERTION, r"persist after reload")
+    async def expect_persisted(self) -> None:
+        failures = []
+        for target, wanted in self.applied.items():
+            prop = {"font size": "fontSize", "text color": "color", "background color": "backgroundColor"}[target]
+            if (await self._marker_style(prop)).replace(" ", "") != wanted.replace(" ", ""):
+                failures.append(target)
+        if failures:
+            raise AssertionError(f"Test case failed: {', '.join(failures)} did not survive save and reload.")
+
+    @step(ASSERTION, r"(?P<target>font size|text color|background color) (?:of the selected text )?(?:changes|updates)")
+    async def expect_style(self, target: str) -> None:
+        prop = {"font size": "fontSize", "text color": "color", "background color": "backgroundColor"}[target.lower()]
+        actual = await self._marker_style(prop)
+        wanted = self.applied.get(target.lower())
+        if actual.replace(" ", "") != (wanted or "").replace(" ", ""):
+            raise AssertionError(f"Test case failed: {target} of the selected text is {actual!r}, expected {wanted!r}.")
+
+    @step(ASSERTION, r"html source is correctly formatted")
+    async def expect_source_matches(self) -> None:
+        source = await self.page.locator("textarea").first.input_value()
+        marker = self.markers.get("selection", "")
+        if marker not in source or not re.search(r"<(b|strong)\b", source):
+            raise AssertionError("Test case failed: the HTML source does not reflect the formatted content.")
+
+    @step(ASSERTION, r"visual editor reflects the updated source")
+    async def expect_visual_matches_source(self) -> None:
+        html = await self._editor().inner_html()
+        if not self.source_edit or self.source_edit not in html:
+            raise AssertionError("Test case failed: the visual editor does not show the edited HTML source.")
+
+    @step(ASSERTION, r"toolbar buttons .*tooltips")
+    async def expect_toolbar_tooltips(self) -> None:
+        untitled = await self.page.evaluate("""() => {
+            const editor = document.querySelector('[contenteditable]');
+            const box = editor && editor.closest('div.flex.flex-col.border');
+            if (!box) return -1;
+            return [...box.querySelectorAll('button')]
+                .filter(b => b.offsetParent !== null && !b.getAttribute('title') && !b.getAttribute('aria-label')).length;
+        }""")
+        if untitled:
+            raise AssertionError(f"Test case failed: {untitled} toolbar controls have no tooltip or label.")
+
+    @step(ASSERTION, r"operable via keyboard")
+    async def expect_keyboard_operable(self) -> None:
+        titled = {name for name in self.focus_path if name and name not in ("BODY", "DIV")}
+        if len(titled) < 3:
+            raise AssertionError(f"Test case failed: keyboard focus did not move across the toolbar ({self.focus_path}).")
+
+    async def unsupported(self, kind: str, description: str) -> None:
+        raise AssertionError(f"Test case failed: no harness.steps entry for {kind} step: {description}")
+
+
+def _rgb(hex_color: str) -> str:
+    """``#e74c3c`` -> ``rgb(231, 76, 60)``, the form computed styles and inline styles use."""
+    value = hex_color.lstrip("#")
+    return "rgb({}, {}, {})".format(*(int(value[i:i + 2], 16) for i in (0, 2, 4)))
@@ -0,0 +1,82 @@
+"""Synthetic bilingual question content shared by the mock servers and seeders.
+
+Records follow the row shape ``geminiService.generateQuestions`` asks the
+model for (``question_eng``/``question_hin``, ``option1_eng`` ...,
+``answer``, ``solution_*``, ``exam``, ``year``, ``section``, ``chapter``).
+Text is drawn from small English and Devanagari word lists so lengths and
+scripts look like real exam content without being meaningful.
+"""
+import random
+from typing import Dict, List
+
+SUBJECTS = [
+    "Current Affairs", "History", "Geography", "Polity", "Economy",
+    "Science", "Mathematics", "Reasoning", "English", "Hindi",
+]
+CHAPTERS = {
+    "Current Affairs": ["National", "International", "Sports", "Awards", "Schemes"],
+    "History": ["Ancient India", "Medieval India", "Modern India", "World History"],
+    "Geography": ["Physical", "Indian Geography", "World Geography", "Climate"],
+    "Polity": ["Constitution", "Parliament", "Judiciary", "Local Government"],
+    "Economy": ["Banking", "Budget", "Inflation", "Five Year Plans"],
+    "Science": ["Physics", "Chemistry", "Biology", "Space"],
+    "Mathematics": ["Percentage", "Profit and Loss", "Time and Work", "Algebra"],
+    "Reasoning": ["Series", "Coding-Decoding", "Blood Relations", "Syllogism"],
+    "English": ["Grammar", "Vocabulary", "Comprehension"],
+    "Hindi": ["व्याकरण", "समास", "संधि", "मुहावरे"],
+}
+EXAMS = ["UPSC", "SSC CGL", "SSC CHSL", "RRB NTPC", "IBPS PO", "SBI Clerk", "UPPSC", "BPSC", "CTET"]
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+YEARS = [str(y) for y in range(2010, 2027)]
+
+ENGLISH_WORDS = (
+    "which of the following is correct about the first national committee constitution "
+    "river state capital governor minister scheme launched year india world largest "
+    "article amendment parliament court bank policy rate growth process energy mission "
+    "satellite award organisation city temple dynasty ruler battle treaty movement"
+).split()
+HINDI_WORDS = (
+    "निम्नलिखित में से कौन सा सही है भारत का पहला राष्ट्रीय समिति संविधान नदी राज्य "
+    "राजधानी राज्यपाल मंत्री योजना शुरू वर्ष विश्व सबसे बड़ा अनुच्छेद संशोधन संसद न्यायालय "
+    "बैंक नीति दर विकास प्रक्रिया ऊर्जा मिशन उपग्रह पुरस्कार संगठन शहर मंदिर राजवंश शासक "
+    "युद्ध संधि आंदोलन"
+).split()
+
+# Word-count ranges that give question/option/solution lengths in line with
+# the sample CSV: questions ~15-40 words, options 1-6, solutions 25-80.
+QUESTION_WORDS = (15, 40)
+OPTION_WORDS = (1, 6)
+SOLUTION_WORDS = (25, 80)
+
+
+def sentence(rng: random.Random, words: List[str], bounds: tuple, end: str = "") -> str:
+    count = rng.randint(*bounds)
+    text = " ".join(rng.choice(words) for _ in range(count))
+    return text[:1].upper() + text[1:] + end
+
+
+def question_record(rng: random.Random, subject: str = "", index: int = 0) -> Dict:
+    """One bilingual MCQ in the Gemini response schema."""
+    subject = subject or rng.choice(SUBJECTS)
+    chapter = rng.choice(CHAPTERS.get(subject, ["General"]))
+    record = {
+        "question_eng": sentence(rng, ENGLISH_WORDS, QUESTION_WORDS, "?"),
+        "question_hin": sentence(rng, HINDI_WORDS, QUESTION_WORDS, "?"),
+        "answer": str(rng.randint(1, 4)),
+        "solution_eng": sentence(rng, ENGLISH_WORDS, SOLUTION_WORDS, "."),
+        "solution_hin": sentence(rng, HINDI_WORDS, SOLUTION_WORDS, "।"),
+        "exam": rng.choice(EXAMS),
+        "year": rng.choice(YEARS),
+        "section": subject,
+        "chapter": chapter,
+        "sources": [{"title": "Synthetic", "uri": f"https://example.invalid/q/{index}", "credibility": "High"}],
+    }
+    for n in range(1, 5):
+        record[f"option{n}_eng"] = sentence(rng, ENGLISH_WORDS, OPTION_WORDS)
+        record[f"option{n}_hin"] = sentence(rng, HINDI_WORDS, OPTION_WORDS)
+    return record
+
+
+def question_batch(seed: int, count: int, subject: str = "") -> List[Dict]:
+    rng = random.Random(seed)
+    return [question_record(rng, subject, i) for i in range(count)]
@@ -0,0 +1,75 @@
+import pytest
+
+from harness.baseline import compare, connect, history, record_metrics, record_run, robust_z, trend
+
+TITLE = "TC001-Open Editor"
+
+
+def record(seconds: float, status: str = "PASSED", **summary) -> dict:
+    return {
+        "title": TITLE,
+        "testStatus": status,
+        "created": "2024-05-01T10:00:00.000Z",
+        "modified": f"2024-05-01T10:00:{seconds:06.3f}Z",
+        "metrics": {"summary": summary},
+    }
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = connect(tmp_path / "baselines.sqlite")
+    yield conn
+    conn.close()
+
+
+def test_robust_z_uses_median_and_mad():
+    z, median, mad = robust_z(20.0, [9.0, 10.0, 10.0, 11.0, 100.0])
+    assert (median, mad) == (10.0, 1.0)
+    assert z == pytest.approx(10.0 / 1.4826)
+
+
+def test_robust_z_spread_has_floors():
+    # No spread at all: 5% of the median.
+    assert robust_z(11.0, [10.0] * 5)[0] == pytest.approx(2.0)
+    # Median 0: the metric's own floor.
+    assert robust_z(50.0, [0.0] * 5, min_spread=25.0)[0] == pytest.approx(2.0)
+
+
+def test_record_metrics():
+    metrics = record_metrics(record(12.5, lcpMax=800, tbtTotal=0, jsHeapPeak=3 * 1048576))
+    assert metrics == {"duration_s": 12.5, "lcp_ms": 800.0, "tbt_ms": 0.0, "heap_mb": 3.0}
+    assert record_metrics({"title": TITLE}) == {}
+
+
+def test_history_skips_failed_runs_and_is_newest_first(conn):
+    for seconds, status in [(10, "PASSED"), (11, "FAILED"), (12, "PASSED")]:
+        last = record_run(conn, [record(seconds, status)])
+    assert history(conn, TITLE, "duration_s", last + 1, 10) == [12.0, 10.0]
+    assert history(conn, TITLE, "duration_s", last, 10) == [10.0]
+    assert [row[3] for row in trend(conn, TITLE, "duration_s", 10)] == ["PASSED", "FAILED", "PASSED"]
+
+
+def test_compare_flags_regressions_only(conn):
+    for seconds in [10.0, 10.2, 9.8, 10.1, 9.9]:
+        record_run(conn, [record(seconds)])
+    assert compare(conn, record_run(conn, [record(10.3)])) == []
+    regressions = compare(conn, record_run(conn, [record(20.0)]))
+    assert [(r.test, r.metric, r.value, r.runs) for r in regressions] == [(TITLE, "duration_s", 20.0, 6)]
+    # Faster is never a regression.
+    assert compare(conn, record_run(conn, [record(1.0)])) == []
+
+
+def test_compare_needs_min_runs_and_a_passing_test(conn):
+    for seconds in [10.0, 10.0, 10.0]:
+        record_run(conn, [record(seconds)])
+    assert compare(conn, record_run(conn, [record(50.0)]), min_runs=5) == []
+    for seconds in [10.0, 10.0]:
+        record_run(conn, [record(seconds)])
+    assert compare(conn, record_run(conn, [record(50.0, "FAILED")]), min_runs=5) == []
+
+
+def test_compare_defaults_to_latest_run(conn):
+    assert compare(conn) == []
+    for seconds in [10.0] * 5 + [30.0]:
+        record_run(conn, [record(seconds)], label="nightly")
+    assert [r.value for r in compare(conn)] == [30.0]
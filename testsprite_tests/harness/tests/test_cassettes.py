@@ -0,0 +1,150 @@
+import asyncio
+import json
+
+import pytest
+
+from harness.cassettes import (
+    RECORD,
+    REPLAY,
+    CassetteEntry,
+    CassetteRecorder,
+    CassetteStore,
+    RecordedResponse,
+    parse_latency,
+    request_key,
+)
+
+GEMINI = "https://generativelanguage.googleapis.com/v1beta/models/gemini:generateContent"
+
+
+def body(**fields) -> bytes:
+    return json.dumps(fields).encode("utf-8")
+
+
+def test_key_ignores_credentials_and_query_order():
+    assert request_key("post", f"{GEMINI}?key=secret&alt=json&b=1", None) == request_key(
+        "POST", f"{GEMINI}?b=1&alt=json&key=other", None
+    )
+
+
+def test_key_distinguishes_method_url_and_body():
+    base = request_key("POST", GEMINI, body(prompt="a"))
+    assert base != request_key("GET", GEMINI, body(prompt="a"))
+    assert base != request_key("POST", GEMINI + "?alt=sse", body(prompt="a"))
+    assert base != request_key("POST", GEMINI, body(prompt="b"))
+
+
+def test_key_ignores_json_key_order_and_whitespace():
+    assert request_key("POST", GEMINI, b'{"a": 1, "b": [1, 2]}') == request_key("POST", GEMINI, b'{"b":[1,2],"a":1}')
+
+
+def test_key_scrubs_dates_and_question_ids():
+    assert request_key("POST", GEMINI, body(prompt="Today is 2024-05-01, id q_1714521600000_ab12c")) == request_key(
+        "POST", GEMINI, body(prompt="Today is 2025-12-31, id q_1767139200000_zz9x0")
+    )
+    assert request_key("POST", GEMINI, body(at="2024-05-01T10:00:00.123Z")) == request_key(
+        "POST", GEMINI, body(at="2026-01-01T00:00:00Z")
+    )
+
+
+def test_replicate_is_keyed_on_path_only():
+    assert request_key("POST", "http://localhost:3000/replicate-api/v1/predictions", None) == request_key(
+        "POST", "http://127.0.0.1:5173/replicate-api/v1/predictions", None
+    )
+
+
+def test_store_round_trip(tmp_path):
+    store = CassetteStore(tmp_path)
+    sha = store.write_body(b"{}")
+    assert store.write_body(b"{}") == sha
+    entry = CassetteEntry("POST", GEMINI, [RecordedResponse(200, {"content-type": "application/json"}, sha, 12.5)])
+    store.put("k", entry)
+    assert store.get("k") == entry
+    assert store.read_body(sha) == b"{}"
+    assert store.get("missing") is None
+
+
+def test_parse_latency():
+    assert parse_latency(None) is None
+    assert parse_latency("none") is None
+    assert parse_latency("recorded") == "recorded"
+    assert parse_latency("250") == 250.0
+    with pytest.raises(ValueError):
+        parse_latency("soon")
+
+
+class FakeRequest:
+    method = "POST"
+    url = GEMINI
+    post_data_buffer = body(prompt="same")
+
+
+class FakeResponse:
+    status = 200
+    headers = {"content-type": "application/json", "content-length": "9"}
+
+    def __init__(self, payload: bytes, delay: float):
+        self.payload = payload
+        self.delay = delay
+
+    async def body(self) -> bytes:
+        await asyncio.sleep(self.delay)
+        return self.payload
+
+
+class FakeRoute:
+    def __init__(self, payload: bytes = b"", delay: float = 0.0):
+        self.response = FakeResponse(payload, delay)
+        self.fulfilled = None
+
+    async def fetch(self) -> FakeResponse:
+        return self.response
+
+    async def fulfill(self, **kwargs) -> None:
+        self.fulfilled = kwargs
+
+
+def test_identical_requests_finishing_out_of_order_keep_call_order(tmp_path):
+    store = CassetteStore(tmp_path)
+
+    async def record():
+        recorder = CassetteRecorder(store, RECORD)
+        # The first call is answered last.
+        await asyncio.gather(
+            recorder._handle(FakeRoute(b'"first"', 0.05), FakeRequest()),
+            recorder._handle(FakeRoute(b'"second"', 0.0), FakeRequest()),
+        )
+        return recorder
+
+    recorder = asyncio.run(record())
+    assert recorder.stats["recorded"] == 2
+    entry = store.get(request_key(FakeRequest.method, FakeRequest.url, FakeRequest.post_data_buffer))
+    assert [store.read_body(r.body_sha) for r in entry.responses] == [b'"first"', b'"second"']
+    assert "content-length" not in entry.responses[0].headers
+
+    async def replay():
+        recorder = CassetteRecorder(store, REPLAY)
+        routes = [FakeRoute() for _ in range(3)]
+        for route in routes:
+            await recorder._handle(route, FakeRequest())
+        return [route.fulfilled["body"] for route in routes]
+
+    # Calls past the recording repeat its last response.
+    assert asyncio.run(replay()) == [b'"first"', b'"second"', b'"second"']
+
+
+def test_replay_miss_answers_599(tmp_path):
+    async def replay():
+        recorder = CassetteRecorder(CassetteStore(tmp_path), REPLAY)
+        route = FakeRoute()
+        await recorder._handle(route, FakeRequest())
+        return recorder, route
+
+    recorder, route = asyncio.run(replay())
+    assert route.fulfilled["status"] == 599
+    assert recorder.stats["misses"] == 1
+
+
+def test_unknown_mode_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        CassetteRecorder(CassetteStore(tmp_path), "sometimes")
@@ -0,0 +1,42 @@
+import argparse
+
+import pytest
+
+from harness.__main__ import _count, _levels, build_parser
+from harness.canvas import parse_levels
+
+
+def test_parse_levels_suffixes_and_decimals():
+    assert parse_levels("1k, 5000,1.5m,1.1k,2K") == [1000, 5000, 1500000, 1100, 2000]
+    assert parse_levels("100,,") == [100]
+
+
+@pytest.mark.parametrize("spec", ["1km", "1.5", "abc", "1.2345k", "-1", "1e3"])
+def test_parse_levels_rejects(spec):
+    with pytest.raises(ValueError):
+        parse_levels(spec)
+
+
+def test_levels_and_count_raise_argparse_errors():
+    assert _levels("10k,20k") == [10000, 20000]
+    assert _count("1.5m") == 1500000
+    with pytest.raises(argparse.ArgumentTypeError):
+        _levels("lots")
+    with pytest.raises(argparse.ArgumentTypeError):
+        _count("1k,2k")
+    with pytest.raises(argparse.ArgumentTypeError):
+        _count("")
+
+
+def test_parser_reads_counts():
+    args = build_parser().parse_args(["gen-bank", "1m", "bank.csv"])
+    assert args.rows == 1000000
+    args = build_parser().parse_args(["bulk-file", "100k", "rows.xlsx"])
+    assert args.rows == 100000
+
+
+def test_parser_reports_bad_counts(capsys):
+    with pytest.raises(SystemExit) as exc:
+        build_parser().parse_args(["gen-bank", "1.5", "bank.csv"])
+    assert exc.value.code == 2
+    assert "bad count '1.5'" in capsys.readouterr().err
@@ -0,0 +1,77 @@
+from harness.codemod import IMPORT_LINE, batch_text_assertions, rewrite_source
+
+GENERATED = '''import asyncio
+from playwright import async_api
+
+async def run_test():
+    try:
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await asyncio.sleep(3)
+        elem = frame.locator('xpath=html/body/div').nth(0)
+        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await page.wait_for_timeout(1000); await elem.fill('x', timeout=5000)
+        await expect(frame.locator('text=One').first).to_be_visible(timeout=30000)
+        await expect(frame.locator('text=Two').first).to_be_visible(timeout=30000)
+        await asyncio.sleep(5)
+
+    finally:
+        if context:
+            await context.close()
+'''
+
+
+def test_sleeps_become_settles():
+    source, stats = rewrite_source(GENERATED)
+    assert "await waits.settle(page)\n" in source
+    assert "await waits.settle(page, elem); await elem.click(" in source
+    assert "await waits.settle(page, elem, budget_ms=1000); await elem.fill(" in source
+    assert "wait_for_timeout" not in source
+    assert "asyncio.sleep" not in source
+    assert stats.settles == 3
+
+
+def test_trailing_sleep_is_deleted_and_reported():
+    source, stats = rewrite_source(GENERATED)
+    assert stats.trailing_ms == 5000
+    assert "\n\n    finally:" in source
+
+
+def test_install_and_import_are_added_once():
+    source, _ = rewrite_source(GENERATED)
+    assert source.count(IMPORT_LINE) == 1
+    assert source.count("await waits.install(context)\n") == 1
+    assert source.index(IMPORT_LINE) == source.index("from playwright import async_api\n") + len(
+        "from playwright import async_api\n"
+    )
+
+
+def test_rewrite_is_idempotent():
+    once, _ = rewrite_source(GENERATED)
+    twice, stats = rewrite_source(once)
+    assert twice == once
+    assert (stats.settles, stats.trailing_ms, stats.batched) == (0, 0, 0)
+
+
+def test_text_assertions_are_batched():
+    source, stats = rewrite_source(GENERATED)
+    assert stats.batched == 2
+    assert "await waits.expect_texts(frame, [\n            'One',\n            'Two',\n        ], timeout_ms=30000)\n" in source
+
+
+def test_batching_needs_same_frame_and_timeout():
+    source = (
+        "    await expect(frame.locator('text=One').first).to_be_visible(timeout=30000)\n"
+        "    await expect(other.locator('text=Two').first).to_be_visible(timeout=30000)\n"
+        "    await expect(other.locator('text=Three').first).to_be_visible(timeout=5000)\n"
+    )
+    assert batch_text_assertions(source) == (source, 0)
+
+
+def test_batching_skips_non_text_selectors():
+    source = (
+        "    await expect(frame.locator('xpath=//div').first).to_be_visible(timeout=30000)\n"
+        "    await expect(frame.locator('text=Two').first).to_be_visible(timeout=30000)\n"
+    )
+    assert batch_text_assertions(source) == (source, 0)
@@ -0,0 +1,88 @@
+import subprocess
+
+import pytest
+
+from harness.impact import KNOWN_SELECTIONS, ImportGraph, changed_files, select
+
+
+def write(root, rel, text=""):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "repo"
+    write(root, "components/Editor.tsx", "import React from 'react';\nexport const Editor = () => null;\n")
+    write(root, "components/index.ts", "export { Editor } from './Editor';\n")
+    write(root, "apps/admin/App.tsx", "import { Editor } from '../../components';\n")
+    write(root, "apps/admin/main.tsx", "import App from '@/App';\nimport './styles.css';\n")
+    write(root, "apps/admin/lazy.tsx", "const Page = React.lazy(() => import('./App'));\n")
+    write(root, "apps/admin/unrelated.ts", "export const x = 1;\n")
+    write(root, "node_modules/pkg/index.js", "import '../../components/Editor';\n")
+    return root
+
+
+def test_import_graph_resolves_relative_alias_index_and_dynamic_imports(tree, tmp_path):
+    graph = ImportGraph(tree, tmp_path / "cache.json").load()
+    assert graph.imports["components/index.ts"] == ["components/Editor.tsx"]
+    assert graph.imports["apps/admin/App.tsx"] == ["components/index.ts"]
+    assert graph.imports["apps/admin/main.tsx"] == ["apps/admin/App.tsx"]
+    assert graph.imports["apps/admin/lazy.tsx"] == ["apps/admin/App.tsx"]
+    assert "node_modules/pkg/index.js" not in graph.imports
+
+
+def test_importers_are_transitive(tree, tmp_path):
+    graph = ImportGraph(tree, tmp_path / "cache.json").load()
+    assert graph.importers_of(["components/Editor.tsx"]) == {
+        "components/Editor.tsx",
+        "components/index.ts",
+        "apps/admin/App.tsx",
+        "apps/admin/main.tsx",
+        "apps/admin/lazy.tsx",
+    }
+    assert graph.importers_of(["apps/admin/unrelated.ts"]) == {"apps/admin/unrelated.ts"}
+
+
+def test_cache_is_reused_and_refreshed(tree, tmp_path):
+    cache = tmp_path / "cache.json"
+    ImportGraph(tree, cache).load()
+    assert cache.exists()
+    write(tree, "apps/admin/unrelated.ts", "import { Editor } from '../../components/Editor';\n")
+    graph = ImportGraph(tree, cache).load()
+    assert graph.imports["apps/admin/unrelated.ts"] == ["components/Editor.tsx"]
+
+
+def test_changed_files_keeps_paths_with_spaces(tmp_path):
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run(git + ["init", "-q", str(tmp_path)], check=True)
+    write(tmp_path, "docs/old name.md", "a\n")
+    subprocess.run(git + ["add", "-A"], cwd=tmp_path, check=True)
+    subprocess.run(git + ["commit", "-qm", "base"], cwd=tmp_path, check=True)
+    write(tmp_path, "docs/old name.md", "b\n")
+    write(tmp_path, "src/new file.ts", "")
+    assert changed_files("HEAD", tmp_path) == ["docs/old name.md", "src/new file.ts"]
+
+
+@pytest.fixture(scope="module")
+def repo_graph(tmp_path_factory):
+    return ImportGraph(cache_path=tmp_path_factory.mktemp("impact") / "cache.json").load()
+
+
+@pytest.mark.parametrize("changed, expected", sorted(KNOWN_SELECTIONS.items()))
+def test_known_selections(repo_graph, changed, expected):
+    selected = select(list(changed), repo_graph)
+    assert set(expected) <= set(selected.tc_ids)
+    assert not selected.unmapped
+
+
+def test_unreached_sources_are_unmapped(repo_graph):
+    selected = select(["components/NotImportedAnywhere.tsx", "README.md"], repo_graph)
+    assert selected.unmapped == ["components/NotImportedAnywhere.tsx"]
+    assert selected.tc_ids == []
+
+
+def test_edited_scripts_select_themselves(repo_graph):
+    selected = select(["testsprite_tests/TC001_Switch_Language_in_Bilingual_Refinement_Studio.py"], repo_graph)
+    assert [s.tc_id for s in selected.scripts] == ["TC001"]
@@ -0,0 +1,53 @@
+import json
+
+from harness.journal import Journal
+
+
+def result(title: str, status: str, modified: str = "2024-05-01T10:00:00.000Z") -> dict:
+    return {"title": title, "testStatus": status, "created": "2024-05-01T09:59:00.000Z", "modified": modified}
+
+
+def test_append_and_read_back(tmp_path):
+    journal = Journal(tmp_path / "results" / "test_results.jsonl")
+    assert journal.entries() == []
+    journal.append(result("TC001-Open Editor", "PASSED"))
+    journal.append(result("TC002-Bold Text", "FAILED"))
+    assert [e["title"] for e in journal.entries()] == ["TC001-Open Editor", "TC002-Bold Text"]
+
+
+def test_torn_last_line_is_skipped_and_not_glued_to(tmp_path):
+    journal = Journal(tmp_path / "test_results.jsonl")
+    journal.append(result("TC001-Open Editor", "PASSED"))
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result("TC002-Bold Text", "PASSED"))[:25])
+    assert [e["title"] for e in journal.entries()] == ["TC001-Open Editor"]
+    journal.append(result("TC003-Undo", "PASSED"))
+    assert [e["title"] for e in journal.entries()] == ["TC001-Open Editor", "TC003-Undo"]
+
+
+def test_rerun_replaces_earlier_attempt(tmp_path):
+    journal = Journal(tmp_path / "test_results.jsonl")
+    journal.append(result("TC001-Open Editor", "FAILED", "2024-05-01T10:00:00.000Z"))
+    journal.append(result("TC002-Bold Text", "PASSED", "2024-05-01T10:00:01.000Z"))
+    journal.append(result("TC001-Open Editor", "PASSED", "2024-05-01T10:05:00.000Z"))
+    assert [(r["title"], r["testStatus"]) for r in journal.records()] == [
+        ("TC001-Open Editor", "PASSED"),
+        ("TC002-Bold Text", "PASSED"),
+    ]
+
+
+def test_passed_titles_are_normalized(tmp_path):
+    journal = Journal(tmp_path / "test_results.jsonl")
+    journal.append(result("TC001-Open Editor", "PASSED"))
+    journal.append(result("TC002-Bold Text", "FAILED"))
+    journal.append(result("TC003-Undo", "PASSED", "2024-05-01T10:00:00.000Z"))
+    journal.append(result("TC003-Undo", "FAILED", "2024-05-01T10:01:00.000Z"))
+    assert journal.passed_titles() == {"tc001openeditor"}
+
+
+def test_reset_empties_the_journal(tmp_path):
+    journal = Journal(tmp_path / "test_results.jsonl")
+    journal.append(result("TC001-Open Editor", "PASSED"))
+    journal.reset()
+    assert journal.entries() == []
+    assert journal.passed_titles() == set()
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from harness import loader
+from harness.report import normalize_title
+from harness.shard import DEFAULT_DURATION, estimate, parse_shard_spec, plan_shards
+
+
+def script(n: int) -> loader.TestScript:
+    return loader.TestScript(Path(f"TC{n:03d}_Case_{n}.py"), f"TC{n:03d}", f"Case_{n}")
+
+
+def history_of(durations):
+    return {normalize_title(script(n).title): seconds for n, seconds in durations.items()}
+
+
+def test_every_script_lands_in_exactly_one_shard():
+    scripts = [script(n) for n in range(1, 12)]
+    plan = plan_shards(scripts, 3, history_of({n: n * 10.0 for n in range(1, 12)}))
+    keys = [s.key for shard in plan.shards for s in shard.scripts]
+    assert sorted(keys) == sorted(s.key for s in scripts)
+    assert [shard.index for shard in plan.shards] == [0, 1, 2]
+
+
+def test_shards_are_balanced():
+    scripts = [script(n) for n in range(1, 7)]
+    plan = plan_shards(scripts, 2, history_of({1: 50, 2: 40, 3: 30, 4: 20, 5: 20, 6: 20}))
+    assert sorted(shard.total for shard in plan.shards) == [90, 90]
+    assert plan.imbalance == 0
+
+
+def test_plan_is_deterministic():
+    scripts = [script(n) for n in range(1, 9)]
+    history = history_of({n: 30.0 for n in range(1, 9)})
+    first = plan_shards(scripts, 3, history)
+    second = plan_shards(list(reversed(scripts)), 3, history)
+    assert [[s.key for s in sh.scripts] for sh in first.shards] == [[s.key for s in sh.scripts] for sh in second.shards]
+
+
+def test_unseen_scripts_get_the_median_of_known_ones():
+    scripts = [script(n) for n in range(1, 5)]
+    durations = estimate(scripts, history_of({1: 10, 2: 20, 3: 90}))
+    assert durations[script(4).key] == 20
+
+
+def test_no_history_falls_back_to_default_duration():
+    durations = estimate([script(1)], {})
+    assert durations == {script(1).key: DEFAULT_DURATION}
+
+
+def test_more_shards_than_scripts_leaves_some_empty():
+    plan = plan_shards([script(1)], 3, {})
+    assert [len(shard.scripts) for shard in plan.shards] == [1, 0, 0]
+
+
+def test_shard_count_must_be_positive():
+    with pytest.raises(ValueError):
+        plan_shards([script(1)], 0, {})
+
+
+def test_parse_shard_spec():
+    assert parse_shard_spec("1/1") == (0, 1)
+    assert parse_shard_spec("2/4") == (1, 4)
+
+
+@pytest.mark.parametrize("spec", ["0/4", "5/4", "-1/4", "2", "a/b", "2/"])
+def test_parse_shard_spec_rejects(spec):
+    with pytest.raises(ValueError):
+        parse_shard_spec(spec)
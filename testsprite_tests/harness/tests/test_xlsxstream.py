@@ -0,0 +1,94 @@
+import io
+import zipfile
+
+import pytest
+
+from harness import xlsxstream
+from harness.xlsxstream import column_index, decode_xml, elements, iter_rows, row_values
+
+MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DOC_RELS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def write_xlsx(path, rows_xml: str, shared: str = "") -> None:
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{MAIN}" xmlns:r="{DOC_RELS}"><sheets>'
+            f'<sheet name="Questions" sheetId="1" r:id="rId7"/></sheets></workbook>',
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            f'<Relationships xmlns="{RELS}">'
+            f'<Relationship Id="rId1" Target="worksheets/sheet2.xml"/>'
+            f'<Relationship Id="rId7" Target="/xl/worksheets/sheet1.xml"/></Relationships>',
+        )
+        archive.writestr("xl/worksheets/sheet1.xml", f'<worksheet xmlns="{MAIN}"><sheetData>{rows_xml}</sheetData></worksheet>')
+        archive.writestr("xl/worksheets/sheet2.xml", f'<worksheet xmlns="{MAIN}"><sheetData/></worksheet>')
+        if shared:
+            archive.writestr("xl/sharedStrings.xml", f'<sst xmlns="{MAIN}">{shared}</sst>')
+
+
+def test_column_index():
+    assert [column_index(c) for c in ("A", "Z", "AA", "AB", "ZZ", "AAA")] == [0, 25, 26, 27, 701, 702]
+
+
+def test_decode_xml():
+    assert decode_xml("a &amp; b &lt;c&gt; &#233;&#x4E2D; &quot;&apos;") == "a & b <c> é中 \"'"
+    assert decode_xml("tab_x0009_here") == "tab\there"
+
+
+def test_cells_land_in_their_columns():
+    row = '<row r="2"><c r="B2" t="s"><v>1</v></c><c r="D2"><v>3.5</v></c><c r="E2" t="b"><v>1</v></c></row>'
+    assert row_values(row, ["zero", "one"]) == [None, "one", None, 3.5, True]
+
+
+def test_cells_without_reference_follow_the_previous_one():
+    row = '<row r="2"><c r="A2" t="inlineStr"><is><t>a</t></is></c><c/><c t="inlineStr"><is><t>c</t></is></c></row>'
+    assert row_values(row, []) == ["a", None, "c"]
+    row = '<row><c r="C1"><v>7</v></c><c><v>8</v></c></row>'
+    assert row_values(row, []) == [None, None, 7, 8]
+
+
+def test_cell_types():
+    row = (
+        '<row><c r="A1"><v>42</v></c><c r="B1" t="str"><v>x &amp; y</v></c>'
+        '<c r="C1" t="b"><v>0</v></c><c r="D1" t="e"><v>#N/A</v></c><c r="E1" t="s"></c></row>'
+    )
+    assert row_values(row, []) == [42, "x & y", False, "#N/A"]
+
+
+@pytest.mark.parametrize("read_chars", [1, 3, 7, 1 << 20])
+def test_elements_survive_chunk_boundaries(monkeypatch, read_chars):
+    monkeypatch.setattr(xlsxstream, "READ_CHARS", read_chars)
+    text = '<sheetData><row r="1"><c><v>1</v></c></row><rows/><row r="2"/><row r="3"><c/></row></sheetData>'
+    assert list(elements(io.StringIO(text), "row")) == [
+        '<row r="1"><c><v>1</v></c></row>',
+        '<row r="2"/>',
+        '<row r="3"><c/></row>',
+    ]
+
+
+def test_iter_rows_reads_the_first_sheet(tmp_path):
+    path = tmp_path / "questions.xlsx"
+    write_xlsx(
+        path,
+        '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>'
+        '<row r="3"/>'
+        '<row r="5" spans="1:2"><c r="A5"><v>2</v></c><c r="B5" t="s"><v>2</v></c></row>'
+        '<row><c r="A6"><v>3</v></c></row>',
+        "<si><t>Question</t></si>"
+        '<si><r><t>Ans</t></r><r><t xml:space="preserve">wer</t></r></si>'
+        "<si><t>東京</t><rPh sb=\"0\" eb=\"2\"><t>トウキョウ</t></rPh></si>",
+    )
+    assert list(iter_rows(path)) == [(1, ["Question", "Answer"]), (5, [2, "東京"]), (6, [3])]
+
+
+def test_workbook_without_sheets_is_rejected(tmp_path):
+    path = tmp_path / "empty.xlsx"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("xl/workbook.xml", f'<workbook xmlns="{MAIN}"><sheets/></workbook>')
+        archive.writestr("xl/_rels/workbook.xml.rels", f'<Relationships xmlns="{RELS}"/>')
+    with pytest.raises(ValueError):
+        list(iter_rows(path))
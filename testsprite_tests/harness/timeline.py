@@ -0,0 +1,99 @@
+"""Per-step latency of a running TC script.
+
+Generated scripts put a ``# -> <step>`` comment above each action and call
+``waits.settle`` before it; compiled scripts put the same comment above each
+``await s.<step>(...)``, whose implementation settles too. ``waits.settle``
+calls ``mark()``, which walks up the stack to the script's own frame, finds
+the step comment above the calling line and starts timing that step. A step
+ends when the next one starts or the test finishes, so its latency covers
+the wait, the action and any checks that follow it.
+"""
+import bisect
+import contextvars
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# "# -> Click the Save button" (action) and "# --> Assertions ..." (checks).
+_STEP_COMMENT = re.compile(r"^\s*#\s*-+>\s*(.+?)\s*$")
+
+
+def step_comments(source: str) -> List[Tuple[int, str]]:
+    """``(line, text)`` of every step comment in a script, in line order."""
+    return [
+        (number, found.group(1))
+        for number, line in enumerate(source.splitlines(), start=1)
+        for found in [_STEP_COMMENT.match(line)]
+        if found
+    ]
+
+
+@dataclass
+class StepTiming:
+    step: str
+    line: int
+    ms: float
+
+
+class Timeline:
+    def __init__(self, path: Path):
+        self.filename = str(path)
+        comments = step_comments(Path(path).read_text(encoding="utf-8"))
+        self._lines = [line for line, _ in comments]
+        self._texts = [text for _, text in comments]
+        self.steps: List[StepTiming] = []
+        self._current: Optional[Tuple[int, str, float]] = None
+
+    def _step_at(self, line: int) -> Optional[Tuple[int, str]]:
+        index = bisect.bisect_right(self._lines, line) - 1
+        return (self._lines[index], self._texts[index]) if index >= 0 else None
+
+    def _caller_line(self) -> Optional[int]:
+        frame = sys._getframe(2)
+        while frame is not None:
+            if frame.f_code.co_filename == self.filename:
+                return frame.f_lineno
+            frame = frame.f_back
+        return None
+
+    def mark(self) -> None:
+        line = self._caller_line()
+        step = self._step_at(line) if line is not None else None
+        if step is None or (self._current and self._current[0] == step[0]):
+            return
+        now = time.monotonic()
+        self._close(now)
+        self._current = (step[0], step[1], now)
+
+    def _close(self, now: float) -> None:
+        if self._current:
+            line, text, started = self._current
+            self.steps.append(StepTiming(text, line, round((now - started) * 1000.0, 1)))
+            self._current = None
+
+    def finish(self) -> List[StepTiming]:
+        self._close(time.monotonic())
+        return self.steps
+
+    def as_list(self) -> List[Dict]:
+        return [{"step": s.step, "line": s.line, "ms": s.ms} for s in self.steps]
+
+
+_timeline: contextvars.ContextVar[Optional[Timeline]] = contextvars.ContextVar("qbank_timeline", default=None)
+
+
+def start(path: Path) -> Timeline:
+    """Begin timing the steps of the script at ``path`` in the current task."""
+    timeline = Timeline(path)
+    _timeline.set(timeline)
+    return timeline
+
+
+def mark() -> None:
+    """Note that the script is working on whichever step encloses its current line."""
+    timeline = _timeline.get()
+    if timeline is not None:
+        timeline.mark()
@@ -0,0 +1,149 @@
+"""Chrome DevTools Protocol tracing, plus small helpers for reading the
+resulting trace events.
+
+Chromium only allows one trace per browser at a time, so benchmarks that
+trace should not share a pooled browser with another tracing test.
+"""
+import asyncio
+import base64
+import json
+from contextlib import asynccontextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from playwright import async_api
+
+# What the DevTools Performance panel records, minus screenshots.
+DEFAULT_CATEGORIES = (
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "blink.user_timing",
+    "v8.execute",
+    "toplevel",
+)
+# Adds V8 sampling, needed for per-function self time.
+PROFILE_CATEGORIES = DEFAULT_CATEGORIES + ("disabled-by-default-v8.cpu_profiler",)
+
+# Main-thread events DevTools files under "Scripting" and "Rendering"/"Painting".
+SCRIPTING_EVENTS = {
+    "EvaluateScript", "FunctionCall", "EventDispatch", "TimerFire", "FireAnimationFrame",
+    "FireIdleCallback", "RunMicrotasks", "v8.compile", "v8.compileModule", "v8.evaluateModule",
+    "MajorGC", "MinorGC", "V8.GCScavenger", "V8.GCFinalizeMC",
+}
+RENDERING_EVENTS = {
+    "UpdateLayoutTree", "Layout", "RecalculateStyles", "UpdateLayerTree", "PrePaint",
+    "Paint", "PaintImage", "CompositeLayers", "Layerize",
+}
+
+
+class Trace:
+    """Raw trace events with lookups for thread names and user timing marks."""
+
+    def __init__(self, events: List[Dict]):
+        self.events = events
+
+    def thread_names(self) -> Dict[Tuple[int, int], str]:
+        return {
+            (e["pid"], e["tid"]): e.get("args", {}).get("name", "")
+            for e in self.events
+            if e.get("ph") == "M" and e.get("name") == "thread_name"
+        }
+
+    def renderer_main_threads(self) -> List[Tuple[int, int]]:
+        return [key for key, name in self.thread_names().items() if name == "CrRendererMain"]
+
+    def mark(self, name: str) -> Optional[float]:
+        """Timestamp (µs) of a ``performance.mark(name)``, if it was traced."""
+        for event in self.events:
+            if event.get("name") == name and "blink.user_timing" in event.get("cat", ""):
+                return float(event["ts"])
+        return None
+
+    def window(self, start: float, end: float) -> List[Dict]:
+        return [e for e in self.events if start <= e.get("ts", -1) <= end]
+
+
+def union_ms(intervals: Iterable[Tuple[float, float]]) -> float:
+    """Total length in ms of the union of ``(start_us, end_us)`` intervals.
+
+    Trace events nest (a FunctionCall inside an EventDispatch), so summing
+    durations would count the same time more than once.
+    """
+    total = 0.0
+    current_start = current_end = None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total / 1000.0
+
+
+def main_thread_ms(events: Iterable[Dict], threads: Sequence[Tuple[int, int]], names: set) -> float:
+    keys = set(threads)
+    return union_ms(
+        (e["ts"], e["ts"] + e.get("dur", 0))
+        for e in events
+        if e.get("ph") == "X" and e.get("name") in names and (e.get("pid"), e.get("tid")) in keys
+    )
+
+
+async def _read_stream(session: async_api.CDPSession, handle: str) -> str:
+    chunks = []
+    while True:
+        result = await session.send("IO.read", {"handle": handle})
+        data = result.get("data", "")
+        chunks.append(base64.b64decode(data).decode("utf-8") if result.get("base64Encoded") else data)
+        if result.get("eof"):
+            break
+    await session.send("IO.close", {"handle": handle})
+    return "".join(chunks)
+
+
+class TraceCapture:
+    """Filled in when the ``cdp_trace`` block exits."""
+
+    def __init__(self):
+        self.trace: Optional[Trace] = None
+
+    @property
+    def events(self) -> List[Dict]:
+        return self.trace.events if self.trace else []
+
+
+async def start_tracing(session: async_api.CDPSession, categories: Sequence[str] = DEFAULT_CATEGORIES) -> None:
+    await session.send("Tracing.start", {
+        "transferMode": "ReturnAsStream",
+        "traceConfig": {"includedCategories": list(categories), "recordMode": "recordAsMuchAsPossible"},
+    })
+
+
+async def stop_tracing(session: async_api.CDPSession) -> Trace:
+    complete = asyncio.get_running_loop().create_future()
+    session.once("Tracing.tracingComplete", lambda params: complete.done() or complete.set_result(params))
+    await session.send("Tracing.end")
+    params = await complete
+    data = json.loads(await _read_stream(session, params["stream"]))
+    return Trace(data["traceEvents"] if isinstance(data, dict) else data)
+
+
+@asynccontextmanager
+async def cdp_trace(page: async_api.Page, categories: Sequence[str] = DEFAULT_CATEGORIES):
+    """Record a trace of everything ``page`` does inside the block::
+
+        async with cdp_trace(page) as capture:
+            ...
+        frames = capture.trace.events
+    """
+    session = await page.context.new_cdp_session(page)
+    capture = TraceCapture()
+    await start_tracing(session, categories)
+    try:
+        yield capture
+    finally:
+        capture.trace = await stop_tracing(session)
+        await session.detach()
@@ -0,0 +1,139 @@
+"""Web Vitals and long-task capture for every page a test opens.
+
+An init script registers PerformanceObservers for LCP, layout shifts, event
+timing and long tasks, and reports a snapshot per navigation through an
+exposed binding. Hard navigations (a new document) and soft ones (the app's
+``history.pushState`` view switches) each get their own entry; LCP only
+exists for hard ones. Snapshots are pushed whenever something changes, so
+the latest numbers survive the script closing its context without warning.
+
+Definitions follow web-vitals: CLS is the worst session window (1s gap, 5s
+cap), INP the 98th percentile of per-interaction worst latency, and TBT the
+sum of long-task time over 50ms for the navigation.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from playwright import async_api
+
+BINDING = "__qbankReportVitals"
+
+_INIT_SCRIPT = """
+(() => {
+  if (window.__qbankVitals || !window.%(binding)s) return;
+  const doc = Math.random().toString(36).slice(2, 10);
+  let seq = 0, timer = null, state;
+  const reset = (kind) => {
+    state = {
+      id: `${doc}:${seq++}`, url: location.href, kind, startedAt: performance.now(),
+      lcp: null, clsWindows: [], cls: 0, interactions: new Map(),
+      longTasks: 0, longTaskMs: 0, tbt: 0,
+    };
+  };
+  reset('hard');
+  const inp = () => {
+    const worst = [...state.interactions.values()].sort((a, b) => b - a);
+    if (!worst.length) return null;
+    return worst[Math.min(worst.length - 1, Math.floor(worst.length / 50))];
+  };
+  const snapshot = () => {
+    const memory = performance.memory || {};
+    return {
+      id: state.id, url: state.url, navigation: state.kind,
+      lcp: state.lcp, cls: Math.round(state.cls * 10000) / 10000, inp: inp(),
+      tbt: Math.round(state.tbt), longTasks: state.longTasks, longTaskMs: Math.round(state.longTaskMs),
+      interactions: state.interactions.size,
+      jsHeapUsed: memory.usedJSHeapSize ?? null, jsHeapTotal: memory.totalJSHeapSize ?? null,
+    };
+  };
+  const report = (now) => {
+    clearTimeout(timer);
+    const send = () => { try { window.%(binding)s(snapshot()); } catch (e) {} };
+    if (now) send(); else timer = setTimeout(send, 200);
+  };
+  const observe = (type, handler, extra) => {
+    try {
+      new PerformanceObserver((list) => { list.getEntries().forEach(handler); report(false); })
+        .observe({ type, buffered: true, ...extra });
+    } catch (e) {}
+  };
+  observe('largest-contentful-paint', (e) => {
+    if (state.kind === 'hard') state.lcp = Math.round(e.renderTime || e.loadTime || e.startTime);
+  });
+  observe('layout-shift', (e) => {
+    if (e.hadRecentInput) return;
+    const w = state.clsWindows[state.clsWindows.length - 1];
+    if (w && e.startTime - w.last < 1000 && e.startTime - w.first < 5000) {
+      w.value += e.value; w.last = e.startTime;
+    } else {
+      state.clsWindows.push({ first: e.startTime, last: e.startTime, value: e.value });
+    }
+    state.cls = Math.max(state.cls, state.clsWindows[state.clsWindows.length - 1].value);
+  });
+  observe('event', (e) => {
+    if (!e.interactionId) return;
+    const prev = state.interactions.get(e.interactionId) || 0;
+    state.interactions.set(e.interactionId, Math.max(prev, Math.round(e.duration)));
+  }, { durationThreshold: 16 });
+  observe('longtask', (e) => {
+    state.longTasks += 1;
+    state.longTaskMs += e.duration;
+    state.tbt += Math.max(0, e.duration - 50);
+  });
+  const softNavigation = () => {
+    if (location.href === state.url) return;
+    report(true);
+    reset('soft');
+    report(false);
+  };
+  for (const name of ['pushState', 'replaceState']) {
+    const original = history[name];
+    history[name] = function (...args) { const result = original.apply(this, args); softNavigation(); return result; };
+  }
+  window.addEventListener('popstate', softNavigation);
+  window.addEventListener('pagehide', () => report(true));
+  document.addEventListener('visibilitychange', () => document.visibilityState === 'hidden' && report(true));
+  window.__qbankVitals = { snapshot };
+  report(false);
+})();
+""" % {"binding": BINDING}
+
+
+def _worst(entries: List[Dict], key: str) -> Optional[float]:
+    values = [e[key] for e in entries if e.get(key) is not None]
+    return max(values) if values else None
+
+
+class VitalsCollector:
+    """Per-test collector; attach with ``await collector.attach(context)``."""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[int, str], Dict[str, Any]] = {}
+
+    async def attach(self, context: async_api.BrowserContext) -> None:
+        await context.expose_binding(BINDING, self._on_report)
+        await context.add_init_script(_INIT_SCRIPT)
+
+    def _on_report(self, source: Dict[str, Any], snapshot: Dict[str, Any]) -> None:
+        # Later snapshots of the same navigation replace earlier ones; dict
+        # insertion order keeps navigations in the order they started.
+        self._entries[(id(source.get("page")), snapshot.pop("id"))] = snapshot
+
+    @property
+    def navigations(self) -> List[Dict[str, Any]]:
+        return list(self._entries.values())
+
+    def metrics(self) -> Dict[str, Any]:
+        """The ``metrics`` block written to test_results.json."""
+        entries = self.navigations
+        return {
+            "navigations": entries,
+            "summary": {
+                "navigations": len(entries),
+                "lcpMax": _worst(entries, "lcp"),
+                "clsMax": _worst(entries, "cls"),
+                "inpMax": _worst(entries, "inp"),
+                "tbtTotal": sum(e["tbt"] for e in entries),
+                "longTasks": sum(e["longTasks"] for e in entries),
+                "jsHeapPeak": _worst(entries, "jsHeapUsed"),
+            },
+        }
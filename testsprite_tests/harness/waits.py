@@ -0,0 +1,306 @@
+"""Event-driven waits that replace the fixed sleeps in the generated scripts.
+
+The generator emits ``await page.wait_for_timeout(3000)`` before every click
+and fill. ``settle`` waits only as long as the page is actually busy:
+
+* the target locator is attached, visible and its box has stopped moving,
+* no network request has been in flight for ``idle_ms``,
+* React has not committed for ``idle_ms``,
+* ``window.__qbankReady`` is not ``false`` (App.tsx clears it while a view
+  switch is being rendered).
+
+Each predicate is bounded by ``max_wait_ms``; when it runs out the script
+proceeds and the following action applies its own timeout, exactly as it did
+after the fixed sleep.
+
+Every ``settle`` call is charged against the sleep it replaced in a per-task
+``WaitLedger`` so the runner can report how much wait time was removed.
+"""
+import asyncio
+import contextvars
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+from playwright import async_api
+
+from . import timeline
+
+DEFAULT_BUDGET_MS = 3000
+DEFAULT_IDLE_MS = 300
+DEFAULT_MAX_WAIT_MS = 10000
+
+# Counts React commits through the devtools hook so the harness can tell when
+# rendering has gone quiet. Installed before any app script runs.
+_INIT_SCRIPT = """
+(() => {
+  if (window.__qbankWaits) return;
+  const state = window.__qbankWaits = { commits: 0, lastCommit: 0 };
+  const mark = () => { state.commits += 1; state.lastCommit = performance.now(); };
+  const hook = window.__REACT_DEVTOOLS_GLOBAL_HOOK__;
+  if (hook) {
+    const original = hook.onCommitFiberRoot;
+    hook.onCommitFiberRoot = function (...args) {
+      mark();
+      return original ? original.apply(this, args) : undefined;
+    };
+    return;
+  }
+  let nextId = 0;
+  window.__REACT_DEVTOOLS_GLOBAL_HOOK__ = {
+    renderers: new Map(),
+    supportsFiber: true,
+    inject(renderer) { nextId += 1; this.renderers.set(nextId, renderer); return nextId; },
+    onCommitFiberRoot: mark,
+    onCommitFiberUnmount() {},
+    onPostCommitFiberRoot() {},
+    checkDCE() {},
+  };
+})();
+"""
+
+_STABLE_BOX_JS = """
+(el) => new Promise((resolve) => {
+  let previous = null;
+  const tick = () => {
+    const box = el.getBoundingClientRect();
+    const key = [box.x, box.y, box.width, box.height].join(',');
+    if (key === previous) resolve(true);
+    else { previous = key; requestAnimationFrame(tick); }
+  };
+  requestAnimationFrame(tick);
+})
+"""
+
+_REACT_QUIET_JS = """
+(idle) => {
+  const state = window.__qbankWaits;
+  return !state || performance.now() - state.lastCommit >= idle;
+}
+"""
+
+_APP_READY_JS = "() => window.__qbankReady !== false"
+
+# Checks every expected text against one snapshot of the rendered text
+# (innerText, lower-cased and whitespace-collapsed, which is how Playwright's
+# ``text=`` selector matches) and re-checks only after the DOM mutates, at
+# most once per frame. Texts count once they have been seen.
+_EXPECT_TEXTS_JS = """
+({ texts, timeout }) => new Promise((resolve) => {
+  const started = performance.now();
+  const normalize = (s) => s.replace(/\\s+/g, ' ').trim().toLowerCase();
+  const pending = new Map(texts.map((text) => [normalize(text), text]));
+  let snapshots = 0, scheduled = false, observer = null, timer = null;
+  const finish = () => {
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    resolve({ missing: [...pending.values()], snapshots, ms: performance.now() - started });
+  };
+  const check = () => {
+    scheduled = false;
+    snapshots += 1;
+    const rendered = normalize(document.body ? document.body.innerText : '');
+    for (const key of [...pending.keys()]) if (rendered.includes(key)) pending.delete(key);
+    if (!pending.size) finish();
+  };
+  check();
+  if (!pending.size) return;
+  observer = new MutationObserver(() => {
+    if (!scheduled) { scheduled = true; requestAnimationFrame(check); }
+  });
+  observer.observe(document.documentElement, { childList: true, subtree: true, characterData: true, attributes: true });
+  timer = setTimeout(finish, timeout);
+})
+"""
+
+
+@dataclass
+class WaitLedger:
+    """Time accounting for one test: fixed sleep replaced vs. time actually waited."""
+
+    calls: int = 0
+    replaced_ms: float = 0.0
+    waited_ms: float = 0.0
+    timeouts: int = 0
+
+    @property
+    def saved_ms(self) -> float:
+        return self.replaced_ms - self.waited_ms
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "replacedMs": round(self.replaced_ms),
+            "waitedMs": round(self.waited_ms),
+            "savedMs": round(self.saved_ms),
+            "timeouts": self.timeouts,
+        }
+
+
+_ledger: contextvars.ContextVar[Optional[WaitLedger]] = contextvars.ContextVar("qbank_wait_ledger", default=None)
+
+
+def start_ledger() -> WaitLedger:
+    """Begin accounting for the current task; returns the fresh ledger."""
+    ledger = WaitLedger()
+    _ledger.set(ledger)
+    return ledger
+
+
+def current_ledger() -> WaitLedger:
+    ledger = _ledger.get()
+    if ledger is None:
+        ledger = start_ledger()
+    return ledger
+
+
+class NetworkTracker:
+    """Counts in-flight requests for a browser context."""
+
+    def __init__(self):
+        self.inflight = 0
+        self.last_activity = time.monotonic()
+        self._changed = asyncio.Event()
+
+    def _bump(self, delta: int) -> None:
+        self.inflight = max(0, self.inflight + delta)
+        self.last_activity = time.monotonic()
+        self._changed.set()
+
+    def attach(self, context: async_api.BrowserContext) -> None:
+        context.on("request", lambda _request: self._bump(1))
+        context.on("requestfinished", lambda _request: self._bump(-1))
+        context.on("requestfailed", lambda _request: self._bump(-1))
+
+    async def wait_idle(self, idle_ms: float) -> None:
+        idle = idle_ms / 1000.0
+        while True:
+            quiet_for = time.monotonic() - self.last_activity
+            if self.inflight == 0 and quiet_for >= idle:
+                return
+            self._changed.clear()
+            remaining = idle - quiet_for if self.inflight == 0 else None
+            try:
+                await asyncio.wait_for(self._changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+
+_trackers: "weakref.WeakKeyDictionary[async_api.BrowserContext, NetworkTracker]" = weakref.WeakKeyDictionary()
+
+
+async def install(context: async_api.BrowserContext) -> None:
+    """Attach request tracking and the React commit hook to ``context``.
+
+    Safe to call more than once; the runner installs it on every context and
+    the generated scripts call it themselves when run standalone.
+    """
+    if context in _trackers:
+        return
+    tracker = NetworkTracker()
+    tracker.attach(context)
+    _trackers[context] = tracker
+    await context.add_init_script(_INIT_SCRIPT)
+
+
+async def locator_ready(locator: async_api.Locator, timeout_ms: float) -> None:
+    await locator.wait_for(state="visible", timeout=timeout_ms)
+    await asyncio.wait_for(locator.evaluate(_STABLE_BOX_JS), timeout_ms / 1000.0)
+
+
+async def network_idle(page: async_api.Page, idle_ms: float, timeout_ms: float) -> None:
+    tracker = _trackers.get(page.context)
+    if tracker is None:
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+        return
+    await asyncio.wait_for(tracker.wait_idle(idle_ms), timeout_ms / 1000.0)
+
+
+async def react_quiet(page: async_api.Page, idle_ms: float, timeout_ms: float) -> None:
+    await page.wait_for_function(_REACT_QUIET_JS, arg=idle_ms, polling="raf", timeout=timeout_ms)
+
+
+async def app_ready(page: async_api.Page, timeout_ms: float) -> None:
+    await page.wait_for_function(_APP_READY_JS, polling="raf", timeout=timeout_ms)
+
+
+async def settle(
+    page: async_api.Page,
+    locator: Optional[async_api.Locator] = None,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    idle_ms: float = DEFAULT_IDLE_MS,
+    max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+) -> None:
+    """Wait until the page (and ``locator``, if given) is ready for the next action.
+
+    ``budget_ms`` is the fixed sleep this call replaces and is only used for
+    the ledger.
+    """
+    timeline.mark()
+    if locator is not None:
+        page = locator.page
+    started = time.monotonic()
+    deadline = started + max_wait_ms / 1000.0
+    timed_out = False
+
+    def remaining_ms() -> float:
+        return max(1.0, (deadline - time.monotonic()) * 1000.0)
+
+    checks = [
+        lambda: app_ready(page, remaining_ms()),
+        lambda: network_idle(page, idle_ms, remaining_ms()),
+        lambda: react_quiet(page, idle_ms, remaining_ms()),
+    ]
+    if locator is not None:
+        checks.append(lambda: locator_ready(locator, remaining_ms()))
+    for check in checks:
+        try:
+            await check()
+        except (asyncio.TimeoutError, async_api.TimeoutError):
+            timed_out = True
+            break
+        except async_api.Error:
+            # Navigation tore down the execution context; the next action
+            # re-resolves everything anyway.
+            break
+
+    ledger = current_ledger()
+    ledger.calls += 1
+    ledger.replaced_ms += budget_ms
+    ledger.waited_ms += (time.monotonic() - started) * 1000.0
+    ledger.timeouts += timed_out
+
+
+async def expect_texts(
+    target: Union[async_api.Page, async_api.Frame],
+    texts: Sequence[str],
+    timeout_ms: float = 30000,
+) -> None:
+    """Assert that every one of ``texts`` shows up on ``target`` within ``timeout_ms``.
+
+    Replaces a run of ``expect(locator('text=...')).to_be_visible()`` calls:
+    all texts are checked against one snapshot of the page's rendered text,
+    the page is only re-read when the DOM mutates, and a failure lists every
+    text that never appeared instead of stopping at the first.
+    """
+    timeline.mark()
+    deadline = time.monotonic() + timeout_ms / 1000.0
+    missing: List[str] = list(texts)
+    while missing:
+        remaining = max(1.0, (deadline - time.monotonic()) * 1000.0)
+        try:
+            result = await target.evaluate(_EXPECT_TEXTS_JS, {"texts": missing, "timeout": remaining})
+        except async_api.Error:
+            # A navigation replaced the document mid-wait; look again at the new one.
+            if time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(0.05)
+            continue
+        missing = result["missing"]
+        if time.monotonic() >= deadline:
+            break
+    if missing:
+        listed = "\n".join(f"  - {text}" for text in missing)
+        raise AssertionError(f"{len(missing)} of {len(texts)} expected texts did not appear "
+                             f"within {timeout_ms / 1000:.0f}s:\n{listed}")
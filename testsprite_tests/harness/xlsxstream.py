@@ -0,0 +1,189 @@
+"""Read-only streaming rows from the first worksheet of an .xlsx file.
+
+The server-side counterpart of apps/admin/services/xlsxStreamReader.ts, and
+the same approach: the sheet is inflated straight from the zip, decoded in
+1MB chunks, and complete ``<row>`` elements are cut out of the text as they
+arrive and read with regular expressions (an element tree costs a Python
+event per cell). Memory does not grow with the sheet; the shared strings
+table is the one part read whole, since any cell may point into it.
+Standard library only.
+
+Values come back as ``str``, ``int``/``float`` or ``bool``, as SheetJS's
+``sheet_to_json`` would give them (dates stay serial numbers).
+"""
+import io
+import re
+import zipfile
+from pathlib import Path
+from typing import IO, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+Cell = Union[str, int, float, bool]
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_RELATIONSHIP_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+SHARED_STRINGS = "xl/sharedStrings.xml"
+READ_CHARS = 1 << 20
+
+# Text never holds a raw "<", so bodies are matched as [^<] runs.
+_CELL = re.compile(r"<c\b([^>]*?)(?:/>|>([^<]*(?:<(?!/c>)[^<]*)*)</c>)")
+_CELL_REF = re.compile(r'\br="([A-Z]+)')
+_ROW_REF = re.compile(r'<row\b[^>]*?\br="(\d+)"')
+_CELL_TYPE = re.compile(r'\bt="([^"]*)"')
+_VALUE = re.compile(r"<v>([^<]*)</v>")
+_TEXT_RUN = re.compile(r"<t\b[^>]*>([^<]*)</t>")
+_PHONETIC = re.compile(r"<rPh\b.*?</rPh>", re.S)
+_ENTITY = re.compile(r"&(?:#(\d+)|#x([0-9a-fA-F]+)|(amp|lt|gt|quot|apos));")
+_NAMED_ENTITIES = {"amp": "&", "lt": "<", "gt": ">", "quot": '"', "apos": "'"}
+_ESCAPED_CHAR = re.compile(r"_x([0-9A-Fa-f]{4})_")
+_TAG_END = frozenset(">/ \t\n\r")
+
+
+def _entity(match: re.Match) -> str:
+    decimal, hexadecimal, name = match.groups()
+    return _NAMED_ENTITIES[name] if name else chr(int(decimal) if decimal else int(hexadecimal, 16))
+
+
+def decode_xml(text: str) -> str:
+    if "&" in text:
+        text = _ENTITY.sub(_entity, text)
+    # OOXML writes control characters as _xHHHH_.
+    return _ESCAPED_CHAR.sub(lambda m: chr(int(m.group(1), 16)), text) if "_x" in text else text
+
+
+def _run_text(xml: str) -> str:
+    """Text of an ``<si>``/``<is>``: its ``<t>`` runs, not phonetic hints."""
+    if "<rPh" in xml:
+        xml = _PHONETIC.sub("", xml)
+    return decode_xml("".join(_TEXT_RUN.findall(xml)))
+
+
+def column_index(letters: str) -> int:
+    """``"AB"`` -> 27."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index - 1
+
+
+def elements(stream: IO[str], tag: str) -> Iterator[str]:
+    """Complete ``<tag ...>...</tag>`` (or ``<tag .../>``) elements of a text stream; ``tag`` must not nest."""
+    opening, closing = f"<{tag}", f"</{tag}>"
+    buffer = ""
+    while True:
+        chunk = stream.read(READ_CHARS)
+        if not chunk:
+            return
+        buffer += chunk
+        pos = 0
+        while True:
+            start = buffer.find(opening, pos)
+            if start < 0:
+                # Keep a tail that may hold the start of the next tag.
+                pos = max(pos, len(buffer) - len(opening))
+                break
+            after = start + len(opening)
+            if after == len(buffer):
+                pos = start
+                break
+            if buffer[after] not in _TAG_END:
+                pos = after
+                continue
+            tag_end = buffer.find(">", after)
+            if tag_end < 0:
+                pos = start
+                break
+            if buffer[tag_end - 1] == "/":
+                yield buffer[start:tag_end + 1]
+                pos = tag_end + 1
+                continue
+            end = buffer.find(closing, tag_end)
+            if end < 0:
+                pos = start
+                break
+            yield buffer[start:end + len(closing)]
+            pos = end + len(closing)
+        buffer = buffer[pos:]
+
+
+def _text_stream(archive: zipfile.ZipFile, name: str) -> IO[str]:
+    return io.TextIOWrapper(archive.open(name), encoding="utf-8")
+
+
+def first_sheet(archive: zipfile.ZipFile) -> str:
+    """Zip path of the workbook's first sheet, the one parseFile reads."""
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    sheet = workbook.find(f"{_MAIN}sheets/{_MAIN}sheet")
+    if sheet is None:
+        raise ValueError("the workbook has no sheets")
+    relationships = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for relationship in relationships:
+        if relationship.get("Id") == sheet.get(_RELATIONSHIP_ID):
+            target = relationship.get("Target", "")
+            return target[1:] if target.startswith("/") else f"xl/{target}"
+    raise ValueError("the first sheet is missing from the workbook")
+
+
+def shared_strings(archive: zipfile.ZipFile) -> List[str]:
+    if SHARED_STRINGS not in archive.namelist():
+        return []
+    with _text_stream(archive, SHARED_STRINGS) as stream:
+        return [_run_text(si) for si in elements(stream, "si")]
+
+
+def _cell_value(attrs: str, body: Optional[str], strings: List[str]) -> Optional[Cell]:
+    if body is None:
+        return None
+    match = _CELL_TYPE.search(attrs)
+    kind = match.group(1) if match else "n"
+    if kind == "inlineStr":
+        return _run_text(body)
+    value = _VALUE.search(body)
+    if value is None:
+        return None
+    text = value.group(1)
+    if kind == "s":
+        return strings[int(text)]
+    if kind == "b":
+        return text == "1"
+    if kind in ("str", "e", "d"):
+        return decode_xml(text)
+    number = float(text)
+    return int(number) if number.is_integer() else number
+
+
+def row_values(row: str, strings: List[str]) -> List[Optional[Cell]]:
+    """Cell values of one ``<row>`` element by column index, ``None`` for gaps."""
+    values: List[Optional[Cell]] = []
+    next_index = 0
+    for attrs, body in _CELL.findall(row):
+        ref = _CELL_REF.search(attrs)
+        # A cell without a reference follows the previous one, empty or not.
+        index = column_index(ref.group(1)) if ref else next_index
+        next_index = index + 1
+        # findall gives "" for a self-closing <c/>; only a body can hold a value.
+        value = _cell_value(attrs, body or None, strings)
+        if value is None:
+            continue
+        if index >= len(values):
+            values.extend([None] * (index + 1 - len(values)))
+        values[index] = value
+    return values
+
+
+def iter_rows(path: Path) -> Iterator[Tuple[int, List[Optional[Cell]]]]:
+    """``(row number, values by column)`` for each non-empty row of the first sheet.
+
+    Rows are numbered by their ``r`` attribute, so rows the writer left out
+    still count; a row without one follows the previous row.
+    """
+    with zipfile.ZipFile(path) as archive:
+        strings = shared_strings(archive)
+        with _text_stream(archive, first_sheet(archive)) as stream:
+            number = 0
+            for row in elements(stream, "row"):
+                ref = _ROW_REF.match(row)
+                number = int(ref.group(1)) if ref else number + 1
+                values = row_values(row, strings)
+                if values:
+                    yield number, values
@@ -0,0 +1,7 @@
+-- Roles supabase-js requests run as. PostgREST logs in as authenticator and
+-- switches to the role named in the JWT (anon unless a key says otherwise).
+CREATE ROLE anon NOLOGIN;
+CREATE ROLE authenticated NOLOGIN;
+CREATE ROLE service_role NOLOGIN BYPASSRLS;
+CREATE ROLE authenticator LOGIN PASSWORD 'authenticator' NOINHERIT;
+GRANT anon, authenticated, service_role TO authenticator;
@@ -0,0 +1,15 @@
+-- StudentView.finishQuiz upserts into "results" (storageService.saveResult),
+-- but no schema file creates it; columns follow the ExamResult type.
+CREATE TABLE IF NOT EXISTS results (
+    id TEXT PRIMARY KEY,
+    "setId" TEXT,
+    "studentName" TEXT,
+    score INT,
+    "totalQuestions" INT,
+    answers JSONB,
+    "timeTaken" INT,
+    "completedDate" TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc'::text, now()) NOT NULL
+);
+ALTER TABLE results ENABLE ROW LEVEL SECURITY;
+CREATE POLICY "Enable all access for all users" ON results FOR ALL USING (true) WITH CHECK (true);
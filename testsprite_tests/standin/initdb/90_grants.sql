@@ -0,0 +1,13 @@
+-- The schema files open every table to the public through RLS policies;
+-- match that with table privileges for the API roles.
+GRANT USAGE ON SCHEMA public TO anon, authenticated, service_role;
+GRANT ALL ON ALL TABLES IN SCHEMA public TO anon, authenticated, service_role;
+GRANT ALL ON ALL SEQUENCES IN SCHEMA public TO anon, authenticated, service_role;
+
+-- Indexes for the filters and orderings storageService/CreatorDashboard use.
+CREATE INDEX IF NOT EXISTS questions_created_date_idx ON questions ("createdDate" DESC);
+CREATE INDEX IF NOT EXISTS questions_subject_idx ON questions (subject);
+CREATE INDEX IF NOT EXISTS questions_master_created_at_idx ON questions_master (created_at DESC);
+CREATE INDEX IF NOT EXISTS questions_master_subject_idx ON questions_master (subject_name);
+
+NOTIFY pgrst, 'reload schema';